@@ -36,6 +36,7 @@ version_info = tuple([int(v) for v in version.split(".") if v.isdigit()])
 from cogent.util.table import Table as _Table
 from cogent.parse.table import load_delimited, autogen_reader
 from cogent.core.tree import TreeBuilder, TreeError
+from cogent.core.compact_tree import CompactTree
 from cogent.parse.tree_xml import parse_string as tree_xml_parse_string
 from cogent.parse.newick import parse_string as newick_parse_string
 from cogent.core.alignment import SequenceCollection
@@ -188,7 +189,7 @@ def LoadTable(filename=None, sep=',', reader=None, header=None, rows=None,
     return table
 
 def LoadTree(filename=None, treestring=None, tip_names=None, format=None, \
-    underscore_unmunge=False):
+    underscore_unmunge=False, compact=False):
 
     """Constructor for tree.
     
@@ -196,6 +197,11 @@ def LoadTree(filename=None, treestring=None, tip_names=None, format=None, \
         - filename: a file containing a newick or xml formatted tree.
         - treestring: a newick or xml formatted tree string.
         - tip_names: a list of tip names.
+    
+    and optionally:
+        - compact: return a read-only cogent.core.compact_tree.CompactTree
+          rather than PhyloNode objects, which is much quicker and smaller
+          for very large newick trees.
 
     Note: underscore_unmunging is turned off by default, although it is part
     of the Newick format. Set underscore_unmunge to True to replace underscores
@@ -211,6 +217,9 @@ def LoadTree(filename=None, treestring=None, tip_names=None, format=None, \
         assert not tip_names
         if format is None and treestring.startswith('<'):
             format = "xml"
+        if compact and format != "xml":
+            return CompactTree.fromNewick(treestring,
+                    underscore_unmunge=underscore_unmunge)
         if format == "xml":
             parser = tree_xml_parse_string
         else:
@@ -230,5 +239,7 @@ def LoadTree(filename=None, treestring=None, tip_names=None, format=None, \
         tree = tree_builder(tips, 'root', {})
     else:
         raise TreeError, 'filename or treestring not specified'
+    if compact:
+        tree = CompactTree.fromTree(tree)
     return tree
 
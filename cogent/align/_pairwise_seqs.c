@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12.1 on Thu Nov 25 11:38:10 2010 */
+/* Generated by Cython 0.12.1 on Sat Oct 17 04:53:21 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -484,6 +484,8 @@ static long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_t_6c
 static long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType, int *, int *); /*proto*/
 static long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong3D(__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType, int *, int *, int *); /*proto*/
 static long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong4D(__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType, int *, int *, int *, int *); /*proto*/
+static int __pyx_f_6cogent_5align_14_pairwise_seqs_cmax(int, int); /*proto*/
+static int __pyx_f_6cogent_5align_14_pairwise_seqs_cmin(int, int); /*proto*/
 static unsigned char *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayUChar3D(__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType, int *, int *, int *); /*proto*/
 #define __Pyx_MODULE_NAME "cogent.align._pairwise_seqs"
 int __pyx_module_is_main_cogent__align___pairwise_seqs = 0;
@@ -505,8 +507,8 @@ static char __pyx_k_9[] = "%s * SCALE_STEP ** %s %s";
 static char __pyx_k_10[] = "transition is a negative probability";
 static char __pyx_k_11[] = "product is a negative probability";
 static char __pyx_k_12[] = "is unexpectedly large";
-static char __pyx_k_13[] = "('1', '6', '0', 'dev')";
-static char __pyx_k_14[] = "calc_rows (line 39)";
+static char __pyx_k_13[] = "('1', '6', '0dev')";
+static char __pyx_k_14[] = "calc_rows (line 51)";
 static char __pyx_k__T[] = "T";
 static char __pyx_k__nd[] = "nd";
 static char __pyx_k__chr[] = "chr";
@@ -515,6 +517,7 @@ static char __pyx_k__data[] = "data";
 static char __pyx_k__fmpt[] = "fmpt";
 static char __pyx_k__plan[] = "plan";
 static char __pyx_k__rows[] = "rows";
+static char __pyx_k__bands[] = "bands";
 static char __pyx_k__flags[] = "flags";
 static char __pyx_k__i_low[] = "i_low";
 static char __pyx_k__j_low[] = "j_low";
@@ -571,6 +574,7 @@ static PyObject *__pyx_n_s____array_struct__;
 static PyObject *__pyx_n_s____main__;
 static PyObject *__pyx_n_s____test__;
 static PyObject *__pyx_n_s____version__;
+static PyObject *__pyx_n_s__bands;
 static PyObject *__pyx_n_s__calc_rows;
 static PyObject *__pyx_n_s__chr;
 static PyObject *__pyx_n_s__data;
@@ -605,10 +609,10 @@ static PyObject *__pyx_n_s__version_info;
 static PyObject *__pyx_n_s__viterbi;
 static PyObject *__pyx_n_s__xgap_scores;
 static PyObject *__pyx_n_s__ygap_scores;
-static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
 static PyObject *__pyx_int_3;
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":32
+/* "../../include/numerical_pyrex.pyx":32
  * ctypedef object ArrayType
  * 
  * cdef double *uncheckedArrayDouble(ArrayType A):             # <<<<<<<<<<<<<<
@@ -624,7 +628,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_uncheckedArrayDouble(__p
   __Pyx_RefNannySetupContext("uncheckedArrayDouble");
   __pyx_v_cobj = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":34
+  /* "../../include/numerical_pyrex.pyx":34
  * cdef double *uncheckedArrayDouble(ArrayType A):
  *     cdef PyArrayInterface *a
  *     cobj = A.__array_struct__             # <<<<<<<<<<<<<<
@@ -637,7 +641,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_uncheckedArrayDouble(__p
   __pyx_v_cobj = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":35
+  /* "../../include/numerical_pyrex.pyx":35
  *     cdef PyArrayInterface *a
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)             # <<<<<<<<<<<<<<
@@ -646,7 +650,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_uncheckedArrayDouble(__p
  */
   __pyx_v_a = ((struct PyArrayInterface *)PyCObject_AsVoidPtr(__pyx_v_cobj));
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":36
+  /* "../../include/numerical_pyrex.pyx":36
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)
  *     return <double *> a.data             # <<<<<<<<<<<<<<
@@ -668,7 +672,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_uncheckedArrayDouble(__p
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":38
+/* "../../include/numerical_pyrex.pyx":38
  *     return <double *> a.data
  * 
  * cdef void *checkArray(ArrayType A, char typecode, int itemsize,             # <<<<<<<<<<<<<<
@@ -695,7 +699,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __Pyx_INCREF(__pyx_v_A);
   __pyx_v_cobj = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":43
+  /* "../../include/numerical_pyrex.pyx":43
  *     cdef int length, size
  *     cdef char kind
  *     if A is None:             # <<<<<<<<<<<<<<
@@ -705,7 +709,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_1 = (__pyx_v_A == ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)Py_None));
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":44
+    /* "../../include/numerical_pyrex.pyx":44
  *     cdef char kind
  *     if A is None:
  *         raise TypeError("Array required, got None")             # <<<<<<<<<<<<<<
@@ -727,7 +731,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   }
   __pyx_L3:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":45
+  /* "../../include/numerical_pyrex.pyx":45
  *     if A is None:
  *         raise TypeError("Array required, got None")
  *     cobj = A.__array_struct__             # <<<<<<<<<<<<<<
@@ -740,7 +744,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_v_cobj = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":46
+  /* "../../include/numerical_pyrex.pyx":46
  *         raise TypeError("Array required, got None")
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)             # <<<<<<<<<<<<<<
@@ -749,7 +753,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
  */
   __pyx_v_a = ((struct PyArrayInterface *)PyCObject_AsVoidPtr(__pyx_v_cobj));
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":47
+  /* "../../include/numerical_pyrex.pyx":47
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)
  *     if a.version != 2:             # <<<<<<<<<<<<<<
@@ -759,7 +763,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_1 = (__pyx_v_a->version != 2);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":49
+    /* "../../include/numerical_pyrex.pyx":49
  *     if a.version != 2:
  *         raise ValueError(
  *             "Unexpected array interface version %s" % str(a.version))             # <<<<<<<<<<<<<<
@@ -794,7 +798,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   }
   __pyx_L4:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":51
+  /* "../../include/numerical_pyrex.pyx":51
  *             "Unexpected array interface version %s" % str(a.version))
  *     cdef char typecode2
  *     typecode2 = a.typekind             # <<<<<<<<<<<<<<
@@ -803,7 +807,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
  */
   __pyx_v_typecode2 = __pyx_v_a->typekind;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":52
+  /* "../../include/numerical_pyrex.pyx":52
  *     cdef char typecode2
  *     typecode2 = a.typekind
  *     if typecode2 != typecode:             # <<<<<<<<<<<<<<
@@ -813,7 +817,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_1 = (__pyx_v_typecode2 != __pyx_v_typecode);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":54
+    /* "../../include/numerical_pyrex.pyx":54
  *     if typecode2 != typecode:
  *         raise TypeError("'%s' type array required, got '%s'" %
  *                 (chr(typecode), chr(typecode2)))             # <<<<<<<<<<<<<<
@@ -866,7 +870,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   }
   __pyx_L5:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":55
+  /* "../../include/numerical_pyrex.pyx":55
  *         raise TypeError("'%s' type array required, got '%s'" %
  *                 (chr(typecode), chr(typecode2)))
  *     if a.itemsize != itemsize:             # <<<<<<<<<<<<<<
@@ -876,7 +880,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_1 = (__pyx_v_a->itemsize != __pyx_v_itemsize);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":57
+    /* "../../include/numerical_pyrex.pyx":57
  *     if a.itemsize != itemsize:
  *         raise TypeError("'%s%s' type array required, got '%s%s'" %
  *                 (chr(typecode), itemsize, chr(typecode2), a.itemsize))             # <<<<<<<<<<<<<<
@@ -939,7 +943,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   }
   __pyx_L6:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":58
+  /* "../../include/numerical_pyrex.pyx":58
  *         raise TypeError("'%s%s' type array required, got '%s%s'" %
  *                 (chr(typecode), itemsize, chr(typecode2), a.itemsize))
  *     if a.nd != nd:             # <<<<<<<<<<<<<<
@@ -949,7 +953,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_1 = (__pyx_v_a->nd != __pyx_v_nd);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":60
+    /* "../../include/numerical_pyrex.pyx":60
  *     if a.nd != nd:
  *         raise ValueError("%s dimensional array required, got %s" %
  *                 (nd, a.nd))             # <<<<<<<<<<<<<<
@@ -986,7 +990,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   }
   __pyx_L7:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":61
+  /* "../../include/numerical_pyrex.pyx":61
  *         raise ValueError("%s dimensional array required, got %s" %
  *                 (nd, a.nd))
  *     if not a.flags & CONTIGUOUS:             # <<<<<<<<<<<<<<
@@ -996,7 +1000,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_1 = (!(__pyx_v_a->flags & CONTIGUOUS));
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":62
+    /* "../../include/numerical_pyrex.pyx":62
  *                 (nd, a.nd))
  *     if not a.flags & CONTIGUOUS:
  *         raise ValueError ('Noncontiguous array')             # <<<<<<<<<<<<<<
@@ -1018,7 +1022,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   }
   __pyx_L8:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":66
+  /* "../../include/numerical_pyrex.pyx":66
  *     cdef int dimension, val
  *     cdef int *var
  *     for dimension from 0 <= dimension < nd:             # <<<<<<<<<<<<<<
@@ -1028,7 +1032,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   __pyx_t_7 = __pyx_v_nd;
   for (__pyx_v_dimension = 0; __pyx_v_dimension < __pyx_t_7; __pyx_v_dimension++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":67
+    /* "../../include/numerical_pyrex.pyx":67
  *     cdef int *var
  *     for dimension from 0 <= dimension < nd:
  *         val = a.shape[dimension]             # <<<<<<<<<<<<<<
@@ -1037,7 +1041,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
  */
     __pyx_v_val = (__pyx_v_a->shape[__pyx_v_dimension]);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":68
+    /* "../../include/numerical_pyrex.pyx":68
  *     for dimension from 0 <= dimension < nd:
  *         val = a.shape[dimension]
  *         var = dims[dimension]             # <<<<<<<<<<<<<<
@@ -1046,7 +1050,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
  */
     __pyx_v_var = (__pyx_v_dims[__pyx_v_dimension]);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":69
+    /* "../../include/numerical_pyrex.pyx":69
  *         val = a.shape[dimension]
  *         var = dims[dimension]
  *         if var[0] == 0:             # <<<<<<<<<<<<<<
@@ -1056,7 +1060,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
     __pyx_t_1 = ((__pyx_v_var[0]) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":71
+      /* "../../include/numerical_pyrex.pyx":71
  *         if var[0] == 0:
  *             # Length unspecified, take it from the provided array
  *             var[0] = val             # <<<<<<<<<<<<<<
@@ -1067,7 +1071,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
       goto __pyx_L11;
     }
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":72
+    /* "../../include/numerical_pyrex.pyx":72
  *             # Length unspecified, take it from the provided array
  *             var[0] = val
  *         elif var[0] != val:             # <<<<<<<<<<<<<<
@@ -1077,7 +1081,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
     __pyx_t_1 = ((__pyx_v_var[0]) != __pyx_v_val);
     if (__pyx_t_1) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":75
+      /* "../../include/numerical_pyrex.pyx":75
  *             # Length already specified, but not the same
  *             raise ValueError("Dimension %s is %s, expected %s" %
  *                     (dimension, val, var[0]))             # <<<<<<<<<<<<<<
@@ -1122,7 +1126,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
     __pyx_L11:;
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":79
+  /* "../../include/numerical_pyrex.pyx":79
  *             # Length matches what was expected
  *             pass
  *     return a.data             # <<<<<<<<<<<<<<
@@ -1149,7 +1153,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray(__pyx_t_6cogent
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":82
+/* "../../include/numerical_pyrex.pyx":82
  * 
  * 
  * cdef void *checkArray1D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1163,7 +1167,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray1D(__pyx_t_6coge
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray1D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":85
+  /* "../../include/numerical_pyrex.pyx":85
  *         int *x) except NULL:
  *     cdef int *dims[1]
  *     dims[0] = x             # <<<<<<<<<<<<<<
@@ -1172,7 +1176,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray1D(__pyx_t_6coge
  */
   (__pyx_v_dims[0]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":86
+  /* "../../include/numerical_pyrex.pyx":86
  *     cdef int *dims[1]
  *     dims[0] = x
  *     return checkArray(a, typecode, size, 1, dims)             # <<<<<<<<<<<<<<
@@ -1193,7 +1197,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray1D(__pyx_t_6coge
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":88
+/* "../../include/numerical_pyrex.pyx":88
  *     return checkArray(a, typecode, size, 1, dims)
  * 
  * cdef void *checkArray2D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1207,7 +1211,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray2D(__pyx_t_6coge
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray2D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":91
+  /* "../../include/numerical_pyrex.pyx":91
  *         int *x, int *y) except NULL:
  *     cdef int *dims[2]
  *     dims[0] = x             # <<<<<<<<<<<<<<
@@ -1216,7 +1220,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray2D(__pyx_t_6coge
  */
   (__pyx_v_dims[0]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":92
+  /* "../../include/numerical_pyrex.pyx":92
  *     cdef int *dims[2]
  *     dims[0] = x
  *     dims[1] = y             # <<<<<<<<<<<<<<
@@ -1225,7 +1229,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray2D(__pyx_t_6coge
  */
   (__pyx_v_dims[1]) = __pyx_v_y;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":93
+  /* "../../include/numerical_pyrex.pyx":93
  *     dims[0] = x
  *     dims[1] = y
  *     return checkArray(a, typecode, size, 2, dims)             # <<<<<<<<<<<<<<
@@ -1246,7 +1250,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray2D(__pyx_t_6coge
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":95
+/* "../../include/numerical_pyrex.pyx":95
  *     return checkArray(a, typecode, size, 2, dims)
  * 
  * cdef void *checkArray3D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1260,7 +1264,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_t_6coge
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":98
+  /* "../../include/numerical_pyrex.pyx":98
  *         int *x, int *y, int *z) except NULL:
  *     cdef int *dims[3]
  *     dims[0] = x             # <<<<<<<<<<<<<<
@@ -1269,7 +1273,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_t_6coge
  */
   (__pyx_v_dims[0]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":99
+  /* "../../include/numerical_pyrex.pyx":99
  *     cdef int *dims[3]
  *     dims[0] = x
  *     dims[1] = y             # <<<<<<<<<<<<<<
@@ -1278,7 +1282,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_t_6coge
  */
   (__pyx_v_dims[1]) = __pyx_v_y;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":100
+  /* "../../include/numerical_pyrex.pyx":100
  *     dims[0] = x
  *     dims[1] = y
  *     dims[2] = z             # <<<<<<<<<<<<<<
@@ -1287,7 +1291,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_t_6coge
  */
   (__pyx_v_dims[2]) = __pyx_v_z;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":101
+  /* "../../include/numerical_pyrex.pyx":101
  *     dims[1] = y
  *     dims[2] = z
  *     return checkArray(a, typecode, size, 3, dims)             # <<<<<<<<<<<<<<
@@ -1308,7 +1312,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_t_6coge
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":103
+/* "../../include/numerical_pyrex.pyx":103
  *     return checkArray(a, typecode, size, 3, dims)
  * 
  * cdef void *checkArray4D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1322,7 +1326,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray4D(__pyx_t_6coge
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray4D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":106
+  /* "../../include/numerical_pyrex.pyx":106
  *         int *w, int *x, int *y, int *z) except NULL:
  *     cdef int *dims[4]
  *     dims[0] = w             # <<<<<<<<<<<<<<
@@ -1331,7 +1335,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray4D(__pyx_t_6coge
  */
   (__pyx_v_dims[0]) = __pyx_v_w;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":107
+  /* "../../include/numerical_pyrex.pyx":107
  *     cdef int *dims[4]
  *     dims[0] = w
  *     dims[1] = x             # <<<<<<<<<<<<<<
@@ -1340,7 +1344,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray4D(__pyx_t_6coge
  */
   (__pyx_v_dims[1]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":108
+  /* "../../include/numerical_pyrex.pyx":108
  *     dims[0] = w
  *     dims[1] = x
  *     dims[2] = y             # <<<<<<<<<<<<<<
@@ -1349,7 +1353,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray4D(__pyx_t_6coge
  */
   (__pyx_v_dims[2]) = __pyx_v_y;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":109
+  /* "../../include/numerical_pyrex.pyx":109
  *     dims[1] = x
  *     dims[2] = y
  *     dims[3] = z             # <<<<<<<<<<<<<<
@@ -1358,7 +1362,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray4D(__pyx_t_6coge
  */
   (__pyx_v_dims[3]) = __pyx_v_z;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":110
+  /* "../../include/numerical_pyrex.pyx":110
  *     dims[2] = y
  *     dims[3] = z
  *     return checkArray(a, typecode, size, 4, dims)             # <<<<<<<<<<<<<<
@@ -1379,7 +1383,7 @@ static  void *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArray4D(__pyx_t_6coge
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":113
+/* "../../include/numerical_pyrex.pyx":113
  * 
  * 
  * cdef double * checkArrayDouble1D(ArrayType a, int *x) except NULL:             # <<<<<<<<<<<<<<
@@ -1392,7 +1396,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble1D(__pyx
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble1D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":114
+  /* "../../include/numerical_pyrex.pyx":114
  * 
  * cdef double * checkArrayDouble1D(ArrayType a, int *x) except NULL:
  *     return <double *> checkArray1D(a, c'f', sizeof(double), x)             # <<<<<<<<<<<<<<
@@ -1413,7 +1417,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble1D(__pyx
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":116
+/* "../../include/numerical_pyrex.pyx":116
  *     return <double *> checkArray1D(a, c'f', sizeof(double), x)
  * 
  * cdef double * checkArrayDouble2D(ArrayType a, int *x, int *y) except NULL:             # <<<<<<<<<<<<<<
@@ -1426,7 +1430,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble2D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":117
+  /* "../../include/numerical_pyrex.pyx":117
  * 
  * cdef double * checkArrayDouble2D(ArrayType a, int *x, int *y) except NULL:
  *     return <double *> checkArray2D(a, c'f', sizeof(double), x, y)             # <<<<<<<<<<<<<<
@@ -1447,7 +1451,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":119
+/* "../../include/numerical_pyrex.pyx":119
  *     return <double *> checkArray2D(a, c'f', sizeof(double), x, y)
  * 
  * cdef double * checkArrayDouble3D(ArrayType a, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1460,7 +1464,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble3D(__pyx
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":120
+  /* "../../include/numerical_pyrex.pyx":120
  * 
  * cdef double * checkArrayDouble3D(ArrayType a, int *x, int *y, int *z) except NULL:
  *     return <double *> checkArray3D(a, c'f', sizeof(double), x, y, z)             # <<<<<<<<<<<<<<
@@ -1481,7 +1485,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble3D(__pyx
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":122
+/* "../../include/numerical_pyrex.pyx":122
  *     return <double *> checkArray3D(a, c'f', sizeof(double), x, y, z)
  * 
  * cdef double * checkArrayDouble4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1494,7 +1498,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble4D(__pyx
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble4D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":123
+  /* "../../include/numerical_pyrex.pyx":123
  * 
  * cdef double * checkArrayDouble4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:
  *     return <double *> checkArray4D(a, c'f', sizeof(double), w, x, y, z)             # <<<<<<<<<<<<<<
@@ -1515,7 +1519,7 @@ static  double *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble4D(__pyx
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":126
+/* "../../include/numerical_pyrex.pyx":126
  * 
  * 
  * cdef long * checkArrayLong1D(ArrayType a, int *x) except NULL:             # <<<<<<<<<<<<<<
@@ -1528,7 +1532,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_t_6
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong1D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":127
+  /* "../../include/numerical_pyrex.pyx":127
  * 
  * cdef long * checkArrayLong1D(ArrayType a, int *x) except NULL:
  *     return <long *> checkArray1D(a, c'i', sizeof(long), x)             # <<<<<<<<<<<<<<
@@ -1549,7 +1553,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_t_6
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":129
+/* "../../include/numerical_pyrex.pyx":129
  *     return <long *> checkArray1D(a, c'i', sizeof(long), x)
  * 
  * cdef long * checkArrayLong2D(ArrayType a, int *x, int *y) except NULL:             # <<<<<<<<<<<<<<
@@ -1562,7 +1566,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(__pyx_t_6
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong2D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":130
+  /* "../../include/numerical_pyrex.pyx":130
  * 
  * cdef long * checkArrayLong2D(ArrayType a, int *x, int *y) except NULL:
  *     return <long *> checkArray2D(a, c'i', sizeof(long), x, y)             # <<<<<<<<<<<<<<
@@ -1583,7 +1587,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(__pyx_t_6
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":132
+/* "../../include/numerical_pyrex.pyx":132
  *     return <long *> checkArray2D(a, c'i', sizeof(long), x, y)
  * 
  * cdef long * checkArrayLong3D(ArrayType a, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1596,7 +1600,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong3D(__pyx_t_6
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":133
+  /* "../../include/numerical_pyrex.pyx":133
  * 
  * cdef long * checkArrayLong3D(ArrayType a, int *x, int *y, int *z) except NULL:
  *     return <long *> checkArray3D(a, c'i', sizeof(long), x, y, z)             # <<<<<<<<<<<<<<
@@ -1617,7 +1621,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong3D(__pyx_t_6
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":135
+/* "../../include/numerical_pyrex.pyx":135
  *     return <long *> checkArray3D(a, c'i', sizeof(long), x, y, z)
  * 
  * cdef long * checkArrayLong4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1629,7 +1633,7 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong4D(__pyx_t_6
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong4D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":136
+  /* "../../include/numerical_pyrex.pyx":136
  * 
  * cdef long * checkArrayLong4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:
  *     return <long *> checkArray4D(a, c'i', sizeof(long), w, x, y, z)             # <<<<<<<<<<<<<<
@@ -1648,9 +1652,117 @@ static  long *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong4D(__pyx_t_6
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":33
+/* "/root/package/cogent/align/_pairwise_seqs.pyx":33
  * #    return <unsigned int *> checkArray3D(a, c'i', sizeof(int), x, y, z)
  * 
+ * cdef int cmax(int a, int b):             # <<<<<<<<<<<<<<
+ *     if a > b:
+ *         return a
+ */
+
+static  int __pyx_f_6cogent_5align_14_pairwise_seqs_cmax(int __pyx_v_a, int __pyx_v_b) {
+  int __pyx_r;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("cmax");
+
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":34
+ * 
+ * cdef int cmax(int a, int b):
+ *     if a > b:             # <<<<<<<<<<<<<<
+ *         return a
+ *     else:
+ */
+  __pyx_t_1 = (__pyx_v_a > __pyx_v_b);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":35
+ * cdef int cmax(int a, int b):
+ *     if a > b:
+ *         return a             # <<<<<<<<<<<<<<
+ *     else:
+ *         return b
+ */
+    __pyx_r = __pyx_v_a;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":37
+ *         return a
+ *     else:
+ *         return b             # <<<<<<<<<<<<<<
+ * 
+ * cdef int cmin(int a, int b):
+ */
+    __pyx_r = __pyx_v_b;
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cogent/align/_pairwise_seqs.pyx":39
+ *         return b
+ * 
+ * cdef int cmin(int a, int b):             # <<<<<<<<<<<<<<
+ *     if a < b:
+ *         return a
+ */
+
+static  int __pyx_f_6cogent_5align_14_pairwise_seqs_cmin(int __pyx_v_a, int __pyx_v_b) {
+  int __pyx_r;
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("cmin");
+
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":40
+ * 
+ * cdef int cmin(int a, int b):
+ *     if a < b:             # <<<<<<<<<<<<<<
+ *         return a
+ *     else:
+ */
+  __pyx_t_1 = (__pyx_v_a < __pyx_v_b);
+  if (__pyx_t_1) {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":41
+ * cdef int cmin(int a, int b):
+ *     if a < b:
+ *         return a             # <<<<<<<<<<<<<<
+ *     else:
+ *         return b
+ */
+    __pyx_r = __pyx_v_a;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":43
+ *         return a
+ *     else:
+ *         return b             # <<<<<<<<<<<<<<
+ * 
+ * cdef unsigned char * checkArrayUChar3D(ArrayType a, int *x, int *y, int *z) except NULL:
+ */
+    __pyx_r = __pyx_v_b;
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cogent/align/_pairwise_seqs.pyx":45
+ *         return b
+ * 
  * cdef unsigned char * checkArrayUChar3D(ArrayType a, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
  *     return <unsigned char *> checkArray3D(a, c'i', sizeof(char), x, y, z)
  * 
@@ -1661,14 +1773,14 @@ static  unsigned char *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayUChar3D
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayUChar3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":34
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":46
  * 
  * cdef unsigned char * checkArrayUChar3D(ArrayType a, int *x, int *y, int *z) except NULL:
  *     return <unsigned char *> checkArray3D(a, c'i', sizeof(char), x, y, z)             # <<<<<<<<<<<<<<
  * 
  * def fmpt(mantissa, exponent, msg=''):
  */
-  __pyx_t_1 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_v_a, 'i', (sizeof(char)), __pyx_v_x, __pyx_v_y, __pyx_v_z); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 34; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArray3D(__pyx_v_a, 'i', (sizeof(char)), __pyx_v_x, __pyx_v_y, __pyx_v_z); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_r = ((unsigned char *)__pyx_t_1);
   goto __pyx_L0;
 
@@ -1682,7 +1794,7 @@ static  unsigned char *__pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayUChar3D
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":36
+/* "/root/package/cogent/align/_pairwise_seqs.pyx":48
  *     return <unsigned char *> checkArray3D(a, c'i', sizeof(char), x, y, z)
  * 
  * def fmpt(mantissa, exponent, msg=''):             # <<<<<<<<<<<<<<
@@ -1721,7 +1833,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__exponent);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("fmpt", 0, 2, 3, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("fmpt", 0, 2, 3, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       if (kw_args > 0) {
@@ -1730,7 +1842,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "fmpt") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "fmpt") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_mantissa = values[0];
     __pyx_v_exponent = values[1];
@@ -1749,13 +1861,13 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fmpt", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("fmpt", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cogent.align._pairwise_seqs.fmpt");
   return NULL;
   __pyx_L4_argument_unpacking_done:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":37
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":49
  * 
  * def fmpt(mantissa, exponent, msg=''):
  *     return "%s * SCALE_STEP ** %s %s" % (mantissa, exponent, msg)             # <<<<<<<<<<<<<<
@@ -1763,7 +1875,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
  * def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_mantissa);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_mantissa);
@@ -1774,7 +1886,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
   __Pyx_INCREF(__pyx_v_msg);
   PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_msg);
   __Pyx_GIVEREF(__pyx_v_msg);
-  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
@@ -1794,7 +1906,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":39
+/* "/root/package/cogent/align/_pairwise_seqs.pyx":51
  *     return "%s * SCALE_STEP ** %s %s" % (mantissa, exponent, msg)
  * 
  * def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,             # <<<<<<<<<<<<<<
@@ -1803,7 +1915,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_fmpt(PyObject *__pyx_s
  */
 
 static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_6cogent_5align_14_pairwise_seqs_calc_rows[] = "The faster, sequence only (no POG) version.  Forward or Viterbi \n    algorithm, with doubles or with slower but practically unoverflowable \n    (double, long) GMP-like numbers.  Viterbi is also available in the ever \n    popular addition-of-logs version.  All this with any possible pair HMM \n    transition matrix.\n        \n    Limitations\n       - HMM states must be in a sensible order: M and X, then Y, then END.\n    ";
+static char __pyx_doc_6cogent_5align_14_pairwise_seqs_calc_rows[] = "The faster, sequence only (no POG) version.  Forward or Viterbi \n    algorithm, with doubles or with slower but practically unoverflowable \n    (double, long) GMP-like numbers.  Viterbi is also available in the ever \n    popular addition-of-logs version.  All this with any possible pair HMM \n    transition matrix.\n        \n    If 'bands' is given it is a [row, (low, high)] array limiting the\n    columns calculated in each row, and cells outside it are impossible.\n    Each row of 'track' then starts at the low column of that row's band.\n        \n    Limitations\n       - HMM states must be in a sensible order: M and X, then Y, then END.\n    ";
 static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   __pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType __pyx_v_plan = 0;
   __pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType __pyx_v_seq1_index = 0;
@@ -1825,6 +1937,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   int __pyx_v_use_logs;
   int __pyx_v_local;
   int __pyx_v_use_scaling;
+  PyObject *__pyx_v_bands = 0;
   int __pyx_v_dx;
   int __pyx_v_dy;
   int __pyx_v_prev_j;
@@ -1878,12 +1991,19 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   int __pyx_v_max_y;
   int __pyx_v_row_count;
   int __pyx_v_plan_index2;
+  int __pyx_v_row_j_low;
+  int __pyx_v_row_j_high;
+  int __pyx_v_track_width;
+  int __pyx_v_track_offset;
+  int __pyx_v_source_states;
+  long *__pyx_v_band_data;
   PyObject *__pyx_v_mantissas;
   PyObject *__pyx_v_exponents;
   int __pyx_v_bin_count;
   int __pyx_v_bin;
   double *__pyx_v_xgap_score_data;
   double *__pyx_v_ygap_score_data;
+  int __pyx_v_two;
   double __pyx_v_impossible;
   PyObject *__pyx_v_plan_index1;
   PyObject *__pyx_v_score;
@@ -1908,13 +2028,23 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   int __pyx_t_18;
   double __pyx_t_19;
   int __pyx_t_20;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__plan,&__pyx_n_s__seq1_index,&__pyx_n_s__seq2_index,&__pyx_n_s__i_low,&__pyx_n_s__i_high,&__pyx_n_s__j_low,&__pyx_n_s__j_high,&__pyx_n_s__preds,&__pyx_n_s__state_directions,&__pyx_n_s__T,&__pyx_n_s__xgap_scores,&__pyx_n_s__ygap_scores,&__pyx_n_s__match_scores,&__pyx_n_s__rows,&__pyx_n_s__track,&__pyx_n_s__track_enc,&__pyx_n_s__viterbi,&__pyx_n_s__use_logs,&__pyx_n_s__local,&__pyx_n_s__use_scaling,0};
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__plan,&__pyx_n_s__seq1_index,&__pyx_n_s__seq2_index,&__pyx_n_s__i_low,&__pyx_n_s__i_high,&__pyx_n_s__j_low,&__pyx_n_s__j_high,&__pyx_n_s__preds,&__pyx_n_s__state_directions,&__pyx_n_s__T,&__pyx_n_s__xgap_scores,&__pyx_n_s__ygap_scores,&__pyx_n_s__match_scores,&__pyx_n_s__rows,&__pyx_n_s__track,&__pyx_n_s__track_enc,&__pyx_n_s__viterbi,&__pyx_n_s__use_logs,&__pyx_n_s__local,&__pyx_n_s__use_scaling,&__pyx_n_s__bands,0};
   __Pyx_RefNannySetupContext("calc_rows");
   __pyx_self = __pyx_self;
   if (unlikely(__pyx_kwds)) {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":56
+ *         ArrayType xgap_scores, ArrayType ygap_scores, ArrayType match_scores,
+ *         rows, track, track_enc, int viterbi, int use_logs=0, int local=False,
+ *         int use_scaling=True, bands=None):             # <<<<<<<<<<<<<<
+ * 
+ *     """The faster, sequence only (no POG) version.  Forward or Viterbi
+ */
     Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[20] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+    PyObject* values[21] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+    values[20] = ((PyObject *)Py_None);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case 21: values[20] = PyTuple_GET_ITEM(__pyx_args, 20);
       case 20: values[19] = PyTuple_GET_ITEM(__pyx_args, 19);
       case 19: values[18] = PyTuple_GET_ITEM(__pyx_args, 18);
       case 18: values[17] = PyTuple_GET_ITEM(__pyx_args, 17);
@@ -1947,97 +2077,97 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__seq1_index);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__seq2_index);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
       values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__i_low);
       if (likely(values[3])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 3); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 3); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  4:
       values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__i_high);
       if (likely(values[4])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 4); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 4); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  5:
       values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__j_low);
       if (likely(values[5])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 5); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 5); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  6:
       values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__j_high);
       if (likely(values[6])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 6); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 6); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  7:
       values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__preds);
       if (likely(values[7])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 7); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 7); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  8:
       values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__state_directions);
       if (likely(values[8])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 8); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 8); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  9:
       values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__T);
       if (likely(values[9])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 9); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 9); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 10:
       values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__xgap_scores);
       if (likely(values[10])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 10); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 10); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 11:
       values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__ygap_scores);
       if (likely(values[11])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 11); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 11); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 12:
       values[12] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__match_scores);
       if (likely(values[12])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 12); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 12); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 13:
       values[13] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__rows);
       if (likely(values[13])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 13); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 13); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 14:
       values[14] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__track);
       if (likely(values[14])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 14); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 14); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 15:
       values[15] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__track_enc);
       if (likely(values[15])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 15); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 15); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 16:
       values[16] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__viterbi);
       if (likely(values[16])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, 16); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, 16); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case 17:
       if (kw_args > 0) {
@@ -2054,17 +2184,22 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__use_scaling);
         if (unlikely(value)) { values[19] = value; kw_args--; }
       }
+      case 20:
+      if (kw_args > 0) {
+        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__bands);
+        if (unlikely(value)) { values[20] = value; kw_args--; }
+      }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "calc_rows") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "calc_rows") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_plan = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)values[0]);
     __pyx_v_seq1_index = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)values[1]);
     __pyx_v_seq2_index = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)values[2]);
-    __pyx_v_i_low = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_i_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i_high = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_i_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_j_low = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_j_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_j_high = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_j_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_i_low = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_i_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_i_high = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_i_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_j_low = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_j_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_j_high = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_j_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_preds = values[7];
     __pyx_v_state_directions = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)values[8]);
     __pyx_v_T = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)values[9]);
@@ -2074,67 +2209,71 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_v_rows = values[13];
     __pyx_v_track = values[14];
     __pyx_v_track_enc = values[15];
-    __pyx_v_viterbi = __Pyx_PyInt_AsInt(values[16]); if (unlikely((__pyx_v_viterbi == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_viterbi = __Pyx_PyInt_AsInt(values[16]); if (unlikely((__pyx_v_viterbi == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     if (values[17]) {
-      __pyx_v_use_logs = __Pyx_PyInt_AsInt(values[17]); if (unlikely((__pyx_v_use_logs == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_use_logs = __Pyx_PyInt_AsInt(values[17]); if (unlikely((__pyx_v_use_logs == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
       __pyx_v_use_logs = ((int)0);
     }
     if (values[18]) {
-      __pyx_v_local = __Pyx_PyInt_AsInt(values[18]); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_local = __Pyx_PyInt_AsInt(values[18]); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":43
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":55
  *         ArrayType state_directions, ArrayType T,
  *         ArrayType xgap_scores, ArrayType ygap_scores, ArrayType match_scores,
  *         rows, track, track_enc, int viterbi, int use_logs=0, int local=False,             # <<<<<<<<<<<<<<
- *         int use_scaling=True):
+ *         int use_scaling=True, bands=None):
  * 
  */
       __pyx_v_local = ((int)0);
     }
     if (values[19]) {
-      __pyx_v_use_scaling = __Pyx_PyInt_AsInt(values[19]); if (unlikely((__pyx_v_use_scaling == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_use_scaling = __Pyx_PyInt_AsInt(values[19]); if (unlikely((__pyx_v_use_scaling == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     } else {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":44
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":56
  *         ArrayType xgap_scores, ArrayType ygap_scores, ArrayType match_scores,
  *         rows, track, track_enc, int viterbi, int use_logs=0, int local=False,
- *         int use_scaling=True):             # <<<<<<<<<<<<<<
+ *         int use_scaling=True, bands=None):             # <<<<<<<<<<<<<<
  * 
  *     """The faster, sequence only (no POG) version.  Forward or Viterbi
  */
       __pyx_v_use_scaling = ((int)1);
     }
+    __pyx_v_bands = values[20];
   } else {
     __pyx_v_use_logs = ((int)0);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":43
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":55
  *         ArrayType state_directions, ArrayType T,
  *         ArrayType xgap_scores, ArrayType ygap_scores, ArrayType match_scores,
  *         rows, track, track_enc, int viterbi, int use_logs=0, int local=False,             # <<<<<<<<<<<<<<
- *         int use_scaling=True):
+ *         int use_scaling=True, bands=None):
  * 
  */
     __pyx_v_local = ((int)0);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":44
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":56
  *         ArrayType xgap_scores, ArrayType ygap_scores, ArrayType match_scores,
  *         rows, track, track_enc, int viterbi, int use_logs=0, int local=False,
- *         int use_scaling=True):             # <<<<<<<<<<<<<<
+ *         int use_scaling=True, bands=None):             # <<<<<<<<<<<<<<
  * 
  *     """The faster, sequence only (no POG) version.  Forward or Viterbi
  */
     __pyx_v_use_scaling = ((int)1);
+    __pyx_v_bands = ((PyObject *)Py_None);
     switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case 21:
+      __pyx_v_bands = PyTuple_GET_ITEM(__pyx_args, 20);
       case 20:
-      __pyx_v_use_scaling = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 19)); if (unlikely((__pyx_v_use_scaling == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_use_scaling = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 19)); if (unlikely((__pyx_v_use_scaling == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case 19:
-      __pyx_v_local = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 18)); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_local = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 18)); if (unlikely((__pyx_v_local == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case 18:
-      __pyx_v_use_logs = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 17)); if (unlikely((__pyx_v_use_logs == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_use_logs = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 17)); if (unlikely((__pyx_v_use_logs == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       case 17:
-      __pyx_v_viterbi = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 16)); if (unlikely((__pyx_v_viterbi == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_viterbi = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 16)); if (unlikely((__pyx_v_viterbi == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       __pyx_v_track_enc = PyTuple_GET_ITEM(__pyx_args, 15);
       __pyx_v_track = PyTuple_GET_ITEM(__pyx_args, 14);
       __pyx_v_rows = PyTuple_GET_ITEM(__pyx_args, 13);
@@ -2144,10 +2283,10 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
       __pyx_v_T = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)PyTuple_GET_ITEM(__pyx_args, 9));
       __pyx_v_state_directions = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)PyTuple_GET_ITEM(__pyx_args, 8));
       __pyx_v_preds = PyTuple_GET_ITEM(__pyx_args, 7);
-      __pyx_v_j_high = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_j_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_j_low = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_j_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_i_high = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_i_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_i_low = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_i_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_j_high = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_j_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_j_low = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_j_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_i_high = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_i_high == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      __pyx_v_i_low = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_i_low == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       __pyx_v_seq2_index = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)PyTuple_GET_ITEM(__pyx_args, 2));
       __pyx_v_seq1_index = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)PyTuple_GET_ITEM(__pyx_args, 1));
       __pyx_v_plan = ((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)PyTuple_GET_ITEM(__pyx_args, 0));
@@ -2157,7 +2296,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 20, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("calc_rows", 0, 17, 21, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cogent.align._pairwise_seqs.calc_rows");
   return NULL;
@@ -2174,13 +2313,14 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __Pyx_INCREF(__pyx_v_rows);
   __Pyx_INCREF(__pyx_v_track);
   __Pyx_INCREF(__pyx_v_track_enc);
+  __Pyx_INCREF(__pyx_v_bands);
   __pyx_v_mantissas = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_exponents = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_plan_index1 = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_score = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":77
- *     cdef int row_count, row_length1, plan_index, plan_index2
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":95
+ *     cdef long *band_data
  * 
  *     (mantissas, exponents) = rows             # <<<<<<<<<<<<<<
  * 
@@ -2197,13 +2337,13 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_v_exponents = __pyx_t_2;
     __pyx_t_2 = 0;
   } else {
-    __pyx_t_3 = PyObject_GetIter(__pyx_v_rows); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetIter(__pyx_v_rows); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_3, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_3, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_3, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_3, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    if (__Pyx_EndUnpack(__pyx_t_3) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (__Pyx_EndUnpack(__pyx_t_3) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 95; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_v_mantissas);
     __pyx_v_mantissas = __pyx_t_1;
@@ -2213,7 +2353,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_t_2 = 0;
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":79
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":97
  *     (mantissas, exponents) = rows
  * 
  *     assert not (use_logs and not viterbi)             # <<<<<<<<<<<<<<
@@ -2229,11 +2369,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   }
   if (unlikely(!(!__pyx_t_5))) {
     PyErr_SetNone(PyExc_AssertionError);
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 79; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   #endif
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":80
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":98
  * 
  *     assert not (use_logs and not viterbi)
  *     assert not (use_logs and use_scaling)             # <<<<<<<<<<<<<<
@@ -2248,11 +2388,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   }
   if (unlikely(!(!__pyx_t_5))) {
     PyErr_SetNone(PyExc_AssertionError);
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   #endif
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":81
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":99
  *     assert not (use_logs and not viterbi)
  *     assert not (use_logs and use_scaling)
  *     assert not (local and not viterbi)             # <<<<<<<<<<<<<<
@@ -2268,11 +2408,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   }
   if (unlikely(!(!__pyx_t_4))) {
     PyErr_SetNone(PyExc_AssertionError);
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   #endif
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":83
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":101
  *     assert not (local and not viterbi)
  * 
  *     N = 0             # <<<<<<<<<<<<<<
@@ -2281,17 +2421,17 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_N = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":84
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":102
  * 
  *     N = 0
  *     T_data = checkArrayDouble2D(T, &N, &N)             # <<<<<<<<<<<<<<
  *     row_length = 0
  *     row_count = 0
  */
-  __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx_v_T, (&__pyx_v_N), (&__pyx_v_N)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx_v_T, (&__pyx_v_N), (&__pyx_v_N)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_T_data = __pyx_t_6;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":85
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":103
  *     N = 0
  *     T_data = checkArrayDouble2D(T, &N, &N)
  *     row_length = 0             # <<<<<<<<<<<<<<
@@ -2300,7 +2440,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_row_length = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":86
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":104
  *     T_data = checkArrayDouble2D(T, &N, &N)
  *     row_length = 0
  *     row_count = 0             # <<<<<<<<<<<<<<
@@ -2309,17 +2449,17 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_row_count = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":87
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":105
  *     row_length = 0
  *     row_count = 0
  *     plan_data = checkArrayLong1D(plan, &row_count)             # <<<<<<<<<<<<<<
  * 
  *     dest_states = 0
  */
-  __pyx_t_7 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_v_plan, (&__pyx_v_row_count)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_v_plan, (&__pyx_v_row_count)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_plan_data = __pyx_t_7;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":89
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":107
  *     plan_data = checkArrayLong1D(plan, &row_count)
  * 
  *     dest_states = 0             # <<<<<<<<<<<<<<
@@ -2328,7 +2468,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_dest_states = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":90
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":108
  * 
  *     dest_states = 0
  *     d4 = 4             # <<<<<<<<<<<<<<
@@ -2337,37 +2477,37 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_d4 = 4;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":92
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":110
  *     d4 = 4
  *     # Array of (state, bin, dx, dy) tuples describing the HMM states.
  *     dest_states_data = checkArrayLong2D(state_directions, &dest_states, &d4)             # <<<<<<<<<<<<<<
  * 
  *     cdef int bin_count, bin
  */
-  __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(__pyx_v_state_directions, (&__pyx_v_dest_states), (&__pyx_v_d4)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(__pyx_v_state_directions, (&__pyx_v_dest_states), (&__pyx_v_d4)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_dest_states_data = __pyx_t_8;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":97
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":115
  *     cdef double *xgap_score_data, *ygap_score_data
  * 
  *     x_index = checkArrayLong1D(seq1_index, &row_count)             # <<<<<<<<<<<<<<
  *     y_index = checkArrayLong1D(seq2_index, &row_length)
  * 
  */
-  __pyx_t_7 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_v_seq1_index, (&__pyx_v_row_count)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_v_seq1_index, (&__pyx_v_row_count)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_x_index = __pyx_t_7;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":98
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":116
  * 
  *     x_index = checkArrayLong1D(seq1_index, &row_count)
  *     y_index = checkArrayLong1D(seq2_index, &row_length)             # <<<<<<<<<<<<<<
  * 
  *     max_x = max_y = bin_count = 0
  */
-  __pyx_t_7 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_v_seq2_index, (&__pyx_v_row_length)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_7 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong1D(__pyx_v_seq2_index, (&__pyx_v_row_length)); if (unlikely(__pyx_t_7 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_y_index = __pyx_t_7;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":100
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":118
  *     y_index = checkArrayLong1D(seq2_index, &row_length)
  * 
  *     max_x = max_y = bin_count = 0             # <<<<<<<<<<<<<<
@@ -2378,37 +2518,37 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_v_max_y = 0;
   __pyx_v_bin_count = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":102
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":120
  *     max_x = max_y = bin_count = 0
  *     match_score_data = checkArrayDouble3D(
  *             match_scores, &bin_count, &max_x, &max_y)             # <<<<<<<<<<<<<<
  *     xgap_score_data = checkArrayDouble2D(xgap_scores, &bin_count, &max_x)
  *     ygap_score_data = checkArrayDouble2D(ygap_scores, &bin_count, &max_y)
  */
-  __pyx_t_9 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble3D(__pyx_v_match_scores, (&__pyx_v_bin_count), (&__pyx_v_max_x), (&__pyx_v_max_y)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_9 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble3D(__pyx_v_match_scores, (&__pyx_v_bin_count), (&__pyx_v_max_x), (&__pyx_v_max_y)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_match_score_data = __pyx_t_9;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":103
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":121
  *     match_score_data = checkArrayDouble3D(
  *             match_scores, &bin_count, &max_x, &max_y)
  *     xgap_score_data = checkArrayDouble2D(xgap_scores, &bin_count, &max_x)             # <<<<<<<<<<<<<<
  *     ygap_score_data = checkArrayDouble2D(ygap_scores, &bin_count, &max_y)
  * 
  */
-  __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx_v_xgap_scores, (&__pyx_v_bin_count), (&__pyx_v_max_x)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx_v_xgap_scores, (&__pyx_v_bin_count), (&__pyx_v_max_x)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_xgap_score_data = __pyx_t_6;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":104
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":122
  *             match_scores, &bin_count, &max_x, &max_y)
  *     xgap_score_data = checkArrayDouble2D(xgap_scores, &bin_count, &max_x)
  *     ygap_score_data = checkArrayDouble2D(ygap_scores, &bin_count, &max_y)             # <<<<<<<<<<<<<<
  * 
  *     for i from 0 <= i < row_count:
  */
-  __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx_v_ygap_scores, (&__pyx_v_bin_count), (&__pyx_v_max_y)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(__pyx_v_ygap_scores, (&__pyx_v_bin_count), (&__pyx_v_max_y)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_ygap_score_data = __pyx_t_6;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":106
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":124
  *     ygap_score_data = checkArrayDouble2D(ygap_scores, &bin_count, &max_y)
  * 
  *     for i from 0 <= i < row_count:             # <<<<<<<<<<<<<<
@@ -2418,7 +2558,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_t_10 = __pyx_v_row_count;
   for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_10; __pyx_v_i++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":107
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":125
  * 
  *     for i from 0 <= i < row_count:
  *         assert 0 <= x_index[i] < max_x             # <<<<<<<<<<<<<<
@@ -2433,12 +2573,12 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     }
     if (unlikely(!__pyx_t_4)) {
       PyErr_SetNone(PyExc_AssertionError);
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     #endif
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":108
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":126
  *     for i from 0 <= i < row_count:
  *         assert 0 <= x_index[i] < max_x
  *     for j from 0 <= j < row_length:             # <<<<<<<<<<<<<<
@@ -2448,7 +2588,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_t_10 = __pyx_v_row_length;
   for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_10; __pyx_v_j++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":109
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":127
  *         assert 0 <= x_index[i] < max_x
  *     for j from 0 <= j < row_length:
  *         assert 0 <= y_index[j] < max_y             # <<<<<<<<<<<<<<
@@ -2463,17 +2603,17 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     }
     if (unlikely(!__pyx_t_4)) {
       PyErr_SetNone(PyExc_AssertionError);
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     #endif
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":111
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":129
  *         assert 0 <= y_index[j] < max_y
  * 
  *     assert j_low >= 0 and j_high > j_low and j_high <= row_length             # <<<<<<<<<<<<<<
  * 
- *     cdef double impossible
+ *     cdef int two
  */
   #ifndef PYREX_WITHOUT_ASSERTIONS
   __pyx_t_4 = (__pyx_v_j_low >= 0);
@@ -2491,11 +2631,72 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   }
   if (unlikely(!__pyx_t_5)) {
     PyErr_SetNone(PyExc_AssertionError);
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   #endif
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":114
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":132
+ * 
+ *     cdef int two
+ *     if bands is not None:             # <<<<<<<<<<<<<<
+ *         two = 2
+ *         band_data = checkArrayLong2D(bands, &row_count, &two)
+ */
+  __pyx_t_5 = (__pyx_v_bands != Py_None);
+  if (__pyx_t_5) {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":133
+ *     cdef int two
+ *     if bands is not None:
+ *         two = 2             # <<<<<<<<<<<<<<
+ *         band_data = checkArrayLong2D(bands, &row_count, &two)
+ *         track_width = 0
+ */
+    __pyx_v_two = 2;
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":134
+ *     if bands is not None:
+ *         two = 2
+ *         band_data = checkArrayLong2D(bands, &row_count, &two)             # <<<<<<<<<<<<<<
+ *         track_width = 0
+ *     else:
+ */
+    __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_v_bands), (&__pyx_v_row_count), (&__pyx_v_two)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_band_data = __pyx_t_8;
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":135
+ *         two = 2
+ *         band_data = checkArrayLong2D(bands, &row_count, &two)
+ *         track_width = 0             # <<<<<<<<<<<<<<
+ *     else:
+ *         band_data = NULL
+ */
+    __pyx_v_track_width = 0;
+    goto __pyx_L10;
+  }
+  /*else*/ {
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":137
+ *         track_width = 0
+ *     else:
+ *         band_data = NULL             # <<<<<<<<<<<<<<
+ *         track_width = row_length
+ * 
+ */
+    __pyx_v_band_data = NULL;
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":138
+ *     else:
+ *         band_data = NULL
+ *         track_width = row_length             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double impossible
+ */
+    __pyx_v_track_width = __pyx_v_row_length;
+  }
+  __pyx_L10:;
+
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":141
  * 
  *     cdef double impossible
  *     if use_logs:             # <<<<<<<<<<<<<<
@@ -2505,7 +2706,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_t_10 = __pyx_v_use_logs;
   if (__pyx_t_10) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":115
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":142
  *     cdef double impossible
  *     if use_logs:
  *         impossible = log(0.0) # -inf             # <<<<<<<<<<<<<<
@@ -2513,11 +2714,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *         impossible = 0.0
  */
     __pyx_v_impossible = log(0.0);
-    goto __pyx_L10;
+    goto __pyx_L11;
   }
   /*else*/ {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":117
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":144
  *         impossible = log(0.0) # -inf
  *     else:
  *         impossible = 0.0             # <<<<<<<<<<<<<<
@@ -2526,13 +2727,13 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_impossible = 0.0;
   }
-  __pyx_L10:;
+  __pyx_L11:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":119
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":146
  *         impossible = 0.0
  * 
  *     if viterbi and track is not None and track_enc is not None:             # <<<<<<<<<<<<<<
- *         track_data = checkArrayUChar3D(track, &row_count, &row_length, &N)
+ *         track_data = checkArrayUChar3D(track, &row_count, &track_width, &N)
  *         (tcode_x, tcode_y, tcode_s) = track_enc
  */
   if (__pyx_v_viterbi) {
@@ -2549,19 +2750,19 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   }
   if (__pyx_t_5) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":120
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":147
  * 
  *     if viterbi and track is not None and track_enc is not None:
- *         track_data = checkArrayUChar3D(track, &row_count, &row_length, &N)             # <<<<<<<<<<<<<<
+ *         track_data = checkArrayUChar3D(track, &row_count, &track_width, &N)             # <<<<<<<<<<<<<<
  *         (tcode_x, tcode_y, tcode_s) = track_enc
  *     else:
  */
-    __pyx_t_14 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayUChar3D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_v_track), (&__pyx_v_row_count), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_14 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayUChar3D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_v_track), (&__pyx_v_row_count), (&__pyx_v_track_width), (&__pyx_v_N)); if (unlikely(__pyx_t_14 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_track_data = __pyx_t_14;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":121
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":148
  *     if viterbi and track is not None and track_enc is not None:
- *         track_data = checkArrayUChar3D(track, &row_count, &row_length, &N)
+ *         track_data = checkArrayUChar3D(track, &row_count, &track_width, &N)
  *         (tcode_x, tcode_y, tcode_s) = track_enc             # <<<<<<<<<<<<<<
  *     else:
  *         track_data = NULL
@@ -2569,43 +2770,43 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     if (PyTuple_CheckExact(__pyx_v_track_enc) && likely(PyTuple_GET_SIZE(__pyx_v_track_enc) == 3)) {
       PyObject* tuple = __pyx_v_track_enc;
       __pyx_t_2 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_10 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_10 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_t_1 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_15 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_15 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_15 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_15 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __pyx_t_3 = PyTuple_GET_ITEM(tuple, 2); __Pyx_INCREF(__pyx_t_3);
-      __pyx_t_16 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_16 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_tcode_x = __pyx_t_10;
       __pyx_v_tcode_y = __pyx_t_15;
       __pyx_v_tcode_s = __pyx_t_16;
     } else {
-      __pyx_t_17 = PyObject_GetIter(__pyx_v_track_enc); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_17 = PyObject_GetIter(__pyx_v_track_enc); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_17);
-      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_17, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_17, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_16 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_16 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_17, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_17, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_15 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_15 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_15 = __Pyx_PyInt_AsInt(__pyx_t_1); if (unlikely((__pyx_t_15 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_17, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_17, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_10 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_10 = __Pyx_PyInt_AsInt(__pyx_t_3); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (__Pyx_EndUnpack(__pyx_t_17) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (__Pyx_EndUnpack(__pyx_t_17) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
       __pyx_v_tcode_x = __pyx_t_16;
       __pyx_v_tcode_y = __pyx_t_15;
       __pyx_v_tcode_s = __pyx_t_10;
     }
-    goto __pyx_L11;
+    goto __pyx_L12;
   }
   /*else*/ {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":123
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":150
  *         (tcode_x, tcode_y, tcode_s) = track_enc
  *     else:
  *         track_data = NULL             # <<<<<<<<<<<<<<
@@ -2614,7 +2815,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_track_data = NULL;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":124
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":151
  *     else:
  *         track_data = NULL
  *         tcode_x = tcode_y = tcode_s = 0             # <<<<<<<<<<<<<<
@@ -2625,9 +2826,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_v_tcode_y = 0;
     __pyx_v_tcode_s = 0;
   }
-  __pyx_L11:;
+  __pyx_L12:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":127
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":154
  * 
  *     # For local
  *     overall_max_exponent = MIN_SCALE             # <<<<<<<<<<<<<<
@@ -2636,7 +2837,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_overall_max_exponent = __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":128
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":155
  *     # For local
  *     overall_max_exponent = MIN_SCALE
  *     overall_max_mantissa = impossible             # <<<<<<<<<<<<<<
@@ -2645,7 +2846,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
   __pyx_v_overall_max_mantissa = __pyx_v_impossible;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":129
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":156
  *     overall_max_exponent = MIN_SCALE
  *     overall_max_mantissa = impossible
  *     last_i = last_j = last_state = -1             # <<<<<<<<<<<<<<
@@ -2656,7 +2857,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_v_last_j = -1;
   __pyx_v_last_state = -1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":131
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":158
  *     last_i = last_j = last_state = -1
  * 
  *     for i from i_low <= i < i_high:             # <<<<<<<<<<<<<<
@@ -2666,7 +2867,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_t_10 = __pyx_v_i_high;
   for (__pyx_v_i = __pyx_v_i_low; __pyx_v_i < __pyx_t_10; __pyx_v_i++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":132
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":159
  * 
  *     for i from i_low <= i < i_high:
  *         x = x_index[i]             # <<<<<<<<<<<<<<
@@ -2675,7 +2876,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_x = (__pyx_v_x_index[__pyx_v_i]);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":134
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":161
  *         x = x_index[i]
  * 
  *         if PyErr_CheckSignals():             # <<<<<<<<<<<<<<
@@ -2685,36 +2886,36 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_t_15 = PyErr_CheckSignals();
     if (__pyx_t_15) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":135
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":162
  * 
  *         if PyErr_CheckSignals():
  *             raise PyErr_Occurred()             # <<<<<<<<<<<<<<
  * 
  *         plan_index1 = plan_data[i]
  */
-      __pyx_t_3 = PyErr_Occurred(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyErr_Occurred(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L14;
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L15;
     }
-    __pyx_L14:;
+    __pyx_L15:;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":137
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":164
  *             raise PyErr_Occurred()
  * 
  *         plan_index1 = plan_data[i]             # <<<<<<<<<<<<<<
  *         if i > 0:
  *             plan_index2 = plan_data[i-1]
  */
-    __pyx_t_3 = PyInt_FromLong((__pyx_v_plan_data[__pyx_v_i])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyInt_FromLong((__pyx_v_plan_data[__pyx_v_i])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_v_plan_index1);
     __pyx_v_plan_index1 = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":138
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":165
  * 
  *         plan_index1 = plan_data[i]
  *         if i > 0:             # <<<<<<<<<<<<<<
@@ -2724,7 +2925,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_t_5 = (__pyx_v_i > 0);
     if (__pyx_t_5) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":139
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":166
  *         plan_index1 = plan_data[i]
  *         if i > 0:
  *             plan_index2 = plan_data[i-1]             # <<<<<<<<<<<<<<
@@ -2732,11 +2933,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *             prev_row_data = NULL
  */
       __pyx_v_plan_index2 = (__pyx_v_plan_data[(__pyx_v_i - 1)]);
-      goto __pyx_L15;
+      goto __pyx_L16;
     }
     /*else*/ {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":141
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":168
  *             plan_index2 = plan_data[i-1]
  *         else:
  *             prev_row_data = NULL             # <<<<<<<<<<<<<<
@@ -2745,22 +2946,22 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
       __pyx_v_prev_row_data = NULL;
     }
-    __pyx_L15:;
+    __pyx_L16:;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":142
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":169
  *         else:
  *             prev_row_data = NULL
  *         current_row_data = checkArrayDouble2D(mantissas[plan_index1], &row_length, &N)             # <<<<<<<<<<<<<<
  *         if use_scaling:
  *             current_row_ex_data = checkArrayLong2D(exponents[plan_index1], &row_length, &N)
  */
-    __pyx_t_3 = PyObject_GetItem(__pyx_v_mantissas, __pyx_v_plan_index1); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyObject_GetItem(__pyx_v_mantissas, __pyx_v_plan_index1); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_v_current_row_data = __pyx_t_6;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":143
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":170
  *             prev_row_data = NULL
  *         current_row_data = checkArrayDouble2D(mantissas[plan_index1], &row_length, &N)
  *         if use_scaling:             # <<<<<<<<<<<<<<
@@ -2770,23 +2971,23 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_t_15 = __pyx_v_use_scaling;
     if (__pyx_t_15) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":144
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":171
  *         current_row_data = checkArrayDouble2D(mantissas[plan_index1], &row_length, &N)
  *         if use_scaling:
  *             current_row_ex_data = checkArrayLong2D(exponents[plan_index1], &row_length, &N)             # <<<<<<<<<<<<<<
  *         if i > 0:
  *             prev_row_data = checkArrayDouble2D(mantissas[plan_index2], &row_length, &N)
  */
-      __pyx_t_3 = PyObject_GetItem(__pyx_v_exponents, __pyx_v_plan_index1); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyObject_GetItem(__pyx_v_exponents, __pyx_v_plan_index1); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_current_row_ex_data = __pyx_t_8;
-      goto __pyx_L16;
+      goto __pyx_L17;
     }
-    __pyx_L16:;
+    __pyx_L17:;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":145
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":172
  *         if use_scaling:
  *             current_row_ex_data = checkArrayLong2D(exponents[plan_index1], &row_length, &N)
  *         if i > 0:             # <<<<<<<<<<<<<<
@@ -2796,20 +2997,20 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
     __pyx_t_5 = (__pyx_v_i > 0);
     if (__pyx_t_5) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":146
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":173
  *             current_row_ex_data = checkArrayLong2D(exponents[plan_index1], &row_length, &N)
  *         if i > 0:
  *             prev_row_data = checkArrayDouble2D(mantissas[plan_index2], &row_length, &N)             # <<<<<<<<<<<<<<
  *             if use_scaling:
  *                 prev_row_ex_data = checkArrayLong2D(exponents[plan_index2], &row_length, &N)
  */
-      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_mantissas, __pyx_v_plan_index2, sizeof(int), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_mantissas, __pyx_v_plan_index2, sizeof(int), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_6 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayDouble2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_6 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 173; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_v_prev_row_data = __pyx_t_6;
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":147
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":174
  *         if i > 0:
  *             prev_row_data = checkArrayDouble2D(mantissas[plan_index2], &row_length, &N)
  *             if use_scaling:             # <<<<<<<<<<<<<<
@@ -2819,37 +3020,106 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
       __pyx_t_15 = __pyx_v_use_scaling;
       if (__pyx_t_15) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":148
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":175
  *             prev_row_data = checkArrayDouble2D(mantissas[plan_index2], &row_length, &N)
  *             if use_scaling:
  *                 prev_row_ex_data = checkArrayLong2D(exponents[plan_index2], &row_length, &N)             # <<<<<<<<<<<<<<
  * 
  *         #for prev_state from 1 <= prev_state < N:
  */
-        __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_exponents, __pyx_v_plan_index2, sizeof(int), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_exponents, __pyx_v_plan_index2, sizeof(int), PyInt_FromLong); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_8 = __pyx_f_6cogent_5align_14_pairwise_seqs_checkArrayLong2D(((__pyx_t_6cogent_5align_14_pairwise_seqs_ArrayType)__pyx_t_3), (&__pyx_v_row_length), (&__pyx_v_N)); if (unlikely(__pyx_t_8 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __pyx_v_prev_row_ex_data = __pyx_t_8;
-        goto __pyx_L18;
+        goto __pyx_L19;
       }
-      __pyx_L18:;
-      goto __pyx_L17;
+      __pyx_L19:;
+      goto __pyx_L18;
     }
-    __pyx_L17:;
+    __pyx_L18:;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":153
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":180
  *         #    current_row_data[0*N+prev_state] = impossible
  * 
- *         for j from j_low <= j < j_high:             # <<<<<<<<<<<<<<
+ *         if band_data != NULL:             # <<<<<<<<<<<<<<
+ *             row_j_low = cmax(j_low, band_data[2*i])
+ *             row_j_high = cmin(j_high, band_data[2*i+1])
+ */
+    __pyx_t_5 = (__pyx_v_band_data != NULL);
+    if (__pyx_t_5) {
+
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":181
+ * 
+ *         if band_data != NULL:
+ *             row_j_low = cmax(j_low, band_data[2*i])             # <<<<<<<<<<<<<<
+ *             row_j_high = cmin(j_high, band_data[2*i+1])
+ *             track_offset = band_data[2*i]
+ */
+      __pyx_v_row_j_low = __pyx_f_6cogent_5align_14_pairwise_seqs_cmax(__pyx_v_j_low, (__pyx_v_band_data[(2 * __pyx_v_i)]));
+
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":182
+ *         if band_data != NULL:
+ *             row_j_low = cmax(j_low, band_data[2*i])
+ *             row_j_high = cmin(j_high, band_data[2*i+1])             # <<<<<<<<<<<<<<
+ *             track_offset = band_data[2*i]
+ *         else:
+ */
+      __pyx_v_row_j_high = __pyx_f_6cogent_5align_14_pairwise_seqs_cmin(__pyx_v_j_high, (__pyx_v_band_data[((2 * __pyx_v_i) + 1)]));
+
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":183
+ *             row_j_low = cmax(j_low, band_data[2*i])
+ *             row_j_high = cmin(j_high, band_data[2*i+1])
+ *             track_offset = band_data[2*i]             # <<<<<<<<<<<<<<
+ *         else:
+ *             row_j_low = j_low
+ */
+      __pyx_v_track_offset = (__pyx_v_band_data[(2 * __pyx_v_i)]);
+      goto __pyx_L20;
+    }
+    /*else*/ {
+
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":185
+ *             track_offset = band_data[2*i]
+ *         else:
+ *             row_j_low = j_low             # <<<<<<<<<<<<<<
+ *             row_j_high = j_high
+ *             track_offset = 0
+ */
+      __pyx_v_row_j_low = __pyx_v_j_low;
+
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":186
+ *         else:
+ *             row_j_low = j_low
+ *             row_j_high = j_high             # <<<<<<<<<<<<<<
+ *             track_offset = 0
+ * 
+ */
+      __pyx_v_row_j_high = __pyx_v_j_high;
+
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":187
+ *             row_j_low = j_low
+ *             row_j_high = j_high
+ *             track_offset = 0             # <<<<<<<<<<<<<<
+ * 
+ *         for j from row_j_low <= j < row_j_high:
+ */
+      __pyx_v_track_offset = 0;
+    }
+    __pyx_L20:;
+
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":189
+ *             track_offset = 0
+ * 
+ *         for j from row_j_low <= j < row_j_high:             # <<<<<<<<<<<<<<
  * 
  *             for dest_state from 0 <= dest_state < dest_states:
  */
-    __pyx_t_15 = __pyx_v_j_high;
-    for (__pyx_v_j = __pyx_v_j_low; __pyx_v_j < __pyx_t_15; __pyx_v_j++) {
+    __pyx_t_15 = __pyx_v_row_j_high;
+    for (__pyx_v_j = __pyx_v_row_j_low; __pyx_v_j < __pyx_t_15; __pyx_v_j++) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":155
- *         for j from j_low <= j < j_high:
+      /* "/root/package/cogent/align/_pairwise_seqs.pyx":191
+ *         for j from row_j_low <= j < row_j_high:
  * 
  *             for dest_state from 0 <= dest_state < dest_states:             # <<<<<<<<<<<<<<
  *                 state = dest_states_data[dest_state*4+0]
@@ -2858,7 +3128,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
       __pyx_t_16 = __pyx_v_dest_states;
       for (__pyx_v_dest_state = 0; __pyx_v_dest_state < __pyx_t_16; __pyx_v_dest_state++) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":156
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":192
  * 
  *             for dest_state from 0 <= dest_state < dest_states:
  *                 state = dest_states_data[dest_state*4+0]             # <<<<<<<<<<<<<<
@@ -2867,7 +3137,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_state = (__pyx_v_dest_states_data[((__pyx_v_dest_state * 4) + 0)]);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":157
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":193
  *             for dest_state from 0 <= dest_state < dest_states:
  *                 state = dest_states_data[dest_state*4+0]
  *                 bin = dest_states_data[dest_state*4+1]             # <<<<<<<<<<<<<<
@@ -2876,7 +3146,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_bin = (__pyx_v_dest_states_data[((__pyx_v_dest_state * 4) + 1)]);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":158
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":194
  *                 state = dest_states_data[dest_state*4+0]
  *                 bin = dest_states_data[dest_state*4+1]
  *                 dx = dest_states_data[dest_state*4+2]             # <<<<<<<<<<<<<<
@@ -2885,7 +3155,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_dx = (__pyx_v_dest_states_data[((__pyx_v_dest_state * 4) + 2)]);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":159
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":195
  *                 bin = dest_states_data[dest_state*4+1]
  *                 dx = dest_states_data[dest_state*4+2]
  *                 dy = dest_states_data[dest_state*4+3]             # <<<<<<<<<<<<<<
@@ -2894,7 +3164,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_dy = (__pyx_v_dest_states_data[((__pyx_v_dest_state * 4) + 3)]);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":161
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":197
  *                 dy = dest_states_data[dest_state*4+3]
  * 
  *                 max_mantissa = impossible             # <<<<<<<<<<<<<<
@@ -2903,7 +3173,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_max_mantissa = __pyx_v_impossible;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":162
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":198
  * 
  *                 max_mantissa = impossible
  *                 max_exponent = MIN_SCALE             # <<<<<<<<<<<<<<
@@ -2912,7 +3182,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_max_exponent = __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":163
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":199
  *                 max_mantissa = impossible
  *                 max_exponent = MIN_SCALE
  *                 partial_sum = 0.0             # <<<<<<<<<<<<<<
@@ -2921,7 +3191,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_partial_sum = 0.0;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":164
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":200
  *                 max_exponent = MIN_SCALE
  *                 partial_sum = 0.0
  *                 pointer_state = N  # ie ERROR             # <<<<<<<<<<<<<<
@@ -2930,7 +3200,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_pointer_state = __pyx_v_N;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":166
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":202
  *                 pointer_state = N  # ie ERROR
  * 
  *                 a = dx             # <<<<<<<<<<<<<<
@@ -2939,7 +3209,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_a = __pyx_v_dx;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":167
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":203
  * 
  *                 a = dx
  *                 b = dy             # <<<<<<<<<<<<<<
@@ -2948,7 +3218,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_b = __pyx_v_dy;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":169
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":205
  *                 b = dy
  * 
  *                 if dx:             # <<<<<<<<<<<<<<
@@ -2958,7 +3228,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_dx;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":170
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":206
  * 
  *                 if dx:
  *                     source_i = i - 1             # <<<<<<<<<<<<<<
@@ -2967,7 +3237,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_source_i = (__pyx_v_i - 1);
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":171
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":207
  *                 if dx:
  *                     source_i = i - 1
  *                     source_row_data = prev_row_data             # <<<<<<<<<<<<<<
@@ -2976,7 +3246,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_source_row_data = __pyx_v_prev_row_data;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":172
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":208
  *                     source_i = i - 1
  *                     source_row_data = prev_row_data
  *                     source_row_ex_data = prev_row_ex_data             # <<<<<<<<<<<<<<
@@ -2984,11 +3254,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                     source_i = i
  */
           __pyx_v_source_row_ex_data = __pyx_v_prev_row_ex_data;
-          goto __pyx_L23;
+          goto __pyx_L25;
         }
         /*else*/ {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":174
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":210
  *                     source_row_ex_data = prev_row_ex_data
  *                 else:
  *                     source_i = i             # <<<<<<<<<<<<<<
@@ -2997,7 +3267,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_source_i = __pyx_v_i;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":175
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":211
  *                 else:
  *                     source_i = i
  *                     source_row_data = current_row_data             # <<<<<<<<<<<<<<
@@ -3006,7 +3276,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_source_row_data = __pyx_v_current_row_data;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":176
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":212
  *                     source_i = i
  *                     source_row_data = current_row_data
  *                     source_row_ex_data = current_row_ex_data             # <<<<<<<<<<<<<<
@@ -3015,9 +3285,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_source_row_ex_data = __pyx_v_current_row_ex_data;
         }
-        __pyx_L23:;
+        __pyx_L25:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":178
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":214
  *                     source_row_ex_data = current_row_ex_data
  * 
  *                 prev_j = j - dy             # <<<<<<<<<<<<<<
@@ -3026,7 +3296,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         __pyx_v_prev_j = (__pyx_v_j - __pyx_v_dy);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":179
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":215
  * 
  *                 prev_j = j - dy
  *                 if prev_j < 0:             # <<<<<<<<<<<<<<
@@ -3036,19 +3306,19 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_5 = (__pyx_v_prev_j < 0);
         if (__pyx_t_5) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":180
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":216
  *                 prev_j = j - dy
  *                 if prev_j < 0:
  *                     continue             # <<<<<<<<<<<<<<
  * 
  *                 if source_i < 0:
  */
-          goto __pyx_L21_continue;
-          goto __pyx_L24;
+          goto __pyx_L23_continue;
+          goto __pyx_L26;
         }
-        __pyx_L24:;
+        __pyx_L26:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":182
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":218
  *                     continue
  * 
  *                 if source_i < 0:             # <<<<<<<<<<<<<<
@@ -3058,20 +3328,71 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_5 = (__pyx_v_source_i < 0);
         if (__pyx_t_5) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":183
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":219
  * 
  *                 if source_i < 0:
  *                     continue             # <<<<<<<<<<<<<<
  * 
+ *                 # source cells outside the band were never calculated
+ */
+          goto __pyx_L23_continue;
+          goto __pyx_L27;
+        }
+        __pyx_L27:;
+
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":222
+ * 
+ *                 # source cells outside the band were never calculated
+ *                 source_states = N             # <<<<<<<<<<<<<<
+ *                 if band_data != NULL and (prev_j < band_data[2*source_i] or
+ *                         prev_j >= band_data[2*source_i+1]):
+ */
+        __pyx_v_source_states = __pyx_v_N;
+
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":223
+ *                 # source cells outside the band were never calculated
+ *                 source_states = N
+ *                 if band_data != NULL and (prev_j < band_data[2*source_i] or             # <<<<<<<<<<<<<<
+ *                         prev_j >= band_data[2*source_i+1]):
+ *                     source_states = 1
+ */
+        __pyx_t_5 = (__pyx_v_band_data != NULL);
+        if (__pyx_t_5) {
+          __pyx_t_13 = (__pyx_v_prev_j < (__pyx_v_band_data[(2 * __pyx_v_source_i)]));
+          if (!__pyx_t_13) {
+
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":224
+ *                 source_states = N
+ *                 if band_data != NULL and (prev_j < band_data[2*source_i] or
+ *                         prev_j >= band_data[2*source_i+1]):             # <<<<<<<<<<<<<<
+ *                     source_states = 1
+ * 
+ */
+            __pyx_t_4 = (__pyx_v_prev_j >= (__pyx_v_band_data[((2 * __pyx_v_source_i) + 1)]));
+            __pyx_t_12 = __pyx_t_4;
+          } else {
+            __pyx_t_12 = __pyx_t_13;
+          }
+          __pyx_t_13 = __pyx_t_12;
+        } else {
+          __pyx_t_13 = __pyx_t_5;
+        }
+        if (__pyx_t_13) {
+
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":225
+ *                 if band_data != NULL and (prev_j < band_data[2*source_i] or
+ *                         prev_j >= band_data[2*source_i+1]):
+ *                     source_states = 1             # <<<<<<<<<<<<<<
+ * 
  *                 if (local and dx and dy) or (prev_j == 0 and source_i == 0):
  */
-          goto __pyx_L21_continue;
-          goto __pyx_L25;
+          __pyx_v_source_states = 1;
+          goto __pyx_L28;
         }
-        __pyx_L25:;
+        __pyx_L28:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":185
- *                     continue
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":227
+ *                     source_states = 1
  * 
  *                 if (local and dx and dy) or (prev_j == 0 and source_i == 0):             # <<<<<<<<<<<<<<
  *                     partial_sum = max_mantissa = T_data[0*N+state]
@@ -3079,29 +3400,29 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         if (__pyx_v_local) {
           if (__pyx_v_dx) {
-            __pyx_t_5 = __pyx_v_dy;
+            __pyx_t_13 = __pyx_v_dy;
           } else {
-            __pyx_t_5 = __pyx_v_dx;
+            __pyx_t_13 = __pyx_v_dx;
           }
-          __pyx_t_13 = __pyx_t_5;
+          __pyx_t_5 = __pyx_t_13;
         } else {
-          __pyx_t_13 = __pyx_v_local;
+          __pyx_t_5 = __pyx_v_local;
         }
-        if (!__pyx_t_13) {
-          __pyx_t_5 = (__pyx_v_prev_j == 0);
-          if (__pyx_t_5) {
-            __pyx_t_4 = (__pyx_v_source_i == 0);
-            __pyx_t_12 = __pyx_t_4;
+        if (!__pyx_t_5) {
+          __pyx_t_13 = (__pyx_v_prev_j == 0);
+          if (__pyx_t_13) {
+            __pyx_t_12 = (__pyx_v_source_i == 0);
+            __pyx_t_4 = __pyx_t_12;
           } else {
-            __pyx_t_12 = __pyx_t_5;
+            __pyx_t_4 = __pyx_t_13;
           }
-          __pyx_t_5 = __pyx_t_12;
+          __pyx_t_13 = __pyx_t_4;
         } else {
-          __pyx_t_5 = __pyx_t_13;
+          __pyx_t_13 = __pyx_t_5;
         }
-        if (__pyx_t_5) {
+        if (__pyx_t_13) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":186
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":228
  * 
  *                 if (local and dx and dy) or (prev_j == 0 and source_i == 0):
  *                     partial_sum = max_mantissa = T_data[0*N+state]             # <<<<<<<<<<<<<<
@@ -3112,7 +3433,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
           __pyx_v_partial_sum = __pyx_t_19;
           __pyx_v_max_mantissa = __pyx_t_19;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":187
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":229
  *                 if (local and dx and dy) or (prev_j == 0 and source_i == 0):
  *                     partial_sum = max_mantissa = T_data[0*N+state]
  *                     max_exponent = 0             # <<<<<<<<<<<<<<
@@ -3121,7 +3442,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_max_exponent = 0;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":188
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":230
  *                     partial_sum = max_mantissa = T_data[0*N+state]
  *                     max_exponent = 0
  *                     pointer_state = 0             # <<<<<<<<<<<<<<
@@ -3130,7 +3451,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_pointer_state = 0;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":189
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":231
  *                     max_exponent = 0
  *                     pointer_state = 0
  *                     pointer_a = a             # <<<<<<<<<<<<<<
@@ -3139,7 +3460,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_pointer_a = __pyx_v_a;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":190
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":232
  *                     pointer_state = 0
  *                     pointer_a = a
  *                     pointer_b = b             # <<<<<<<<<<<<<<
@@ -3147,49 +3468,49 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                 if use_scaling:
  */
           __pyx_v_pointer_b = __pyx_v_b;
-          goto __pyx_L26;
+          goto __pyx_L29;
         }
-        __pyx_L26:;
+        __pyx_L29:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":192
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":234
  *                     pointer_b = b
  * 
  *                 if use_scaling:             # <<<<<<<<<<<<<<
  *                             sub_partial_sum = 0.0
- *                             for prev_state from 1 <= prev_state < N:
+ *                             for prev_state from 1 <= prev_state < source_states:
  */
         __pyx_t_18 = __pyx_v_use_scaling;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":193
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":235
  * 
  *                 if use_scaling:
  *                             sub_partial_sum = 0.0             # <<<<<<<<<<<<<<
- *                             for prev_state from 1 <= prev_state < N:
+ *                             for prev_state from 1 <= prev_state < source_states:
  *                                 index = prev_j*N + prev_state
  */
           __pyx_v_sub_partial_sum = 0.0;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":194
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":236
  *                 if use_scaling:
  *                             sub_partial_sum = 0.0
- *                             for prev_state from 1 <= prev_state < N:             # <<<<<<<<<<<<<<
+ *                             for prev_state from 1 <= prev_state < source_states:             # <<<<<<<<<<<<<<
  *                                 index = prev_j*N + prev_state
  * 
  */
-          __pyx_t_18 = __pyx_v_N;
+          __pyx_t_18 = __pyx_v_source_states;
           for (__pyx_v_prev_state = 1; __pyx_v_prev_state < __pyx_t_18; __pyx_v_prev_state++) {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":195
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":237
  *                             sub_partial_sum = 0.0
- *                             for prev_state from 1 <= prev_state < N:
+ *                             for prev_state from 1 <= prev_state < source_states:
  *                                 index = prev_j*N + prev_state             # <<<<<<<<<<<<<<
  * 
  *                                 exponent = source_row_ex_data[index]
  */
             __pyx_v_index = ((__pyx_v_prev_j * __pyx_v_N) + __pyx_v_prev_state);
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":197
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":239
  *                                 index = prev_j*N + prev_state
  * 
  *                                 exponent = source_row_ex_data[index]             # <<<<<<<<<<<<<<
@@ -3198,29 +3519,29 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_exponent = (__pyx_v_source_row_ex_data[__pyx_v_index]);
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":198
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":240
  * 
  *                                 exponent = source_row_ex_data[index]
  *                                 if exponent == MIN_SCALE:             # <<<<<<<<<<<<<<
  *                                     continue
  * 
  */
-            __pyx_t_5 = (__pyx_v_exponent == __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE);
-            if (__pyx_t_5) {
+            __pyx_t_13 = (__pyx_v_exponent == __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE);
+            if (__pyx_t_13) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":199
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":241
  *                                 exponent = source_row_ex_data[index]
  *                                 if exponent == MIN_SCALE:
  *                                     continue             # <<<<<<<<<<<<<<
  * 
  *                                 mantissa = (source_row_data[index]
  */
-              goto __pyx_L28_continue;
-              goto __pyx_L30;
+              goto __pyx_L31_continue;
+              goto __pyx_L33;
             }
-            __pyx_L30:;
+            __pyx_L33:;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":202
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":244
  * 
  *                                 mantissa = (source_row_data[index]
  *                                      * T_data[prev_state*N+state])             # <<<<<<<<<<<<<<
@@ -3229,72 +3550,72 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_mantissa = ((__pyx_v_source_row_data[__pyx_v_index]) * (__pyx_v_T_data[((__pyx_v_prev_state * __pyx_v_N) + __pyx_v_state)]));
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":204
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":246
  *                                      * T_data[prev_state*N+state])
  * 
  *                                 if mantissa < MIN_FLOAT_VALUE:             # <<<<<<<<<<<<<<
  *                                     if mantissa == 0.0:
  *                                         continue
  */
-            __pyx_t_5 = (__pyx_v_mantissa < __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE);
-            if (__pyx_t_5) {
+            __pyx_t_13 = (__pyx_v_mantissa < __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE);
+            if (__pyx_t_13) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":205
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":247
  * 
  *                                 if mantissa < MIN_FLOAT_VALUE:
  *                                     if mantissa == 0.0:             # <<<<<<<<<<<<<<
  *                                         continue
  *                                     if mantissa < 0.0:
  */
-              __pyx_t_5 = (__pyx_v_mantissa == 0.0);
-              if (__pyx_t_5) {
+              __pyx_t_13 = (__pyx_v_mantissa == 0.0);
+              if (__pyx_t_13) {
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":206
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":248
  *                                 if mantissa < MIN_FLOAT_VALUE:
  *                                     if mantissa == 0.0:
  *                                         continue             # <<<<<<<<<<<<<<
  *                                     if mantissa < 0.0:
  *                                         if T_data[prev_state*N+state] < 0.0:
  */
-                goto __pyx_L28_continue;
-                goto __pyx_L32;
+                goto __pyx_L31_continue;
+                goto __pyx_L35;
               }
-              __pyx_L32:;
+              __pyx_L35:;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":207
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":249
  *                                     if mantissa == 0.0:
  *                                         continue
  *                                     if mantissa < 0.0:             # <<<<<<<<<<<<<<
  *                                         if T_data[prev_state*N+state] < 0.0:
  *                                             raise ArithmeticError(fmpt(mantissa, exponent,
  */
-              __pyx_t_5 = (__pyx_v_mantissa < 0.0);
-              if (__pyx_t_5) {
+              __pyx_t_13 = (__pyx_v_mantissa < 0.0);
+              if (__pyx_t_13) {
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":208
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":250
  *                                         continue
  *                                     if mantissa < 0.0:
  *                                         if T_data[prev_state*N+state] < 0.0:             # <<<<<<<<<<<<<<
  *                                             raise ArithmeticError(fmpt(mantissa, exponent,
  *                                                     "transition is a negative probability"))
  */
-                __pyx_t_5 = ((__pyx_v_T_data[((__pyx_v_prev_state * __pyx_v_N) + __pyx_v_state)]) < 0.0);
-                if (__pyx_t_5) {
+                __pyx_t_13 = ((__pyx_v_T_data[((__pyx_v_prev_state * __pyx_v_N) + __pyx_v_state)]) < 0.0);
+                if (__pyx_t_13) {
 
-                  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":209
+                  /* "/root/package/cogent/align/_pairwise_seqs.pyx":251
  *                                     if mantissa < 0.0:
  *                                         if T_data[prev_state*N+state] < 0.0:
  *                                             raise ArithmeticError(fmpt(mantissa, exponent,             # <<<<<<<<<<<<<<
  *                                                     "transition is a negative probability"))
  *                                         raise ArithmeticError(fmpt(mantissa, exponent,
  */
-                  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_3);
-                  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_1);
-                  __pyx_t_2 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_2 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_2);
-                  __pyx_t_17 = PyTuple_New(3); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_17 = PyTuple_New(3); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_17);
                   PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_1);
                   __Pyx_GIVEREF(__pyx_t_1);
@@ -3305,39 +3626,39 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
                   __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
                   __pyx_t_1 = 0;
                   __pyx_t_2 = 0;
-                  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_2);
                   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                   __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-                  __pyx_t_17 = PyTuple_New(1); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_17 = PyTuple_New(1); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_17);
                   PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_2);
                   __Pyx_GIVEREF(__pyx_t_2);
                   __pyx_t_2 = 0;
-                  __pyx_t_2 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_2 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_2);
                   __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
                   __Pyx_Raise(__pyx_t_2, 0, 0);
                   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                  {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                  goto __pyx_L34;
+                  {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  goto __pyx_L37;
                 }
-                __pyx_L34:;
+                __pyx_L37:;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":211
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":253
  *                                             raise ArithmeticError(fmpt(mantissa, exponent,
  *                                                     "transition is a negative probability"))
  *                                         raise ArithmeticError(fmpt(mantissa, exponent,             # <<<<<<<<<<<<<<
  *                                                 "product is a negative probability"))
  *                                     while mantissa < MIN_FLOAT_VALUE:
  */
-                __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_17 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_17 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_17);
-                __pyx_t_3 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_3 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_3);
-                __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_1);
                 PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_17);
                 __Pyx_GIVEREF(__pyx_t_17);
@@ -3348,26 +3669,26 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
                 __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_11));
                 __pyx_t_17 = 0;
                 __pyx_t_3 = 0;
-                __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_1);
                 PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
                 __Pyx_GIVEREF(__pyx_t_3);
                 __pyx_t_3 = 0;
-                __pyx_t_3 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_3 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 __Pyx_Raise(__pyx_t_3, 0, 0);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                goto __pyx_L33;
+                {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                goto __pyx_L36;
               }
-              __pyx_L33:;
+              __pyx_L36:;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":213
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":255
  *                                         raise ArithmeticError(fmpt(mantissa, exponent,
  *                                                 "product is a negative probability"))
  *                                     while mantissa < MIN_FLOAT_VALUE:             # <<<<<<<<<<<<<<
@@ -3375,10 +3696,10 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                         exponent += -1
  */
               while (1) {
-                __pyx_t_5 = (__pyx_v_mantissa < __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE);
-                if (!__pyx_t_5) break;
+                __pyx_t_13 = (__pyx_v_mantissa < __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE);
+                if (!__pyx_t_13) break;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":214
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":256
  *                                                 "product is a negative probability"))
  *                                     while mantissa < MIN_FLOAT_VALUE:
  *                                         mantissa *= SCALE_STEP             # <<<<<<<<<<<<<<
@@ -3387,7 +3708,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
                 __pyx_v_mantissa *= __pyx_v_6cogent_5align_14_pairwise_seqs_SCALE_STEP;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":215
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":257
  *                                     while mantissa < MIN_FLOAT_VALUE:
  *                                         mantissa *= SCALE_STEP
  *                                         exponent += -1             # <<<<<<<<<<<<<<
@@ -3396,30 +3717,30 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
                 __pyx_v_exponent += -1;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":216
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":258
  *                                         mantissa *= SCALE_STEP
  *                                         exponent += -1
  *                                         if exponent <= MIN_SCALE:             # <<<<<<<<<<<<<<
  *                                           raise ArithmeticError(fmpt(mantissa, exponent,
  *                                                 "underflows"))
  */
-                __pyx_t_5 = (__pyx_v_exponent <= __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE);
-                if (__pyx_t_5) {
+                __pyx_t_13 = (__pyx_v_exponent <= __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE);
+                if (__pyx_t_13) {
 
-                  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":217
+                  /* "/root/package/cogent/align/_pairwise_seqs.pyx":259
  *                                         exponent += -1
  *                                         if exponent <= MIN_SCALE:
  *                                           raise ArithmeticError(fmpt(mantissa, exponent,             # <<<<<<<<<<<<<<
  *                                                 "underflows"))
  * 
  */
-                  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_3 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_3);
-                  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_1);
-                  __pyx_t_2 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_2 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_2);
-                  __pyx_t_17 = PyTuple_New(3); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_17 = PyTuple_New(3); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_17);
                   PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_1);
                   __Pyx_GIVEREF(__pyx_t_1);
@@ -3430,39 +3751,39 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
                   __Pyx_GIVEREF(((PyObject *)__pyx_n_s__underflows));
                   __pyx_t_1 = 0;
                   __pyx_t_2 = 0;
-                  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_2 = PyObject_Call(__pyx_t_3, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_2);
                   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
                   __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-                  __pyx_t_17 = PyTuple_New(1); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_17 = PyTuple_New(1); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_17);
                   PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_2);
                   __Pyx_GIVEREF(__pyx_t_2);
                   __pyx_t_2 = 0;
-                  __pyx_t_2 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  __pyx_t_2 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_17, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                   __Pyx_GOTREF(__pyx_t_2);
                   __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
                   __Pyx_Raise(__pyx_t_2, 0, 0);
                   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                  {__pyx_filename = __pyx_f[1]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                  goto __pyx_L37;
+                  {__pyx_filename = __pyx_f[1]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                  goto __pyx_L40;
                 }
-                __pyx_L37:;
+                __pyx_L40:;
               }
-              goto __pyx_L31;
+              goto __pyx_L34;
             }
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":220
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":262
  *                                                 "underflows"))
  * 
  *                                 elif mantissa > 1.0:             # <<<<<<<<<<<<<<
  *                                     mantissa *= MIN_FLOAT_VALUE
  *                                     exponent += 1
  */
-            __pyx_t_5 = (__pyx_v_mantissa > 1.0);
-            if (__pyx_t_5) {
+            __pyx_t_13 = (__pyx_v_mantissa > 1.0);
+            if (__pyx_t_13) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":221
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":263
  * 
  *                                 elif mantissa > 1.0:
  *                                     mantissa *= MIN_FLOAT_VALUE             # <<<<<<<<<<<<<<
@@ -3471,7 +3792,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_mantissa *= __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":222
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":264
  *                                 elif mantissa > 1.0:
  *                                     mantissa *= MIN_FLOAT_VALUE
  *                                     exponent += 1             # <<<<<<<<<<<<<<
@@ -3480,30 +3801,30 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_exponent += 1;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":223
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":265
  *                                     mantissa *= MIN_FLOAT_VALUE
  *                                     exponent += 1
  *                                     if exponent > MAX_SCALE:             # <<<<<<<<<<<<<<
  *                                         raise ArithmeticError(fmpt(mantissa, exponent,
  *                                             "is unexpectedly large"))
  */
-              __pyx_t_5 = (__pyx_v_exponent > __pyx_v_6cogent_5align_14_pairwise_seqs_MAX_SCALE);
-              if (__pyx_t_5) {
+              __pyx_t_13 = (__pyx_v_exponent > __pyx_v_6cogent_5align_14_pairwise_seqs_MAX_SCALE);
+              if (__pyx_t_13) {
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":224
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":266
  *                                     exponent += 1
  *                                     if exponent > MAX_SCALE:
  *                                         raise ArithmeticError(fmpt(mantissa, exponent,             # <<<<<<<<<<<<<<
  *                                             "is unexpectedly large"))
  * 
  */
-                __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__fmpt); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_17 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_17 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_17);
-                __pyx_t_3 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_3 = PyInt_FromLong(__pyx_v_exponent); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_3);
-                __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_1);
                 PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_17);
                 __Pyx_GIVEREF(__pyx_t_17);
@@ -3514,49 +3835,49 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
                 __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_12));
                 __pyx_t_17 = 0;
                 __pyx_t_3 = 0;
-                __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_3 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_1);
                 PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
                 __Pyx_GIVEREF(__pyx_t_3);
                 __pyx_t_3 = 0;
-                __pyx_t_3 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                __pyx_t_3 = PyObject_Call(__pyx_builtin_ArithmeticError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
                 __Pyx_GOTREF(__pyx_t_3);
                 __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
                 __Pyx_Raise(__pyx_t_3, 0, 0);
                 __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                {__pyx_filename = __pyx_f[1]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-                goto __pyx_L38;
+                {__pyx_filename = __pyx_f[1]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+                goto __pyx_L41;
               }
-              __pyx_L38:;
-              goto __pyx_L31;
+              __pyx_L41:;
+              goto __pyx_L34;
             }
-            __pyx_L31:;
+            __pyx_L34:;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":227
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":269
  *                                             "is unexpectedly large"))
  * 
  *                                 if exponent > max_exponent:             # <<<<<<<<<<<<<<
  *                                     if exponent == max_exponent + 1:
  *                                         sub_partial_sum = partial_sum
  */
-            __pyx_t_5 = (__pyx_v_exponent > __pyx_v_max_exponent);
-            if (__pyx_t_5) {
+            __pyx_t_13 = (__pyx_v_exponent > __pyx_v_max_exponent);
+            if (__pyx_t_13) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":228
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":270
  * 
  *                                 if exponent > max_exponent:
  *                                     if exponent == max_exponent + 1:             # <<<<<<<<<<<<<<
  *                                         sub_partial_sum = partial_sum
  *                                     else:
  */
-              __pyx_t_5 = (__pyx_v_exponent == (__pyx_v_max_exponent + 1));
-              if (__pyx_t_5) {
+              __pyx_t_13 = (__pyx_v_exponent == (__pyx_v_max_exponent + 1));
+              if (__pyx_t_13) {
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":229
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":271
  *                                 if exponent > max_exponent:
  *                                     if exponent == max_exponent + 1:
  *                                         sub_partial_sum = partial_sum             # <<<<<<<<<<<<<<
@@ -3564,11 +3885,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                         sub_partial_sum = 0.0
  */
                 __pyx_v_sub_partial_sum = __pyx_v_partial_sum;
-                goto __pyx_L40;
+                goto __pyx_L43;
               }
               /*else*/ {
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":231
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":273
  *                                         sub_partial_sum = partial_sum
  *                                     else:
  *                                         sub_partial_sum = 0.0             # <<<<<<<<<<<<<<
@@ -3577,9 +3898,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
                 __pyx_v_sub_partial_sum = 0.0;
               }
-              __pyx_L40:;
+              __pyx_L43:;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":232
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":274
  *                                     else:
  *                                         sub_partial_sum = 0.0
  *                                     partial_sum = 0.0             # <<<<<<<<<<<<<<
@@ -3588,7 +3909,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_partial_sum = 0.0;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":233
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":275
  *                                         sub_partial_sum = 0.0
  *                                     partial_sum = 0.0
  *                                     max_mantissa = 0.0             # <<<<<<<<<<<<<<
@@ -3597,7 +3918,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_max_mantissa = 0.0;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":234
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":276
  *                                     partial_sum = 0.0
  *                                     max_mantissa = 0.0
  *                                     max_exponent = exponent             # <<<<<<<<<<<<<<
@@ -3605,21 +3926,21 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                 if exponent == max_exponent:
  */
               __pyx_v_max_exponent = __pyx_v_exponent;
-              goto __pyx_L39;
+              goto __pyx_L42;
             }
-            __pyx_L39:;
+            __pyx_L42:;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":236
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":278
  *                                     max_exponent = exponent
  * 
  *                                 if exponent == max_exponent:             # <<<<<<<<<<<<<<
  *                                     partial_sum += mantissa
  *                                     if viterbi and mantissa > max_mantissa:
  */
-            __pyx_t_5 = (__pyx_v_exponent == __pyx_v_max_exponent);
-            if (__pyx_t_5) {
+            __pyx_t_13 = (__pyx_v_exponent == __pyx_v_max_exponent);
+            if (__pyx_t_13) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":237
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":279
  * 
  *                                 if exponent == max_exponent:
  *                                     partial_sum += mantissa             # <<<<<<<<<<<<<<
@@ -3628,7 +3949,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_partial_sum += __pyx_v_mantissa;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":238
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":280
  *                                 if exponent == max_exponent:
  *                                     partial_sum += mantissa
  *                                     if viterbi and mantissa > max_mantissa:             # <<<<<<<<<<<<<<
@@ -3636,14 +3957,14 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                         pointer_state = prev_state
  */
               if (__pyx_v_viterbi) {
-                __pyx_t_5 = (__pyx_v_mantissa > __pyx_v_max_mantissa);
-                __pyx_t_13 = __pyx_t_5;
+                __pyx_t_13 = (__pyx_v_mantissa > __pyx_v_max_mantissa);
+                __pyx_t_5 = __pyx_t_13;
               } else {
-                __pyx_t_13 = __pyx_v_viterbi;
+                __pyx_t_5 = __pyx_v_viterbi;
               }
-              if (__pyx_t_13) {
+              if (__pyx_t_5) {
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":239
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":281
  *                                     partial_sum += mantissa
  *                                     if viterbi and mantissa > max_mantissa:
  *                                         max_mantissa = mantissa             # <<<<<<<<<<<<<<
@@ -3652,7 +3973,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
                 __pyx_v_max_mantissa = __pyx_v_mantissa;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":240
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":282
  *                                     if viterbi and mantissa > max_mantissa:
  *                                         max_mantissa = mantissa
  *                                         pointer_state = prev_state             # <<<<<<<<<<<<<<
@@ -3661,7 +3982,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
                 __pyx_v_pointer_state = __pyx_v_prev_state;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":241
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":283
  *                                         max_mantissa = mantissa
  *                                         pointer_state = prev_state
  *                                         pointer_a = a             # <<<<<<<<<<<<<<
@@ -3670,7 +3991,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
                 __pyx_v_pointer_a = __pyx_v_a;
 
-                /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":242
+                /* "/root/package/cogent/align/_pairwise_seqs.pyx":284
  *                                         pointer_state = prev_state
  *                                         pointer_a = a
  *                                         pointer_b = b             # <<<<<<<<<<<<<<
@@ -3678,23 +3999,23 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                 elif exponent == max_exponent - 1:
  */
                 __pyx_v_pointer_b = __pyx_v_b;
-                goto __pyx_L42;
+                goto __pyx_L45;
               }
-              __pyx_L42:;
-              goto __pyx_L41;
+              __pyx_L45:;
+              goto __pyx_L44;
             }
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":244
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":286
  *                                         pointer_b = b
  * 
  *                                 elif exponent == max_exponent - 1:             # <<<<<<<<<<<<<<
  *                                     sub_partial_sum += mantissa
  * 
  */
-            __pyx_t_13 = (__pyx_v_exponent == (__pyx_v_max_exponent - 1));
-            if (__pyx_t_13) {
+            __pyx_t_5 = (__pyx_v_exponent == (__pyx_v_max_exponent - 1));
+            if (__pyx_t_5) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":245
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":287
  * 
  *                                 elif exponent == max_exponent - 1:
  *                                     sub_partial_sum += mantissa             # <<<<<<<<<<<<<<
@@ -3702,45 +4023,45 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                             partial_sum += sub_partial_sum * MIN_FLOAT_VALUE
  */
               __pyx_v_sub_partial_sum += __pyx_v_mantissa;
-              goto __pyx_L41;
+              goto __pyx_L44;
             }
-            __pyx_L41:;
-            __pyx_L28_continue:;
+            __pyx_L44:;
+            __pyx_L31_continue:;
           }
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":247
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":289
  *                                     sub_partial_sum += mantissa
  * 
  *                             partial_sum += sub_partial_sum * MIN_FLOAT_VALUE             # <<<<<<<<<<<<<<
  *                 else:
- *                             for prev_state from 1 <= prev_state < N:
+ *                             for prev_state from 1 <= prev_state < source_states:
  */
           __pyx_v_partial_sum += (__pyx_v_sub_partial_sum * __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE);
-          goto __pyx_L27;
+          goto __pyx_L30;
         }
         /*else*/ {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":249
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":291
  *                             partial_sum += sub_partial_sum * MIN_FLOAT_VALUE
  *                 else:
- *                             for prev_state from 1 <= prev_state < N:             # <<<<<<<<<<<<<<
+ *                             for prev_state from 1 <= prev_state < source_states:             # <<<<<<<<<<<<<<
  *                                 index = prev_j*N + prev_state
  *                                 if use_logs:
  */
-          __pyx_t_18 = __pyx_v_N;
+          __pyx_t_18 = __pyx_v_source_states;
           for (__pyx_v_prev_state = 1; __pyx_v_prev_state < __pyx_t_18; __pyx_v_prev_state++) {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":250
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":292
  *                 else:
- *                             for prev_state from 1 <= prev_state < N:
+ *                             for prev_state from 1 <= prev_state < source_states:
  *                                 index = prev_j*N + prev_state             # <<<<<<<<<<<<<<
  *                                 if use_logs:
  *                                     mantissa = (source_row_data[index]
  */
             __pyx_v_index = ((__pyx_v_prev_j * __pyx_v_N) + __pyx_v_prev_state);
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":251
- *                             for prev_state from 1 <= prev_state < N:
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":293
+ *                             for prev_state from 1 <= prev_state < source_states:
  *                                 index = prev_j*N + prev_state
  *                                 if use_logs:             # <<<<<<<<<<<<<<
  *                                     mantissa = (source_row_data[index]
@@ -3749,7 +4070,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
             __pyx_t_20 = __pyx_v_use_logs;
             if (__pyx_t_20) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":253
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":295
  *                                 if use_logs:
  *                                     mantissa = (source_row_data[index]
  *                                          + T_data[prev_state*N+state])             # <<<<<<<<<<<<<<
@@ -3757,11 +4078,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                     mantissa = (source_row_data[index]
  */
               __pyx_v_mantissa = ((__pyx_v_source_row_data[__pyx_v_index]) + (__pyx_v_T_data[((__pyx_v_prev_state * __pyx_v_N) + __pyx_v_state)]));
-              goto __pyx_L45;
+              goto __pyx_L48;
             }
             /*else*/ {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":256
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":298
  *                                 else:
  *                                     mantissa = (source_row_data[index]
  *                                          * T_data[prev_state*N+state])             # <<<<<<<<<<<<<<
@@ -3770,7 +4091,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_mantissa = ((__pyx_v_source_row_data[__pyx_v_index]) * (__pyx_v_T_data[((__pyx_v_prev_state * __pyx_v_N) + __pyx_v_state)]));
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":257
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":299
  *                                     mantissa = (source_row_data[index]
  *                                          * T_data[prev_state*N+state])
  *                                     partial_sum += mantissa             # <<<<<<<<<<<<<<
@@ -3779,9 +4100,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_partial_sum += __pyx_v_mantissa;
             }
-            __pyx_L45:;
+            __pyx_L48:;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":258
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":300
  *                                          * T_data[prev_state*N+state])
  *                                     partial_sum += mantissa
  *                                 if viterbi and mantissa > max_mantissa:             # <<<<<<<<<<<<<<
@@ -3789,14 +4110,14 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                                     pointer_state = prev_state
  */
             if (__pyx_v_viterbi) {
-              __pyx_t_13 = (__pyx_v_mantissa > __pyx_v_max_mantissa);
-              __pyx_t_5 = __pyx_t_13;
+              __pyx_t_5 = (__pyx_v_mantissa > __pyx_v_max_mantissa);
+              __pyx_t_13 = __pyx_t_5;
             } else {
-              __pyx_t_5 = __pyx_v_viterbi;
+              __pyx_t_13 = __pyx_v_viterbi;
             }
-            if (__pyx_t_5) {
+            if (__pyx_t_13) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":259
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":301
  *                                     partial_sum += mantissa
  *                                 if viterbi and mantissa > max_mantissa:
  *                                     max_mantissa = mantissa             # <<<<<<<<<<<<<<
@@ -3805,7 +4126,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_max_mantissa = __pyx_v_mantissa;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":260
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":302
  *                                 if viterbi and mantissa > max_mantissa:
  *                                     max_mantissa = mantissa
  *                                     pointer_state = prev_state             # <<<<<<<<<<<<<<
@@ -3814,7 +4135,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_pointer_state = __pyx_v_prev_state;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":261
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":303
  *                                     max_mantissa = mantissa
  *                                     pointer_state = prev_state
  *                                     pointer_a = a             # <<<<<<<<<<<<<<
@@ -3823,7 +4144,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
               __pyx_v_pointer_a = __pyx_v_a;
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":262
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":304
  *                                     pointer_state = prev_state
  *                                     pointer_a = a
  *                                     pointer_b = b             # <<<<<<<<<<<<<<
@@ -3831,14 +4152,14 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                 if viterbi:
  */
               __pyx_v_pointer_b = __pyx_v_b;
-              goto __pyx_L46;
+              goto __pyx_L49;
             }
-            __pyx_L46:;
+            __pyx_L49:;
           }
         }
-        __pyx_L27:;
+        __pyx_L30:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":264
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":306
  *                                     pointer_b = b
  * 
  *                 if viterbi:             # <<<<<<<<<<<<<<
@@ -3848,41 +4169,41 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_viterbi;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":265
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":307
  * 
  *                 if viterbi:
  *                     mantissa = max_mantissa             # <<<<<<<<<<<<<<
  *                     if track_data:
- *                         track_data[(i*row_length+j)*N+state] = (
+ *                         track_data[(i*track_width+j-track_offset)*N+state] = (
  */
           __pyx_v_mantissa = __pyx_v_max_mantissa;
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":266
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":308
  *                 if viterbi:
  *                     mantissa = max_mantissa
  *                     if track_data:             # <<<<<<<<<<<<<<
- *                         track_data[(i*row_length+j)*N+state] = (
+ *                         track_data[(i*track_width+j-track_offset)*N+state] = (
  *                             (pointer_a << tcode_x) |
  */
-          __pyx_t_5 = (__pyx_v_track_data != 0);
-          if (__pyx_t_5) {
+          __pyx_t_13 = (__pyx_v_track_data != 0);
+          if (__pyx_t_13) {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":267
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":309
  *                     mantissa = max_mantissa
  *                     if track_data:
- *                         track_data[(i*row_length+j)*N+state] = (             # <<<<<<<<<<<<<<
+ *                         track_data[(i*track_width+j-track_offset)*N+state] = (             # <<<<<<<<<<<<<<
  *                             (pointer_a << tcode_x) |
  *                             (pointer_b << tcode_y) |
  */
-            (__pyx_v_track_data[((((__pyx_v_i * __pyx_v_row_length) + __pyx_v_j) * __pyx_v_N) + __pyx_v_state)]) = (((__pyx_v_pointer_a << __pyx_v_tcode_x) | (__pyx_v_pointer_b << __pyx_v_tcode_y)) | (__pyx_v_pointer_state << __pyx_v_tcode_s));
-            goto __pyx_L48;
+            (__pyx_v_track_data[(((((__pyx_v_i * __pyx_v_track_width) + __pyx_v_j) - __pyx_v_track_offset) * __pyx_v_N) + __pyx_v_state)]) = (((__pyx_v_pointer_a << __pyx_v_tcode_x) | (__pyx_v_pointer_b << __pyx_v_tcode_y)) | (__pyx_v_pointer_state << __pyx_v_tcode_s));
+            goto __pyx_L51;
           }
-          __pyx_L48:;
-          goto __pyx_L47;
+          __pyx_L51:;
+          goto __pyx_L50;
         }
         /*else*/ {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":272
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":314
  *                             (pointer_state << tcode_s))
  *                 else:
  *                     mantissa = partial_sum             # <<<<<<<<<<<<<<
@@ -3891,9 +4212,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_mantissa = __pyx_v_partial_sum;
         }
-        __pyx_L47:;
+        __pyx_L50:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":274
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":316
  *                     mantissa = partial_sum
  * 
  *                 if dy:             # <<<<<<<<<<<<<<
@@ -3903,7 +4224,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_dy;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":275
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":317
  * 
  *                 if dy:
  *                     y = y_index[j]             # <<<<<<<<<<<<<<
@@ -3912,7 +4233,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_y = (__pyx_v_y_index[__pyx_v_j]);
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":276
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":318
  *                 if dy:
  *                     y = y_index[j]
  *                     if dx:             # <<<<<<<<<<<<<<
@@ -3922,7 +4243,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
           __pyx_t_18 = __pyx_v_dx;
           if (__pyx_t_18) {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":277
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":319
  *                     y = y_index[j]
  *                     if dx:
  *                         d_score = match_score_data[((bin*max_x+x)*max_y)+y]             # <<<<<<<<<<<<<<
@@ -3930,11 +4251,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                         d_score = ygap_score_data[bin*max_y+y]
  */
             __pyx_v_d_score = (__pyx_v_match_score_data[((((__pyx_v_bin * __pyx_v_max_x) + __pyx_v_x) * __pyx_v_max_y) + __pyx_v_y)]);
-            goto __pyx_L50;
+            goto __pyx_L53;
           }
           /*else*/ {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":279
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":321
  *                         d_score = match_score_data[((bin*max_x+x)*max_y)+y]
  *                     else:
  *                         d_score = ygap_score_data[bin*max_y+y]             # <<<<<<<<<<<<<<
@@ -3943,11 +4264,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_d_score = (__pyx_v_ygap_score_data[((__pyx_v_bin * __pyx_v_max_y) + __pyx_v_y)]);
           }
-          __pyx_L50:;
-          goto __pyx_L49;
+          __pyx_L53:;
+          goto __pyx_L52;
         }
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":280
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":322
  *                     else:
  *                         d_score = ygap_score_data[bin*max_y+y]
  *                 elif dx:             # <<<<<<<<<<<<<<
@@ -3957,7 +4278,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_dx;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":281
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":323
  *                         d_score = ygap_score_data[bin*max_y+y]
  *                 elif dx:
  *                     d_score = xgap_score_data[bin*max_x+x]             # <<<<<<<<<<<<<<
@@ -3965,10 +4286,10 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                     d_score = 0.0
  */
           __pyx_v_d_score = (__pyx_v_xgap_score_data[((__pyx_v_bin * __pyx_v_max_x) + __pyx_v_x)]);
-          goto __pyx_L49;
+          goto __pyx_L52;
         }
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":282
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":324
  *                 elif dx:
  *                     d_score = xgap_score_data[bin*max_x+x]
  *                 elif use_logs:             # <<<<<<<<<<<<<<
@@ -3978,7 +4299,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_use_logs;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":283
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":325
  *                     d_score = xgap_score_data[bin*max_x+x]
  *                 elif use_logs:
  *                     d_score = 0.0             # <<<<<<<<<<<<<<
@@ -3986,11 +4307,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                     d_score = 1.0
  */
           __pyx_v_d_score = 0.0;
-          goto __pyx_L49;
+          goto __pyx_L52;
         }
         /*else*/ {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":285
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":327
  *                     d_score = 0.0
  *                 else:
  *                     d_score = 1.0             # <<<<<<<<<<<<<<
@@ -3999,9 +4320,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_d_score = 1.0;
         }
-        __pyx_L49:;
+        __pyx_L52:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":287
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":329
  *                     d_score = 1.0
  * 
  *                 if use_logs:             # <<<<<<<<<<<<<<
@@ -4011,7 +4332,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_use_logs;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":288
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":330
  * 
  *                 if use_logs:
  *                     mantissa += d_score             # <<<<<<<<<<<<<<
@@ -4019,11 +4340,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                     mantissa *= d_score
  */
           __pyx_v_mantissa += __pyx_v_d_score;
-          goto __pyx_L51;
+          goto __pyx_L54;
         }
         /*else*/ {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":290
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":332
  *                     mantissa += d_score
  *                 else:
  *                     mantissa *= d_score             # <<<<<<<<<<<<<<
@@ -4032,9 +4353,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
           __pyx_v_mantissa *= __pyx_v_d_score;
         }
-        __pyx_L51:;
+        __pyx_L54:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":292
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":334
  *                     mantissa *= d_score
  * 
  *                 current_row_data[j*N+state] = mantissa             # <<<<<<<<<<<<<<
@@ -4043,7 +4364,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         (__pyx_v_current_row_data[((__pyx_v_j * __pyx_v_N) + __pyx_v_state)]) = __pyx_v_mantissa;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":293
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":335
  * 
  *                 current_row_data[j*N+state] = mantissa
  *                 if use_scaling:             # <<<<<<<<<<<<<<
@@ -4053,7 +4374,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
         __pyx_t_18 = __pyx_v_use_scaling;
         if (__pyx_t_18) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":294
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":336
  *                 current_row_data[j*N+state] = mantissa
  *                 if use_scaling:
  *                     current_row_ex_data[j*N+state] = max_exponent             # <<<<<<<<<<<<<<
@@ -4061,11 +4382,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                 if local and dx and dy:
  */
           (__pyx_v_current_row_ex_data[((__pyx_v_j * __pyx_v_N) + __pyx_v_state)]) = __pyx_v_max_exponent;
-          goto __pyx_L52;
+          goto __pyx_L55;
         }
-        __pyx_L52:;
+        __pyx_L55:;
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":296
+        /* "/root/package/cogent/align/_pairwise_seqs.pyx":338
  *                     current_row_ex_data[j*N+state] = max_exponent
  * 
  *                 if local and dx and dy:             # <<<<<<<<<<<<<<
@@ -4074,17 +4395,17 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
         if (__pyx_v_local) {
           if (__pyx_v_dx) {
-            __pyx_t_5 = __pyx_v_dy;
+            __pyx_t_13 = __pyx_v_dy;
           } else {
-            __pyx_t_5 = __pyx_v_dx;
+            __pyx_t_13 = __pyx_v_dx;
           }
-          __pyx_t_13 = __pyx_t_5;
+          __pyx_t_5 = __pyx_t_13;
         } else {
-          __pyx_t_13 = __pyx_v_local;
+          __pyx_t_5 = __pyx_v_local;
         }
-        if (__pyx_t_13) {
+        if (__pyx_t_5) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":297
+          /* "/root/package/cogent/align/_pairwise_seqs.pyx":339
  * 
  *                 if local and dx and dy:
  *                     if (use_scaling and max_exponent > overall_max_exponent) or (             # <<<<<<<<<<<<<<
@@ -4092,48 +4413,48 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *                             mantissa > overall_max_mantissa)):
  */
           if (__pyx_v_use_scaling) {
-            __pyx_t_13 = (__pyx_v_max_exponent > __pyx_v_overall_max_exponent);
-            __pyx_t_5 = __pyx_t_13;
+            __pyx_t_5 = (__pyx_v_max_exponent > __pyx_v_overall_max_exponent);
+            __pyx_t_13 = __pyx_t_5;
           } else {
-            __pyx_t_5 = __pyx_v_use_scaling;
+            __pyx_t_13 = __pyx_v_use_scaling;
           }
-          if (!__pyx_t_5) {
+          if (!__pyx_t_13) {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":298
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":340
  *                 if local and dx and dy:
  *                     if (use_scaling and max_exponent > overall_max_exponent) or (
  *                             (not use_scaling or max_exponent == overall_max_exponent) and (             # <<<<<<<<<<<<<<
  *                             mantissa > overall_max_mantissa)):
  *                         overall_max_exponent = max_exponent
  */
-            __pyx_t_13 = (!__pyx_v_use_scaling);
-            if (!__pyx_t_13) {
-              __pyx_t_12 = (__pyx_v_max_exponent == __pyx_v_overall_max_exponent);
-              __pyx_t_4 = __pyx_t_12;
+            __pyx_t_5 = (!__pyx_v_use_scaling);
+            if (!__pyx_t_5) {
+              __pyx_t_4 = (__pyx_v_max_exponent == __pyx_v_overall_max_exponent);
+              __pyx_t_12 = __pyx_t_4;
             } else {
-              __pyx_t_4 = __pyx_t_13;
+              __pyx_t_12 = __pyx_t_5;
             }
-            if (__pyx_t_4) {
+            if (__pyx_t_12) {
 
-              /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":299
+              /* "/root/package/cogent/align/_pairwise_seqs.pyx":341
  *                     if (use_scaling and max_exponent > overall_max_exponent) or (
  *                             (not use_scaling or max_exponent == overall_max_exponent) and (
  *                             mantissa > overall_max_mantissa)):             # <<<<<<<<<<<<<<
  *                         overall_max_exponent = max_exponent
  *                         overall_max_mantissa = mantissa
  */
-              __pyx_t_13 = (__pyx_v_mantissa > __pyx_v_overall_max_mantissa);
-              __pyx_t_12 = __pyx_t_13;
+              __pyx_t_5 = (__pyx_v_mantissa > __pyx_v_overall_max_mantissa);
+              __pyx_t_4 = __pyx_t_5;
             } else {
-              __pyx_t_12 = __pyx_t_4;
+              __pyx_t_4 = __pyx_t_12;
             }
-            __pyx_t_4 = __pyx_t_12;
+            __pyx_t_12 = __pyx_t_4;
           } else {
-            __pyx_t_4 = __pyx_t_5;
+            __pyx_t_12 = __pyx_t_13;
           }
-          if (__pyx_t_4) {
+          if (__pyx_t_12) {
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":300
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":342
  *                             (not use_scaling or max_exponent == overall_max_exponent) and (
  *                             mantissa > overall_max_mantissa)):
  *                         overall_max_exponent = max_exponent             # <<<<<<<<<<<<<<
@@ -4142,7 +4463,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_overall_max_exponent = __pyx_v_max_exponent;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":301
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":343
  *                             mantissa > overall_max_mantissa)):
  *                         overall_max_exponent = max_exponent
  *                         overall_max_mantissa = mantissa             # <<<<<<<<<<<<<<
@@ -4151,7 +4472,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_overall_max_mantissa = __pyx_v_mantissa;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":302
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":344
  *                         overall_max_exponent = max_exponent
  *                         overall_max_mantissa = mantissa
  *                         last_i = i             # <<<<<<<<<<<<<<
@@ -4160,7 +4481,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_last_i = __pyx_v_i;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":303
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":345
  *                         overall_max_mantissa = mantissa
  *                         last_i = i
  *                         last_j = j             # <<<<<<<<<<<<<<
@@ -4169,7 +4490,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
             __pyx_v_last_j = __pyx_v_j;
 
-            /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":304
+            /* "/root/package/cogent/align/_pairwise_seqs.pyx":346
  *                         last_i = i
  *                         last_j = j
  *                         last_state = state             # <<<<<<<<<<<<<<
@@ -4177,28 +4498,28 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *         last_i = i_high - 1
  */
             __pyx_v_last_state = __pyx_v_state;
-            goto __pyx_L54;
+            goto __pyx_L57;
           }
-          __pyx_L54:;
-          goto __pyx_L53;
+          __pyx_L57:;
+          goto __pyx_L56;
         }
-        __pyx_L53:;
-        __pyx_L21_continue:;
+        __pyx_L56:;
+        __pyx_L23_continue:;
       }
     }
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":305
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":347
  *                         last_j = j
  *                         last_state = state
  *     if not local:             # <<<<<<<<<<<<<<
  *         last_i = i_high - 1
  *         last_j = j_high - 1
  */
-  __pyx_t_4 = (!__pyx_v_local);
-  if (__pyx_t_4) {
+  __pyx_t_12 = (!__pyx_v_local);
+  if (__pyx_t_12) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":306
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":348
  *                         last_state = state
  *     if not local:
  *         last_i = i_high - 1             # <<<<<<<<<<<<<<
@@ -4207,7 +4528,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_last_i = (__pyx_v_i_high - 1);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":307
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":349
  *     if not local:
  *         last_i = i_high - 1
  *         last_j = j_high - 1             # <<<<<<<<<<<<<<
@@ -4216,7 +4537,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_last_j = (__pyx_v_j_high - 1);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":308
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":350
  *         last_i = i_high - 1
  *         last_j = j_high - 1
  *         last_state = state             # <<<<<<<<<<<<<<
@@ -4224,11 +4545,11 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  *         mantissa = overall_max_mantissa
  */
     __pyx_v_last_state = __pyx_v_state;
-    goto __pyx_L55;
+    goto __pyx_L58;
   }
   /*else*/ {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":310
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":352
  *         last_state = state
  *     else:
  *         mantissa = overall_max_mantissa             # <<<<<<<<<<<<<<
@@ -4237,7 +4558,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_mantissa = __pyx_v_overall_max_mantissa;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":311
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":353
  *     else:
  *         mantissa = overall_max_mantissa
  *         max_exponent = overall_max_exponent             # <<<<<<<<<<<<<<
@@ -4246,9 +4567,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
  */
     __pyx_v_max_exponent = __pyx_v_overall_max_exponent;
   }
-  __pyx_L55:;
+  __pyx_L58:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":313
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":355
  *         max_exponent = overall_max_exponent
  * 
  *     if use_scaling:             # <<<<<<<<<<<<<<
@@ -4258,22 +4579,22 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_t_10 = __pyx_v_use_scaling;
   if (__pyx_t_10) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":314
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":356
  * 
  *     if use_scaling:
  *         score = log(mantissa) + log(SCALE_STEP) * max_exponent             # <<<<<<<<<<<<<<
  *     elif use_logs:
  *         score = mantissa
  */
-    __pyx_t_3 = PyFloat_FromDouble((log(__pyx_v_mantissa) + (log(__pyx_v_6cogent_5align_14_pairwise_seqs_SCALE_STEP) * __pyx_v_max_exponent))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyFloat_FromDouble((log(__pyx_v_mantissa) + (log(__pyx_v_6cogent_5align_14_pairwise_seqs_SCALE_STEP) * __pyx_v_max_exponent))); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_v_score);
     __pyx_v_score = __pyx_t_3;
     __pyx_t_3 = 0;
-    goto __pyx_L56;
+    goto __pyx_L59;
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":315
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":357
  *     if use_scaling:
  *         score = log(mantissa) + log(SCALE_STEP) * max_exponent
  *     elif use_logs:             # <<<<<<<<<<<<<<
@@ -4283,47 +4604,47 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __pyx_t_10 = __pyx_v_use_logs;
   if (__pyx_t_10) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":316
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":358
  *         score = log(mantissa) + log(SCALE_STEP) * max_exponent
  *     elif use_logs:
  *         score = mantissa             # <<<<<<<<<<<<<<
  *     else:
  *         score = log(mantissa)
  */
-    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_v_mantissa); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 358; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_v_score);
     __pyx_v_score = __pyx_t_3;
     __pyx_t_3 = 0;
-    goto __pyx_L56;
+    goto __pyx_L59;
   }
   /*else*/ {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":318
+    /* "/root/package/cogent/align/_pairwise_seqs.pyx":360
  *         score = mantissa
  *     else:
  *         score = log(mantissa)             # <<<<<<<<<<<<<<
  *     return ((last_i, last_j), last_state, score)
  */
-    __pyx_t_3 = PyFloat_FromDouble(log(__pyx_v_mantissa)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PyFloat_FromDouble(log(__pyx_v_mantissa)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_v_score);
     __pyx_v_score = __pyx_t_3;
     __pyx_t_3 = 0;
   }
-  __pyx_L56:;
+  __pyx_L59:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":319
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":361
  *     else:
  *         score = log(mantissa)
  *     return ((last_i, last_j), last_state, score)             # <<<<<<<<<<<<<<
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_last_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyInt_FromLong(__pyx_v_last_i); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_last_j); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_last_j); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_3);
@@ -4331,9 +4652,9 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __Pyx_GIVEREF(__pyx_t_1);
   __pyx_t_3 = 0;
   __pyx_t_1 = 0;
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_last_state); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyInt_FromLong(__pyx_v_last_state); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_2);
@@ -4374,6 +4695,7 @@ static PyObject *__pyx_pf_6cogent_5align_14_pairwise_seqs_calc_rows(PyObject *__
   __Pyx_DECREF(__pyx_v_rows);
   __Pyx_DECREF(__pyx_v_track);
   __Pyx_DECREF(__pyx_v_track_enc);
+  __Pyx_DECREF(__pyx_v_bands);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
@@ -4424,6 +4746,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
   {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
   {&__pyx_n_s____version__, __pyx_k____version__, sizeof(__pyx_k____version__), 0, 0, 1, 1},
+  {&__pyx_n_s__bands, __pyx_k__bands, sizeof(__pyx_k__bands), 0, 0, 1, 1},
   {&__pyx_n_s__calc_rows, __pyx_k__calc_rows, sizeof(__pyx_k__calc_rows), 0, 0, 1, 1},
   {&__pyx_n_s__chr, __pyx_k__chr, sizeof(__pyx_k__chr), 0, 0, 1, 1},
   {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
@@ -4464,7 +4787,7 @@ static int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_TypeError = __Pyx_GetName(__pyx_b, __pyx_n_s__TypeError); if (!__pyx_builtin_TypeError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_chr = __Pyx_GetName(__pyx_b, __pyx_n_s__chr); if (!__pyx_builtin_chr) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_ArithmeticError = __Pyx_GetName(__pyx_b, __pyx_n_s__ArithmeticError); if (!__pyx_builtin_ArithmeticError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ArithmeticError = __Pyx_GetName(__pyx_b, __pyx_n_s__ArithmeticError); if (!__pyx_builtin_ArithmeticError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -4472,7 +4795,7 @@ static int __Pyx_InitCachedBuiltins(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
   return 0;
   __pyx_L1_error:;
@@ -4542,16 +4865,16 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/include/numerical_pyrex.pyx":13
+  /* "../../include/numerical_pyrex.pyx":13
  * #
  * 
- * __version__ = "('1', '6', '0', 'dev')"             # <<<<<<<<<<<<<<
+ * __version__ = "('1', '6', '0dev')"             # <<<<<<<<<<<<<<
  * 
  * cdef extern from "Python.h":
  */
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_13)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":10
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":10
  *     double Py_HUGE_VAL
  * 
  * cdef extern from "math.h":             # <<<<<<<<<<<<<<
@@ -4563,22 +4886,22 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
   __Pyx_INCREF(__pyx_int_3);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_3);
   __Pyx_GIVEREF(__pyx_int_3);
-  __Pyx_INCREF(__pyx_int_1);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
-  __Pyx_GIVEREF(__pyx_int_1);
+  __Pyx_INCREF(__pyx_int_2);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_2);
+  __Pyx_GIVEREF(__pyx_int_2);
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s__version_info, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":14
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":14
  * 
- * version_info = (3, 1)
- * __version__ = "('1', '6', '0', 'dev')"             # <<<<<<<<<<<<<<
+ * version_info = (3, 2)
+ * __version__ = "('1', '6', '0dev')"             # <<<<<<<<<<<<<<
  * 
  * cdef double SCALE_STEP, MIN_FLOAT_VALUE
  */
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_13)) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 14; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":17
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":17
  * 
  * cdef double SCALE_STEP, MIN_FLOAT_VALUE
  * SCALE_STEP = 2.0**50             # <<<<<<<<<<<<<<
@@ -4587,7 +4910,7 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
  */
   __pyx_v_6cogent_5align_14_pairwise_seqs_SCALE_STEP = pow(2.0, 50);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":18
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":18
  * cdef double SCALE_STEP, MIN_FLOAT_VALUE
  * SCALE_STEP = 2.0**50
  * MIN_FLOAT_VALUE = 1.0 / SCALE_STEP             # <<<<<<<<<<<<<<
@@ -4600,7 +4923,7 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
   }
   __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_FLOAT_VALUE = (1.0 / __pyx_v_6cogent_5align_14_pairwise_seqs_SCALE_STEP);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":21
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":21
  * 
  * cdef int MAX_XCOUNT
  * MAX_XCOUNT = 256             # <<<<<<<<<<<<<<
@@ -4609,7 +4932,7 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
  */
   __pyx_v_6cogent_5align_14_pairwise_seqs_MAX_XCOUNT = 256;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":24
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":24
  * 
  * cdef long MIN_SCALE, MAX_SCALE
  * MIN_SCALE = -10000             # <<<<<<<<<<<<<<
@@ -4618,7 +4941,7 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
  */
   __pyx_v_6cogent_5align_14_pairwise_seqs_MIN_SCALE = -10000;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":25
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":25
  * cdef long MIN_SCALE, MAX_SCALE
  * MIN_SCALE = -10000
  * MAX_SCALE = +10000  # or 0 if all numbers should be probabilities             # <<<<<<<<<<<<<<
@@ -4627,7 +4950,7 @@ PyMODINIT_FUNC PyInit__pairwise_seqs(void)
  */
   __pyx_v_6cogent_5align_14_pairwise_seqs_MAX_SCALE = 10000;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/align/_pairwise_seqs.pyx":1
+  /* "/root/package/cogent/align/_pairwise_seqs.pyx":1
  * include "numerical_pyrex.pyx"             # <<<<<<<<<<<<<<
  * 
  * # The weird indentation in this file is to match the POG version.
@@ -10,7 +10,7 @@ cdef extern from "Python.h":
 cdef extern from "math.h":
     double log (double x)
 
-version_info = (3, 1)
+version_info = (3, 2)
 __version__ = "('1', '6', '0dev')"
 
 cdef double SCALE_STEP, MIN_FLOAT_VALUE
@@ -30,6 +30,18 @@ MAX_SCALE = +10000  # or 0 if all numbers should be probabilities
 #cdef unsigned int * checkArrayUInt3D(ArrayType a, int *x, int *y, int *z) except NULL:
 #    return <unsigned int *> checkArray3D(a, c'i', sizeof(int), x, y, z)
 
+cdef int cmax(int a, int b):
+    if a > b:
+        return a
+    else:
+        return b
+            
+cdef int cmin(int a, int b):
+    if a < b:
+        return a
+    else:
+        return b
+
 cdef unsigned char * checkArrayUChar3D(ArrayType a, int *x, int *y, int *z) except NULL:
     return <unsigned char *> checkArray3D(a, c'i', sizeof(char), x, y, z)
 
@@ -41,7 +53,7 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
         ArrayType state_directions, ArrayType T, 
         ArrayType xgap_scores, ArrayType ygap_scores, ArrayType match_scores, 
         rows, track, track_enc, int viterbi, int use_logs=0, int local=False, 
-        int use_scaling=True):
+        int use_scaling=True, bands=None):
     
     """The faster, sequence only (no POG) version.  Forward or Viterbi 
     algorithm, with doubles or with slower but practically unoverflowable 
@@ -49,6 +61,10 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
     popular addition-of-logs version.  All this with any possible pair HMM 
     transition matrix.
         
+    If 'bands' is given it is a [row, (low, high)] array limiting the
+    columns calculated in each row, and cells outside it are impossible.
+    Each row of 'track' then starts at the low column of that row's band.
+        
     Limitations
        - HMM states must be in a sensible order: M and X, then Y, then END.
     """
@@ -73,6 +89,8 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
     cdef int x, y, max_x, max_y
     
     cdef int row_count, row_length1, plan_index, plan_index2
+    cdef int row_j_low, row_j_high, track_width, track_offset, source_states
+    cdef long *band_data
     
     (mantissas, exponents) = rows
 
@@ -110,6 +128,15 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
     
     assert j_low >= 0 and j_high > j_low and j_high <= row_length
     
+    cdef int two
+    if bands is not None:
+        two = 2
+        band_data = checkArrayLong2D(bands, &row_count, &two)
+        track_width = 0
+    else:
+        band_data = NULL
+        track_width = row_length
+    
     cdef double impossible                
     if use_logs:
         impossible = log(0.0) # -inf
@@ -117,7 +144,7 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
         impossible = 0.0
 
     if viterbi and track is not None and track_enc is not None:
-        track_data = checkArrayUChar3D(track, &row_count, &row_length, &N)
+        track_data = checkArrayUChar3D(track, &row_count, &track_width, &N)
         (tcode_x, tcode_y, tcode_s) = track_enc
     else:
         track_data = NULL
@@ -149,8 +176,17 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
                 
         #for prev_state from 1 <= prev_state < N:
         #    current_row_data[0*N+prev_state] = impossible
+        
+        if band_data != NULL:
+            row_j_low = cmax(j_low, band_data[2*i])
+            row_j_high = cmin(j_high, band_data[2*i+1])
+            track_offset = band_data[2*i]
+        else:
+            row_j_low = j_low
+            row_j_high = j_high
+            track_offset = 0
            
-        for j from j_low <= j < j_high:              
+        for j from row_j_low <= j < row_j_high:              
             
             for dest_state from 0 <= dest_state < dest_states:
                 state = dest_states_data[dest_state*4+0]
@@ -182,6 +218,12 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
                 if source_i < 0:
                     continue
 
+                # source cells outside the band were never calculated
+                source_states = N
+                if band_data != NULL and (prev_j < band_data[2*source_i] or
+                        prev_j >= band_data[2*source_i+1]):
+                    source_states = 1
+                    
                 if (local and dx and dy) or (prev_j == 0 and source_i == 0):
                     partial_sum = max_mantissa = T_data[0*N+state]
                     max_exponent = 0
@@ -191,7 +233,7 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
                     
                 if use_scaling:
                             sub_partial_sum = 0.0
-                            for prev_state from 1 <= prev_state < N:
+                            for prev_state from 1 <= prev_state < source_states:
                                 index = prev_j*N + prev_state
                                 
                                 exponent = source_row_ex_data[index]
@@ -246,7 +288,7 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
                                     
                             partial_sum += sub_partial_sum * MIN_FLOAT_VALUE
                 else:
-                            for prev_state from 1 <= prev_state < N:
+                            for prev_state from 1 <= prev_state < source_states:
                                 index = prev_j*N + prev_state
                                 if use_logs:
                                     mantissa = (source_row_data[index] 
@@ -264,7 +306,7 @@ def calc_rows(ArrayType plan, ArrayType seq1_index, ArrayType seq2_index,
                 if viterbi:
                     mantissa = max_mantissa
                     if track_data:
-                        track_data[(i*row_length+j)*N+state] = (        
+                        track_data[(i*track_width+j-track_offset)*N+state] = (        
                             (pointer_a << tcode_x) |  
                             (pointer_b << tcode_y) |
                             (pointer_state << tcode_s))
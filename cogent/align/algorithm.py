@@ -1,7 +1,15 @@
 #!/usr/bin/env python
 """Code for performing alignments by Needleman-Wunsch and Smith-Waterman.
+
+nw_align and sw_align use an array based implementation which fills in one
+anti-diagonal of the dynamic programming matrix at a time, as every cell of
+an anti-diagonal depends only on the previous two.  It gives the same
+alignments as the ScoreMatrix classes, which are kept as the readable
+reference implementation.
 """
 
+import numpy
+
 __author__ = "Rob Knight"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
 __credits__ = ["Rob Knight", "Jeremy Widmann"]
@@ -316,21 +324,189 @@ class SmithWatermanMatrix(ScoreMatrix):
         align_2.reverse()
         self.FirstAlign, self.SecondAlign = align_1, align_2
 
-def nw_align(seq1, seq2, scorer=equality_scorer, gap=default_gap, return_score=False):
-    """Returns globally optimal alignment of seq1 and seq2."""
-    N = NeedlemanWunschMatrix(seq1, seq2, scorer, gap)
-    if return_score:
-        return N.alignment(), N.MaxScore[0]
+# Traceback pointers, packed into one byte per cell: how the best score
+# was reached, then whether each of the two gap scores extended a gap.
+NONE, DIAG, UP, LEFT = 0, 1, 2, 3
+UP_EXTENDS, LEFT_EXTENDS = 4, 8
+
+# Small enough that adding gap scores to it can't overflow an int32
+_INT_IMPOSSIBLE = -2**29
+
+def _score_array(seq1, seq2, scorer):
+    """(seq1 indices, seq2 indices, scores) where scores[a, b] is the score
+    of the a'th distinct item of seq1 against the b'th of seq2"""
+    indices = []
+    items = []
+    for seq in [seq1, seq2]:
+        codes = {}
+        indices.append(numpy.array(
+                [codes.setdefault(x, len(codes)) for x in seq], int))
+        by_code = [None] * len(codes)
+        for (x, code) in codes.items():
+            by_code[code] = x
+        items.append(by_code)
+    scores = numpy.array([[scorer(x, y) for y in items[1]]
+            for x in items[0]])
+    scores.shape = (len(items[0]), len(items[1]))
+    return (indices[0], indices[1], scores)
+
+def _fill(index1, index2, scores, gap, gap_extend, local):
+    """Pointer array, best score and its (row, col) position.
+    
+    Rows correspond to positions in the second sequence and columns to
+    positions in the first, as in ScoreMatrix, and ties are broken the same
+    way: up, then diag, then left."""
+    (R, C) = (len(index2) + 1, len(index1) + 1)
+    affine = gap_extend is not None
+    if not affine:
+        gap_extend = gap
+    if scores.dtype.kind in 'iub' and numpy.asarray(
+            [gap, gap_extend]).dtype.kind in 'iub':
+        (dtype, impossible) = (numpy.int32, _INT_IMPOSSIBLE)
     else:
-        return N.alignment()
-
-def sw_align(seq1, seq2, scorer=equality_scorer, gap=default_gap, return_score=False):
-    """Returns locally optimal alignment of seq1 and seq2."""
-    S = SmithWatermanMatrix(seq1, seq2, scorer, gap)
+        (dtype, impossible) = (float, -numpy.inf)
+    scores = scores.astype(dtype)
+    pointers = numpy.zeros([R, C], numpy.uint8)
+    flat = pointers.reshape(-1)
+    
+    # Gap scores along the top row and down the first column
+    if local:
+        boundary = numpy.zeros([max(R, C)], dtype)
+    else:
+        steps = numpy.arange(max(R, C))
+        if affine:
+            boundary = gap + (steps - 1) * gap_extend
+        else:
+            boundary = gap * steps
+        boundary = boundary.astype(dtype)
+        boundary[0] = 0
+        pointers[0, 1:] = LEFT
+        pointers[0, 2:] |= LEFT_EXTENDS
+        pointers[1:, 0] = UP
+        pointers[2:, 0] |= UP_EXTENDS
+    
+    # Scores of the last three anti-diagonals, indexed by row
+    (H, H1, H2) = [numpy.empty([R], dtype) for i in range(3)]
+    (E, E1, F, F1) = [numpy.empty([R], dtype) for i in range(4)]
+    H[0] = 0
+    best = (0, 0, 0)
+    for d in range(1, R + C - 1):
+        (H, H1, H2) = (H2, H, H1)
+        (E, E1) = (E1, E)
+        (F, F1) = (F1, F)
+        if d < C:
+            H[0] = boundary[d]
+            E[0] = impossible
+            F[0] = [impossible, boundary[d]][not local]
+        if d < R:
+            H[d] = boundary[d]
+            E[d] = [impossible, boundary[d]][not local]
+            F[d] = impossible
+        (lo, hi) = (max(1, d - C + 1), min(R - 1, d - 1))
+        if lo > hi:
+            continue
+        rows = slice(lo, hi + 1)
+        above = slice(lo - 1, hi)
+        # columns d-lo down to d-hi, less one for the start column
+        match = scores[index1[d-hi-1:d-lo][::-1], index2[lo-1:hi]]
+        up_open = H1[above] + gap
+        up_extend = E1[above] + gap_extend
+        up = E[rows] = numpy.maximum(up_open, up_extend)
+        left_open = H1[rows] + gap
+        left_extend = F1[rows] + gap_extend
+        left = F[rows] = numpy.maximum(left_open, left_extend)
+        diag = H2[above] + match
+        score = numpy.maximum(numpy.maximum(diag, up), left)
+        pointer = numpy.where(score == diag, DIAG, LEFT)
+        pointer[score == up] = UP
+        pointer += UP_EXTENDS * (up_extend > up_open) + \
+                LEFT_EXTENDS * (left_extend > left_open)
+        if local:
+            ended = score <= 0
+            score[ended] = 0
+            pointer[ended] &= ~3
+            top = score.max()
+            if top > 0 and top >= best[0]:
+                i = lo + int(numpy.argmax(score))
+                position = (top, i, d - i)
+                if top > best[0] or position[1:] < best[1:]:
+                    best = position
+        H[rows] = score
+        # (row, d-row) for rows lo to hi is a strided slice of flat
+        flat[lo*(C-1)+d:hi*(C-1)+d+1:C-1] = pointer
+    if not local:
+        if R + C > 2:
+            best = (H[R - 1], R - 1, C - 1)
+        else:
+            best = (0, 0, 0)
+    return (pointers, best)
+
+def _traceback(seq1, seq2, pointers, row, col):
+    """Aligned versions of seq1 and seq2 as lists, following the pointers
+    back from (row, col)"""
+    align_1 = []
+    align_2 = []
+    state = NONE
+    while 1:
+        p = pointers[row, col]
+        if state == NONE:
+            state = p & 3
+            if state == NONE:
+                break
+        if state == DIAG:
+            align_1.append(seq1[col-1])
+            align_2.append(seq2[row-1])
+            (row, col) = (row - 1, col - 1)
+            state = NONE
+        elif state == UP:
+            align_1.append('-')
+            align_2.append(seq2[row-1])
+            row -= 1
+            if not p & UP_EXTENDS:
+                state = NONE
+        else:
+            align_1.append(seq1[col-1])
+            align_2.append('-')
+            col -= 1
+            if not p & LEFT_EXTENDS:
+                state = NONE
+    align_1.reverse()
+    align_2.reverse()
+    return (align_1, align_2)
+
+def _as_seq_type(seq, aligned):
+    # As in ScoreMatrix.alignment
+    if isinstance(seq, str):
+        return seq.__class__(''.join(aligned))
+    else:
+        return seq.__class__(aligned)
+
+def _align(seq1, seq2, scorer, gap, gap_extend, local, return_score):
+    (index1, index2, scores) = _score_array(seq1, seq2, scorer)
+    (pointers, (score, row, col)) = _fill(index1, index2, scores, gap,
+            gap_extend, local)
+    (align_1, align_2) = _traceback(seq1, seq2, pointers, row, col)
+    result = (_as_seq_type(seq1, align_1), _as_seq_type(seq2, align_2))
     if return_score:
-        return S.alignment(), S.MaxScore[0]
+        return result, numpy.asarray(score).item()
     else:
-        return S.alignment()
+        return result
+
+def nw_align(seq1, seq2, scorer=equality_scorer, gap=default_gap, 
+        return_score=False, gap_extend=None):
+    """Returns globally optimal alignment of seq1 and seq2.
+    
+    With gap_extend the gap scores are affine: 'gap' for the first position
+    of each gap and 'gap_extend' for each further position."""
+    return _align(seq1, seq2, scorer, gap, gap_extend, False, return_score)
+
+def sw_align(seq1, seq2, scorer=equality_scorer, gap=default_gap, 
+        return_score=False, gap_extend=None):
+    """Returns locally optimal alignment of seq1 and seq2.
+    
+    With gap_extend the gap scores are affine: 'gap' for the first position
+    of each gap and 'gap_extend' for each further position."""
+    return _align(seq1, seq2, scorer, gap, gap_extend, True, return_score)
 
 def demo(seq1, seq2):
     result = []
@@ -54,7 +54,15 @@ def _align_pairwise(s1, s2, mprobs, psub, TM, local, return_score=False, **kw):
         return alignment
 
 def classic_align_pairwise(s1, s2, Sd, d, e, local, return_score=False, **kw):
-    """Alignment specified by gap costs and a score matrix"""
+    """Alignment specified by gap costs and a score matrix.
+    
+    With band=n only the cells within n of a path through k-mer anchored
+    diagonal segments are calculated, which for long similar sequences
+    is much faster and needs much less memory.  For global alignments
+    linear_space=True uses Hirschberg's divide and conquer algorithm, which
+    needs memory proportional to the sequence lengths rather than their
+    product but takes about twice as long.  It isn't available for local
+    or banded alignments, which warn and use the full matrix instead."""
     TM = indel_model.ClassicGapScores(d, e)
     a1 = s1.MolType.Alphabet
     a2 = s2.MolType.Alphabet
@@ -69,8 +77,11 @@ def classic_align_pairwise(s1, s2, Sd, d, e, local, return_score=False, **kw):
 # these can't do codon sequences
 # they could be replaced with something more sophisticated, like the HMM
 # may not give same answer's as algorithm
-def local_pairwise(s1, s2, S, d, e, return_score=False):
-    return classic_align_pairwise(s1, s2, S, d, e, True, return_score=return_score)
+def local_pairwise(s1, s2, S, d, e, return_score=False, band=None):
+    return classic_align_pairwise(s1, s2, S, d, e, True,
+            return_score=return_score, band=band)
 
-def global_pairwise(s1, s2, S, d, e, return_score=False):
-    return classic_align_pairwise(s1, s2, S, d, e, False, return_score=return_score)
+def global_pairwise(s1, s2, S, d, e, return_score=False, band=None,
+        linear_space=None):
+    return classic_align_pairwise(s1, s2, S, d, e, False,
+            return_score=return_score, band=band, linear_space=linear_space)
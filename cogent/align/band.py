@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Bands of dynamic programming cells around the likely path of a pairwise
+alignment, for banded alignment of long, similar sequences.
+
+The band is built around a chain of anchors: diagonal segments found by
+seeding with shared k-mers and then extending along each seeded diagonal
+with the same windowed match counting as the dotplot.  Between consecutive
+anchors the band covers both diagonals, from the end of one anchor and into
+the start of the next, so it widens where the anchors imply an indel."""
+
+from __future__ import division
+import numpy
+
+from cogent.align.pycompare import segments_from_diagonal
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+# k-mers more common than this are repeats and not useful as seeds
+MAX_WORD_OCCURRENCES = 10
+# chaining is quadratic in the number of segments, so keep the longest
+MAX_ANCHOR_SEGMENTS = 1000
+
+def default_word_length(len1, len2, alphabet_size):
+    """Long enough that few chance matches are expected between
+    unrelated sequences"""
+    expected = numpy.log(max(len1 * len2, 2)) / numpy.log(
+            max(alphabet_size, 2))
+    return int(min(40, max(4, numpy.ceil(expected) + 1)))
+
+def seeded_diagonals(seq1, seq2, word_length):
+    """Sorted diagonals (j-i) on which seq1[i:i+k] == seq2[j:j+k]"""
+    words = {}
+    for i in range(len(seq1) - word_length + 1):
+        words.setdefault(seq1[i:i+word_length], []).append(i)
+    diagonals = set()
+    for j in range(len(seq2) - word_length + 1):
+        positions = words.get(seq2[j:j+word_length], ())
+        if len(positions) <= MAX_WORD_OCCURRENCES:
+            for i in positions:
+                diagonals.add(j - i)
+    return sorted(diagonals)
+
+def _chained(segments):
+    # Heaviest chain of non-overlapping (start, end, diagonal) segments
+    # which are colinear, ie: increasing in both sequences.
+    segments = sorted(segments, key=lambda s: s[1]-s[0], reverse=True)
+    segments = sorted(segments[:MAX_ANCHOR_SEGMENTS])
+    best = []
+    previous = []
+    for (n, (start, end, diagonal)) in enumerate(segments):
+        (score, prior) = (0, None)
+        for m in range(n):
+            (start2, end2, diagonal2) = segments[m]
+            if end2 <= start and end2 + diagonal2 <= start + diagonal and \
+                    best[m] > score:
+                (score, prior) = (best[m], m)
+        best.append(score + end - start)
+        previous.append(prior)
+    chain = []
+    if best:
+        n = int(numpy.argmax(best))
+        while n is not None:
+            chain.append(segments[n])
+            n = previous[n]
+    chain.reverse()
+    return chain
+
+def anchor_segments(seq1, seq2, word_length=None, window=None,
+        threshold=None):
+    """Colinear chain of (start, end, diagonal) segments in which
+    seq1[i] probably aligns with seq2[i+diagonal] for start <= i < end.
+    Sequences are strings of one character per motif."""
+    if word_length is None:
+        word_length = default_word_length(len(seq1), len(seq2),
+                len(set(seq1) | set(seq2)))
+    if window is None:
+        window = min(99, 2 * word_length)
+    if threshold is None:
+        threshold = (3 * window) // 4
+    segments = []
+    for diagonal in seeded_diagonals(seq1, seq2, word_length):
+        for (start, end) in segments_from_diagonal(seq1, seq2, window,
+                threshold, 0, diagonal):
+            segments.append((start, end, diagonal))
+    return _chained(segments)
+
+def band_bounds(len1, len2, width, anchors=()):
+    """[row, (low, high)] array of the columns in the band for each row
+    of a pairwise dynamic programming matrix with begin and end rows and
+    columns, ie: shaped (len1+2, len2+2).  The band extends 'width' cells
+    either side of any colinear path through the 'anchors'."""
+    (M, N) = (len1 + 2, len2 + 2)
+    # corners of the path, in matrix coordinates which are offset by the
+    # begin row and column.
+    points = [(0, 0)]
+    for (start, end, diagonal) in anchors:
+        points.append((start + 1, start + diagonal + 1))
+        points.append((end, end + diagonal))
+    points.append((M-1, N-1))
+    bounds = numpy.empty([M, 2], int)
+    bounds[:, 0] = N
+    bounds[:, 1] = 0
+    for ((x1, y1), (x2, y2)) in zip(points[:-1], points[1:]):
+        assert x2 >= x1 and y2 >= y1, (x1, y1, x2, y2)
+        rows = numpy.arange(x1, x2+1)
+        # diagonals leaving the first point and arriving at the second
+        leaving = numpy.minimum(y1 + rows - x1, y2)
+        arriving = numpy.maximum(y2 - x2 + rows, y1)
+        low = numpy.minimum(leaving, arriving) - width
+        high = numpy.maximum(leaving, arriving) + width + 1
+        bounds[x1:x2+1, 0] = numpy.minimum(bounds[x1:x2+1, 0], low)
+        bounds[x1:x2+1, 1] = numpy.maximum(bounds[x1:x2+1, 1], high)
+    bounds[:, 0] = numpy.maximum(bounds[:, 0], 0)
+    bounds[:, 1] = numpy.minimum(bounds[:, 1], N)
+    return bounds
+
+def anchored_band(seq1, seq2, width, **kw):
+    """band_bounds() around the anchor_segments() of seq1 and seq2"""
+    anchors = anchor_segments(seq1, seq2, **kw)
+    return band_bounds(len(seq1), len(seq2), width, anchors)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""Pairwise alignment of many sequences, every pair with the same pair HMM.
+
+The substitution model's contribution to the emission probabilities is
+calculated just once per sequence rather than once per pair, and the
+dynamic programming arrays are reused from one pair to the next.  Chunks of
+pairs are shared out over the current parallel context."""
+
+from __future__ import division
+import numpy
+
+from cogent import LoadTree
+from cogent.util import parallel
+from cogent.align.pairwise import AlignableSeq, Pair, PairEmissionProbs, \
+        ReversiblePairEmissionProbs, DPFlags, DPBuffers
+from cogent.align.traceback import alignment_traceback
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+class AllPairsAligner(object):
+    """Viterbi alignments of pairs of sequences from 'seqs' with the pair
+    HMM that model.makeLikelihoodFunction(tree, aligned=False) provides.
+
+    As the HMM parameters are shared, motif probabilities taken from the
+    data are those of all the sequences rather than of each pair."""
+
+    def __init__(self, model, seqs, modify_lf=None, use_cost_function=True,
+            **dp_options):
+        """Arguments:
+            - model: a substitution model, as for TreeAlign
+            - seqs: a sequence collection, or dict of sequences
+            - modify_lf: a callback which takes and returns the likelihood
+              function from which the pair HMM parameters are taken
+            - dp_options: other DPFlags options, eg: band or linear_space
+        """
+        if isinstance(seqs, dict):
+            named_seqs = seqs
+            self.names = sorted(seqs.keys())
+        else:
+            named_seqs = seqs.NamedSeqs
+            self.names = seqs.getSeqNames()
+        assert len(self.names) > 1, self.names
+        self.alignables = dict((name, AlignableSeq(
+                model.convertSequence(named_seqs[name], name)))
+                for name in self.names)
+
+        hmm = self._templatePairHMM(model, modify_lf)
+        self.transition_matrix = hmm._transition_matrix
+        emission_probs = hmm.emission_probs
+        if isinstance(emission_probs, ReversiblePairEmissionProbs):
+            emission_probs = emission_probs.midpoint
+        self.bins = emission_probs.bins
+        self.dp_options = DPFlags(viterbi=True,
+                use_cost_function=use_cost_function, **dp_options)
+        self.word_length = model.getAlphabet().getMotifLen()
+        self.emissions = dict((name, self._emissions(alignable))
+                for (name, alignable) in self.alignables.items())
+
+    def _templatePairHMM(self, model, modify_lf):
+        # The pair HMM of a likelihood function of any two of the sequences
+        names = self.names[:2]
+        lf = model.makeLikelihoodFunction(LoadTree(tip_names=names),
+                aligned=False)
+        lf.setPogs(dict((name, self.alignables[name]) for name in names))
+        if lf.mprobs_from_alignment:
+            counts = numpy.sum([alignable.leaf.getMotifCounts()
+                    for alignable in self.alignables.values()], 0)
+            lf.setMotifProbs(counts / numpy.sum(counts), is_constant=True,
+                    auto=True)
+        if modify_lf:
+            lf = modify_lf(lf)
+        return lf.getLogLikelihood().edge
+
+    def _emissions(self, alignable):
+        # Like PairEmissionProbs.makePartialLikelihoods but for one sequence
+        # in either dimension: [dim][bin] plh and gap scores
+        use_cost_function = self.dp_options.use_cost_function
+        plhs = [[], []]
+        gap_scores = [[], []]
+        for bin in self.bins:
+            for dim in [0, 1]:
+                plh = numpy.inner(alignable.plh, bin.ppsubs[dim])
+                gap_plh = numpy.inner(alignable.plh, bin.mprobs)
+                if use_cost_function:
+                    plh /= gap_plh[..., numpy.newaxis]
+                    gap_plh[:] = 1.0
+                else:
+                    gap_plh[0] = gap_plh[-1] = 1.0
+                plhs[dim].append(plh)
+                gap_scores[dim].append(gap_plh)
+        if self.dp_options.use_logs:
+            gap_scores = [numpy.log(g) for g in gap_scores]
+        return ([numpy.array(p) for p in plhs],
+                [numpy.array(g) for g in gap_scores])
+
+    def _emissionProbs(self, pair, name1, name2):
+        (plhs1, gaps1) = self.emissions[name1]
+        (plhs2, gaps2) = self.emissions[name2]
+        (x, y) = (plhs1[0], plhs2[1])
+        match_scores = numpy.zeros([len(self.bins)] + pair.uniq_size, float)
+        for (b, bin) in enumerate(self.bins):
+            match_scores[b] = numpy.inner(x[b] * bin.mprobs, y[b])
+        match_scores[:, 0, 0] = match_scores[:, -1, -1] = 1.0
+        if self.dp_options.use_logs:
+            match_scores = numpy.log(match_scores)
+        emission_probs = PairEmissionProbs(pair, self.bins)
+        key = (self.dp_options.use_logs, self.dp_options.use_cost_function)
+        emission_probs.scores[key] = (match_scores, (gaps1[0], gaps2[1]))
+        return emission_probs
+
+    def getScoreAndAlignment(self, name1, name2, buffers=None):
+        """Viterbi (score, alignment) of one pair of sequences"""
+        pair = Pair(self.alignables[name1], self.alignables[name2])
+        emission_probs = self._emissionProbs(pair, name1, name2)
+        (score, tb) = emission_probs.dp(self.transition_matrix,
+                self.dp_options, buffers=buffers)
+        (state_directions, T) = self.transition_matrix
+        aligned_positions = [posn for (bin, posn) in
+                tb.asBinPosTuples(state_directions)]
+        aln = alignment_traceback(pair.getSeqNamePairs(), aligned_positions,
+                self.word_length)
+        return (score, aln)
+
+    def getAlignments(self, pairs=None, chunksize=50):
+        """{(name1, name2): alignment} for each of 'pairs', by default all
+        N*(N-1)/2 of them.  Each chunk of pairs is aligned by one CPU with
+        one set of DP arrays."""
+        if pairs is None:
+            pairs = [(name1, name2) for (i, name1) in enumerate(self.names)
+                    for name2 in self.names[i+1:]]
+        chunks = [pairs[i:i+chunksize]
+                for i in range(0, len(pairs), chunksize)]
+
+        def _align_chunk(chunk):
+            buffers = DPBuffers()
+            return [((name1, name2), self.getScoreAndAlignment(
+                    name1, name2, buffers)[1]) for (name1, name2) in chunk]
+
+        result = {}
+        for aligned in parallel.imap(_align_chunk, chunks):
+            result.update(aligned)
+        return result
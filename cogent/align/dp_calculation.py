@@ -5,6 +5,7 @@ from cogent.recalculation.definition import PositiveParamDefn, \
     ProbabilityParamDefn, CalculationDefn, CalcDefn, NonParamDefn, \
     PartitionDefn
 from cogent.align import indel_model, pairwise
+from cogent.util import parallel, progress_display as UI
 import numpy
 
 __author__ = "Gavin Huttley and Peter Maxwell"
@@ -89,6 +90,9 @@ class FwdDefn(CalculationDefn):
 
 class EdgeSumAndAlignDefn(CalculationDefn):
     name = 'pair'
+    def setup(self, linear_space=None):
+        self.linear_space = linear_space
+    
     def calc(self, pog1, pog2, length1, length2, bin):
         edge = Edge(pog1, pog2, length1+length2, [bin])
         def _getaln():
@@ -96,23 +100,112 @@ class EdgeSumAndAlignDefn(CalculationDefn):
                 ratio = length1/(length1+length2)
             except (ZeroDivisionError, FloatingPointError):
                 ratio = 1.
-            return edge.getViterbiPath().getAlignable(ratio)
+            return edge.getViterbiPath(
+                    linear_space=self.linear_space).getAlignable(ratio)
         edge.getaln = _getaln
         return edge
 
 
 class EdgeSumAndAlignDefnWithBins(CalculationDefn):
     name = 'pair'
+    def setup(self, linear_space=None):
+        self.linear_space = linear_space
+    
     def calc(self, pog1, pog2, length1, length2, switch, bprobs, *bin_data):
         edge = Edge(pog1, pog2, length1+length2, bin_data, switch, bprobs)
         def _getaln():
             ratio = length1/(length1+length2)
-            (vtScore, result) = edge.getViterbiScoreAndAlignable(ratio)
-            return result
+            return edge.getViterbiPath(
+                    linear_space=self.linear_space).getAlignable(ratio)
+        edge.getaln = _getaln
+        return edge
+
+def _length_ratio(length1, length2):
+    try:
+        return length1/(length1+length2)
+    except (ZeroDivisionError, FloatingPointError):
+        return 1.
+
+def _merged(task):
+    # One progressive step, a module level function so that it is cheap
+    # to send to other processes along with its inputs.
+    (pog1, pog2, length1, length2, bin_data, switch, bprobs,
+            linear_space) = task
+    edge = Edge(pog1, pog2, length1+length2, bin_data, switch, bprobs)
+    return edge.getViterbiPath(linear_space=linear_space).getAlignable(
+            _length_ratio(length1, length2))
+
+@UI.display_wrap
+def subtree_alignables(tree, alignables, lengths, bin_data, switch=1.0,
+        bprobs=None, linear_space=None, ui=None):
+    """{name: alignable} for every edge below the root of 'tree', given
+    the tip 'alignables' and edge 'lengths'.  Each subtree is aligned as
+    soon as both its children have been, so all the merges which have
+    become independent of each other are shared out over the current
+    parallel context together."""
+    alignables = dict(alignables)
+    pending = [node for node in tree.postorder(include_self=False)
+            if not node.istip()]
+    (done, total) = (0, len(pending))
+    while pending:
+        ready = [node for node in pending if not [child for child in
+                node.Children if child.Name not in alignables]]
+        pending = [node for node in pending if node not in ready]
+        tasks = []
+        for node in ready:
+            (child1, child2) = [child.Name for child in node.Children]
+            tasks.append((alignables[child1], alignables[child2],
+                    lengths[child1], lengths[child2], bin_data, switch, bprobs,
+                    linear_space))
+        for (node, alignable) in zip(ready, parallel.imap(_merged, tasks)):
+            alignables[node.Name] = alignable
+            done += 1
+            ui.display('merge %s/%s' % (done, total),
+                    progress=done / float(total))
+    return alignables
+
+class SubtreeMergesDefn(CalculationDefn):
+    """The root edge of a progressive alignment, as EdgeSumAndAlignDefn
+    would calculate it, but with the whole tree's tips, lengths and bin data
+    as inputs so that the subtrees can be aligned by subtree_alignables()
+    rather than one at a time."""
+    
+    name = 'pair'
+    def setup(self, tree, with_bins=False, linear_space=None):
+        self.tree = tree
+        self.tip_names = tree.getTipNames()
+        self.edge_names = [node.Name for node in
+                tree.postorder(include_self=False)]
+        self.with_bins = with_bins
+        self.linear_space = linear_space
+    
+    def calc(self, *args):
+        tip_count = len(self.tip_names)
+        edge_count = len(self.edge_names)
+        leaves = dict(zip(self.tip_names, args[:tip_count]))
+        lengths = dict(zip(self.edge_names,
+                args[tip_count:tip_count+edge_count]))
+        bin_args = list(args[tip_count+edge_count:])
+        if self.with_bins:
+            (switch, bprobs) = bin_args[:2]
+            bin_data = bin_args[2:]
+        else:
+            (switch, bprobs, bin_data) = (1.0, None, bin_args)
+        alignables = subtree_alignables(self.tree, leaves, lengths,
+                bin_data, switch, bprobs, self.linear_space)
+        (child1, child2) = [child.Name for child in self.tree.Children]
+        (length1, length2) = (lengths[child1], lengths[child2])
+        edge = Edge(alignables[child1], alignables[child2], length1+length2,
+                bin_data, switch, bprobs)
+        def _getaln():
+            return edge.getViterbiPath(
+                    linear_space=self.linear_space).getAlignable(
+                    _length_ratio(length1, length2))
         edge.getaln = _getaln
         return edge
 
-def _recursive_defns(edge, subst, leaf, edge_defn_constructor, bin_args):
+def _recursive_defns(edge, subst, leaf, edge_defn_constructor, bin_args,
+        linear_space):
     """A defn which calculates a fwd score with an .edge
     attribute which can provide a viterbi alignment which can be
     provided to a similar defn"""
@@ -123,7 +216,8 @@ def _recursive_defns(edge, subst, leaf, edge_defn_constructor, bin_args):
             args.append(leaf.selectFromDimension('edge', child.Name))
         else:
             (child_defn, scores2) = _recursive_defns(
-                    child, subst, leaf, edge_defn_constructor, bin_args)
+                    child, subst, leaf, edge_defn_constructor, bin_args,
+                    linear_space)
             child_defn = ViterbiPogDefn(child_defn)
             scores.extend(scores2)
             args.append(child_defn)
@@ -132,14 +226,19 @@ def _recursive_defns(edge, subst, leaf, edge_defn_constructor, bin_args):
     child_lengths = subst['length'].acrossDimension('edge', child_names)
     args.extend(child_lengths)
     args.extend(bin_args)
-    edge_defn = edge_defn_constructor(*args)
+    edge_defn = edge_defn_constructor(*args, linear_space=linear_space)
     #fwd = FwdDefn(edge_defn)
     #scores.append(fwd)
     return (edge_defn, scores)
 
 def makeForwardTreeDefn(subst_model, tree, bin_names,
-        with_indel_params=True, kn=True):
-    """Pairwise Fwd"""
+        with_indel_params=True, kn=True, linear_space=None,
+        parallel_subtrees=False):
+    """Pairwise Fwd.  'linear_space' is passed on to the Viterbi alignment
+    of each edge, see pairwise.DPFlags.  With 'parallel_subtrees' the
+    progressive alignment is one calculation step in which independent
+    subtrees are aligned in parallel, but which has to be entirely redone
+    whenever any parameter changes."""
     indel = makeIndelModelDefn(with_indel_params, kn)
     subst = subst_model.makeFundamentalParamControllerDefns(bin_names)
     leaf = NonParamDefn('leaf', dimensions=('edge',))
@@ -160,8 +259,17 @@ def makeForwardTreeDefn(subst_model, tree, bin_names,
     bin_data = bin_data.acrossDimension('bin', bin_names)
     edge_args.extend(bin_data)
     
-    (top, scores) = _recursive_defns(tree, subst, leaf, edge_defn_constructor,
-        edge_args)
+    if parallel_subtrees:
+        args = [leaf.selectFromDimension('edge', name)
+                for name in tree.getTipNames()]
+        args.extend(subst['length'].acrossDimension('edge',
+                [node.Name for node in tree.postorder(include_self=False)]))
+        args.extend(edge_args)
+        top = SubtreeMergesDefn(*args, tree=tree,
+                with_bins=len(bin_names) > 1, linear_space=linear_space)
+    else:
+        (top, scores) = _recursive_defns(tree, subst, leaf,
+                edge_defn_constructor, edge_args, linear_space)
     defn = FwdDefn(top)
     #defn = SumDefn(*scores)
     return AnnotateFloatDefn(defn, top)
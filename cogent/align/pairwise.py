@@ -6,6 +6,9 @@ produced by the same code."""
 # How many cells before using linear space alignment algorithm.
 # Should probably set to about half of physical memory / PointerEncoder.bytes
 HIRSCHBERG_LIMIT = 10**8
+# Size below which the linear space algorithm, when requested, stops dividing
+# the problem in half.
+HIRSCHBERG_MIN = 10**5
 
 import numpy
 
@@ -22,6 +25,7 @@ from indel_positions import leaf2pog
 from cogent import LoadSeqs
 from cogent.core.alignment import Aligned
 from cogent.align.traceback import map_traceback
+from cogent.align.band import anchored_band
 from cogent.util import parallel
 
 from cogent.util.modules import importVersionedModule, ExpectedImportError
@@ -32,7 +36,7 @@ except ExpectedImportError:
     pyrex_align_module = None
 try:
     pyrex_seq_align_module = importVersionedModule('_pairwise_seqs', globals(),
-            (3, 1), "slow Python alignment implementation")
+            (3, 2), "slow Python alignment implementation")
 except ExpectedImportError:
     pyrex_seq_align_module = None
 
@@ -71,15 +75,34 @@ class PointerEncoding(object):
         return (parts << self.positions).sum()
     def decode(self, coded):
         return (coded >> self.positions) % self.limits
-    def getEmptyArray(self, shape):
-        return numpy.zeros(shape, self.dtype)
+    def getEmptyArray(self, shape, buffers=None):
+        if buffers is None:
+            return numpy.zeros(shape, self.dtype)
+        return buffers.getArray('track', shape, self.dtype, 0)
+    
+
+class DPBuffers(object):
+    """Arrays to reuse for the dynamic programming of one pair after 
+    another rather than allocating them afresh each time"""
+    
+    def __init__(self):
+        self.arrays = {}
+    
+    def getArray(self, name, shape, dtype, fill):
+        size = numpy.product(shape)
+        array = self.arrays.get(name)
+        if array is None or array.dtype != dtype or len(array) < size:
+            array = self.arrays[name] = numpy.empty([size], dtype)
+        array = array[:size].reshape(shape)
+        array.fill(fill)
+        return array
     
 DEBUG = False
 
 def py_calc_rows(plan, x_index, y_index, i_low, i_high, j_low, j_high,
         preds, state_directions, T,
         xgap_scores, ygap_scores, match_scores, rows, track, track_enc, 
-        viterbi, local=False, use_scaling=False, use_logs=False):
+        viterbi, local=False, use_scaling=False, use_logs=False, bands=None):
     """Pure python version of the dynamic programming algorithms
     Forward and Viterbi.  Works on sequences and POGs.  Unli"""
     if use_scaling:
@@ -104,7 +127,13 @@ def py_calc_rows(plan, x_index, y_index, i_low, i_high, j_low, j_high,
         current_row[:,0] = impossible
         if i == 0 and not local:
             current_row[0,0] = neutral_score
-        for j in range(j_low, j_high):
+        if bands is None:
+            (row_j_low, row_j_high, track_offset) = (j_low, j_high, 0)
+        else:
+            track_offset = bands[i, 0]
+            row_j_low = max(j_low, track_offset)
+            row_j_high = min(j_high, bands[i, 1])
+        for j in range(row_j_low, row_j_high):
             y = y_index[j]
             j_sources = preds[1][j]
             for (state, bin, dx, dy) in state_directions:
@@ -117,6 +146,9 @@ def py_calc_rows(plan, x_index, y_index, i_low, i_high, j_low, j_high,
                 for (a, prev_i) in enumerate([[i], i_sources][dx]):
                     source_row = rows[plan[prev_i]]
                     for (b, prev_j) in enumerate([[j], j_sources][dy]):
+                        if bands is not None and not (
+                                bands[prev_i, 0] <= prev_j < bands[prev_i, 1]):
+                            continue  # outside the band so impossible
                         source_posn = source_row[prev_j]
                         for prev_state in source_states:
                             prev_value = source_posn[prev_state]
@@ -148,7 +180,8 @@ def py_calc_rows(plan, x_index, y_index, i_low, i_high, j_low, j_high,
                 else:
                     current_row[j, state] = cumulative_score * d_score
                 if track is not None:
-                    track[i,j,state] = (numpy.array(pointer) << track_enc).sum()
+                    track[i,j-track_offset,state] = (
+                            numpy.array(pointer) << track_enc).sum()
                 if (i==i_high-1 and j==j_high-1 and not local) or (
                         local and dx and dy and current_row[j, state] > best_score):
                     (best, best_score) = (((i, j), state), current_row[j, state])
@@ -255,8 +288,11 @@ class Pair(object):
                 self.children, index)]
         return Pair(*children)
         
-    def _decode_state(self, track, encoding, posn, pstate):
-        coded = int(track[posn[0], posn[1], pstate])
+    def _decode_state(self, track, encoding, posn, pstate, bands=None):
+        if bands is None:
+            coded = int(track[posn[0], posn[1], pstate])
+        else:
+            coded = int(track[posn[0], posn[1]-bands[posn[0], 0], pstate])
         (a, b, state) = encoding.decode(coded)
         if state >= track.shape[-1]:
             raise ArithmeticError('Error state in traceback')
@@ -269,12 +305,13 @@ class Pair(object):
             next = numpy.array([x,y], int)
         return (next, (a, b), state)
     
-    def traceback(self, track, encoding, posn, state, skip_last=False):
+    def traceback(self, track, encoding, posn, state, skip_last=False,
+            bands=None):
         result = []
         started = False
         while 1:
             (nposn, (a, b), nstate) = self._decode_state(track, encoding, 
-                    posn, state)
+                    posn, state, bands)
             if state:
                 result.append((state, posn, (a>0, b>0)))
             if started and state == 0:
@@ -296,6 +333,22 @@ class Pair(object):
         (pog1, pog2) = [child.getPOG() for child in self.children]
         return pog1.traceback(pog2, aligned_positions)
         
+    def getBand(self, width):
+        """[row, (low, high)] columns of the DP matrix within 'width' cells
+        of a path through k-mer anchored diagonal segments"""
+        if not self.both_seqs:
+            raise ValueError('banded alignment needs two sequences, not '
+                    'partial order graphs')
+        # one character per motif, for the dotplot code
+        codes = {}
+        seqs = []
+        for child in self.children:
+            leaf = child.leaf
+            chars = [chr(1 + min(254, codes.setdefault(motif, len(codes))))
+                    for motif in leaf.uniq]
+            seqs.append(''.join([chars[u] for u in leaf.index]))
+        return anchored_band(seqs[0], seqs[1], width)
+    
     def getPointerEncoding(self, n_states):
         assert n_states <= self.pointer_encoding.max_states, (
             n_states, self.pointer_encoding.max_states)
@@ -306,13 +359,17 @@ class Pair(object):
         N = self.size[1]
         return (needed, N)
     
-    def getEmptyScoreArrays(self, n_states, dp_options):
+    def getEmptyScoreArrays(self, n_states, dp_options, buffers=None):
+        if buffers is None:
+            buffers = DPBuffers()
         shape = self.getScoreArraysShape() + (n_states,)
-        mantissas = numpy.zeros(shape, float)
         if dp_options.use_logs:
-            mantissas[:] = numpy.log(0.0)
+            impossible = numpy.log(0.0)
+        else:
+            impossible = 0.0
+        mantissas = buffers.getArray('mantissas', shape, float, impossible)
         if dp_options.use_scaling:
-            exponents = numpy.ones(shape, int) * -10000
+            exponents = buffers.getArray('exponents', shape, int, -10000)
         else:
             exponents = None
         return (mantissas, exponents)
@@ -600,9 +657,26 @@ class PairEmissionProbs(object):
             if i > last_i:
                 rr = pair.calcRows(last_i+1, i+1, 0, N-1,
                     state_directions, T, scores, rows, None, None, **kw)
+                if kw['viterbi'] and kw['use_logs']:
+                    # the same as the END transitions below, for a whole row.
+                    # Like them it ignores NaNs, which the pure Python DP can
+                    # leave in the first column.
+                    row = mantissas[pair.plan[i]]
+                    row = numpy.where(numpy.isnan(row), impossible, row)
+                    if backward:
+                        row_scores = numpy.max(
+                            row[:, 1:, numpy.newaxis] + T[1:], axis=1)
+                    else:
+                        row_scores = row
+                        row_scores[:, 0] = impossible
+                else:
+                    row_scores = None
             else:
                 assert i == last_i, (i, last_i)
             last_i = i
+            if row_scores is not None and (i or j):
+                probs.append(row_scores[j, state])
+                continue
             T2 = T.copy()
             if backward:
                 T2[:, -1] = T[:, state]
@@ -696,33 +770,56 @@ class PairEmissionProbs(object):
             probs[p_rows.index(i)] for i in last_row])
         return result
         
-    def dp(self, TM, dp_options, cells=None, backward=False):
+    def dp(self, TM, dp_options, cells=None, backward=False, buffers=None):
         """Score etc. from a Dynamic Programming function applied to this pair.
         
         TM - (state_directions, array) describing the Transition Matrix.
         dp_options - instance of DPFlags indicating algorithm etc.
         cells - List of (state, posn) for which posterior probs are requested.
         backward - run algorithm in reverse order.
+        buffers - DPBuffers to reuse rather than allocating new arrays.
         """
         (state_directions, T) = TM
+        if dp_options.band is not None and cells is None and \
+                not self.pair.both_seqs:
+            # eg: the inner edges of a progressive alignment
+            warnings.warn('band ignored, only used when aligning two '
+                    'sequences', stacklevel=4)
+            bands = None
+        elif dp_options.band is not None and cells is None:
+            bands = self.pair.getBand(dp_options.band)
+            if bool(dp_options.backward) ^ bool(backward):
+                bands = self.pair.size[1] - bands[::-1, ::-1]
+        else:
+            bands = None
         if dp_options.viterbi and cells is None:
             encoder = self.pair.getPointerEncoding(len(T))
-            problem_dimensions = self.pair.size + [len(T)]
+            if bands is None:
+                problem_dimensions = self.pair.size + [len(T)]
+            else:
+                width = max(bands[:, 1] - bands[:, 0])
+                problem_dimensions = [self.pair.size[0], width, len(T)]
             problem_size = numpy.product(problem_dimensions)
             memory = problem_size * encoder.bytes / 10**6
+            if dp_options.linear_space and (dp_options.local or
+                    bands is not None):
+                warnings.warn('linear_space ignored, only used for global '
+                        'unbanded alignment', stacklevel=4)
             if dp_options.local:
                 msg = 'Local alignment'
             elif cells is not None:
                 msg = 'Posterior probs'
-            elif self.pair.size[0]-2 >= 3 and not backward and (
-                    problem_size > HIRSCHBERG_LIMIT or 
+            elif bands is None and self.pair.size[0]-2 >= 3 and (
+                    not backward) and dp_options.linear_space is not False and (
+                    (dp_options.linear_space and problem_size > HIRSCHBERG_MIN)
+                    or problem_size > HIRSCHBERG_LIMIT or 
                     parallel.getCommunicator().Get_size() > 1):
                  return self.hirschberg(TM, dp_options)
             else:
                 msg = 'dp'
             if memory > 500:
                 warnings.warn('%s will use > %sMb.' % (msg, memory))
-            track = encoder.getEmptyArray(problem_dimensions)
+            track = encoder.getEmptyArray(problem_dimensions, buffers)
         else:
             track = encoder = None
         
@@ -731,6 +828,8 @@ class PairEmissionProbs(object):
                 use_logs=dp_options.use_logs,
                 viterbi=dp_options.viterbi,
                 local=dp_options.local)
+        if bands is not None:
+            kw['bands'] = bands
         
         if dp_options.backward:
             backward = not backward
@@ -751,7 +850,7 @@ class PairEmissionProbs(object):
         scores = self._getEmissionProbs(
                 dp_options.use_logs, dp_options.use_cost_function)
         
-        rows = pair.getEmptyScoreArrays(len(T), dp_options)
+        rows = pair.getEmptyScoreArrays(len(T), dp_options, buffers)
         
         if cells is not None:
             assert not dp_options.local
@@ -774,7 +873,7 @@ class PairEmissionProbs(object):
                 result = score
             else:
                 tb = self.pair.traceback(track, encoder, maxpos, state,
-                    skip_last = not dp_options.local)
+                    skip_last = not dp_options.local, bands=bands)
                 result = (score, tb)
         return result
         
@@ -849,7 +948,8 @@ class ReversiblePairEmissionProbs(object):
 
 class DPFlags(object):
     def __init__(self, viterbi, local=False, use_logs=None,
-            use_cost_function=True, use_scaling=None, backward=False):
+            use_cost_function=True, use_scaling=None, backward=False,
+            band=None, linear_space=None):
         if use_logs is None:
             use_logs = viterbi and not use_scaling
         if use_scaling is None:
@@ -862,8 +962,13 @@ class DPFlags(object):
         self.use_scaling = use_scaling
         self.viterbi = viterbi
         self.backward = backward
+        # half width of the band of cells calculated, or None for all
+        self.band = band
+        # Hirschberg's algorithm: always, never, or None for when the
+        # traceback array would be larger than HIRSCHBERG_LIMIT
+        self.linear_space = linear_space
         self.as_tuple = (local, use_logs, use_cost_function, use_scaling,
-                viterbi, backward)
+                viterbi, backward, band, linear_space)
     
     def __hash__(self):
         return hash(self.as_tuple)
@@ -4,6 +4,7 @@ from __future__ import with_statement
 from cogent import LoadTree
 from cogent.phylo import nj as NJ
 from cogent.phylo.distance import EstimateDistances
+from cogent.phylo.kmer_distance import kmer_distances
 from cogent.core.info import Info
 from cogent.util import progress_display as UI
 
@@ -18,15 +19,17 @@ __status__ = "Production"
 
 @UI.display_wrap
 def TreeAlign(model, seqs, tree=None, indel_rate=0.01, indel_length=0.01,
-    ui = None, ests_from_pairwise=True, param_vals=None):
+    ui = None, ests_from_pairwise=True, param_vals=None, linear_space=None,
+    kmer_tree=False):
     """Returns a multiple alignment and tree.
     
     Uses the provided substitution model and a tree for determining the
     progressive order. If a tree is not provided a Neighbour Joining tree is
     constructed from pairwise distances estimated from pairwise aligning the
-    sequences. If running in parallel, only the distance estimation is
-    parallelised and only the master CPU returns the alignment and tree, other
-    CPU's return None, None.
+    sequences, or with kmer_tree=True from much quicker alignment free
+    k-mer distances. If running in parallel, the distance estimation is
+    parallelised, as are the progressive alignment steps to the extent that
+    the tree allows: sibling subtrees are aligned at the same time.
     
     Arguments:
         - model: a substitution model
@@ -36,6 +39,13 @@ def TreeAlign(model, seqs, tree=None, indel_rate=0.01, indel_length=0.01,
           of the substitution model parameters are used
         - param_vals: named key, value pairs for model parameters. These
           override ests_from_pairwise.
+        - kmer_tree: if no tree provided and True, the Neighbour Joining tree
+          is built from kmer_distances() and, as there are no pairwise
+          alignments, ests_from_pairwise is ignored.
+        - linear_space: if True use Hirschberg's algorithm for every pairwise
+          alignment, which needs memory proportional to the sequence lengths
+          rather than their product but takes about twice as long.  If None
+          it is only used for very large alignments.
     """
     _exclude_params = ['mprobs', 'rate', 'bin_switch']
     if param_vals:
@@ -60,6 +70,10 @@ def TreeAlign(model, seqs, tree=None, indel_rate=0.01, indel_length=0.01,
     elif two_seqs:
         tree = LoadTree(tip_names=seqs.getSeqNames())
         ests_from_pairwise = False
+    elif kmer_tree:
+        dists = kmer_distances(seqs, moltype=model.MolType)
+        tree = NJ.nj(dists)
+        ests_from_pairwise = False
     else:
         if ests_from_pairwise:
             est_params = [param for param in model.getParamList() \
@@ -72,7 +86,8 @@ def TreeAlign(model, seqs, tree=None, indel_rate=0.01, indel_length=0.01,
         dists = dcalc.getPairwiseDistances()
         tree = NJ.nj(dists)
     
-    LF = model.makeLikelihoodFunction(tree.bifurcating(), aligned=False)
+    LF = model.makeLikelihoodFunction(tree.bifurcating(), aligned=False,
+            linear_space=linear_space, parallel_subtrees=True)
     if ests_from_pairwise and not param_vals:
         # we use the Median to avoid the influence of outlier pairs
         param_vals = {}
@@ -90,7 +105,8 @@ def TreeAlign(model, seqs, tree=None, indel_rate=0.01, indel_length=0.01,
         LF.setParamRule('indel_length', value=indel_length, is_constant=True)
         LF.setSequences(seqs)
     edge = LF.getLogLikelihood().edge
-    (vtLnL, align) = edge.getViterbiScoreAndAlignment(0.5)
+    (vtLnL, align) = edge.getViterbiScoreAndAlignment(0.5,
+            linear_space=linear_space)
     info = Info()
     info["AlignParams"] = param_vals
     info["AlignParams"].update(dict(indel_length=indel_length, indel_rate=indel_rate))
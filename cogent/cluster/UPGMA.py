@@ -7,12 +7,16 @@ UPGMA_cluster takes an array and a list of PhyloNode objects corresponding
 to the array as input. Can also generate this type of input from a Dict2D using
 inputs_from_dict2D function.
 
+nn_chain_cluster does the same from a 1D array of the distances, as used by
+upgma, using much less time and memory for large numbers of sequences.
+
 Both return a PhyloNode object of the UPGMA cluster
 """
 
 from numpy import array, ravel, argmin, take, sum, average, ma, diag
 from cogent.core.tree import PhyloNode
 from cogent.util.dict2d import Dict2D
+from cogent.phylo.util import CondensedDistances
 
 __author__ = "Catherine Lozupone"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -28,26 +32,43 @@ numerictypes = numpy.core.numerictypes.sctype2char
 Float = numerictypes(float)
 BIG_NUM = 1e305
 
-def upgma(pairwise_distances):
+def upgma(pairwise_distances, dtype=Float):
     """Uses the UPGMA algorithm to cluster sequences
 
-    pairwise_distances: a dictionary with pair tuples mapped to a distance
+    pairwise_distances: a dictionary with pair tuples mapped to a distance,
+        or a cogent.phylo.util.CondensedDistances
+    dtype: of the distances while clustering, eg: numpy.float32 to halve
+        the memory needed
     returns a PhyloNode object of the UPGMA cluster
     """
-    items_in_matrix = []
-    for i in pairwise_distances:
-        if i[0] not in items_in_matrix:
-            items_in_matrix.append(i[0])
-        if i[1] not in items_in_matrix:
-            items_in_matrix.append(i[1])
-    dict2d_input = [(i[0], i[1], pairwise_distances[i]) for i in \
-            pairwise_distances]
-    dict2d_input.extend([(i[1], i[0], pairwise_distances[i]) for i in \
-            pairwise_distances])
-    dict2d_input = Dict2D(dict2d_input, RowOrder=items_in_matrix, \
-            ColOrder=items_in_matrix, Pad=True, Default=BIG_NUM)
-    matrix_a, node_order = inputs_from_dict2D(dict2d_input)
-    tree = UPGMA_cluster(matrix_a, node_order, BIG_NUM)
+    large_value = min(BIG_NUM, numpy.finfo(dtype).max)
+    if isinstance(pairwise_distances, CondensedDistances):
+        items_in_matrix = pairwise_distances.Names
+        dists = numpy.array(pairwise_distances.Data, dtype)
+        dists[numpy.isnan(dists)] = large_value
+    else:
+        items_in_matrix = []
+        index = {}
+        for pair in pairwise_distances:
+            for name in pair:
+                if name not in index:
+                    index[name] = len(items_in_matrix)
+                    items_in_matrix.append(name)
+        num_items = len(items_in_matrix)
+        dists = numpy.empty([num_items * (num_items - 1) // 2], dtype)
+        dists[:] = large_value
+        for ((name1, name2), distance) in pairwise_distances.items():
+            (i, j) = (index[name1], index[name2])
+            if i > j:
+                (i, j) = (j, i)
+            if i != j:
+                position = j * (j - 1) // 2 + i
+                dists[position] = min(dists[position], distance)
+    node_order = [PhyloNode(Name=name) for name in items_in_matrix]
+    tree = nn_chain_cluster(dists, node_order)
+    return _named_internal_nodes(tree)
+
+def _named_internal_nodes(tree):
     index = 0
     for node in tree.traverse():
         if not node.Parent:
@@ -106,11 +127,17 @@ def condense_node_order(matrix, smallest_index, node_order):
     Also sets the branch length of the nodes to 1/2 of the distance between
     the nodes in the matrix"""
     index1, index2 = smallest_index
-    node1 = node_order[index1]
-    node2 = node_order[index2]
-    #get the distance between the nodes and assign 1/2 the distance to the
-    #Length property of each node
     distance = matrix[index1, index2]
+    #replace the object at index1 with the combined node
+    node_order[index1] = _join_nodes(node_order[index1], node_order[index2],
+            distance)
+    #replace the object at index2 with None
+    node_order[index2] = None
+    return node_order
+
+def _join_nodes(node1, node2, distance):
+    """PhyloNode with children node1 and node2, which are each given 1/2 of
+    the distance between them less their own height as a branch length"""
     nodes = [node1,node2]
     d = distance/2.0
     for n in nodes:
@@ -125,11 +152,7 @@ def condense_node_order(matrix, smallest_index, node_order):
     new_node.Children.append(node2)
     node1.Parent = new_node
     node2.Parent = new_node
-    #replace the object at index1 with the combined node
-    node_order[index1] = new_node
-    #replace the object at index2 with None
-    node_order[index2] = None
-    return node_order
+    return new_node
 
 def UPGMA_cluster(matrix, node_order, large_number):
     """cluster with UPGMA
@@ -158,6 +181,65 @@ def UPGMA_cluster(matrix, node_order, large_number):
         tree = node_order[smallest_index[0]]
     return tree
 
+def nn_chain_cluster(dists, node_order):
+    """cluster with UPGMA using the nearest neighbour chain algorithm
+    
+    Gives the same tree as UPGMA_cluster, barring ties, in O(n^2) rather
+    than O(n^3) time, and without a square matrix.
+    
+    dists is a 1D numpy array of the distances between the nodes, with
+    the distance between nodes i and j (i < j) at j*(j-1)//2 + i, as in
+    cogent.phylo.util.CondensedDistances.
+    node_order is a list of PhyloNode objects corresponding to dists.
+    
+    WARNING: Changes dists and node_order in-place.
+    """
+    num_entries = len(node_order)
+    assert len(dists) == num_entries * (num_entries - 1) // 2
+    indices = numpy.arange(num_entries)
+    row_starts = indices * (indices - 1) // 2
+    def row_positions(i):
+        # positions in dists of d[i, k] for all k, with a dummy for d[i, i]
+        return numpy.concatenate(
+                [row_starts[i] + indices[:i], [0], row_starts[i+1:] + i])
+    
+    active = numpy.ones([num_entries], bool)
+    chain = []
+    tree = node_order[0]
+    for joins in range(num_entries - 1):
+        # extend a chain of nearest neighbours until its last two nodes are
+        # each other's nearest neighbour, then join them.
+        while True:
+            if not chain:
+                chain.append(numpy.flatnonzero(active)[0])
+            current = chain[-1]
+            row = dists[row_positions(current)]
+            row[~active] = numpy.inf
+            row[current] = numpy.inf
+            nearest = numpy.argmin(row)
+            if len(chain) > 1:
+                previous = chain[-2]
+                if row[previous] == row[nearest]:
+                    nearest = previous
+                if nearest == previous:
+                    break
+            chain.append(nearest)
+        chain[-2:] = []
+        (index1, index2) = sorted([current, nearest])
+        tree = _join_nodes(node_order[index1], node_order[index2],
+                float(row[nearest]))
+        node_order[index1] = tree
+        node_order[index2] = None
+        
+        #the new node's distances are the average of the two rows
+        active[index2] = False
+        others = active.copy()
+        others[index1] = False
+        positions1 = row_positions(index1)[others]
+        positions2 = row_positions(index2)[others]
+        dists[positions1] = (dists[positions1] + dists[positions2]) / 2
+    return tree
+
 def inputs_from_dict2D(dict2d_matrix):
     """makes inputs for UPGMA_cluster from a Dict2D object
     
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 
-__all__ = ['alignment', 'alphabet', 'annotation', 'bitvector', 'entity',
-           'genetic_code', 'info', 'location', 'moltype', 'profile', 'sequence',
-           'tree', 'usage']
+__all__ = ['alignment', 'alphabet', 'annotation', 'bitvector',
+           'compact_tree', 'entity', 'genetic_code', 'info', 'location',
+           'moltype', 'profile', 'sequence', 'tree', 'usage']
 
 __author__ = ""
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -381,6 +381,10 @@ class JointEnumeration(Enumeration):
         #remember to reset shape after superclass init
         self.Shape = tuple(sub_enum_lengths)
     
+    def __getnewargs__(self):
+        # for pickle protocol 2, which passes these to __new__
+        return (self.SubEnumerations, self.Gap, self.MolType)
+    
     def _coerce_enumerations(cls, enums):
         """Coerces putative enumerations into Enumeration objects.
         
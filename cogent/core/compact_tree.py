@@ -0,0 +1,635 @@
+#!/usr/bin/env python
+"""A read-only tree stored in numpy arrays rather than as node objects.
+
+Very large trees take a lot of memory and time as TreeNode/PhyloNode
+objects, since each node is an object with its own list of children and
+dict of parameters.  A CompactTree instead keeps one array for each
+attribute, with the nodes numbered in preorder, so that every subtree
+occupies a contiguous range of node numbers and of tip numbers.
+
+CompactNode objects are lightweight views of single nodes, created as
+needed, providing the commonly used read-only parts of the TreeNode and
+PhyloNode API.  A CompactTree is also the CompactNode for its own root.
+Conversion to and from PhyloNode trees is lossless except that branch
+lengths are always floats.
+"""
+
+import re
+import numpy
+
+from cogent.core.tree import PhyloNode, TreeBuilder, TreeError, LCAIndex, \
+        tip_distance_matrix
+from cogent.parse.newick import parse_arrays
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+def _newick_name(name, escape_name):
+    # Same as in TreeNode.getNewick
+    if name is None:
+        return ''
+    name = str(name)
+    if escape_name and not (name.startswith("'") and name.endswith("'")):
+        if re.search("""[]['"(),:;_]""", name):
+            name = "'%s'" % name.replace("'", "''")
+        else:
+            name = name.replace(' ','_')
+    return name
+
+class CompactNode(object):
+    """One node of a CompactTree"""
+
+    __slots__ = ['Tree', 'Index']
+
+    def __init__(self, tree, index):
+        self.Tree = tree
+        self.Index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactNode) and
+                self.Tree is other.Tree and self.Index == other.Index)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self.Tree), self.Index))
+
+    def __repr__(self):
+        return 'CompactNode(%r, %s)' % (self.Name, self.Index)
+
+    def __str__(self):
+        """Returns Newick-format string, with names and distances."""
+        return self.getNewick(with_distances=True)
+
+    def _node(self, index):
+        if index == self.Index:
+            return self
+        return CompactNode(self.Tree, index)
+
+    def _range(self):
+        return (self.Index, self.Index + self.Tree.Sizes[self.Index])
+
+    def _tipRange(self):
+        tree = self.Tree
+        return (tree.TipStarts[self.Index], tree.TipStops[self.Index])
+
+    def _childIndices(self, index=None):
+        if index is None:
+            index = self.Index
+        (first_child, next_sibling) = (self.Tree.FirstChildren,
+                self.Tree.NextSiblings)
+        children = []
+        child = first_child[index]
+        while child >= 0:
+            children.append(child)
+            child = next_sibling[child]
+        return children
+
+    Name = property(lambda self: self.Tree.Names[self.Index])
+    NameLoaded = property(
+            lambda self: bool(self.Tree.NamesLoaded[self.Index]))
+
+    def _get_length(self):
+        length = self.Tree.Lengths[self.Index]
+        if length != length:
+            return None
+        return float(length)
+    Length = property(_get_length)
+
+    def _get_params(self):
+        params = dict(self.Tree.NodeParams.get(self.Index, {}))
+        params['length'] = self.Length
+        return params
+    params = property(_get_params)
+
+    def _get_parent(self):
+        if self.Index == 0:
+            return None
+        return CompactNode(self.Tree, self.Tree.Parents[self.Index])
+    Parent = property(_get_parent)
+
+    def _get_children(self):
+        return [CompactNode(self.Tree, i) for i in self._childIndices()]
+    Children = property(_get_children)
+
+    def istip(self):
+        """Returns True if is tip, i.e. no children."""
+        return self.Tree.Sizes[self.Index] == 1
+
+    def isRoot(self):
+        """Returns True if the current is a root, i.e. has no parent."""
+        return self.Index == 0
+
+    def __len__(self):
+        """Number of children"""
+        return int(self.Tree.NumChildren[self.Index])
+
+    def __getitem__(self, i):
+        return self.Children[i]
+
+    def __iter__(self):
+        return iter(self.Children)
+
+    def root(self):
+        """Returns root of the tree self is in."""
+        return self.Tree
+
+    def ancestors(self):
+        """Returns all ancestors back to the root, nearest first."""
+        result = []
+        index = self.Tree.Parents[self.Index]
+        while index >= 0:
+            result.append(CompactNode(self.Tree, index))
+            index = self.Tree.Parents[index]
+        return result
+
+    def preorder(self, include_self=True):
+        """Performs preorder iteration over tree."""
+        (start, stop) = self._range()
+        if not include_self:
+            start += 1
+        for index in xrange(start, stop):
+            yield self._node(index)
+
+    def postorder(self, include_self=True):
+        """Performs postorder iteration over tree."""
+        tree = self.Tree
+        end = tree.PostorderPositions[self.Index] + 1
+        start = end - tree.Sizes[self.Index]
+        if not include_self:
+            end -= 1
+        for index in tree.Postorder[start:end]:
+            yield self._node(index)
+
+    def pre_and_postorder(self, include_self=True):
+        """Performs iteration over tree, visiting node before and after."""
+        tree = self.Tree
+        (start, stop) = self._range()
+        open_nodes = []
+        for index in xrange(start, stop):
+            while open_nodes and index >= open_nodes[-1] + tree.Sizes[
+                    open_nodes[-1]]:
+                closing = open_nodes.pop()
+                if include_self or closing != start:
+                    yield self._node(closing)
+            if include_self or index != start:
+                yield self._node(index)
+            if tree.Sizes[index] > 1:
+                open_nodes.append(index)
+        while open_nodes:
+            closing = open_nodes.pop()
+            if include_self or closing != start:
+                yield self._node(closing)
+
+    def traverse(self, self_before=True, self_after=False, include_self=True):
+        """Returns iterator over descendants, as for TreeNode.traverse"""
+        if self_before:
+            if self_after:
+                return self.pre_and_postorder(include_self=include_self)
+            else:
+                return self.preorder(include_self=include_self)
+        else:
+            if self_after:
+                return self.postorder(include_self=include_self)
+            else:
+                return self.iterTips(include_self=include_self)
+
+    def iterTips(self, include_self=False):
+        """Iterates over tips descended from self, [] if self is a tip."""
+        if self.istip():
+            if include_self:
+                yield self
+            return
+        (start, stop) = self._tipRange()
+        for index in self.Tree.Tips[start:stop]:
+            yield CompactNode(self.Tree, index)
+
+    def tips(self, include_self=False):
+        """Returns tips descended from self, [] if self is a tip."""
+        return list(self.iterTips(include_self=include_self))
+
+    def iterNontips(self, include_self=False):
+        """Iterates over nontips descended from self, [] if none."""
+        for node in self.preorder(include_self=include_self):
+            if not node.istip():
+                yield node
+
+    def nontips(self, include_self=False):
+        """Returns nontips descended from self."""
+        return list(self.iterNontips(include_self=include_self))
+
+    def getNodeNames(self, includeself=True, tipsonly=False):
+        """Names of the nodes, in preorder, or of the tips only"""
+        names = self.Tree.Names
+        if tipsonly:
+            if self.istip():
+                return [names[self.Index]]
+            (start, stop) = self._tipRange()
+            return [names[i] for i in self.Tree.Tips[start:stop]]
+        (start, stop) = self._range()
+        if not includeself:
+            start += 1
+        return names[start:stop]
+
+    def getTipNames(self, includeself=False):
+        """return the list of the names of all tips contained by this edge
+        """
+        return self.getNodeNames(includeself, tipsonly=True)
+
+    def _nameIndex(self, name):
+        # First node with 'name' in the subtree, or None
+        tree = self.Tree
+        if tree._name_index is None:
+            tree._name_index = {}
+            for (index, node_name) in enumerate(tree.Names):
+                tree._name_index.setdefault(node_name, index)
+        (start, stop) = self._range()
+        index = tree._name_index.get(name)
+        if index is not None and not start <= index < stop:
+            index = None
+            for index in xrange(start, stop):
+                if tree.Names[index] == name:
+                    break
+            else:
+                index = None
+        return index
+
+    def getNodeMatchingName(self, name):
+        index = self._nameIndex(name)
+        if index is None:
+            raise TreeError("No node named '%s' in %s" %
+                    (name, self.getTipNames()))
+        return self._node(index)
+
+    def getNewick(self, with_distances=False, semicolon=True,
+            escape_name=True):
+        """Return the newick string for this tree, as TreeNode.getNewick"""
+        tree = self.Tree
+        (names, loaded, lengths, sizes, parents) = (tree.Names,
+                tree.NamesLoaded.tolist(), tree.Lengths.tolist(),
+                tree.Sizes.tolist(), tree.Parents.tolist())
+
+        def label(index):
+            if loaded[index]:
+                text = _newick_name(names[index], escape_name)
+            else:
+                text = ''
+            length = lengths[index]
+            if with_distances and length == length:
+                text = "%s:%s" % (text, length)
+            return text
+
+        (start, stop) = self._range()
+        if stop - start == 1:
+            result = [[label(start), ''][not loaded[start]]]
+        else:
+            result = []
+            open_nodes = []
+            for index in xrange(start, stop):
+                while open_nodes and index >= open_nodes[-1] + sizes[
+                        open_nodes[-1]]:
+                    result.append(')' + label(open_nodes.pop()))
+                if index != start and parents[index] != index - 1:
+                    result.append(',')
+                if sizes[index] > 1:
+                    result.append('(')
+                    open_nodes.append(index)
+                else:
+                    result.append(label(index))
+            while open_nodes:
+                result.append(')' + label(open_nodes.pop()))
+        if semicolon:
+            result.append(';')
+        return ''.join(result)
+
+    def _indices(self, nodes):
+        # node numbers from a list of CompactNodes or names
+        if len(nodes) and isinstance(nodes[0], CompactNode):
+            return [node.Index for node in nodes]
+        return [self.getNodeMatchingName(name).Index for name in nodes]
+
+    def tipToTipDistances(self, endpoints=None, default_length=1):
+        """Returns distance matrix between all pairs of tips, and a tip
+        order, as PhyloNode.tipToTipDistances."""
+        tree = self.Tree
+        (start, stop) = self._range()
+        (tip_start, tip_stop) = self._tipRange()
+        if endpoints is None:
+            positions = numpy.arange(tip_start, tip_stop)
+        else:
+            positions = tree.TipStarts[self._indices(endpoints)]
+        tip_order = [CompactNode(tree, i) for i in tree.Tips[positions]]
+        result = tip_distance_matrix(positions - tip_start,
+                tree.Tips[tip_start:tip_stop] - start,
+                tree.Parents[start:stop] - start,
+                tree.getRootDistances(default_length)[start:stop],
+                tree.TipStarts[start:stop] - tip_start,
+                tree.TipStops[start:stop] - tip_start)
+        return (result, tip_order)
+
+    def lowestCommonAncestors(self, nodes1, nodes2):
+        """Array of the node number of the lowest common ancestor of each
+        node (or name) in nodes1 with the corresponding one in nodes2"""
+        return self.Tree.getLCAIndex().lowestCommonAncestors(
+                self._indices(nodes1), self._indices(nodes2))
+
+    def pairDistances(self, nodes1, nodes2, default_length=1):
+        """Array of the distance between each node (or name) in nodes1 and
+        the corresponding one in nodes2.  Unlike tipToTipDistances, this
+        takes constant time per pair once the LCA index has been made."""
+        tree = self.Tree
+        return tree.getLCAIndex().pairDistances(self._indices(nodes1),
+                self._indices(nodes2), tree.getRootDistances(default_length))
+
+    def getSubTree(self, name_list, ignore_missing=False, keep_root=False):
+        """A new CompactTree of the sub tree that contains all the otus
+        that are listed in name_list, as for TreeNode.getSubTree"""
+        tree = self.Tree
+        (start, stop) = self._range()
+        included = set(name_list)
+        names = tree.Names[start:stop]
+        if not ignore_missing:
+            present = set(names)
+            for name in name_list:
+                if name not in present:
+                    raise ValueError("edge %s not found in tree" % name)
+
+        # Selected nodes are copied along with all their descendants.
+        sizes = tree.Sizes[start:stop]
+        selected = numpy.array([i for (i, name) in enumerate(names)
+                if name in included], int)
+        change = (numpy.bincount(selected, minlength=stop - start + 1) -
+                numpy.bincount(selected + sizes[selected],
+                    minlength=stop - start + 1))
+        copied = numpy.cumsum(change)[:-1] > 0
+        count = numpy.concatenate([[0], numpy.cumsum(copied)])
+        wanted = (count[numpy.arange(stop - start) + sizes] -
+                count[:stop - start]) > 0
+
+        # Nodes outside the copied clades are rebuilt, in postorder, as
+        # (index, length, params, children) or None, like _getSubTree
+        (parents, lengths) = (tree.Parents.tolist(), tree.Lengths.tolist())
+        results = {}
+        def rebuilt(index):
+            return results.pop(index, None)
+
+        for index in self.postorder():
+            i = index.Index
+            if not wanted[i - start]:
+                continue
+            params = tree.NodeParams.get(i, {})
+            if copied[i - start]:
+                if i == start or not copied[parents[i] - start]:
+                    results[i] = (i, lengths[i], params, None)
+                continue
+            children = [rebuilt(child) for child in self._childIndices(i)]
+            children = [child for child in children if child is not None]
+            if not children:
+                continue
+            elif len(children) == 1 and not (keep_root and i == start):
+                (child, child_length, child_params, grandchildren) = \
+                        children[0]
+                (length, merged) = (numpy.nan, {})
+                if lengths[i] == lengths[i] and child_length == child_length:
+                    total = lengths[i] + child_length
+                    if total:
+                        length = total
+                        for (name, value) in params.items():
+                            if child_params.get(name) is not None and \
+                                    value is not None:
+                                merged[name] = (value * lengths[i] +
+                                        child_params[name] * child_length
+                                        ) / total
+                results[i] = (child, length, merged, grandchildren)
+            else:
+                results[i] = (i, lengths[i], params, children)
+
+        result = results.get(start)
+        if result is None:
+            raise TreeError, "no tree created in make sub tree"
+        (root, length, params, children) = result
+        if children is None and tree.Sizes[root] == 1:
+            raise TreeError, "only a tip was returned from selecting sub tree"
+        if len(self._childIndices()) > 2:
+            result = self._unrooted(result)
+        return self._assemble(result)
+
+    def _unrooted(self, result):
+        # As TreeNode.unrooted, on the (index, length, params, children)
+        # form of a tree
+        (root, length, params, children) = result
+        if children is None:
+            children = [(child, self.Tree.Lengths[child],
+                    self.Tree.NodeParams.get(child, {}), None)
+                    for child in self._childIndices(root)]
+        need_to_expand = len(children) < 3
+        new_children = []
+        for child in children:
+            (index, child_length, child_params, grandchildren) = child
+            if grandchildren is None and self.Tree.Sizes[index] > 1:
+                grandchildren = [(i, self.Tree.Lengths[i],
+                        self.Tree.NodeParams.get(i, {}), None)
+                        for i in self._childIndices(index)]
+            if grandchildren and need_to_expand:
+                for (i, grand_length, grand_params, rest) in grandchildren:
+                    if grand_length == grand_length and \
+                            child_length == child_length:
+                        grand_length += child_length
+                    new_children.append(
+                            (i, grand_length, grand_params, rest))
+                need_to_expand = False
+            else:
+                new_children.append(child)
+        return (root, length, params, new_children)
+
+    def _assemble(self, result):
+        # New CompactTree from the (index, length, params, children) form
+        tree = self.Tree
+        (sources, parents, lengths, params) = ([], [], [], {})
+        stack = [(result, -1)]
+        while stack:
+            ((index, length, node_params, children), parent) = stack.pop()
+            position = len(sources)
+            if children is None:
+                # copy the whole clade
+                stop = index + tree.Sizes[index]
+                offset = position - index
+                sources.extend(range(index, stop))
+                parents.append(parent)
+                parents.extend((tree.Parents[index+1:stop] + offset).tolist())
+                lengths.append(length)
+                lengths.extend(tree.Lengths[index+1:stop].tolist())
+                for i in range(index + 1, stop):
+                    if i in tree.NodeParams:
+                        params[i + offset] = tree.NodeParams[i]
+            else:
+                sources.append(index)
+                parents.append(parent)
+                lengths.append(length)
+                stack.extend((child, position) for child in children[::-1])
+            if node_params:
+                params[position] = node_params
+        names = [tree.Names[i] for i in sources]
+        names[0] = "root"
+        name_loaded = tree.NamesLoaded[sources]
+        return CompactTree(parents, names, lengths, name_loaded, params)
+
+    def toTree(self, constructor=PhyloNode):
+        """An equivalent tree of TreeNode/PhyloNode objects"""
+        tree = self.Tree
+        (start, stop) = self._range()
+        (names, loaded, lengths, parents) = (tree.Names,
+                tree.NamesLoaded.tolist(), tree.Lengths.tolist(),
+                tree.Parents.tolist())
+        nodes = []
+        for index in xrange(start, stop):
+            params = dict(tree.NodeParams.get(index, {}))
+            length = lengths[index]
+            params['length'] = [None, length][length == length]
+            node = constructor(Name=names[index], NameLoaded=loaded[index],
+                    Params=params)
+            if index > start:
+                parent = nodes[parents[index] - start]
+                parent.Children.append(node)
+                node._parent = parent
+            nodes.append(node)
+        return nodes[0]
+
+
+class CompactTree(CompactNode):
+    """A tree stored as arrays of node attributes, indexed by the preorder
+    number of each node, the root being 0.
+
+    Attributes:
+        - Parents, FirstChildren, NextSiblings: node numbers, -1 if none
+        - Names: list of node names
+        - NamesLoaded: bool array
+        - Lengths: branch lengths, NaN where there is none
+        - NodeParams: dict of node number: dict of any other parameters
+        - Sizes: number of nodes in each subtree, so the subtree of node i
+          is nodes i to i+Sizes[i]-1
+        - NumChildren, Depths: depth being the number of edges from the root
+        - Tips: node numbers of the tips, in order
+        - TipStarts, TipStops: the tips of the subtree of node i are
+          Tips[TipStarts[i]:TipStops[i]]
+        - Postorder: node numbers in postorder, and PostorderPositions the
+          position of each node in it
+    """
+
+    def __init__(self, parents, names, lengths=None, name_loaded=None,
+            params=None):
+        """Arguments:
+            - parents: the parent of each node, in preorder, -1 for the root
+            - names: of each node
+            - lengths: branch lengths, None or NaN for missing
+            - name_loaded: for each node, default True where there is a name
+            - params: dict of node number: dict of other parameters
+        """
+        CompactNode.__init__(self, self, 0)
+        self.Parents = parents = numpy.array(parents, int)
+        num_nodes = len(parents)
+        if not num_nodes or parents[0] != -1:
+            raise TreeError("first node must be the root")
+        if not (parents[1:] < numpy.arange(1, num_nodes)).all():
+            raise TreeError("nodes must be in preorder")
+        self.Names = list(names)
+        assert len(self.Names) == num_nodes
+        if lengths is None:
+            lengths = [None] * num_nodes
+        self.Lengths = numpy.array([[length, numpy.nan][length is None]
+                for length in lengths], float)
+        if name_loaded is None:
+            name_loaded = [name is not None for name in self.Names]
+        self.NamesLoaded = numpy.array(name_loaded, bool)
+        self.NodeParams = dict(params or {})
+        self._name_index = None
+        self._lca_index = None
+
+        parent_list = parents.tolist()
+        sizes = [1] * num_nodes
+        for index in xrange(num_nodes - 1, 0, -1):
+            sizes[parent_list[index]] += sizes[index]
+        self.Sizes = numpy.array(sizes)
+        ends = numpy.arange(num_nodes) + self.Sizes
+        if not (ends[1:] <= ends[parents[1:]]).all():
+            raise TreeError("nodes must be in preorder")
+
+        self.NumChildren = numpy.bincount(parents[1:], minlength=num_nodes)
+        self.FirstChildren = -numpy.ones([num_nodes], int)
+        first = numpy.flatnonzero(parents[1:] == numpy.arange(num_nodes-1))
+        self.FirstChildren[first] = first + 1
+        self.NextSiblings = -numpy.ones([num_nodes], int)
+        has_sibling = ends[1:] < ends[parents[1:]]
+        self.NextSiblings[1:][has_sibling] = ends[1:][has_sibling]
+
+        depths = [0] * num_nodes
+        for index in xrange(1, num_nodes):
+            depths[index] = depths[parent_list[index]] + 1
+        self.Depths = numpy.array(depths)
+
+        is_tip = self.Sizes == 1
+        self.Tips = numpy.flatnonzero(is_tip)
+        tip_count = numpy.concatenate([[0], numpy.cumsum(is_tip)])
+        self.TipStarts = tip_count[:-1]
+        self.TipStops = tip_count[ends]
+        # preorder and postorder positions are related by the depth
+        self.PostorderPositions = ends - 1 - self.Depths
+        self.Postorder = numpy.empty([num_nodes], int)
+        self.Postorder[self.PostorderPositions] = numpy.arange(num_nodes)
+
+    def getRootDistances(self, default_length=1):
+        """Array of the distance of each node from the root"""
+        lengths = self.Lengths.copy()
+        lengths[numpy.isnan(lengths)] = default_length
+        lengths[0] = 0.0
+        parents = self.Parents.tolist()
+        lengths = lengths.tolist()
+        for index in xrange(1, len(lengths)):
+            lengths[index] += lengths[parents[index]]
+        return numpy.array(lengths)
+
+    def getLCAIndex(self):
+        """The LCAIndex of this tree, made on first use"""
+        if self._lca_index is None:
+            self._lca_index = LCAIndex(self.Parents, self.Depths)
+        return self._lca_index
+
+    @classmethod
+    def fromTree(cls, tree):
+        """CompactTree equivalent to a TreeNode/PhyloNode tree"""
+        (index, parents, names, lengths, loaded, params) = (
+                {}, [], [], [], [], {})
+        for (i, node) in enumerate(tree.preorder()):
+            index[id(node)] = i
+            parents.append([-1, index.get(id(node.Parent))][i > 0])
+            names.append(node.Name)
+            loaded.append(node.NameLoaded)
+            node_params = getattr(node, 'params', {})
+            lengths.append(node_params.get('length'))
+            other = dict((name, value) for (name, value)
+                    in node_params.items() if name != 'length')
+            if other:
+                params[i] = other
+        return cls(parents, names, lengths, loaded, params)
+
+    @classmethod
+    def fromNewick(cls, text, underscore_unmunge=False):
+        """CompactTree from a Newick-format string, without creating node
+        objects.  Nodes are named as by LoadTree."""
+        (parents, names, lengths, postorder) = parse_arrays(text,
+                underscore_unmunge=underscore_unmunge)
+        loaded = [name is not None for name in names]
+        unique_name = TreeBuilder()._unique_name
+        for index in postorder:
+            names[index] = unique_name(names[index])
+        if not loaded[0]:
+            names[0] = 'root'
+        return cls(parents, names, lengths, loaded)
+
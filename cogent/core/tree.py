@@ -26,6 +26,7 @@ Definition of relevant terms or abbreviations:
     -  stem: the edge immediately preceeding a clade
 """
 from numpy import zeros, argsort
+import numpy
 from copy import deepcopy
 import re
 from cogent.util.transform import comb
@@ -57,6 +58,177 @@ def distance_from_r(m1, m2):
 class TreeError(Exception):
     pass
 
+def tip_distance_matrix(positions, tips, parents, distances, tip_starts,
+        tip_stops):
+    """Matrix of the distances between the tips numbered 'positions',
+    filled in a rectangular block for each pair of sibling subtrees.
+
+    The other arguments describe the nodes of the tree, numbered in preorder
+    from 0 for the root: tips[tip_starts[i]:tip_stops[i]] are the node
+    numbers of the tips in the subtree of node i, parents[i] is the parent
+    of node i and distances[i] is its distance from the root.
+    """
+    positions = numpy.asarray(positions, int)
+    order = numpy.argsort(positions, kind='mergesort')
+    positions = positions[order]
+    # Rows of the sorted result matrix belonging to each node
+    starts = numpy.searchsorted(positions, tip_starts)
+    stops = numpy.searchsorted(positions, tip_stops)
+    parents = numpy.asarray(parents, int)[1:]
+    # Only children which share their parent's rows with others matter
+    children = numpy.flatnonzero(
+            (stops[1:] > starts[1:]) &
+            (stops[1:] - starts[1:] < stops[parents] - starts[parents])) + 1
+
+    distances = numpy.asarray(distances, float)
+    tip_distances = distances[numpy.asarray(tips, int)[positions]]
+    num_tips = len(positions)
+    result = numpy.empty([num_tips, num_tips], float)
+    result[:] = tip_distances[:, numpy.newaxis]
+    for child in children:
+        parent = parents[child - 1]
+        (lo, hi) = (starts[child], stops[child])
+        ancestor_distance = distances[parent]
+        result[lo:hi, starts[parent]:lo] = ancestor_distance
+        result[lo:hi, hi:stops[parent]] = ancestor_distance
+    # now d(x,y) = D(x) + D(y) - 2 D(LCA(x,y)), D being from the root
+    result *= -2
+    result += tip_distances[:, numpy.newaxis]
+    result += tip_distances
+    result[numpy.diag_indices(num_tips)] = 0.0
+
+    if (order[1:] > order[:-1]).all():
+        return result
+    inverse = numpy.empty_like(order)
+    inverse[order] = numpy.arange(num_tips)
+    return result[numpy.ix_(inverse, inverse)]
+
+class LCAIndex(object):
+    """Finds lowest common ancestors of nodes in constant time per pair,
+    after O(N log N) preparation.
+
+    Nodes are numbered in preorder.  For nodes u < v the LCA is the parent
+    of the shallowest node among u+1..v, which is the preorder equivalent of
+    the Euler tour method with half the array length.  That range minimum
+    is found from a sparse table of the shallowest node in each range of
+    2**k nodes.
+    """
+
+    def __init__(self, parents, depths=None):
+        """Arguments:
+            - parents: the parent of each node, in preorder, -1 for the root
+            - depths: number of edges from the root to each node, calculated
+              from parents if not given
+        """
+        self.Parents = parents = numpy.asarray(parents, int)
+        num_nodes = len(parents)
+        if depths is None:
+            parent_list = parents.tolist()
+            depths = [0] * num_nodes
+            for index in xrange(1, num_nodes):
+                depths[index] = depths[parent_list[index]] + 1
+        self.Depths = depths = numpy.asarray(depths, int)
+        levels = max(1, numpy.frexp(num_nodes)[1])
+        dtype = [int, numpy.int32][num_nodes < 2**31]
+        self._table = table = numpy.zeros([levels, num_nodes], dtype)
+        table[0] = numpy.arange(num_nodes)
+        for level in range(1, levels):
+            span = 2 ** (level-1)
+            width = num_nodes - 2 * span + 1
+            a = table[level-1, :width]
+            b = table[level-1, span:span+width]
+            table[level, :width] = numpy.where(depths[a] <= depths[b], a, b)
+
+    def lowestCommonAncestor(self, node1, node2):
+        """The number of the lowest common ancestor of two nodes"""
+        (node1, node2) = (int(node1), int(node2))
+        if node1 == node2:
+            return node1
+        (lo, hi) = (min(node1, node2) + 1, max(node1, node2))
+        level = (hi - lo + 1).bit_length() - 1
+        row = self._table[level]
+        (a, b) = (row[lo], row[hi - (1 << level) + 1])
+        if self.Depths[b] < self.Depths[a]:
+            a = b
+        return int(self.Parents[a])
+
+    def lowestCommonAncestors(self, nodes1, nodes2):
+        """Array of the number of the lowest common ancestor of each node in
+        nodes1 and the corresponding node in nodes2"""
+        nodes1 = numpy.asarray(nodes1, int)
+        nodes2 = numpy.asarray(nodes2, int)
+        same = nodes1 == nodes2
+        hi = numpy.maximum(nodes1, nodes2)
+        lo = numpy.where(same, hi, numpy.minimum(nodes1, nodes2) + 1)
+        level = numpy.frexp(hi - lo + 1)[1] - 1
+        a = self._table[level, lo]
+        b = self._table[level, hi - (1 << level) + 1]
+        shallowest = numpy.where(self.Depths[a] <= self.Depths[b], a, b)
+        return numpy.where(same, nodes1, self.Parents[shallowest])
+
+    def pairDistances(self, nodes1, nodes2, distances):
+        """Array of path lengths between each node in nodes1 and the
+        corresponding node in nodes2, given the distance of every node from
+        the root"""
+        nodes1 = numpy.asarray(nodes1, int)
+        nodes2 = numpy.asarray(nodes2, int)
+        distances = numpy.asarray(distances, float)
+        ancestors = self.lowestCommonAncestors(nodes1, nodes2)
+        return (distances[nodes1] + distances[nodes2] -
+                2 * distances[ancestors])
+
+class TreeLCAIndex(LCAIndex):
+    """An LCAIndex of the nodes of a TreeNode tree, made by
+    TreeNode.getLCAIndex.  Nodes[i] is the node numbered i.
+
+    Each node keeps a reference to the index, so that changing the tree
+    through the TreeNode methods invalidates it.
+    """
+
+    def __init__(self, root):
+        self.Nodes = nodes = list(root.preorder())
+        self._numbers = numbers = {}
+        for (i, node) in enumerate(nodes):
+            numbers[id(node)] = i
+            node._lca_index = self
+        parents = [-1] + [numbers[id(node._parent)] for node in nodes[1:]]
+        LCAIndex.__init__(self, parents)
+        self.Valid = True
+
+    def invalidate(self):
+        """Marks the index as out of date and releases the nodes"""
+        self.Valid = False
+        self.Nodes = self._numbers = None
+
+    def getNodeNumbers(self, nodes):
+        """Array of the numbers of nodes, given as node objects or names.
+        An array is assumed to be node numbers already."""
+        if not self.Valid:
+            raise TreeError("tree has changed since the LCA index was made")
+        if isinstance(nodes, numpy.ndarray):
+            return nodes
+        nodes = list(nodes)
+        if nodes and not isinstance(nodes[0], TreeNode):
+            numbers = {}
+            for (i, node) in enumerate(self.Nodes):
+                numbers.setdefault(node.Name, i)
+            missing = [name for name in nodes if name not in numbers]
+            if missing:
+                raise TreeError("No node named '%s'" % missing[0])
+            return numpy.array([numbers[name] for name in nodes], int)
+        try:
+            return numpy.array([self._numbers[id(node)] for node in nodes],
+                    int)
+        except KeyError:
+            raise TreeError("node not in the indexed tree")
+
+    def lowestCommonAncestors(self, nodes1, nodes2):
+        """Array of the number of the lowest common ancestor of each node in
+        nodes1 and the corresponding node in nodes2.  The nodes can be
+        given as node objects, names or numbers."""
+        return LCAIndex.lowestCommonAncestors(self,
+                self.getNodeNumbers(nodes1), self.getNodeNumbers(nodes2))
+
 class TreeNode(object):
     """Store information about a tree node. Mutable.
     
@@ -66,7 +238,8 @@ class TreeNode(object):
         Params: dict containing arbitrary parameters for the node.
         NameLoaded: ?
     """
-    _exclude_from_copy = dict.fromkeys(['_parent','Children'])
+    _exclude_from_copy = dict.fromkeys(['_parent','Children','_lca_index'])
+    _lca_index = None
     
     def __init__(self, Name=None, Children=None, Parent=None, Params=None, \
             NameLoaded=True, **kwargs):
@@ -121,7 +294,9 @@ class TreeNode(object):
         Cleans up refs from i's original parent, but doesn't give self ref to i.
         """
         c = self.__class__
+        self._topologyChanged()
         if isinstance(i, c):
+            i._topologyChanged()
             if i._parent not in (None, self):
                 i._parent.Children.remove(i)
         else:
@@ -143,6 +318,7 @@ class TreeNode(object):
     
     def pop(self, index=-1):
         """Returns and deletes child of self at index (default: -1)"""
+        self._topologyChanged()
         result = self.Children.pop(index)
         result._parent = None
         return result
@@ -167,6 +343,7 @@ class TreeNode(object):
     
     def __setitem__(self, i, val):
         """Node[i] = x sets the corresponding item in Children."""
+        self._topologyChanged()
         curr = self.Children[i]
         if isinstance(i, slice):
             for c in curr:
@@ -180,6 +357,7 @@ class TreeNode(object):
     
     def __delitem__(self, i):
         """del node[i] deletes index or slice from self.Children."""
+        self._topologyChanged()
         curr = self.Children[i]
         if isinstance(i, slice):
             for c in curr:
@@ -191,6 +369,12 @@ class TreeNode(object):
     def __iter__(self):
         """Node iter iterates over the Children."""
         return iter(self.Children)
+
+    def _topologyChanged(self):
+        # Called before any change to the shape of the tree
+        if self._lca_index is not None:
+            self._lca_index.invalidate()
+            self._lca_index = None
     
     def __len__(self):
         """Node len returns number of children."""
@@ -267,6 +451,9 @@ class TreeNode(object):
     
     def _set_parent(self, Parent):
         """Mutator for parent: cleans up refs in old parent."""
+        self._topologyChanged()
+        if Parent is not None:
+            Parent._topologyChanged()
         if self._parent is not None:
             self._parent.removeNode(self)
         self._parent = Parent
@@ -565,11 +752,33 @@ class TreeNode(object):
         result.append(curr)
         return result
     
+    def getLCAIndex(self, rebuild=False):
+        """The TreeLCAIndex of the whole tree containing self, made if need
+        be, for lowest common ancestors of many pairs of nodes at once.
+
+        While the tree has a valid index, lastCommonAncestor,
+        lowestCommonAncestor and getConnectingNode use it too.  Changing the
+        tree through the TreeNode methods invalidates the index; after
+        changing Children lists directly use rebuild=True.
+        """
+        root = self.root()
+        index = root._lca_index
+        if rebuild or index is None or not index.Valid or \
+                index.Nodes[0] is not root:
+            if index is not None:
+                index.invalidate()
+            index = TreeLCAIndex(root)
+        return index
+
     def lastCommonAncestor(self, other):
         """Finds last common ancestor of self and other, or None.
         
         Always tests by identity.
         """
+        index = self._lca_index
+        if index is not None and index.Valid and other._lca_index is index:
+            return index.Nodes[index.lowestCommonAncestor(
+                    index._numbers[id(self)], index._numbers[id(other)])]
         my_lineage = set([id(node) for node in [self] + self.ancestors()])
         curr = other
         while curr is not None:
@@ -593,6 +802,12 @@ class TreeNode(object):
         if len(tips) == 0:
             return None
 
+        index = self._lca_index
+        if index is not None and index.Valid:
+            numbers = index.getNodeNumbers(tips)
+            return index.Nodes[index.lowestCommonAncestor(
+                    numbers.min(), numbers.max())]
+
         # scrub tree
         if hasattr(self, 'black'):
             for n in self.traverse(include_self=True):
@@ -711,7 +926,7 @@ class TreeNode(object):
         in the array"""
         #get a list of internal nodes
         node_list = [node for node in self.traverse() if node.Children]
-        node_list.sort()
+        node_list.sort(key=lambda n: n.Name)
         
         #get a list of tips() Name if one is not supplied
         if not dec_list:
@@ -1449,62 +1664,90 @@ class TreeNode(object):
         mismatches: if you don't want this behavior, strip out the non-matching
         tips first.
         """
-        self_sets, other_sets = self.subsets(), other.subsets()
+        # the subsets, encoded as integers with a bit for each tip name
+        from cogent.phylo.splits import SplitEncoder
+        encoder = SplitEncoder()
+        self_sets, other_sets = encoder.getSplits(self), \
+                encoder.getSplits(other)
         if exclude_absent_taxa:
-            in_both = self.subset() & other.subset()
+            in_both = encoder.encode(self.subset() & other.subset())
             self_sets = [i & in_both for i in self_sets]
-            self_sets = frozenset([i for i in self_sets if len(i) > 1])
+            self_sets = frozenset([i for i in self_sets
+                    if bin(i).count('1') > 1])
             other_sets = [i & in_both for i in other_sets]
-            other_sets = frozenset([i for i in other_sets if len(i) > 1])
+            other_sets = frozenset([i for i in other_sets
+                    if bin(i).count('1') > 1])
         total_subsets = len(self_sets) + len(other_sets)
         intersection_length = len(self_sets & other_sets)
         if not total_subsets:   #no common subsets after filtering, so max dist
             return 1
         return 1 - 2*intersection_length/float(total_subsets)
 
+    def _preorderArrays(self, default_length=1):
+        """The nodes of this subtree in preorder, and lists of the parent
+        of each node, its distance from self, the node numbers of the tips
+        and the range of tip numbers in the subtree of each node.
+        """
+        nodes = list(self.preorder())
+        number = dict([(id(node), i) for (i, node) in enumerate(nodes)])
+        parents = [-1] + [number[id(node.Parent)] for node in nodes[1:]]
+        distances = [0.0] * len(nodes)
+        tip_counts = [0] * len(nodes)
+        tips = []
+        for (i, node) in enumerate(nodes):
+            if i:
+                length = getattr(node, 'Length', None)
+                if length is None:
+                    length = default_length
+                distances[i] = distances[parents[i]] + length
+            if not node.Children:
+                tips.append(i)
+                tip_counts[i] = 1
+        for i in xrange(len(nodes) - 1, 0, -1):
+            tip_counts[parents[i]] += tip_counts[i]
+        tip_starts = numpy.searchsorted(tips, numpy.arange(len(nodes)))
+        tip_stops = tip_starts + tip_counts
+        return (nodes, parents, distances, tips, tip_starts, tip_stops)
+
+    def _tipToTipDistances(self, endpoints=None, default_length=1):
+        # Shared by TreeNode and PhyloNode.tipToTipDistances
+        (nodes, parents, distances, tips, tip_starts, tip_stops) = \
+                self._preorderArrays(default_length)
+        all_tips = [nodes[i] for i in tips]
+        if endpoints is None:
+            # a lone tip is not its own tip
+            tip_order = [[], all_tips][bool(self.Children)]
+            positions = range(len(tip_order))
+        else:
+            if endpoints and not isinstance(endpoints[0], TreeNode):
+                by_name = {}
+                for node in nodes:
+                    by_name.setdefault(node.Name, node)
+                names = endpoints
+                endpoints = []
+                for name in names:
+                    if name not in by_name:
+                        self.getNodeMatchingName(name) # raises TreeError
+                    endpoints.append(by_name[name])
+            tip_order = list(endpoints)
+            position_of = dict([(id(tip), i)
+                    for (i, tip) in enumerate(all_tips)])
+            positions = []
+            for node in tip_order:
+                if id(node) not in position_of:
+                    raise TreeError("'%s' is not a tip" % node.Name)
+                positions.append(position_of[id(node)])
+        result = tip_distance_matrix(positions, tips, parents, distances,
+                tip_starts, tip_stops)
+        return result, tip_order
+
     def tipToTipDistances(self, default_length=1):
         """Returns distance matrix between all pairs of tips, and a tip order.
-            
-        Warning: .__start and .__stop added to self and its descendants.
 
         tip_order contains the actual node objects, not their names (may be
         confusing in some cases).
         """
-        ## linearize the tips in postorder.
-        # .__start, .__stop compose the slice in tip_order.
-        tip_order = list(self.tips())
-        for i, tip in enumerate(tip_order):
-            tip.__start, tip.__stop = i, i+1
-
-        num_tips = len(tip_order)
-        result = zeros((num_tips, num_tips), float) #tip by tip matrix
-        tipdistances = zeros((num_tips), float) #distances from tip to curr node
-
-        def update_result(): 
-        # set tip_tip distance between tips of different child
-            for child1, child2 in comb(node.Children, 2):
-                for tip1 in range(child1.__start, child1.__stop):
-                    for tip2 in range(child2.__start, child2.__stop):
-                        result[tip1,tip2] = \
-                            tipdistances[tip1] + tipdistances[tip2]
-
-        for node in self.traverse(self_before=False, self_after=True):
-            if not node.Children:
-                continue
-            ## subtree with solved child wedges
-            starts, stops = [], [] #to calc ._start and ._stop for curr node
-            for child in node.Children:
-                if hasattr(child, 'Length') and child.Length is not None:
-                    child_len = child.Length
-                else:
-                    child_len = default_length
-                tipdistances[child.__start : child.__stop] += child_len
-                starts.append(child.__start); stops.append(child.__stop)
-            node.__start, node.__stop = min(starts), max(stops)
-            ## update result if nessessary
-            if len(node.Children) > 1: #not single child
-                update_result()
-        return result+result.T, tip_order 
+        return self._tipToTipDistances(default_length=default_length)
 
     def compareByTipDistances(self, other, dist_f=distance_from_r):
         """Compares self to other using tip-to-tip distance matrices.
@@ -1530,8 +1773,10 @@ class TreeNode(object):
         if len(common_names) <= 2:
             return 1    #the two trees must match by definition in this case
         #figure out correct order of the two name matrices
-        self_order = [self_names.index(i) for i in common_names]
-        other_order = [other_names.index(i) for i in common_names]
+        self_index = dict([(n, i) for (i, n) in enumerate(self_names)])
+        other_index = dict([(n, i) for (i, n) in enumerate(other_names)])
+        self_order = [self_index[i] for i in common_names]
+        other_order = [other_index[i] for i in common_names]
         self_matrix = self.tipToTipDistances()[0][self_order][:,self_order]
         other_matrix = other.tipToTipDistances()[0][other_order][:,other_order]
         return dist_f(self_matrix, other_matrix)
@@ -1965,63 +2210,14 @@ class PhyloNode(TreeNode):
 
     def tipToTipDistances(self, endpoints=None, default_length=1):
         """Returns distance matrix between all pairs of tips, and a tip order.
-            
-        Warning: .__start and .__stop added to self and its descendants.
+
+        endpoints, if given, is a list of the tips, or of their names, to
+        include, in the order wanted.
 
         tip_order contains the actual node objects, not their names (may be
         confusing in some cases).
         """
-        all_tips = self.tips()
-        if endpoints is None:
-            tip_order = list(all_tips)
-        else:
-             if isinstance(endpoints[0], PhyloNode):
-                tip_order = endpoints
-             else:
-                tip_order = [self.getNodeMatchingName(n) for n in endpoints]
-
-        ## linearize all tips in postorder
-        # .__start, .__stop compose the slice in tip_order.
-        for i, node in enumerate(all_tips):
-            node.__start, node.__stop = i, i+1
-        
-        # the result map provides index in the result matrix
-        result_map = dict([(n.__start,i) for i,n in enumerate(tip_order)])
-        num_all_tips = len(all_tips) # total number of tips
-        num_tips = len(tip_order) # total number of tips in result
-        result = zeros((num_tips, num_tips), float) # tip by tip matrix
-        tipdistances = zeros((num_all_tips), float) # dist from tip to curr node
-
-        def update_result():
-        # set tip_tip distance between tips of different child
-            for child1, child2 in comb(node.Children, 2):
-                for tip1 in range(child1.__start, child1.__stop):
-                    if tip1 not in result_map:
-                        continue
-                    res_tip1 = result_map[tip1]
-                    for tip2 in range(child2.__start, child2.__stop):
-                        if tip2 not in result_map:
-                            continue
-                        result[res_tip1,result_map[tip2]] = \
-                            tipdistances[tip1] + tipdistances[tip2]
-
-        for node in self.traverse(self_before=False, self_after=True):
-            if not node.Children:
-                continue
-            ## subtree with solved child wedges
-            starts, stops = [], [] #to calc ._start and ._stop for curr node
-            for child in node.Children:
-                if hasattr(child, 'Length') and child.Length is not None:
-                    child_len = child.Length
-                else:
-                    child_len = default_length
-                tipdistances[child.__start : child.__stop] += child_len
-                starts.append(child.__start); stops.append(child.__stop)
-            node.__start, node.__stop = min(starts), max(stops)
-            ## update result if nessessary
-            if len(node.Children) > 1: #not single child
-                update_result()
-        return result+result.T, tip_order
+        return self._tipToTipDistances(endpoints, default_length)
 
     def compareByTipDistances(self, other, sample=None, dist_f=distance_from_r,\
             shuffle_f=shuffle):
@@ -2040,11 +2236,14 @@ class PhyloNode(TreeNode):
         match, and because we need to reorder the names in the two trees to 
         match up the distance matrices).
         """
-        self_names = dict([(i.Name, i) for i in self.tips()])
+        self_tips = self.tips()
+        self_names = dict([(i.Name, i) for i in self_tips])
         other_names = dict([(i.Name, i) for i in other.tips()])
         common_names = frozenset(self_names.keys()) & \
                        frozenset(other_names.keys())
-        common_names = list(common_names)
+        # in self's tip order, so self's matrix needs no reordering
+        common_names = [i.Name for i in self_tips if i.Name in common_names
+                and self_names[i.Name] is i]
 
         if not common_names:
             raise ValueError, "No names in common between the two trees."""
@@ -2052,9 +2251,11 @@ class PhyloNode(TreeNode):
             return 1    #the two trees must match by definition in this case
 
         if sample is not None:
+            order = dict([(n, i) for (i, n) in enumerate(common_names)])
             shuffle_f(common_names)
             common_names = common_names[:sample]
-            
+            common_names.sort(key=order.get)
+
         self_nodes = [self_names[k] for k in common_names]
         other_nodes = [other_names[k] for k in common_names]
 
@@ -1,4 +1,4 @@
-/* Generated by Cython 0.12.1 on Thu Nov 25 11:38:31 2010 */
+/* Generated by Cython 0.12.1 on Sat Oct 17 04:42:25 2026 */
 
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
@@ -486,9 +486,10 @@ static char __pyx_k_4[] = "'%s%s' type array required, got '%s%s'";
 static char __pyx_k_5[] = "%s dimensional array required, got %s";
 static char __pyx_k_6[] = "Noncontiguous array";
 static char __pyx_k_7[] = "Dimension %s is %s, expected %s";
-static char __pyx_k_8[] = "('1', '6', '0', 'dev')";
+static char __pyx_k_8[] = "('1', '6', '0dev')";
 static char __pyx_k__nd[] = "nd";
 static char __pyx_k__chr[] = "chr";
+static char __pyx_k__BASE[] = "BASE";
 static char __pyx_k__copy[] = "copy";
 static char __pyx_k__data[] = "data";
 static char __pyx_k__plhs[] = "plhs";
@@ -504,6 +505,7 @@ static char __pyx_k____test__[] = "__test__";
 static char __pyx_k__itemsize[] = "itemsize";
 static char __pyx_k__typekind[] = "typekind";
 static char __pyx_k__TypeError[] = "TypeError";
+static char __pyx_k__exponents[] = "exponents";
 static char __pyx_k__ValueError[] = "ValueError";
 static char __pyx_k____version__[] = "__version__";
 static char __pyx_k__likelihoods[] = "likelihoods";
@@ -511,6 +513,7 @@ static char __pyx_k__patch_probs[] = "patch_probs";
 static char __pyx_k__switch_probs[] = "switch_probs";
 static char __pyx_k__version_info[] = "version_info";
 static char __pyx_k__child_indexes[] = "child_indexes";
+static char __pyx_k__child_exponents[] = "child_exponents";
 static char __pyx_k____array_struct__[] = "__array_struct__";
 static char __pyx_k__input_likelihoods[] = "input_likelihoods";
 static PyObject *__pyx_kp_s_1;
@@ -521,17 +524,20 @@ static PyObject *__pyx_kp_s_5;
 static PyObject *__pyx_kp_s_6;
 static PyObject *__pyx_kp_s_7;
 static PyObject *__pyx_kp_s_8;
+static PyObject *__pyx_n_s__BASE;
 static PyObject *__pyx_n_s__TypeError;
 static PyObject *__pyx_n_s__ValueError;
 static PyObject *__pyx_n_s____array_struct__;
 static PyObject *__pyx_n_s____main__;
 static PyObject *__pyx_n_s____test__;
 static PyObject *__pyx_n_s____version__;
+static PyObject *__pyx_n_s__child_exponents;
 static PyObject *__pyx_n_s__child_indexes;
 static PyObject *__pyx_n_s__chr;
 static PyObject *__pyx_n_s__copy;
 static PyObject *__pyx_n_s__counts;
 static PyObject *__pyx_n_s__data;
+static PyObject *__pyx_n_s__exponents;
 static PyObject *__pyx_n_s__flags;
 static PyObject *__pyx_n_s__index;
 static PyObject *__pyx_n_s__input_likelihoods;
@@ -550,7 +556,7 @@ static PyObject *__pyx_n_s__version_info;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":32
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":32
  * ctypedef object ArrayType
  * 
  * cdef double *uncheckedArrayDouble(ArrayType A):             # <<<<<<<<<<<<<<
@@ -566,7 +572,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_uncheckedArrayDouble(
   __Pyx_RefNannySetupContext("uncheckedArrayDouble");
   __pyx_v_cobj = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":34
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":34
  * cdef double *uncheckedArrayDouble(ArrayType A):
  *     cdef PyArrayInterface *a
  *     cobj = A.__array_struct__             # <<<<<<<<<<<<<<
@@ -579,7 +585,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_uncheckedArrayDouble(
   __pyx_v_cobj = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":35
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":35
  *     cdef PyArrayInterface *a
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)             # <<<<<<<<<<<<<<
@@ -588,7 +594,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_uncheckedArrayDouble(
  */
   __pyx_v_a = ((struct PyArrayInterface *)PyCObject_AsVoidPtr(__pyx_v_cobj));
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":36
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":36
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)
  *     return <double *> a.data             # <<<<<<<<<<<<<<
@@ -610,7 +616,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_uncheckedArrayDouble(
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":38
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":38
  *     return <double *> a.data
  * 
  * cdef void *checkArray(ArrayType A, char typecode, int itemsize,             # <<<<<<<<<<<<<<
@@ -637,7 +643,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __Pyx_INCREF(__pyx_v_A);
   __pyx_v_cobj = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":43
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":43
  *     cdef int length, size
  *     cdef char kind
  *     if A is None:             # <<<<<<<<<<<<<<
@@ -647,7 +653,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_1 = (__pyx_v_A == ((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)Py_None));
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":44
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":44
  *     cdef char kind
  *     if A is None:
  *         raise TypeError("Array required, got None")             # <<<<<<<<<<<<<<
@@ -669,7 +675,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   }
   __pyx_L3:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":45
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":45
  *     if A is None:
  *         raise TypeError("Array required, got None")
  *     cobj = A.__array_struct__             # <<<<<<<<<<<<<<
@@ -682,7 +688,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_v_cobj = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":46
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":46
  *         raise TypeError("Array required, got None")
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)             # <<<<<<<<<<<<<<
@@ -691,7 +697,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
  */
   __pyx_v_a = ((struct PyArrayInterface *)PyCObject_AsVoidPtr(__pyx_v_cobj));
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":47
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":47
  *     cobj = A.__array_struct__
  *     a = <PyArrayInterface *> PyCObject_AsVoidPtr(cobj)
  *     if a.version != 2:             # <<<<<<<<<<<<<<
@@ -701,7 +707,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_1 = (__pyx_v_a->version != 2);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":49
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":49
  *     if a.version != 2:
  *         raise ValueError(
  *             "Unexpected array interface version %s" % str(a.version))             # <<<<<<<<<<<<<<
@@ -736,7 +742,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   }
   __pyx_L4:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":51
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":51
  *             "Unexpected array interface version %s" % str(a.version))
  *     cdef char typecode2
  *     typecode2 = a.typekind             # <<<<<<<<<<<<<<
@@ -745,7 +751,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
  */
   __pyx_v_typecode2 = __pyx_v_a->typekind;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":52
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":52
  *     cdef char typecode2
  *     typecode2 = a.typekind
  *     if typecode2 != typecode:             # <<<<<<<<<<<<<<
@@ -755,7 +761,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_1 = (__pyx_v_typecode2 != __pyx_v_typecode);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":54
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":54
  *     if typecode2 != typecode:
  *         raise TypeError("'%s' type array required, got '%s'" %
  *                 (chr(typecode), chr(typecode2)))             # <<<<<<<<<<<<<<
@@ -808,7 +814,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   }
   __pyx_L5:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":55
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":55
  *         raise TypeError("'%s' type array required, got '%s'" %
  *                 (chr(typecode), chr(typecode2)))
  *     if a.itemsize != itemsize:             # <<<<<<<<<<<<<<
@@ -818,7 +824,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_1 = (__pyx_v_a->itemsize != __pyx_v_itemsize);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":57
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":57
  *     if a.itemsize != itemsize:
  *         raise TypeError("'%s%s' type array required, got '%s%s'" %
  *                 (chr(typecode), itemsize, chr(typecode2), a.itemsize))             # <<<<<<<<<<<<<<
@@ -881,7 +887,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   }
   __pyx_L6:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":58
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":58
  *         raise TypeError("'%s%s' type array required, got '%s%s'" %
  *                 (chr(typecode), itemsize, chr(typecode2), a.itemsize))
  *     if a.nd != nd:             # <<<<<<<<<<<<<<
@@ -891,7 +897,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_1 = (__pyx_v_a->nd != __pyx_v_nd);
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":60
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":60
  *     if a.nd != nd:
  *         raise ValueError("%s dimensional array required, got %s" %
  *                 (nd, a.nd))             # <<<<<<<<<<<<<<
@@ -928,7 +934,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   }
   __pyx_L7:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":61
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":61
  *         raise ValueError("%s dimensional array required, got %s" %
  *                 (nd, a.nd))
  *     if not a.flags & CONTIGUOUS:             # <<<<<<<<<<<<<<
@@ -938,7 +944,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_1 = (!(__pyx_v_a->flags & CONTIGUOUS));
   if (__pyx_t_1) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":62
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":62
  *                 (nd, a.nd))
  *     if not a.flags & CONTIGUOUS:
  *         raise ValueError ('Noncontiguous array')             # <<<<<<<<<<<<<<
@@ -960,7 +966,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   }
   __pyx_L8:;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":66
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":66
  *     cdef int dimension, val
  *     cdef int *var
  *     for dimension from 0 <= dimension < nd:             # <<<<<<<<<<<<<<
@@ -970,7 +976,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   __pyx_t_7 = __pyx_v_nd;
   for (__pyx_v_dimension = 0; __pyx_v_dimension < __pyx_t_7; __pyx_v_dimension++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":67
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":67
  *     cdef int *var
  *     for dimension from 0 <= dimension < nd:
  *         val = a.shape[dimension]             # <<<<<<<<<<<<<<
@@ -979,7 +985,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
  */
     __pyx_v_val = (__pyx_v_a->shape[__pyx_v_dimension]);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":68
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":68
  *     for dimension from 0 <= dimension < nd:
  *         val = a.shape[dimension]
  *         var = dims[dimension]             # <<<<<<<<<<<<<<
@@ -988,7 +994,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
  */
     __pyx_v_var = (__pyx_v_dims[__pyx_v_dimension]);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":69
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":69
  *         val = a.shape[dimension]
  *         var = dims[dimension]
  *         if var[0] == 0:             # <<<<<<<<<<<<<<
@@ -998,7 +1004,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
     __pyx_t_1 = ((__pyx_v_var[0]) == 0);
     if (__pyx_t_1) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":71
+      /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":71
  *         if var[0] == 0:
  *             # Length unspecified, take it from the provided array
  *             var[0] = val             # <<<<<<<<<<<<<<
@@ -1009,7 +1015,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
       goto __pyx_L11;
     }
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":72
+    /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":72
  *             # Length unspecified, take it from the provided array
  *             var[0] = val
  *         elif var[0] != val:             # <<<<<<<<<<<<<<
@@ -1019,7 +1025,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
     __pyx_t_1 = ((__pyx_v_var[0]) != __pyx_v_val);
     if (__pyx_t_1) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":75
+      /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":75
  *             # Length already specified, but not the same
  *             raise ValueError("Dimension %s is %s, expected %s" %
  *                     (dimension, val, var[0]))             # <<<<<<<<<<<<<<
@@ -1064,7 +1070,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
     __pyx_L11:;
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":79
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":79
  *             # Length matches what was expected
  *             pass
  *     return a.data             # <<<<<<<<<<<<<<
@@ -1091,7 +1097,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray(__pyx_t_6cog
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":82
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":82
  * 
  * 
  * cdef void *checkArray1D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1105,7 +1111,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray1D(__pyx_t_6c
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray1D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":85
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":85
  *         int *x) except NULL:
  *     cdef int *dims[1]
  *     dims[0] = x             # <<<<<<<<<<<<<<
@@ -1114,7 +1120,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray1D(__pyx_t_6c
  */
   (__pyx_v_dims[0]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":86
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":86
  *     cdef int *dims[1]
  *     dims[0] = x
  *     return checkArray(a, typecode, size, 1, dims)             # <<<<<<<<<<<<<<
@@ -1135,7 +1141,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray1D(__pyx_t_6c
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":88
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":88
  *     return checkArray(a, typecode, size, 1, dims)
  * 
  * cdef void *checkArray2D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1149,7 +1155,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray2D(__pyx_t_6c
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray2D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":91
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":91
  *         int *x, int *y) except NULL:
  *     cdef int *dims[2]
  *     dims[0] = x             # <<<<<<<<<<<<<<
@@ -1158,7 +1164,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray2D(__pyx_t_6c
  */
   (__pyx_v_dims[0]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":92
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":92
  *     cdef int *dims[2]
  *     dims[0] = x
  *     dims[1] = y             # <<<<<<<<<<<<<<
@@ -1167,7 +1173,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray2D(__pyx_t_6c
  */
   (__pyx_v_dims[1]) = __pyx_v_y;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":93
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":93
  *     dims[0] = x
  *     dims[1] = y
  *     return checkArray(a, typecode, size, 2, dims)             # <<<<<<<<<<<<<<
@@ -1188,7 +1194,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray2D(__pyx_t_6c
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":95
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":95
  *     return checkArray(a, typecode, size, 2, dims)
  * 
  * cdef void *checkArray3D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1202,7 +1208,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray3D(__pyx_t_6c
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":98
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":98
  *         int *x, int *y, int *z) except NULL:
  *     cdef int *dims[3]
  *     dims[0] = x             # <<<<<<<<<<<<<<
@@ -1211,7 +1217,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray3D(__pyx_t_6c
  */
   (__pyx_v_dims[0]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":99
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":99
  *     cdef int *dims[3]
  *     dims[0] = x
  *     dims[1] = y             # <<<<<<<<<<<<<<
@@ -1220,7 +1226,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray3D(__pyx_t_6c
  */
   (__pyx_v_dims[1]) = __pyx_v_y;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":100
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":100
  *     dims[0] = x
  *     dims[1] = y
  *     dims[2] = z             # <<<<<<<<<<<<<<
@@ -1229,7 +1235,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray3D(__pyx_t_6c
  */
   (__pyx_v_dims[2]) = __pyx_v_z;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":101
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":101
  *     dims[1] = y
  *     dims[2] = z
  *     return checkArray(a, typecode, size, 3, dims)             # <<<<<<<<<<<<<<
@@ -1250,7 +1256,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray3D(__pyx_t_6c
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":103
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":103
  *     return checkArray(a, typecode, size, 3, dims)
  * 
  * cdef void *checkArray4D(ArrayType a, char typecode, int size,             # <<<<<<<<<<<<<<
@@ -1264,7 +1270,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray4D(__pyx_t_6c
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArray4D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":106
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":106
  *         int *w, int *x, int *y, int *z) except NULL:
  *     cdef int *dims[4]
  *     dims[0] = w             # <<<<<<<<<<<<<<
@@ -1273,7 +1279,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray4D(__pyx_t_6c
  */
   (__pyx_v_dims[0]) = __pyx_v_w;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":107
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":107
  *     cdef int *dims[4]
  *     dims[0] = w
  *     dims[1] = x             # <<<<<<<<<<<<<<
@@ -1282,7 +1288,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray4D(__pyx_t_6c
  */
   (__pyx_v_dims[1]) = __pyx_v_x;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":108
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":108
  *     dims[0] = w
  *     dims[1] = x
  *     dims[2] = y             # <<<<<<<<<<<<<<
@@ -1291,7 +1297,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray4D(__pyx_t_6c
  */
   (__pyx_v_dims[2]) = __pyx_v_y;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":109
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":109
  *     dims[1] = x
  *     dims[2] = y
  *     dims[3] = z             # <<<<<<<<<<<<<<
@@ -1300,7 +1306,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray4D(__pyx_t_6c
  */
   (__pyx_v_dims[3]) = __pyx_v_z;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":110
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":110
  *     dims[2] = y
  *     dims[3] = z
  *     return checkArray(a, typecode, size, 4, dims)             # <<<<<<<<<<<<<<
@@ -1321,7 +1327,7 @@ static  void *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArray4D(__pyx_t_6c
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":113
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":113
  * 
  * 
  * cdef double * checkArrayDouble1D(ArrayType a, int *x) except NULL:             # <<<<<<<<<<<<<<
@@ -1334,7 +1340,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(__
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble1D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":114
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":114
  * 
  * cdef double * checkArrayDouble1D(ArrayType a, int *x) except NULL:
  *     return <double *> checkArray1D(a, c'f', sizeof(double), x)             # <<<<<<<<<<<<<<
@@ -1355,7 +1361,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(__
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":116
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":116
  *     return <double *> checkArray1D(a, c'f', sizeof(double), x)
  * 
  * cdef double * checkArrayDouble2D(ArrayType a, int *x, int *y) except NULL:             # <<<<<<<<<<<<<<
@@ -1368,7 +1374,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(__
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble2D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":117
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":117
  * 
  * cdef double * checkArrayDouble2D(ArrayType a, int *x, int *y) except NULL:
  *     return <double *> checkArray2D(a, c'f', sizeof(double), x, y)             # <<<<<<<<<<<<<<
@@ -1389,7 +1395,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(__
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":119
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":119
  *     return <double *> checkArray2D(a, c'f', sizeof(double), x, y)
  * 
  * cdef double * checkArrayDouble3D(ArrayType a, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1402,7 +1408,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble3D(__
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":120
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":120
  * 
  * cdef double * checkArrayDouble3D(ArrayType a, int *x, int *y, int *z) except NULL:
  *     return <double *> checkArray3D(a, c'f', sizeof(double), x, y, z)             # <<<<<<<<<<<<<<
@@ -1423,7 +1429,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble3D(__
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":122
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":122
  *     return <double *> checkArray3D(a, c'f', sizeof(double), x, y, z)
  * 
  * cdef double * checkArrayDouble4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1436,7 +1442,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble4D(__
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayDouble4D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":123
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":123
  * 
  * cdef double * checkArrayDouble4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:
  *     return <double *> checkArray4D(a, c'f', sizeof(double), w, x, y, z)             # <<<<<<<<<<<<<<
@@ -1457,7 +1463,7 @@ static  double *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble4D(__
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":126
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":126
  * 
  * 
  * cdef long * checkArrayLong1D(ArrayType a, int *x) except NULL:             # <<<<<<<<<<<<<<
@@ -1470,7 +1476,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(__pyx_
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong1D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":127
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":127
  * 
  * cdef long * checkArrayLong1D(ArrayType a, int *x) except NULL:
  *     return <long *> checkArray1D(a, c'i', sizeof(long), x)             # <<<<<<<<<<<<<<
@@ -1491,7 +1497,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(__pyx_
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":129
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":129
  *     return <long *> checkArray1D(a, c'i', sizeof(long), x)
  * 
  * cdef long * checkArrayLong2D(ArrayType a, int *x, int *y) except NULL:             # <<<<<<<<<<<<<<
@@ -1504,7 +1510,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong2D(__pyx_
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong2D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":130
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":130
  * 
  * cdef long * checkArrayLong2D(ArrayType a, int *x, int *y) except NULL:
  *     return <long *> checkArray2D(a, c'i', sizeof(long), x, y)             # <<<<<<<<<<<<<<
@@ -1525,7 +1531,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong2D(__pyx_
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":132
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":132
  *     return <long *> checkArray2D(a, c'i', sizeof(long), x, y)
  * 
  * cdef long * checkArrayLong3D(ArrayType a, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1538,7 +1544,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong3D(__pyx_
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong3D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":133
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":133
  * 
  * cdef long * checkArrayLong3D(ArrayType a, int *x, int *y, int *z) except NULL:
  *     return <long *> checkArray3D(a, c'i', sizeof(long), x, y, z)             # <<<<<<<<<<<<<<
@@ -1559,7 +1565,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong3D(__pyx_
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":135
+/* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":135
  *     return <long *> checkArray3D(a, c'i', sizeof(long), x, y, z)
  * 
  * cdef long * checkArrayLong4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:             # <<<<<<<<<<<<<<
@@ -1571,7 +1577,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong4D(__pyx_
   void *__pyx_t_1;
   __Pyx_RefNannySetupContext("checkArrayLong4D");
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":136
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":136
  * 
  * cdef long * checkArrayLong4D(ArrayType a, int *w, int *x, int *y, int *z) except NULL:
  *     return <long *> checkArray4D(a, c'i', sizeof(long), w, x, y, z)             # <<<<<<<<<<<<<<
@@ -1590,7 +1596,7 @@ static  long *__pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong4D(__pyx_
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":8
+/* "/root/package/cogent/evolve/_likelihood_tree.pyx":8
  *     double log (double x)
  * 
  * def sumInputLikelihoods(child_indexes, result, likelihoods):             # <<<<<<<<<<<<<<
@@ -1681,7 +1687,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
   __pyx_v_first = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_index = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":18
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":18
  *     cdef double *target_data
  * 
  *     M = S = 0             # <<<<<<<<<<<<<<
@@ -1691,7 +1697,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
   __pyx_v_M = 0;
   __pyx_v_S = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":19
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":19
  * 
  *     M = S = 0
  *     target_data = checkArrayDouble2D(result, &S, &M)             # <<<<<<<<<<<<<<
@@ -1701,7 +1707,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
   __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_result), (&__pyx_v_S), (&__pyx_v_M)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_target_data = __pyx_t_1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":20
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":20
  *     M = S = 0
  *     target_data = checkArrayDouble2D(result, &S, &M)
  *     first = 1             # <<<<<<<<<<<<<<
@@ -1712,7 +1718,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
   __Pyx_DECREF(__pyx_v_first);
   __pyx_v_first = __pyx_int_1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":21
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":21
  *     target_data = checkArrayDouble2D(result, &S, &M)
  *     first = 1
  *     c = 0             # <<<<<<<<<<<<<<
@@ -1721,7 +1727,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
  */
   __pyx_v_c = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":22
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":22
  *     first = 1
  *     c = 0
  *     for index in child_indexes:             # <<<<<<<<<<<<<<
@@ -1753,7 +1759,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
     __pyx_v_index = __pyx_t_4;
     __pyx_t_4 = 0;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":23
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":23
  *     c = 0
  *     for index in child_indexes:
  *         U = 0             # <<<<<<<<<<<<<<
@@ -1762,7 +1768,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
  */
     __pyx_v_U = 0;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":24
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":24
  *     for index in child_indexes:
  *         U = 0
  *         index_data = checkArrayLong1D(index, &S)             # <<<<<<<<<<<<<<
@@ -1772,7 +1778,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
     __pyx_t_5 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_index), (&__pyx_v_S)); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_v_index_data = __pyx_t_5;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":25
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":25
  *         U = 0
  *         index_data = checkArrayLong1D(index, &S)
  *         values_data = checkArrayDouble2D(likelihoods[c], &U, &M)             # <<<<<<<<<<<<<<
@@ -1785,7 +1791,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __pyx_v_values_data = __pyx_t_1;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":28
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":28
  *         #if index_data[S-1] >= U:
  *         #    raise RangeError
  *         if c == 0:             # <<<<<<<<<<<<<<
@@ -1795,7 +1801,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
     __pyx_t_6 = (__pyx_v_c == 0);
     if (__pyx_t_6) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":29
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":29
  *         #    raise RangeError
  *         if c == 0:
  *             for i from 0 <= i < S:             # <<<<<<<<<<<<<<
@@ -1805,7 +1811,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
       __pyx_t_7 = __pyx_v_S;
       for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_7; __pyx_v_i++) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":30
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":30
  *         if c == 0:
  *             for i from 0 <= i < S:
  *                 u = index_data[i]             # <<<<<<<<<<<<<<
@@ -1814,7 +1820,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
  */
         __pyx_v_u = (__pyx_v_index_data[__pyx_v_i]);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":31
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":31
  *             for i from 0 <= i < S:
  *                 u = index_data[i]
  *                 for m from 0 <= m < M:             # <<<<<<<<<<<<<<
@@ -1824,7 +1830,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
         __pyx_t_8 = __pyx_v_M;
         for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_8; __pyx_v_m++) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":32
+          /* "/root/package/cogent/evolve/_likelihood_tree.pyx":32
  *                 u = index_data[i]
  *                 for m from 0 <= m < M:
  *                     target_data[M*i+m] = values_data[M*u+m]             # <<<<<<<<<<<<<<
@@ -1838,7 +1844,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
     }
     /*else*/ {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":34
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":34
  *                     target_data[M*i+m] = values_data[M*u+m]
  *         else:
  *             for i from 0 <= i < S: # col of parent data             # <<<<<<<<<<<<<<
@@ -1848,7 +1854,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
       __pyx_t_7 = __pyx_v_S;
       for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_7; __pyx_v_i++) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":35
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":35
  *         else:
  *             for i from 0 <= i < S: # col of parent data
  *                 u = index_data[i] # col of childs data             # <<<<<<<<<<<<<<
@@ -1857,7 +1863,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
  */
         __pyx_v_u = (__pyx_v_index_data[__pyx_v_i]);
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":36
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":36
  *             for i from 0 <= i < S: # col of parent data
  *                 u = index_data[i] # col of childs data
  *                 for m from 0 <= m < M:             # <<<<<<<<<<<<<<
@@ -1867,7 +1873,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
         __pyx_t_8 = __pyx_v_M;
         for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_8; __pyx_v_m++) {
 
-          /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":37
+          /* "/root/package/cogent/evolve/_likelihood_tree.pyx":37
  *                 u = index_data[i] # col of childs data
  *                 for m from 0 <= m < M:
  *                     target_data[M*i+m] *= values_data[M*u+m]             # <<<<<<<<<<<<<<
@@ -1880,7 +1886,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
     }
     __pyx_L8:;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":38
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":38
  *                 for m from 0 <= m < M:
  *                     target_data[M*i+m] *= values_data[M*u+m]
  *         c += 1             # <<<<<<<<<<<<<<
@@ -1891,12 +1897,12 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":39
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":39
  *                     target_data[M*i+m] *= values_data[M*u+m]
  *         c += 1
  *     return result             # <<<<<<<<<<<<<<
  * 
- * def getTotalLogLikelihood(counts, input_likelihoods, mprobs):
+ * def rescaleLikelihoods(child_indexes, child_exponents, result, exponents,
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_result);
@@ -1921,7 +1927,490 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":41
+/* "/root/package/cogent/evolve/_likelihood_tree.pyx":41
+ *     return result
+ * 
+ * def rescaleLikelihoods(child_indexes, child_exponents, result, exponents,             # <<<<<<<<<<<<<<
+ *         double BASE):
+ *     # exponents gets the sum of the child exponents for each parent column,
+ */
+
+static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_rescaleLikelihoods(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_rescaleLikelihoods(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_child_indexes = 0;
+  PyObject *__pyx_v_child_exponents = 0;
+  PyObject *__pyx_v_result = 0;
+  PyObject *__pyx_v_exponents = 0;
+  double __pyx_v_BASE;
+  int __pyx_v_M;
+  int __pyx_v_S;
+  int __pyx_v_i;
+  int __pyx_v_m;
+  int __pyx_v_c;
+  double __pyx_v_biggest;
+  double __pyx_v_value;
+  double __pyx_v_LIMIT;
+  double *__pyx_v_target_data;
+  long *__pyx_v_index_data;
+  long *__pyx_v_child_data;
+  long *__pyx_v_exponents_data;
+  int __pyx_v_U;
+  PyObject *__pyx_v_index;
+  PyObject *__pyx_r = NULL;
+  double *__pyx_t_1;
+  long *__pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__child_indexes,&__pyx_n_s__child_exponents,&__pyx_n_s__result,&__pyx_n_s__exponents,&__pyx_n_s__BASE,0};
+  __Pyx_RefNannySetupContext("rescaleLikelihoods");
+  __pyx_self = __pyx_self;
+  if (unlikely(__pyx_kwds)) {
+    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
+    PyObject* values[5] = {0,0,0,0,0};
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      case  0: break;
+      default: goto __pyx_L5_argtuple_error;
+    }
+    switch (PyTuple_GET_SIZE(__pyx_args)) {
+      case  0:
+      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__child_indexes);
+      if (likely(values[0])) kw_args--;
+      else goto __pyx_L5_argtuple_error;
+      case  1:
+      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__child_exponents);
+      if (likely(values[1])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("rescaleLikelihoods", 1, 5, 5, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  2:
+      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__result);
+      if (likely(values[2])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("rescaleLikelihoods", 1, 5, 5, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  3:
+      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__exponents);
+      if (likely(values[3])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("rescaleLikelihoods", 1, 5, 5, 3); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+      case  4:
+      values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__BASE);
+      if (likely(values[4])) kw_args--;
+      else {
+        __Pyx_RaiseArgtupleInvalid("rescaleLikelihoods", 1, 5, 5, 4); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    }
+    if (unlikely(kw_args > 0)) {
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "rescaleLikelihoods") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    }
+    __pyx_v_child_indexes = values[0];
+    __pyx_v_child_exponents = values[1];
+    __pyx_v_result = values[2];
+    __pyx_v_exponents = values[3];
+    __pyx_v_BASE = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_BASE == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+    goto __pyx_L5_argtuple_error;
+  } else {
+    __pyx_v_child_indexes = PyTuple_GET_ITEM(__pyx_args, 0);
+    __pyx_v_child_exponents = PyTuple_GET_ITEM(__pyx_args, 1);
+    __pyx_v_result = PyTuple_GET_ITEM(__pyx_args, 2);
+    __pyx_v_exponents = PyTuple_GET_ITEM(__pyx_args, 3);
+    __pyx_v_BASE = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_BASE == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("rescaleLikelihoods", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cogent.evolve._likelihood_tree.rescaleLikelihoods");
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __Pyx_INCREF(__pyx_v_child_indexes);
+  __Pyx_INCREF(__pyx_v_child_exponents);
+  __Pyx_INCREF(__pyx_v_result);
+  __Pyx_INCREF(__pyx_v_exponents);
+  __pyx_v_index = Py_None; __Pyx_INCREF(Py_None);
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":52
+ *     cdef int U
+ * 
+ *     M = S = 0             # <<<<<<<<<<<<<<
+ *     target_data = checkArrayDouble2D(result, &S, &M)
+ *     exponents_data = checkArrayLong1D(exponents, &S)
+ */
+  __pyx_v_M = 0;
+  __pyx_v_S = 0;
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":53
+ * 
+ *     M = S = 0
+ *     target_data = checkArrayDouble2D(result, &S, &M)             # <<<<<<<<<<<<<<
+ *     exponents_data = checkArrayLong1D(exponents, &S)
+ *     for i from 0 <= i < S:
+ */
+  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_result), (&__pyx_v_S), (&__pyx_v_M)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_target_data = __pyx_t_1;
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":54
+ *     M = S = 0
+ *     target_data = checkArrayDouble2D(result, &S, &M)
+ *     exponents_data = checkArrayLong1D(exponents, &S)             # <<<<<<<<<<<<<<
+ *     for i from 0 <= i < S:
+ *         exponents_data[i] = 0
+ */
+  __pyx_t_2 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_exponents), (&__pyx_v_S)); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_exponents_data = __pyx_t_2;
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":55
+ *     target_data = checkArrayDouble2D(result, &S, &M)
+ *     exponents_data = checkArrayLong1D(exponents, &S)
+ *     for i from 0 <= i < S:             # <<<<<<<<<<<<<<
+ *         exponents_data[i] = 0
+ *     c = 0
+ */
+  __pyx_t_3 = __pyx_v_S;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":56
+ *     exponents_data = checkArrayLong1D(exponents, &S)
+ *     for i from 0 <= i < S:
+ *         exponents_data[i] = 0             # <<<<<<<<<<<<<<
+ *     c = 0
+ *     for index in child_indexes:
+ */
+    (__pyx_v_exponents_data[__pyx_v_i]) = 0;
+  }
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":57
+ *     for i from 0 <= i < S:
+ *         exponents_data[i] = 0
+ *     c = 0             # <<<<<<<<<<<<<<
+ *     for index in child_indexes:
+ *         if child_exponents[c] is not None:
+ */
+  __pyx_v_c = 0;
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":58
+ *         exponents_data[i] = 0
+ *     c = 0
+ *     for index in child_indexes:             # <<<<<<<<<<<<<<
+ *         if child_exponents[c] is not None:
+ *             U = 0
+ */
+  if (PyList_CheckExact(__pyx_v_child_indexes) || PyTuple_CheckExact(__pyx_v_child_indexes)) {
+    __pyx_t_4 = 0; __pyx_t_5 = __pyx_v_child_indexes; __Pyx_INCREF(__pyx_t_5);
+  } else {
+    __pyx_t_4 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_child_indexes); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  for (;;) {
+    if (likely(PyList_CheckExact(__pyx_t_5))) {
+      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_5)) break;
+      __pyx_t_6 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++;
+    } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
+      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
+      __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++;
+    } else {
+      __pyx_t_6 = PyIter_Next(__pyx_t_5);
+      if (!__pyx_t_6) {
+        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    __Pyx_DECREF(__pyx_v_index);
+    __pyx_v_index = __pyx_t_6;
+    __pyx_t_6 = 0;
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":59
+ *     c = 0
+ *     for index in child_indexes:
+ *         if child_exponents[c] is not None:             # <<<<<<<<<<<<<<
+ *             U = 0
+ *             index_data = checkArrayLong1D(index, &S)
+ */
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_child_exponents, __pyx_v_c, sizeof(int), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = (__pyx_t_6 != Py_None);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (__pyx_t_7) {
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":60
+ *     for index in child_indexes:
+ *         if child_exponents[c] is not None:
+ *             U = 0             # <<<<<<<<<<<<<<
+ *             index_data = checkArrayLong1D(index, &S)
+ *             child_data = checkArrayLong1D(child_exponents[c], &U)
+ */
+      __pyx_v_U = 0;
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":61
+ *         if child_exponents[c] is not None:
+ *             U = 0
+ *             index_data = checkArrayLong1D(index, &S)             # <<<<<<<<<<<<<<
+ *             child_data = checkArrayLong1D(child_exponents[c], &U)
+ *             for i from 0 <= i < S:
+ */
+      __pyx_t_2 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_index), (&__pyx_v_S)); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_v_index_data = __pyx_t_2;
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":62
+ *             U = 0
+ *             index_data = checkArrayLong1D(index, &S)
+ *             child_data = checkArrayLong1D(child_exponents[c], &U)             # <<<<<<<<<<<<<<
+ *             for i from 0 <= i < S:
+ *                 exponents_data[i] += child_data[index_data[i]]
+ */
+      __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_child_exponents, __pyx_v_c, sizeof(int), PyInt_FromLong); if (!__pyx_t_6) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_2 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_t_6), (&__pyx_v_U)); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_v_child_data = __pyx_t_2;
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":63
+ *             index_data = checkArrayLong1D(index, &S)
+ *             child_data = checkArrayLong1D(child_exponents[c], &U)
+ *             for i from 0 <= i < S:             # <<<<<<<<<<<<<<
+ *                 exponents_data[i] += child_data[index_data[i]]
+ *         c += 1
+ */
+      __pyx_t_3 = __pyx_v_S;
+      for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":64
+ *             child_data = checkArrayLong1D(child_exponents[c], &U)
+ *             for i from 0 <= i < S:
+ *                 exponents_data[i] += child_data[index_data[i]]             # <<<<<<<<<<<<<<
+ *         c += 1
+ *     LIMIT = 1.0 / BASE
+ */
+        (__pyx_v_exponents_data[__pyx_v_i]) += (__pyx_v_child_data[(__pyx_v_index_data[__pyx_v_i])]);
+      }
+      goto __pyx_L10;
+    }
+    __pyx_L10:;
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":65
+ *             for i from 0 <= i < S:
+ *                 exponents_data[i] += child_data[index_data[i]]
+ *         c += 1             # <<<<<<<<<<<<<<
+ *     LIMIT = 1.0 / BASE
+ *     for i from 0 <= i < S:
+ */
+    __pyx_v_c += 1;
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":66
+ *                 exponents_data[i] += child_data[index_data[i]]
+ *         c += 1
+ *     LIMIT = 1.0 / BASE             # <<<<<<<<<<<<<<
+ *     for i from 0 <= i < S:
+ *         biggest = 0.0
+ */
+  if (unlikely(__pyx_v_BASE == 0)) {
+    PyErr_Format(PyExc_ZeroDivisionError, "float division");
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_v_LIMIT = (1.0 / __pyx_v_BASE);
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":67
+ *         c += 1
+ *     LIMIT = 1.0 / BASE
+ *     for i from 0 <= i < S:             # <<<<<<<<<<<<<<
+ *         biggest = 0.0
+ *         for m from 0 <= m < M:
+ */
+  __pyx_t_3 = __pyx_v_S;
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":68
+ *     LIMIT = 1.0 / BASE
+ *     for i from 0 <= i < S:
+ *         biggest = 0.0             # <<<<<<<<<<<<<<
+ *         for m from 0 <= m < M:
+ *             value = target_data[M*i+m]
+ */
+    __pyx_v_biggest = 0.0;
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":69
+ *     for i from 0 <= i < S:
+ *         biggest = 0.0
+ *         for m from 0 <= m < M:             # <<<<<<<<<<<<<<
+ *             value = target_data[M*i+m]
+ *             if value < 0.0:
+ */
+    __pyx_t_8 = __pyx_v_M;
+    for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_8; __pyx_v_m++) {
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":70
+ *         biggest = 0.0
+ *         for m from 0 <= m < M:
+ *             value = target_data[M*i+m]             # <<<<<<<<<<<<<<
+ *             if value < 0.0:
+ *                 value = -value
+ */
+      __pyx_v_value = (__pyx_v_target_data[((__pyx_v_M * __pyx_v_i) + __pyx_v_m)]);
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":71
+ *         for m from 0 <= m < M:
+ *             value = target_data[M*i+m]
+ *             if value < 0.0:             # <<<<<<<<<<<<<<
+ *                 value = -value
+ *             if value > biggest:
+ */
+      __pyx_t_7 = (__pyx_v_value < 0.0);
+      if (__pyx_t_7) {
+
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":72
+ *             value = target_data[M*i+m]
+ *             if value < 0.0:
+ *                 value = -value             # <<<<<<<<<<<<<<
+ *             if value > biggest:
+ *                 biggest = value
+ */
+        __pyx_v_value = (-__pyx_v_value);
+        goto __pyx_L17;
+      }
+      __pyx_L17:;
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":73
+ *             if value < 0.0:
+ *                 value = -value
+ *             if value > biggest:             # <<<<<<<<<<<<<<
+ *                 biggest = value
+ *         if biggest == 0.0:
+ */
+      __pyx_t_7 = (__pyx_v_value > __pyx_v_biggest);
+      if (__pyx_t_7) {
+
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":74
+ *                 value = -value
+ *             if value > biggest:
+ *                 biggest = value             # <<<<<<<<<<<<<<
+ *         if biggest == 0.0:
+ *             continue
+ */
+        __pyx_v_biggest = __pyx_v_value;
+        goto __pyx_L18;
+      }
+      __pyx_L18:;
+    }
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":75
+ *             if value > biggest:
+ *                 biggest = value
+ *         if biggest == 0.0:             # <<<<<<<<<<<<<<
+ *             continue
+ *         while biggest < LIMIT:
+ */
+    __pyx_t_7 = (__pyx_v_biggest == 0.0);
+    if (__pyx_t_7) {
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":76
+ *                 biggest = value
+ *         if biggest == 0.0:
+ *             continue             # <<<<<<<<<<<<<<
+ *         while biggest < LIMIT:
+ *             for m from 0 <= m < M:
+ */
+      goto __pyx_L13_continue;
+      goto __pyx_L19;
+    }
+    __pyx_L19:;
+
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":77
+ *         if biggest == 0.0:
+ *             continue
+ *         while biggest < LIMIT:             # <<<<<<<<<<<<<<
+ *             for m from 0 <= m < M:
+ *                 target_data[M*i+m] *= BASE
+ */
+    while (1) {
+      __pyx_t_7 = (__pyx_v_biggest < __pyx_v_LIMIT);
+      if (!__pyx_t_7) break;
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":78
+ *             continue
+ *         while biggest < LIMIT:
+ *             for m from 0 <= m < M:             # <<<<<<<<<<<<<<
+ *                 target_data[M*i+m] *= BASE
+ *             biggest *= BASE
+ */
+      __pyx_t_8 = __pyx_v_M;
+      for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_8; __pyx_v_m++) {
+
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":79
+ *         while biggest < LIMIT:
+ *             for m from 0 <= m < M:
+ *                 target_data[M*i+m] *= BASE             # <<<<<<<<<<<<<<
+ *             biggest *= BASE
+ *             exponents_data[i] += 1
+ */
+        (__pyx_v_target_data[((__pyx_v_M * __pyx_v_i) + __pyx_v_m)]) *= __pyx_v_BASE;
+      }
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":80
+ *             for m from 0 <= m < M:
+ *                 target_data[M*i+m] *= BASE
+ *             biggest *= BASE             # <<<<<<<<<<<<<<
+ *             exponents_data[i] += 1
+ *     return result
+ */
+      __pyx_v_biggest *= __pyx_v_BASE;
+
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":81
+ *                 target_data[M*i+m] *= BASE
+ *             biggest *= BASE
+ *             exponents_data[i] += 1             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+ */
+      (__pyx_v_exponents_data[__pyx_v_i]) += 1;
+    }
+    __pyx_L13_continue:;
+  }
+
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":82
+ *             biggest *= BASE
+ *             exponents_data[i] += 1
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * def getTotalLogLikelihood(counts, input_likelihoods, mprobs):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_result);
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("cogent.evolve._likelihood_tree.rescaleLikelihoods");
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_DECREF(__pyx_v_index);
+  __Pyx_DECREF(__pyx_v_child_indexes);
+  __Pyx_DECREF(__pyx_v_child_exponents);
+  __Pyx_DECREF(__pyx_v_result);
+  __Pyx_DECREF(__pyx_v_exponents);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "/root/package/cogent/evolve/_likelihood_tree.pyx":84
  *     return result
  * 
  * def getTotalLogLikelihood(counts, input_likelihoods, mprobs):             # <<<<<<<<<<<<<<
@@ -1971,17 +2460,17 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__input_likelihoods);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("getTotalLogLikelihood", 1, 3, 3, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("getTotalLogLikelihood", 1, 3, 3, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__mprobs);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("getTotalLogLikelihood", 1, 3, 3, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("getTotalLogLikelihood", 1, 3, 3, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "getTotalLogLikelihood") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "getTotalLogLikelihood") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_counts = values[0];
     __pyx_v_input_likelihoods = values[1];
@@ -1995,7 +2484,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("getTotalLogLikelihood", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("getTotalLogLikelihood", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cogent.evolve._likelihood_tree.getTotalLogLikelihood");
   return NULL;
@@ -2004,7 +2493,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
   __Pyx_INCREF(__pyx_v_input_likelihoods);
   __Pyx_INCREF(__pyx_v_mprobs);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":46
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":89
  *     cdef double *likelihoods_data, *mprobs_data, *weights_data
  * 
  *     S = M = 0             # <<<<<<<<<<<<<<
@@ -2014,37 +2503,37 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
   __pyx_v_S = 0;
   __pyx_v_M = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":47
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":90
  * 
  *     S = M = 0
  *     mprobs_data = checkArrayDouble1D(mprobs, &M)             # <<<<<<<<<<<<<<
  *     weights_data = checkArrayDouble1D(counts, &S)
  *     likelihoods_data = checkArrayDouble2D(input_likelihoods, &S, &M)
  */
-  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_mprobs), (&__pyx_v_M)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_mprobs), (&__pyx_v_M)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_mprobs_data = __pyx_t_1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":48
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":91
  *     S = M = 0
  *     mprobs_data = checkArrayDouble1D(mprobs, &M)
  *     weights_data = checkArrayDouble1D(counts, &S)             # <<<<<<<<<<<<<<
  *     likelihoods_data = checkArrayDouble2D(input_likelihoods, &S, &M)
  *     total = 0.0
  */
-  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_counts), (&__pyx_v_S)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_counts), (&__pyx_v_S)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_weights_data = __pyx_t_1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":49
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":92
  *     mprobs_data = checkArrayDouble1D(mprobs, &M)
  *     weights_data = checkArrayDouble1D(counts, &S)
  *     likelihoods_data = checkArrayDouble2D(input_likelihoods, &S, &M)             # <<<<<<<<<<<<<<
  *     total = 0.0
  *     for i from 0 <= i < S:
  */
-  __pyx_t_2 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_input_likelihoods), (&__pyx_v_S), (&__pyx_v_M)); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_input_likelihoods), (&__pyx_v_S), (&__pyx_v_M)); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_likelihoods_data = __pyx_t_2;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":50
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":93
  *     weights_data = checkArrayDouble1D(counts, &S)
  *     likelihoods_data = checkArrayDouble2D(input_likelihoods, &S, &M)
  *     total = 0.0             # <<<<<<<<<<<<<<
@@ -2053,7 +2542,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
  */
   __pyx_v_total = 0.0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":51
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":94
  *     likelihoods_data = checkArrayDouble2D(input_likelihoods, &S, &M)
  *     total = 0.0
  *     for i from 0 <= i < S:             # <<<<<<<<<<<<<<
@@ -2063,7 +2552,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
   __pyx_t_3 = __pyx_v_S;
   for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_3; __pyx_v_i++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":52
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":95
  *     total = 0.0
  *     for i from 0 <= i < S:
  *         posn = 0.0             # <<<<<<<<<<<<<<
@@ -2072,7 +2561,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
  */
     __pyx_v_posn = 0.0;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":53
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":96
  *     for i from 0 <= i < S:
  *         posn = 0.0
  *         for m from 0 <= m < M:             # <<<<<<<<<<<<<<
@@ -2082,7 +2571,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
     __pyx_t_4 = __pyx_v_M;
     for (__pyx_v_m = 0; __pyx_v_m < __pyx_t_4; __pyx_v_m++) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":54
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":97
  *         posn = 0.0
  *         for m from 0 <= m < M:
  *             posn += likelihoods_data[i*M+m] * mprobs_data[m]             # <<<<<<<<<<<<<<
@@ -2092,7 +2581,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
       __pyx_v_posn += ((__pyx_v_likelihoods_data[((__pyx_v_i * __pyx_v_M) + __pyx_v_m)]) * (__pyx_v_mprobs_data[__pyx_v_m]));
     }
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":55
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":98
  *         for m from 0 <= m < M:
  *             posn += likelihoods_data[i*M+m] * mprobs_data[m]
  *         total += log(posn)*weights_data[i]             # <<<<<<<<<<<<<<
@@ -2102,7 +2591,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
     __pyx_v_total += (log(__pyx_v_posn) * (__pyx_v_weights_data[__pyx_v_i]));
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":56
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":99
  *             posn += likelihoods_data[i*M+m] * mprobs_data[m]
  *         total += log(posn)*weights_data[i]
  *     return total             # <<<<<<<<<<<<<<
@@ -2110,7 +2599,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
  * def getLogSumAcrossSites(counts, input_likelihoods):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_total); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_total); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_r = __pyx_t_5;
   __pyx_t_5 = 0;
@@ -2131,7 +2620,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikeliho
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":58
+/* "/root/package/cogent/evolve/_likelihood_tree.pyx":101
  *     return total
  * 
  * def getLogSumAcrossSites(counts, input_likelihoods):             # <<<<<<<<<<<<<<
@@ -2173,11 +2662,11 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__input_likelihoods);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("getLogSumAcrossSites", 1, 2, 2, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("getLogSumAcrossSites", 1, 2, 2, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "getLogSumAcrossSites") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "getLogSumAcrossSites") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_counts = values[0];
     __pyx_v_input_likelihoods = values[1];
@@ -2189,7 +2678,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("getLogSumAcrossSites", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("getLogSumAcrossSites", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cogent.evolve._likelihood_tree.getLogSumAcrossSites");
   return NULL;
@@ -2197,7 +2686,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
   __Pyx_INCREF(__pyx_v_counts);
   __Pyx_INCREF(__pyx_v_input_likelihoods);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":62
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":105
  *     cdef double total
  *     cdef double *likelihoods_data,  *weights_data
  *     S = 0             # <<<<<<<<<<<<<<
@@ -2206,27 +2695,27 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
  */
   __pyx_v_S = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":63
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":106
  *     cdef double *likelihoods_data,  *weights_data
  *     S = 0
  *     weights_data = checkArrayDouble1D(counts, &S)             # <<<<<<<<<<<<<<
  *     likelihoods_data = checkArrayDouble1D(input_likelihoods, &S)
  *     total = 0.0
  */
-  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_counts), (&__pyx_v_S)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_counts), (&__pyx_v_S)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_weights_data = __pyx_t_1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":64
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":107
  *     S = 0
  *     weights_data = checkArrayDouble1D(counts, &S)
  *     likelihoods_data = checkArrayDouble1D(input_likelihoods, &S)             # <<<<<<<<<<<<<<
  *     total = 0.0
  *     for i from 0 <= i < S:
  */
-  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_input_likelihoods), (&__pyx_v_S)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_input_likelihoods), (&__pyx_v_S)); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_likelihoods_data = __pyx_t_1;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":65
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":108
  *     weights_data = checkArrayDouble1D(counts, &S)
  *     likelihoods_data = checkArrayDouble1D(input_likelihoods, &S)
  *     total = 0.0             # <<<<<<<<<<<<<<
@@ -2235,7 +2724,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
  */
   __pyx_v_total = 0.0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":66
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":109
  *     likelihoods_data = checkArrayDouble1D(input_likelihoods, &S)
  *     total = 0.0
  *     for i from 0 <= i < S:             # <<<<<<<<<<<<<<
@@ -2245,7 +2734,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
   __pyx_t_2 = __pyx_v_S;
   for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_2; __pyx_v_i++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":67
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":110
  *     total = 0.0
  *     for i from 0 <= i < S:
  *         total += log(likelihoods_data[i])*weights_data[i]             # <<<<<<<<<<<<<<
@@ -2255,7 +2744,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
     __pyx_v_total += (log((__pyx_v_likelihoods_data[__pyx_v_i])) * (__pyx_v_weights_data[__pyx_v_i]));
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":68
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":111
  *     for i from 0 <= i < S:
  *         total += log(likelihoods_data[i])*weights_data[i]
  *     return total             # <<<<<<<<<<<<<<
@@ -2263,7 +2752,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
  * def logDotReduce(index, patch_probs, switch_probs, plhs):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_total); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_total); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -2283,7 +2772,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSite
   return __pyx_r;
 }
 
-/* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":70
+/* "/root/package/cogent/evolve/_likelihood_tree.pyx":113
  *     return total
  * 
  * def logDotReduce(index, patch_probs, switch_probs, plhs):             # <<<<<<<<<<<<<<
@@ -2350,23 +2839,23 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__patch_probs);
       if (likely(values[1])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, 1); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  2:
       values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__switch_probs);
       if (likely(values[2])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, 2); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
       case  3:
       values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__plhs);
       if (likely(values[3])) kw_args--;
       else {
-        __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, 3); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, 3); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     }
     if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "logDotReduce") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "logDotReduce") < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     }
     __pyx_v_index = values[0];
     __pyx_v_patch_probs = values[1];
@@ -2382,7 +2871,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("logDotReduce", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("cogent.evolve._likelihood_tree.logDotReduce");
   return NULL;
@@ -2394,7 +2883,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
   __pyx_v_patch_probs1 = Py_None; __Pyx_INCREF(Py_None);
   __pyx_v_patch_probs2 = Py_None; __Pyx_INCREF(Py_None);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":76
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":119
  *     cdef long *index_data
  *     cdef object patch_probs1, patch_probs2
  *     BASE = 2.0 ** 1000             # <<<<<<<<<<<<<<
@@ -2403,39 +2892,39 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
   __pyx_v_BASE = pow(2.0, 1000);
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":77
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":120
  *     cdef object patch_probs1, patch_probs2
  *     BASE = 2.0 ** 1000
  *     patch_probs1 = patch_probs.copy()             # <<<<<<<<<<<<<<
  *     patch_probs2 = patch_probs.copy()
  *     n = uniq = length = 0
  */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_patch_probs, __pyx_n_s__copy); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_GetAttr(__pyx_v_patch_probs, __pyx_n_s__copy); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_v_patch_probs1);
   __pyx_v_patch_probs1 = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":78
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":121
  *     BASE = 2.0 ** 1000
  *     patch_probs1 = patch_probs.copy()
  *     patch_probs2 = patch_probs.copy()             # <<<<<<<<<<<<<<
  *     n = uniq = length = 0
  *     state = checkArrayDouble1D(patch_probs1, &n)
  */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_patch_probs, __pyx_n_s__copy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_GetAttr(__pyx_v_patch_probs, __pyx_n_s__copy); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_v_patch_probs2);
   __pyx_v_patch_probs2 = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":79
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":122
  *     patch_probs1 = patch_probs.copy()
  *     patch_probs2 = patch_probs.copy()
  *     n = uniq = length = 0             # <<<<<<<<<<<<<<
@@ -2446,57 +2935,57 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
   __pyx_v_uniq = 0;
   __pyx_v_length = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":80
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":123
  *     patch_probs2 = patch_probs.copy()
  *     n = uniq = length = 0
  *     state = checkArrayDouble1D(patch_probs1, &n)             # <<<<<<<<<<<<<<
  *     prev = checkArrayDouble1D(patch_probs2, &n)
  *     sp = checkArrayDouble2D(switch_probs, &n, &n)
  */
-  __pyx_t_3 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_patch_probs1), (&__pyx_v_n)); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_patch_probs1), (&__pyx_v_n)); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_state = __pyx_t_3;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":81
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":124
  *     n = uniq = length = 0
  *     state = checkArrayDouble1D(patch_probs1, &n)
  *     prev = checkArrayDouble1D(patch_probs2, &n)             # <<<<<<<<<<<<<<
  *     sp = checkArrayDouble2D(switch_probs, &n, &n)
  *     pl = checkArrayDouble2D(plhs, &uniq, &n)
  */
-  __pyx_t_3 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_patch_probs2), (&__pyx_v_n)); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_patch_probs2), (&__pyx_v_n)); if (unlikely(__pyx_t_3 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_prev = __pyx_t_3;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":82
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":125
  *     state = checkArrayDouble1D(patch_probs1, &n)
  *     prev = checkArrayDouble1D(patch_probs2, &n)
  *     sp = checkArrayDouble2D(switch_probs, &n, &n)             # <<<<<<<<<<<<<<
  *     pl = checkArrayDouble2D(plhs, &uniq, &n)
  *     index_data = checkArrayLong1D(index, &length)
  */
-  __pyx_t_4 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_switch_probs), (&__pyx_v_n), (&__pyx_v_n)); if (unlikely(__pyx_t_4 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_switch_probs), (&__pyx_v_n), (&__pyx_v_n)); if (unlikely(__pyx_t_4 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_sp = __pyx_t_4;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":83
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":126
  *     prev = checkArrayDouble1D(patch_probs2, &n)
  *     sp = checkArrayDouble2D(switch_probs, &n, &n)
  *     pl = checkArrayDouble2D(plhs, &uniq, &n)             # <<<<<<<<<<<<<<
  *     index_data = checkArrayLong1D(index, &length)
  *     exponent = 0
  */
-  __pyx_t_4 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_plhs), (&__pyx_v_uniq), (&__pyx_v_n)); if (unlikely(__pyx_t_4 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayDouble2D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_plhs), (&__pyx_v_uniq), (&__pyx_v_n)); if (unlikely(__pyx_t_4 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_pl = __pyx_t_4;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":84
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":127
  *     sp = checkArrayDouble2D(switch_probs, &n, &n)
  *     pl = checkArrayDouble2D(plhs, &uniq, &n)
  *     index_data = checkArrayLong1D(index, &length)             # <<<<<<<<<<<<<<
  *     exponent = 0
  *     for site from 0 <= site < length:
  */
-  __pyx_t_5 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_index), (&__pyx_v_length)); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_f_6cogent_6evolve_16_likelihood_tree_checkArrayLong1D(((__pyx_t_6cogent_6evolve_16_likelihood_tree_ArrayType)__pyx_v_index), (&__pyx_v_length)); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_index_data = __pyx_t_5;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":85
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":128
  *     pl = checkArrayDouble2D(plhs, &uniq, &n)
  *     index_data = checkArrayLong1D(index, &length)
  *     exponent = 0             # <<<<<<<<<<<<<<
@@ -2505,7 +2994,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
   __pyx_v_exponent = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":86
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":129
  *     index_data = checkArrayLong1D(index, &length)
  *     exponent = 0
  *     for site from 0 <= site < length:             # <<<<<<<<<<<<<<
@@ -2515,7 +3004,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
   __pyx_t_6 = __pyx_v_length;
   for (__pyx_v_site = 0; __pyx_v_site < __pyx_t_6; __pyx_v_site++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":87
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":130
  *     exponent = 0
  *     for site from 0 <= site < length:
  *         k = index_data[site]             # <<<<<<<<<<<<<<
@@ -2524,7 +3013,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
     __pyx_v_k = (__pyx_v_index_data[__pyx_v_site]);
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":88
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":131
  *     for site from 0 <= site < length:
  *         k = index_data[site]
  *         if k >= uniq:             # <<<<<<<<<<<<<<
@@ -2534,18 +3023,18 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
     __pyx_t_7 = (__pyx_v_k >= __pyx_v_uniq);
     if (__pyx_t_7) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":89
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":132
  *         k = index_data[site]
  *         if k >= uniq:
  *             raise ValueError((k, uniq))             # <<<<<<<<<<<<<<
  *         tmp = prev
  *         prev = state
  */
-      __pyx_t_1 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_1 = PyInt_FromLong(__pyx_v_k); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_uniq); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyInt_FromLong(__pyx_v_uniq); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_8);
       PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_1);
       __Pyx_GIVEREF(__pyx_t_1);
@@ -2553,22 +3042,22 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       __Pyx_GIVEREF(__pyx_t_2);
       __pyx_t_1 = 0;
       __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_8);
       __Pyx_GIVEREF(__pyx_t_8);
       __pyx_t_8 = 0;
-      __pyx_t_8 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_8 = PyObject_Call(__pyx_builtin_ValueError, __pyx_t_2, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_Raise(__pyx_t_8, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       goto __pyx_L8;
     }
     __pyx_L8:;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":90
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":133
  *         if k >= uniq:
  *             raise ValueError((k, uniq))
  *         tmp = prev             # <<<<<<<<<<<<<<
@@ -2577,7 +3066,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
     __pyx_v_tmp = __pyx_v_prev;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":91
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":134
  *             raise ValueError((k, uniq))
  *         tmp = prev
  *         prev = state             # <<<<<<<<<<<<<<
@@ -2586,7 +3075,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
     __pyx_v_prev = __pyx_v_state;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":92
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":135
  *         tmp = prev
  *         prev = state
  *         state = tmp             # <<<<<<<<<<<<<<
@@ -2595,7 +3084,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
     __pyx_v_state = __pyx_v_tmp;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":93
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":136
  *         prev = state
  *         state = tmp
  *         most_probable_state = 0             # <<<<<<<<<<<<<<
@@ -2604,7 +3093,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
     __pyx_v_most_probable_state = 0;
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":94
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":137
  *         state = tmp
  *         most_probable_state = 0
  *         for i from 0 <= i < n:             # <<<<<<<<<<<<<<
@@ -2614,7 +3103,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
     __pyx_t_9 = __pyx_v_n;
     for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_9; __pyx_v_i++) {
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":95
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":138
  *         most_probable_state = 0
  *         for i from 0 <= i < n:
  *             state[i] = 0             # <<<<<<<<<<<<<<
@@ -2623,7 +3112,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
       (__pyx_v_state[__pyx_v_i]) = 0;
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":96
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":139
  *         for i from 0 <= i < n:
  *             state[i] = 0
  *             for j from 0 <= j < n:             # <<<<<<<<<<<<<<
@@ -2633,7 +3122,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       __pyx_t_10 = __pyx_v_n;
       for (__pyx_v_j = 0; __pyx_v_j < __pyx_t_10; __pyx_v_j++) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":97
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":140
  *             state[i] = 0
  *             for j from 0 <= j < n:
  *                 state[i] += prev[j] * sp[j*n+i]             # <<<<<<<<<<<<<<
@@ -2643,7 +3132,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
         (__pyx_v_state[__pyx_v_i]) += ((__pyx_v_prev[__pyx_v_j]) * (__pyx_v_sp[((__pyx_v_j * __pyx_v_n) + __pyx_v_i)]));
       }
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":98
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":141
  *             for j from 0 <= j < n:
  *                 state[i] += prev[j] * sp[j*n+i]
  *             state[i] *= pl[k*n+i]             # <<<<<<<<<<<<<<
@@ -2652,7 +3141,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
       (__pyx_v_state[__pyx_v_i]) *= (__pyx_v_pl[((__pyx_v_k * __pyx_v_n) + __pyx_v_i)]);
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":99
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":142
  *                 state[i] += prev[j] * sp[j*n+i]
  *             state[i] *= pl[k*n+i]
  *             if state[i] > state[most_probable_state]:             # <<<<<<<<<<<<<<
@@ -2662,7 +3151,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       __pyx_t_7 = ((__pyx_v_state[__pyx_v_i]) > (__pyx_v_state[__pyx_v_most_probable_state]));
       if (__pyx_t_7) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":100
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":143
  *             state[i] *= pl[k*n+i]
  *             if state[i] > state[most_probable_state]:
  *                 most_probable_state = i             # <<<<<<<<<<<<<<
@@ -2675,7 +3164,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       __pyx_L13:;
     }
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":101
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":144
  *             if state[i] > state[most_probable_state]:
  *                 most_probable_state = i
  *         while state[most_probable_state] < 1.0:             # <<<<<<<<<<<<<<
@@ -2686,7 +3175,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       __pyx_t_7 = ((__pyx_v_state[__pyx_v_most_probable_state]) < 1.0);
       if (!__pyx_t_7) break;
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":102
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":145
  *                 most_probable_state = i
  *         while state[most_probable_state] < 1.0:
  *             for i from 0 <= i < n:             # <<<<<<<<<<<<<<
@@ -2696,7 +3185,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
       __pyx_t_9 = __pyx_v_n;
       for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_9; __pyx_v_i++) {
 
-        /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":103
+        /* "/root/package/cogent/evolve/_likelihood_tree.pyx":146
  *         while state[most_probable_state] < 1.0:
  *             for i from 0 <= i < n:
  *                 state[i] *= BASE             # <<<<<<<<<<<<<<
@@ -2706,7 +3195,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
         (__pyx_v_state[__pyx_v_i]) *= __pyx_v_BASE;
       }
 
-      /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":104
+      /* "/root/package/cogent/evolve/_likelihood_tree.pyx":147
  *             for i from 0 <= i < n:
  *                 state[i] *= BASE
  *             exponent += -1             # <<<<<<<<<<<<<<
@@ -2717,7 +3206,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
     }
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":105
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":148
  *                 state[i] *= BASE
  *             exponent += -1
  *     result = 0.0             # <<<<<<<<<<<<<<
@@ -2726,7 +3215,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
  */
   __pyx_v_result = 0.0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":106
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":149
  *             exponent += -1
  *     result = 0.0
  *     for i from 0 <= i < n:             # <<<<<<<<<<<<<<
@@ -2736,7 +3225,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
   __pyx_t_6 = __pyx_v_n;
   for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_6; __pyx_v_i++) {
 
-    /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":107
+    /* "/root/package/cogent/evolve/_likelihood_tree.pyx":150
  *     result = 0.0
  *     for i from 0 <= i < n:
  *         result += state[i]             # <<<<<<<<<<<<<<
@@ -2746,14 +3235,14 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
     __pyx_v_result += (__pyx_v_state[__pyx_v_i]);
   }
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":109
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":152
  *         result += state[i]
  * 
  *     return log(result) + exponent * log(BASE)             # <<<<<<<<<<<<<<
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_8 = PyFloat_FromDouble((log(__pyx_v_result) + (__pyx_v_exponent * log(__pyx_v_BASE)))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_8 = PyFloat_FromDouble((log(__pyx_v_result) + (__pyx_v_exponent * log(__pyx_v_BASE)))); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_8);
   __pyx_r = __pyx_t_8;
   __pyx_t_8 = 0;
@@ -2781,6 +3270,7 @@ static PyObject *__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce(PyObje
 
 static struct PyMethodDef __pyx_methods[] = {
   {__Pyx_NAMESTR("sumInputLikelihoods"), (PyCFunction)__pyx_pf_6cogent_6evolve_16_likelihood_tree_sumInputLikelihoods, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
+  {__Pyx_NAMESTR("rescaleLikelihoods"), (PyCFunction)__pyx_pf_6cogent_6evolve_16_likelihood_tree_rescaleLikelihoods, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("getTotalLogLikelihood"), (PyCFunction)__pyx_pf_6cogent_6evolve_16_likelihood_tree_getTotalLogLikelihood, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("getLogSumAcrossSites"), (PyCFunction)__pyx_pf_6cogent_6evolve_16_likelihood_tree_getLogSumAcrossSites, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
   {__Pyx_NAMESTR("logDotReduce"), (PyCFunction)__pyx_pf_6cogent_6evolve_16_likelihood_tree_logDotReduce, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
@@ -2812,17 +3302,20 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 0},
   {&__pyx_kp_s_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 0, 1, 0},
   {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
+  {&__pyx_n_s__BASE, __pyx_k__BASE, sizeof(__pyx_k__BASE), 0, 0, 1, 1},
   {&__pyx_n_s__TypeError, __pyx_k__TypeError, sizeof(__pyx_k__TypeError), 0, 0, 1, 1},
   {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
   {&__pyx_n_s____array_struct__, __pyx_k____array_struct__, sizeof(__pyx_k____array_struct__), 0, 0, 1, 1},
   {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
   {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
   {&__pyx_n_s____version__, __pyx_k____version__, sizeof(__pyx_k____version__), 0, 0, 1, 1},
+  {&__pyx_n_s__child_exponents, __pyx_k__child_exponents, sizeof(__pyx_k__child_exponents), 0, 0, 1, 1},
   {&__pyx_n_s__child_indexes, __pyx_k__child_indexes, sizeof(__pyx_k__child_indexes), 0, 0, 1, 1},
   {&__pyx_n_s__chr, __pyx_k__chr, sizeof(__pyx_k__chr), 0, 0, 1, 1},
   {&__pyx_n_s__copy, __pyx_k__copy, sizeof(__pyx_k__copy), 0, 0, 1, 1},
   {&__pyx_n_s__counts, __pyx_k__counts, sizeof(__pyx_k__counts), 0, 0, 1, 1},
   {&__pyx_n_s__data, __pyx_k__data, sizeof(__pyx_k__data), 0, 0, 1, 1},
+  {&__pyx_n_s__exponents, __pyx_k__exponents, sizeof(__pyx_k__exponents), 0, 0, 1, 1},
   {&__pyx_n_s__flags, __pyx_k__flags, sizeof(__pyx_k__flags), 0, 0, 1, 1},
   {&__pyx_n_s__index, __pyx_k__index, sizeof(__pyx_k__index), 0, 0, 1, 1},
   {&__pyx_n_s__input_likelihoods, __pyx_k__input_likelihoods, sizeof(__pyx_k__input_likelihoods), 0, 0, 1, 1},
@@ -2919,19 +3412,19 @@ PyMODINIT_FUNC PyInit__likelihood_tree(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/../../include/numerical_pyrex.pyx":13
+  /* "/root/package/cogent/evolve/../../include/numerical_pyrex.pyx":13
  * #
  * 
- * __version__ = "('1', '6', '0', 'dev')"             # <<<<<<<<<<<<<<
+ * __version__ = "('1', '6', '0dev')"             # <<<<<<<<<<<<<<
  * 
  * cdef extern from "Python.h":
  */
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_8)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 13; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":2
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":2
  * include "../../include/numerical_pyrex.pyx"
- * version_info = (2, 1)             # <<<<<<<<<<<<<<
- * __version__ = "('1', '6', '0', 'dev')"
+ * version_info = (2, 2)             # <<<<<<<<<<<<<<
+ * __version__ = "('1', '6', '0dev')"
  * 
  */
   __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 2; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -2939,25 +3432,25 @@ PyMODINIT_FUNC PyInit__likelihood_tree(void)
   __Pyx_INCREF(__pyx_int_2);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_int_2);
   __Pyx_GIVEREF(__pyx_int_2);
-  __Pyx_INCREF(__pyx_int_1);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
-  __Pyx_GIVEREF(__pyx_int_1);
+  __Pyx_INCREF(__pyx_int_2);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_2);
+  __Pyx_GIVEREF(__pyx_int_2);
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s__version_info, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 2; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":3
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":3
  * include "../../include/numerical_pyrex.pyx"
- * version_info = (2, 1)
- * __version__ = "('1', '6', '0', 'dev')"             # <<<<<<<<<<<<<<
+ * version_info = (2, 2)
+ * __version__ = "('1', '6', '0dev')"             # <<<<<<<<<<<<<<
  * 
  * cdef extern from "math.h":
  */
   if (PyObject_SetAttr(__pyx_m, __pyx_n_s____version__, ((PyObject *)__pyx_kp_s_8)) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "/Users/gavin/DevRepos/PyCogent-trunk/cogent/evolve/_likelihood_tree.pyx":1
+  /* "/root/package/cogent/evolve/_likelihood_tree.pyx":1
  * include "../../include/numerical_pyrex.pyx"             # <<<<<<<<<<<<<<
- * version_info = (2, 1)
- * __version__ = "('1', '6', '0', 'dev')"
+ * version_info = (2, 2)
+ * __version__ = "('1', '6', '0dev')"
  */
   __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(((PyObject *)__pyx_t_1));
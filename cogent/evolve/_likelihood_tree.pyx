@@ -1,5 +1,5 @@
 include "../../include/numerical_pyrex.pyx"
-version_info = (2, 1)
+version_info = (2, 2)
 __version__ = "('1', '6', '0dev')"
 
 cdef extern from "math.h":
@@ -38,6 +38,49 @@ def sumInputLikelihoods(child_indexes, result, likelihoods):
         c += 1
     return result
     
+def rescaleLikelihoods(child_indexes, child_exponents, result, exponents,
+        double BASE):
+    # exponents gets the sum of the child exponents for each parent column,
+    # then any row of result with nothing bigger than 1/BASE is multiplied 
+    # by BASE, and its exponent incremented, until it does.
+    cdef int M, S, i, m, c
+    cdef double biggest, value, LIMIT
+    cdef double *target_data
+    cdef long *index_data, *child_data, *exponents_data
+    cdef int U
+    
+    M = S = 0
+    target_data = checkArrayDouble2D(result, &S, &M)
+    exponents_data = checkArrayLong1D(exponents, &S)
+    for i from 0 <= i < S:
+        exponents_data[i] = 0
+    c = 0
+    for index in child_indexes:
+        if child_exponents[c] is not None:
+            U = 0
+            index_data = checkArrayLong1D(index, &S)
+            child_data = checkArrayLong1D(child_exponents[c], &U)
+            for i from 0 <= i < S:
+                exponents_data[i] += child_data[index_data[i]]
+        c += 1
+    LIMIT = 1.0 / BASE
+    for i from 0 <= i < S:
+        biggest = 0.0
+        for m from 0 <= m < M:
+            value = target_data[M*i+m]
+            if value < 0.0:
+                value = -value
+            if value > biggest:
+                biggest = value
+        if biggest == 0.0:
+            continue
+        while biggest < LIMIT:
+            for m from 0 <= m < M:
+                target_data[M*i+m] *= BASE
+            biggest *= BASE
+            exponents_data[i] += 1
+    return result
+
 def getTotalLogLikelihood(counts, input_likelihoods, mprobs):
     cdef int S, M, i, m
     cdef double posn, total
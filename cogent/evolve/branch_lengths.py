@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+"""Analytic derivatives of the log likelihood with respect to branch lengths,
+and a Newton's method optimiser which uses them.
+
+Each site likelihood is linear in the psub of any one edge, so substituting
+dP/dt = QP (or d2P/dt2 = QQP) for that psub and recalculating from there to
+the root gives the derivative of every site likelihood at the cost of one
+ordinary evaluation.  Only lengths which affect a single edge per locus and
+bin, ie: the default independent lengths, are handled this way."""
+
+from __future__ import division
+import numpy
+
+from cogent.evolve.substitution_calculation import _StackedPsubs
+from cogent.evolve.likelihood_calculation import common_scale
+from cogent.maths.optimisers import ParameterOutOfBoundsError, \
+        MaximumEvaluationsReached
+from cogent.util import progress_display as UI
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+class BranchLengthDerivatives(object):
+    """First and second derivatives of the total log likelihood of
+    a likelihood function's calculator with respect to its 'length' OptPars"""
+
+    def __init__(self, lf, lc):
+        if 'bin_switch' in lf.defn_for:
+            raise NotImplementedError(
+                'branch length derivatives need sites_independent=True')
+        self.lc = lc
+
+        def cell_for(name, **scope):
+            defn = lf.defn_for[name]
+            posn = defn._getPosnForScope(**scope)
+            return lc.results_by_id[id(defn)][posn]
+
+        # with stack_bins=True there is one [bin, site] lh array per locus
+        self.stacked = 'bin_lh' in lf.defn_for
+        self.loci = []
+        for locus in lf.locus_names:
+            root = cell_for('root', locus=locus)
+            if self.stacked:
+                lhs = [cell_for('bin_lh', locus=locus)]
+            else:
+                lhs = [cell_for('lh', locus=locus, bin=bin)
+                        for bin in lf.bin_names]
+            if len(lf.bin_names) > 1:
+                bprobs = cell_for('bprobs', locus=locus)
+            else:
+                bprobs = None
+            self.loci.append((root, bprobs, lhs))
+        self.lh_cells = [cell for (root, bprobs, lhs) in self.loci
+                for cell in lhs]
+        # with scaled=True the lh are (likelihoods, exponents) pairs
+        self.scaled = isinstance(self._value(self.lh_cells[0]), tuple)
+
+        self.psubs_for = {}
+        for opt_par in lc.opt_pars:
+            if opt_par.name != 'length':
+                continue
+            psubs = [cell for cell in lc._cells
+                    if cell.rank in opt_par.consequences
+                    and isinstance(cell.calc, _StackedPsubs)]
+            if psubs and self._separable(opt_par, psubs):
+                self.psubs_for[opt_par.rank] = psubs
+        self.opt_pars = [p for p in lc.opt_pars if p.rank in self.psubs_for]
+
+    def _separable(self, opt_par, psubs):
+        # distance must be the length, or length * rate, and each site
+        # likelihood must depend on only one of the psubs.
+        for psub in psubs:
+            distance = psub.args[1]
+            if not (distance is opt_par or
+                    [arg for arg in distance.args if arg is opt_par]):
+                return False
+        if self.stacked:
+            edge_psubs = []
+            for psub in psubs:
+                for client in psub.clients:
+                    if client.name == 'bin_psubs' and not [
+                            c for c in edge_psubs if c is client]:
+                        edge_psubs.append(client)
+        else:
+            edge_psubs = psubs
+        for lh in self.lh_cells:
+            if len([p for p in edge_psubs if lh.rank in p.consequences]) > 1:
+                return False
+        return True
+
+    def _value(self, cell):
+        return self.lc._getCurrentCellValue(cell)
+
+    def __call__(self, opt_par):
+        """(first, second) derivatives of the log likelihood with respect
+        to opt_par"""
+        d1_psubs = {}
+        d2_psubs = {}
+        affected = set()
+        for psub in self.psubs_for[opt_par.rank]:
+            (expm, distance) = psub.args
+            Q = self._value(expm).Q
+            P = self._value(psub)
+            if distance is opt_par:
+                scale = 1.0
+            else:
+                scale = numpy.product([self._value(arg)
+                        for arg in distance.args if arg is not opt_par])
+            QP = numpy.dot(Q, P)
+            d1_psubs[psub] = scale * QP
+            d2_psubs[psub] = scale * scale * numpy.dot(Q, QP)
+            affected.update(psub.consequences)
+
+        d1_lhs = self.lc.cellValuesWith(d1_psubs, self.lh_cells)
+        d2_lhs = self.lc.cellValuesWith(d2_psubs, self.lh_cells)
+        d1_for = dict(zip(self.lh_cells, d1_lhs))
+        d2_for = dict(zip(self.lh_cells, d2_lhs))
+
+        (first, second) = (0.0, 0.0)
+        for (root, bprobs, lh_cells) in self.loci:
+            if not [cell for cell in lh_cells if cell.rank in affected]:
+                continue
+            if bprobs is None:
+                weights = [1.0]
+            else:
+                weights = self._value(bprobs)
+            (lhs, d1s, d2s) = ([], [], [])
+            for cell in lh_cells:
+                lhs.append(self._value(cell))
+                if cell.rank in affected:
+                    d1s.append(d1_for[cell])
+                    d2s.append(d2_for[cell])
+                elif self.scaled:
+                    d1s.append((0.0, lhs[-1][1]))
+                    d2s.append((0.0, lhs[-1][1]))
+                else:
+                    d1s.append(0.0)
+                    d2s.append(0.0)
+            if self.scaled:
+                # only ratios of these are needed, so any common scale
+                (values, exponents) = common_scale(*(lhs + d1s + d2s))
+                n = len(lh_cells)
+                (lhs, d1s, d2s) = (values[:n], values[n:2*n], values[2*n:])
+            if self.stacked:
+                # the rows of one [bin, site] array
+                [lhs] = lhs
+                [d1s] = d1s
+                [d2s] = d2s
+            lh = d1 = d2 = 0.0
+            for (weight, bin_lh, bin_d1, bin_d2) in zip(
+                    weights, lhs, d1s, d2s):
+                lh = lh + weight * bin_lh
+                d1 = d1 + weight * bin_d1
+                d2 = d2 + weight * bin_d2
+            ratio = d1 / lh
+            counts = self._value(root).counts
+            f = numpy.inner(ratio, counts)
+            s = numpy.inner(d2 / lh - ratio * ratio, counts)
+            comm = self._value(root).comm
+            if comm is not None:
+                (f, s) = comm.allreduce(numpy.array([f, s]))
+            first += f
+            second += s
+        return (first, second)
+
+    def getDerivatives(self):
+        """[(opt_par, (first, second))] for each length OptPar handled"""
+        return [(p, self(p)) for p in self.opt_pars]
+
+    @UI.display_wrap
+    def newtonOptimise(self, tolerance=1e-6, max_rounds=100,
+            max_halvings=20, max_evaluations=None, ui=None):
+        """Maximise the log likelihood by adjusting one branch length at a
+        time with Newton's method, until a whole round of them improves the
+        log likelihood by less than 'tolerance'.  Returns the number of
+        calculator evaluations used.  Raises MaximumEvaluationsReached,
+        leaving the best lengths found so far, if more than
+        'max_evaluations' would be needed."""
+        lc = self.lc
+        self._first_evaluation = evaluations = lc.evaluations
+        if max_evaluations is None:
+            self._last_evaluation = numpy.inf
+        else:
+            self._last_evaluation = evaluations + max_evaluations
+        fval = lc.testfunction()
+        for i in range(max_rounds):
+            ui.display('Newton  f = % #10.6g   evals = %6i' % (
+                    fval, lc.evaluations - evaluations), i / max_rounds)
+            start_fval = fval
+            for opt_par in self.opt_pars:
+                fval = self._newtonStep(opt_par, fval, max_halvings,
+                        tolerance / len(self.opt_pars))
+            if fval - start_fval < tolerance:
+                break
+        return lc.evaluations - evaluations
+
+    def _newtonStep(self, opt_par, fval, max_halvings, min_gain):
+        lc = self.lc
+        if lc.evaluations >= self._last_evaluation:
+            raise MaximumEvaluationsReached(
+                    lc.evaluations - self._first_evaluation)
+        (lower, upper) = (opt_par.lower, opt_par.upper)
+        x = self._value(opt_par)
+        (first, second) = self(opt_par)
+        if second < 0.0:
+            step = -first / second
+            if first * step / 2.0 < min_gain:
+                return fval  # not worth evaluating
+        elif first < 0.0:
+            # not concave here, so just head uphill, cautiously as all
+            # the other lengths may be too long too.
+            step = -0.75 * x
+        else:
+            step = max(x, 0.01)
+        for i in range(max_halvings):
+            new_x = min(upper, max(lower, x + step))
+            if new_x == x:
+                return fval
+            try:
+                new_fval = lc.change(
+                        [(opt_par.rank, opt_par.transformToOptimiser(new_x))])
+            except (ArithmeticError, ParameterOutOfBoundsError):
+                new_fval = -numpy.inf
+            if new_fval >= fval:
+                return new_fval
+            if lc.evaluations >= self._last_evaluation:
+                lc.change([(opt_par.rank, opt_par.transformToOptimiser(x))])
+                raise MaximumEvaluationsReached(
+                        lc.evaluations - self._first_evaluation)
+            step /= 2.0
+        lc.change([(opt_par.rank, opt_par.transformToOptimiser(x))])
+        return fval
+
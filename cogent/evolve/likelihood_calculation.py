@@ -16,7 +16,8 @@ from cogent.recalculation.definition import CalculationDefn, _FuncDefn, \
         CalcDefn, ProbabilityParamDefn, NonParamDefn, SumDefn, CallDefn, \
         ParallelSumDefn
 
-from cogent.evolve.likelihood_tree import LikelihoodTreeEdge
+from cogent.evolve.likelihood_tree import LikelihoodTreeEdge, \
+        poolLikelihoodTreeLeaves
 from cogent.evolve.simulate import argpick
 from cogent.maths.markov import SiteClassTransitionMatrix
 
@@ -44,54 +45,104 @@ class PartialLikelihoodProductDefn(_PartialLikelihoodDefn):
     name = "plh"
     recycling = True
     
-    def calc(self, recycled_result, lh_edge, *child_likelihoods):
-        if recycled_result is None:
-            recycled_result = lh_edge.makePartialLikelihoodsArray()
-        return lh_edge.sumInputLikelihoodsR(recycled_result, *child_likelihoods)
-    
-
-class PartialLikelihoodProductDefnFixedMotif(PartialLikelihoodProductDefn):
+    def setup(self, edge_name, scaled=False):
+        self.edge_name = edge_name
+        self.scaled = scaled
     
-    def calc(self, recycled_result, fixed_motif, lh_edge, *child_likelihoods):
+    def calc(self, recycled_result, lh_edge, *child_likelihoods):
+        return self._product(recycled_result, lh_edge, child_likelihoods)
+    
+    def _product(self, recycled_result, lh_edge, child_likelihoods,
+            fixed_motif=None):
+        if self.scaled:
+            # (likelihoods, exponents) pairs, see ScaledCalc
+            (recycled_result, exponents) = recycled_result or (None, None)
+            child_exponents = [e for (lh, e) in child_likelihoods]
+            child_likelihoods = [lh for (lh, e) in child_likelihoods]
         if recycled_result is None:
-            recycled_result = lh_edge.makePartialLikelihoodsArray()
+            recycled_result = lh_edge.makePartialLikelihoodsArray(
+                    child_likelihoods[0].shape[-1])
         result = lh_edge.sumInputLikelihoodsR(
                 recycled_result, *child_likelihoods)
         if fixed_motif not in [None, -1]:
-            for motif in range(result.shape[-1]):
+            # a [site, bin, motif] view in case of stacked bins
+            M = lh_edge.shape[-1]
+            by_motif = result.reshape([len(result), -1, M])
+            for motif in range(M):
                 if motif != fixed_motif:
-                    result[:, motif] = 0.0
+                    by_motif[:, :, motif] = 0.0
+        if self.scaled:
+            if exponents is None:
+                exponents = lh_edge.makeExponentsArray()
+            lh_edge.rescaleLikelihoodsR(result, exponents, *child_exponents)
+            result = (result, exponents)
         return result
     
 
+class PartialLikelihoodProductDefnFixedMotif(PartialLikelihoodProductDefn):
+    
+    def calc(self, recycled_result, fixed_motif, lh_edge, *child_likelihoods):
+        return self._product(recycled_result, lh_edge, child_likelihoods,
+                fixed_motif)
+    
+
+class ScaledCalc(object):
+    """Wraps a function of partial likelihoods so that it can be given
+    scaled partial likelihoods, ie: (likelihoods, exponents) pairs in which
+    each site's likelihoods have been multiplied by SCALE_BASE**exponent.
+    Leaf likelihoods are never scaled and so are plain arrays."""
+    
+    def __init__(self, calc):
+        self.calc = calc
+        self.__name__ = calc.__name__
+    
+    def __call__(self, likelihoods, *args):
+        if isinstance(likelihoods, tuple):
+            (likelihoods, exponents) = likelihoods
+        else:
+            exponents = None
+        return (self.calc(likelihoods, *args), exponents)
+    
+
+def common_scale(*scaled_likelihoods):
+    """([likelihoods], exponents) from (likelihoods, exponents) pairs, 
+    the likelihoods all rescaled to the smallest of the exponents at each
+    site so that they can be added together"""
+    exponents = numpy.minimum.reduce([e for (lh, e) in scaled_likelihoods])
+    base = LikelihoodTreeEdge.SCALE_BASE
+    result = [lh * base ** (exponents - e) for (lh, e) in scaled_likelihoods]
+    return (result, exponents)
+
 class LhtEdgeLookupDefn(CalculationDefn):
     name = 'col_index'
     
-    def setup(self, edge_name):
+    def setup(self, edge_name, root_name='root'):
         self.edge_name = edge_name
         # so that it can be found by reconstructAncestralSeqs etc:
         if edge_name == 'root':
-            self.name = 'root'
+            self.name = root_name
     
     def calc(self, lht):
         return lht.getEdge(self.edge_name)
     
 
-def makePartialLikelihoodDefns(edge, lht, psubs, fixed_motifs):
+def makePartialLikelihoodDefns(edge, lht, psubs, fixed_motifs,
+        root_name='root', inner=numpy.inner, scaled=False):
     kw = {'edge_name':edge.Name}
     
     if edge.istip():
         plh = LeafPartialLikelihoodDefn(lht, **kw)
     else:
-        lht_edge = LhtEdgeLookupDefn(lht, **kw)
+        lht_edge = LhtEdgeLookupDefn(lht, root_name=root_name, **kw)
         children = []
         for child in edge.Children:
             child_plh = makePartialLikelihoodDefns(child, lht, psubs,
-                    fixed_motifs)
+                    fixed_motifs, inner=inner, scaled=scaled)
             psub = psubs.selectFromDimension('edge', child.Name)
-            child_plh = CalcDefn(numpy.inner)(child_plh, psub)
+            child_plh = CalcDefn(inner)(child_plh, psub)
             children.append(child_plh)
         
+        kw['scaled'] = scaled
         if fixed_motifs:
             fixed_motif = fixed_motifs.selectFromDimension('edge', edge.Name)
             plh = PartialLikelihoodProductDefnFixedMotif(
@@ -101,6 +152,44 @@ def makePartialLikelihoodDefns(edge, lht, psubs, fixed_motifs):
     
     return plh
 
+def stack_values(*values):
+    return numpy.array(values)
+
+def bin_stacked_inner(plh, psubs):
+    """numpy.inner(plh, psub) for each bin's psub at once.  plh and the
+    result are [site, bin*motif] arrays, except that leaf plh, being the
+    same for every bin, are just [site, motif]"""
+    (B, M) = psubs.shape[:2]
+    if plh.shape[-1] == M:
+        # one big matrix product is quicker than B small ones
+        return numpy.inner(plh, psubs.reshape([B*M, M]))
+    if B * M <= 32:
+        # block diagonal, again to have just one matrix product
+        block = numpy.zeros([B*M, B*M], psubs.dtype.char)
+        for (b, psub) in enumerate(psubs):
+            block[b*M:(b+1)*M, b*M:(b+1)*M] = psub
+        return numpy.inner(plh, block)
+    result = numpy.empty(plh.shape, plh.dtype.char)
+    by_bin = result.reshape([len(result), B, M])
+    plh = plh.reshape([len(plh), B, M])
+    for (b, psub) in enumerate(psubs):
+        by_bin[:, b] = numpy.inner(plh[:, b], psub)
+    return result
+
+def bin_stacked_lh(plh, mprobs):
+    """[bin, site] likelihoods from [site, bin*motif] root plh and
+    [bin, motif] mprobs"""
+    (B, M) = mprobs.shape
+    lh = (plh.reshape([len(plh), B, M]) * mprobs).sum(axis=-1)
+    return numpy.ascontiguousarray(lh.T)
+
+def call_with_bins(func, lhs):
+    return func(*lhs)
+
+def call_with_scaled_bins(func, scaled_lhs):
+    (lhs, exponents) = scaled_lhs
+    return func.getScaledLogLikelihood(lhs, exponents)
+
 def recursive_lht_build(edge, leaves):
     if edge.istip():
         lhe = leaves[edge.Name]
@@ -114,11 +203,40 @@ def recursive_lht_build(edge, leaves):
 
 class LikelihoodTreeDefn(CalculationDefn):
     name = 'lht'
-    def setup(self, tree):
+    def setup(self, tree, shared_memory=False):
         self.tree = tree
+        self.shared_memory = shared_memory
     
     def calc(self, leaves):
-        return recursive_lht_build(self.tree, leaves)
+        lht = recursive_lht_build(self.tree, leaves)
+        if self.shared_memory:
+            lht = lht.inSharedMemory()
+        return lht
+    
+
+class PooledLikelihoodTreeDefn(LikelihoodTreeDefn):
+    """One likelihood tree for the distinct site patterns of all the loci"""
+    name = 'pooled_lht'
+    
+    def calc(self, *locus_leaves):
+        (leaves, bounds) = poolLikelihoodTreeLeaves(locus_leaves)
+        lht = recursive_lht_build(self.tree, leaves)
+        lht.locus_bounds = bounds
+        lht.locus_leaves = locus_leaves
+        if self.shared_memory:
+            lht = lht.inSharedMemory()
+        return lht
+    
+
+class LocusLikelihoodTreeDefn(CalculationDefn):
+    """The columns of a pooled likelihood tree which belong to one locus"""
+    name = 'lht'
+    
+    def calc(self, pooled_lht, leaves):
+        for (locus_num, l) in enumerate(pooled_lht.locus_leaves):
+            if l is leaves:
+                return pooled_lht.getLocusView(locus_num)
+        raise ValueError('leaves not pooled into this likelihood tree')
     
 
 class LikelihoodTreeAlignmentSplitterDefn(CalculationDefn):
@@ -127,18 +245,55 @@ class LikelihoodTreeAlignmentSplitterDefn(CalculationDefn):
         return lht.parallelShare(parallel_context)
     
 
+class LocusLikelihoodTreeSplitterDefn(CalculationDefn):
+    """This CPU's share of one locus of a pooled likelihood tree"""
+    name = 'root'
+    def calc(self, local_pooled_lht, locus_lht):
+        if local_pooled_lht.comm is None:
+            return locus_lht
+        return local_pooled_lht.getLocusView(locus_lht.locus_num)
+    
+
 def makeTotalLogLikelihoodDefn(tree, leaves, psubs, mprobs, bprobs, bin_names,
-        locus_names, sites_independent):
+        locus_names, sites_independent, shared_memory=False,
+        pool_loci=False, stack_bins=False, scaled=False):
     
     fixed_motifs = NonParamDefn('fixed_motif', ['edge'])
-    
-    lht = LikelihoodTreeDefn(leaves, tree=tree)
-    
-    # Split up the alignment columns between the available CPUs.
     parallel_context = NonParamDefn('parallel_context')
-    lht = LikelihoodTreeAlignmentSplitterDefn(parallel_context, lht)
     
-    plh = makePartialLikelihoodDefns(tree, lht, psubs, fixed_motifs)
+    stack_bins = stack_bins and len(bin_names) > 1
+    if stack_bins:
+        # The partial likelihoods of all the bins in one [site, bin*motif]
+        # array, so one cell per edge rather than one per edge per bin.
+        psubs = CalcDefn(stack_values, name='bin_psubs')(
+                *psubs.acrossDimension('bin', bin_names))
+        inner = bin_stacked_inner
+    else:
+        inner = numpy.inner
+    if scaled:
+        inner = ScaledCalc(inner)
+    
+    if pool_loci and len(locus_names) > 1:
+        # Site patterns common to several loci are only evaluated once,
+        # each locus then sums over the patterns with its own counts.
+        # Only worthwhile if the loci share their psubs.
+        pooled = PooledLikelihoodTreeDefn(
+                *leaves.acrossDimension('locus', locus_names),
+                **dict(tree=tree, shared_memory=shared_memory))
+        lht = LocusLikelihoodTreeDefn(pooled, leaves)
+        pooled = LikelihoodTreeAlignmentSplitterDefn(parallel_context, pooled)
+        plh = makePartialLikelihoodDefns(tree, pooled, psubs, fixed_motifs,
+                root_name='pooled_root', inner=inner, scaled=scaled)
+        lht = LocusLikelihoodTreeSplitterDefn(pooled, lht)
+    else:
+        lht = LikelihoodTreeDefn(leaves, tree=tree,
+                shared_memory=shared_memory)
+        
+        # Split up the alignment columns between the available CPUs.
+        lht = LikelihoodTreeAlignmentSplitterDefn(parallel_context, lht)
+        
+        plh = makePartialLikelihoodDefns(tree, lht, psubs, fixed_motifs,
+                inner=inner, scaled=scaled)
     
     # After the root partial likelihoods have been calculated it remains to
     # sum over the motifs, local sites, other sites (ie: cpus), bins and loci.
@@ -148,7 +303,18 @@ def makeTotalLogLikelihoodDefn(tree, leaves, psubs, mprobs, bprobs, bin_names,
     # minimise inter-CPU communicaton.
     
     root_mprobs = mprobs.selectFromDimension('edge', 'root')
-    lh = CalcDefn(numpy.inner, name='lh')(plh, root_mprobs)
+    if stack_bins:
+        root_mprobs = CalcDefn(stack_values, name='bin_mprobs')(
+                *root_mprobs.acrossDimension('bin', bin_names))
+        root_lh = bin_stacked_lh
+    else:
+        root_lh = numpy.inner
+    if scaled:
+        root_lh = ScaledCalc(root_lh)
+    if stack_bins:
+        lh = CalcDefn(root_lh, name='bin_lh')(plh, root_mprobs)
+    else:
+        lh = CalcDefn(root_lh, name='lh')(plh, root_mprobs)
     if len(bin_names) > 1:
         if sites_independent:
             site_pattern = CalcDefn(BinnedSiteDistribution, name='bdist')(
@@ -159,11 +325,23 @@ def makeTotalLogLikelihoodDefn(tree, leaves, psubs, mprobs, bprobs, bin_names,
             site_pattern = CalcDefn(PatchSiteDistribution, name='bdist')(
                     switch, bprobs)
         blh = CallDefn(site_pattern, lht, name='bindex')
-        tll = CallDefn(blh, *lh.acrossDimension('bin', bin_names),
-                **dict(name='tll'))
+        if scaled:
+            if not stack_bins:
+                lh = CalcDefn(common_scale, name='scaled_lhs')(
+                        *lh.acrossDimension('bin', bin_names))
+            tll = CalcDefn(call_with_scaled_bins, name='tll')(blh, lh)
+        elif stack_bins:
+            tll = CalcDefn(call_with_bins, name='tll')(blh, lh)
+        else:
+            tll = CallDefn(blh, *lh.acrossDimension('bin', bin_names),
+                    **dict(name='tll'))
     else:
         lh = lh.selectFromDimension('bin', bin_names[0])
-        tll = CalcDefn(log_sum_across_sites, name='logsum')(lht, lh)
+        if scaled:
+            tll = CalcDefn(scaled_log_sum_across_sites, name='logsum')(
+                    lht, lh)
+        else:
+            tll = CalcDefn(log_sum_across_sites, name='logsum')(lht, lh)
     
     if len(locus_names) > 1 or parallel_context is None:
         # "or parallel_context is None" only because SelectFromDimension
@@ -180,6 +358,11 @@ def makeTotalLogLikelihoodDefn(tree, leaves, psubs, mprobs, bprobs, bin_names,
 def log_sum_across_sites(root, root_lh):
     return root.getLogSumAcrossSites(root_lh)
 
+def scaled_log_sum_across_sites(root, scaled_root_lh):
+    (root_lh, exponents) = scaled_root_lh
+    return (root.getLogSumAcrossSites(root_lh) - 
+            root.getLogScaleAcrossSites(exponents))
+
 class BinnedSiteDistribution(object):
     def __init__(self, bprobs):
         self.bprobs = bprobs
@@ -246,6 +429,10 @@ class BinnedLikelihood(object):
     def __call__(self, *lhs):
         result = self.distrib.getWeightedSumLh(lhs)
         return self.root.getLogSumAcrossSites(result)
+    
+    def getScaledLogLikelihood(self, lhs, exponents):
+        # lhs all multiplied by SCALE_BASE**exponents
+        return self(*lhs) - self.root.getLogScaleAcrossSites(exponents)
 
     def getPosteriorProbs(self, *lhs):
         # posterior bin probs, not motif probs
@@ -269,6 +456,11 @@ class SiteHmm(object):
         return self.root.logDotReduce(
             matrix.StationaryProbs, matrix.Matrix, plhs)
     
+    def getScaledLogLikelihood(self, lhs, exponents):
+        # lhs all multiplied by SCALE_BASE**exponents
+        (root, exponents) = self.root.parallelReconstructColumns(exponents)
+        return self(*lhs) - root.getLogScaleAcrossSites(exponents)
+    
     def getPosteriorProbs(self, *lhs):
         plhs = []
         for lh in self.distrib.getWeightedSumLhs(lhs):
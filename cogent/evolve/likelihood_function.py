@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 
-import random, numpy
+import random, numpy, warnings
 
 from cogent.core.alignment import Alignment
 from cogent.util.dict_array import DictArrayTemplate
 from cogent.evolve.simulate import AlignmentEvolver, randomSequence
+from cogent.evolve.branch_lengths import BranchLengthDerivatives
+from cogent.maths.optimisers import MaximumEvaluationsReached
+from cogent.evolve.likelihood_tree import LikelihoodTreeEdge
 from cogent.util import parallel, table
 from cogent.recalculation.definition import ParameterController
 
@@ -38,6 +41,72 @@ class LikelihoodFunction(ParameterController):
     def getLogLikelihood(self):
         return self.getFinalResult()
     
+    def optimise(self, *args, **kw):
+        """As for ParameterController.optimise, plus 'newton_branch_lengths'
+        which if true first optimises the branch lengths using their
+        analytic derivatives.  The general optimiser is then only run if
+        there are other free parameters.  max_evaluations, limit_action and
+        show_progress apply to both.  Derivatives aren't available when
+        bins switch between sites (sites_independent=False), in which case
+        the general optimiser does all the work."""
+        newton = kw.pop('newton_branch_lengths', False)
+        if newton and 'bin_switch' in self.defn_for:
+            warnings.warn('Newton branch lengths need sites_independent=True,'
+                    ' using the general optimiser only', stacklevel=2)
+            newton = False
+        if newton:
+            max_evaluations = kw.get('max_evaluations', None)
+            limit_action = kw.get('limit_action', 'warn')
+            lc = self.makeCalculator()
+            derivs = BranchLengthDerivatives(self, lc)
+            limited = False
+            try:
+                evals = derivs.newtonOptimise(
+                        tolerance=kw.get('tolerance', 1e-6),
+                        max_evaluations=max_evaluations,
+                        show_progress=kw.get('show_progress', None))
+            except MaximumEvaluationsReached, detail:
+                evals = detail[0]
+                err_msg = 'FORCED EXIT from optimiser after %s evaluations' \
+                        % evals
+                if limit_action == 'ignore':
+                    pass
+                elif limit_action == 'warn':
+                    warnings.warn(err_msg, stacklevel=2)
+                else:
+                    raise ArithmeticError(err_msg)
+                limited = True
+            finally:
+                self.updateFromCalculator(lc)
+            if limited or len(derivs.opt_pars) == len(lc.opt_pars):
+                if kw.get('return_calculator', False):
+                    return lc
+                return
+            if max_evaluations is not None:
+                kw['max_evaluations'] = max_evaluations - evals
+        return ParameterController.optimise(self, *args, **kw)
+    
+    def optimiseBranchLengths(self, tolerance=1e-6, max_rounds=100):
+        """Optimise just the branch lengths, one at a time by Newton's
+        method, holding all other parameters constant."""
+        lc = self.makeCalculator()
+        derivs = BranchLengthDerivatives(self, lc)
+        try:
+            derivs.newtonOptimise(tolerance=tolerance, max_rounds=max_rounds)
+        finally:
+            self.updateFromCalculator(lc)
+    
+    def getBranchLengthDerivatives(self):
+        """{edge name: (first, second)} derivatives of the log likelihood
+        with respect to each independent branch length"""
+        lc = self.makeCalculator()
+        derivs = BranchLengthDerivatives(self, lc)
+        result = {}
+        for (opt_par, d) in derivs.getDerivatives():
+            for scope in opt_par.scope:
+                result[scope[0]] = d
+        return result
+    
     def getPsubForEdge(self, name, **kw):
         """returns the substitution probability matrix for the named edge"""
         try:
@@ -60,14 +129,43 @@ class LikelihoodFunction(ParameterController):
                 raise
         return DictArrayTemplate(self._motifs, self._motifs).wrap(array)
     
+    def _getScaledLikelihoodValuesForEachBin(self, locus=None):
+        """([lh for each bin], exponents) where the lh have been multiplied
+        by SCALE_BASE**exponents if scaled=True, exponents otherwise None"""
+        if len(self.bin_names) == 1:
+            lhs = self.getParamValue('lh', locus=locus)
+        elif 'scaled_lhs' in self.defn_for:
+            lhs = self.getParamValue('scaled_lhs', locus=locus)
+        elif 'bin_lh' in self.defn_for:
+            # stack_bins=True
+            lhs = self.getParamValue('bin_lh', locus=locus)
+        else:
+            lhs = [self.getParamValue('lh', locus=locus, bin=bin)
+                    for bin in self.bin_names]
+        if isinstance(lhs, tuple):
+            (lhs, exponents) = lhs
+        else:
+            exponents = None
+        if len(self.bin_names) == 1:
+            lhs = [lhs]
+        return (list(lhs), exponents)
+    
+    def _getLikelihoodValuesForEachBin(self, locus=None):
+        # possibly scaled, but all alike, so fine for ratios
+        (lhs, exponents) = self._getScaledLikelihoodValuesForEachBin(locus)
+        return lhs
+    
     def _getLikelihoodValuesSummedAcrossAnyBins(self, locus=None):
-        if self.bin_names and len(self.bin_names) > 1:
-            root_lhs = [self.getParamValue('lh', locus=locus, bin=bin) for
-                bin in self.bin_names]
+        (root_lhs, exponents) = self._getScaledLikelihoodValuesForEachBin(
+                locus)
+        if len(root_lhs) > 1:
             bprobs = self.getParamValue('bprobs')
             root_lh = bprobs.dot(root_lhs)
         else:
-            root_lh = self.getParamValue('lh', locus=locus)
+            [root_lh] = root_lhs
+        if exponents is not None:
+            # may underflow, but then the unscaled calculation would have
+            root_lh = root_lh / LikelihoodTreeEdge.SCALE_BASE ** exponents
         return root_lh
         
     def getFullLengthLikelihoods(self, locus=None):
@@ -131,8 +229,7 @@ class LikelihoodFunction(ParameterController):
     
     def getBinProbs(self, locus=None):
         hmm = self.getParamValue('bindex', locus=locus)
-        lhs = [self.getParamValue('lh', locus=locus, bin=bin)
-                for bin in self.bin_names]
+        lhs = self._getLikelihoodValuesForEachBin(locus=locus)
         array = hmm.getPosteriorProbs(*lhs)
         return DictArrayTemplate(self.bin_names, array.shape[1]).wrap(array)
     
@@ -5,9 +5,11 @@ Each leaf holds a sequence.  Used by a likelihood function."""
 from __future__ import division
 from cogent.util.modules import importVersionedModule, ExpectedImportError
 from cogent.util.parallel import MPI
+from cogent.util.shared_memory import share_array
 from cogent import LoadTable
 
 import numpy
+import copy
 
 numpy.seterr(all='ignore')
 
@@ -24,7 +26,7 @@ __status__ = "Production"
 
 try:
     pyrex = importVersionedModule('_likelihood_tree', globals(), 
-            (2, 1), "pure Python/NumPy likelihoodihood tree")
+            (2, 2), "pure Python/NumPy likelihoodihood tree")
 except ExpectedImportError:
     pyrex = None
         
@@ -119,6 +121,7 @@ class _LikelihoodTreeEdge(object):
         local.share_sizes = share_sizes
         local.comm = comm
         local.full_length_version = self
+        local.columns = numpy.array(local_cols, self.integer_type)
         return local
     
     def selectColumns(self, cols):
@@ -128,6 +131,42 @@ class _LikelihoodTreeEdge(object):
             children.append(child)
         return self.__class__(children, self.edge_name)
     
+    def inSharedMemory(self):
+        """A copy of self with its column index arrays, and those of all
+        its descendants, in shared memory so that they are not copied when 
+        sent to multiprocessing workers"""
+        result = copy.copy(self)
+        children = [child.inSharedMemory() 
+                for (index, child) in self._indexed_children]
+        result.index = share_array(self.index)
+        result.uniq = share_array(self.uniq)
+        result.counts = share_array(self.counts)
+        result.ambig = share_array(self.ambig)
+        result.indexes = [share_array(index) for index in self.indexes]
+        result._indexed_children = zip(result.indexes, children)
+        return result
+    
+    def getLocusView(self, locus_num):
+        """A copy of this root with the index and counts of just one of
+        the loci it was pooled from, see poolLikelihoodTreeLeaves"""
+        result = copy.copy(self)
+        result.locus_num = locus_num
+        if self.comm is None:
+            (start, end) = self.locus_bounds[locus_num]
+            result.index = self.index[start:end]
+        else:
+            (start, end) = self.full_length_version.locus_bounds[locus_num]
+            in_locus = (self.columns >= start) & (self.columns < end)
+            result.index = self.index[in_locus]
+            result.full_length_version = \
+                    self.full_length_version.getLocusView(locus_num)
+        counts = numpy.zeros([len(self.uniq)], self.float_type)
+        if len(result.index):
+            locus_counts = numpy.bincount(result.index)
+            counts[:len(locus_counts)] = locus_counts
+        result.counts = counts
+        return result
+    
     def parallelReconstructColumns(self, likelihoods):
         """Recombine full uniq array (eg: likelihoods) from MPI CPUs"""
         if self.comm is None:
@@ -173,13 +212,29 @@ class _LikelihoodTreeEdge(object):
                     return r
         return None
     
-    def makePartialLikelihoodsArray(self):
-        return numpy.ones(self.shape, self.float_type)
+    def makePartialLikelihoodsArray(self, width=None):
+        # width is bins*motifs if the bins are stacked
+        if width is None:
+            width = self.shape[-1]
+        return numpy.ones([self.shape[0], width], self.float_type)
     
     def sumInputLikelihoods(self, *likelihoods):
         result = numpy.ones(self.shape, self.float_type)
         self.sumInputLikelihoodsR(result, *likelihoods)
         return result
+    
+    # For scaled partial likelihoods, which are kept >= 1/SCALE_BASE by
+    # multiplying each site by SCALE_BASE**exponent.
+    SCALE_BASE = 2.0 ** 256
+    LOG_SCALE_BASE = numpy.log(SCALE_BASE)
+    
+    def makeExponentsArray(self):
+        return numpy.zeros([self.shape[0]], self.integer_type)
+    
+    def getLogScaleAcrossSites(self, exponents):
+        # For root, the log of the product of the sites' scale factors
+        return self.LOG_SCALE_BASE * numpy.inner(exponents, self.counts)
+    
 
     def asLeaf(self, likelihoods):
         (self, likelihoods) = self.parallelReconstructColumns(likelihoods)
@@ -203,6 +258,20 @@ class _PyLikelihoodTreeEdge(_LikelihoodTreeEdge):
             result *= numpy.take(likelihoods[i], index, 0)
         return result
     
+    def rescaleLikelihoodsR(self, result, exponents, *child_exponents):
+        exponents[:] = 0
+        for (index, child) in zip(self.indexes, child_exponents):
+            if child is not None:
+                exponents += numpy.take(child, index)
+        biggest = numpy.absolute(result).max(axis=-1)
+        small = (biggest < 1.0 / self.SCALE_BASE) & (biggest > 0.0)
+        while small.any():
+            result[small] *= self.SCALE_BASE
+            exponents[small] += 1
+            biggest[small] *= self.SCALE_BASE
+            small &= biggest < 1.0 / self.SCALE_BASE
+        return result
+    
     # For root
     
     def logDotReduce(self, patch_probs, switch_probs, plhs):
@@ -231,6 +300,11 @@ class _PyxLikelihoodTreeEdge(_LikelihoodTreeEdge):
         pyrex.sumInputLikelihoods(self.indexes, result, likelihoods)
         return result
     
+    def rescaleLikelihoodsR(self, result, exponents, *child_exponents):
+        pyrex.rescaleLikelihoods(self.indexes, child_exponents, result,
+                exponents, self.SCALE_BASE)
+        return result
+    
     # For root
     
     def logDotReduce(self, patch_probs, switch_probs, plhs):
@@ -302,6 +376,48 @@ def makeLikelihoodTreeLeaf(sequence, alphabet=None, seq_name=None):
     return LikelihoodTreeLeaf(uniq_motifs, likelihoods, 
                 counts, index, seq_name, alphabet, sequence)
 
+def poolLikelihoodTreeLeaves(locus_leaves):
+    """Combine several loci's {name:leaf} dicts into one, each leaf being
+    the concatenation of that sequence's leaves with their unique motifs
+    merged.  Also returns the (start, end) columns of each locus."""
+    names = locus_leaves[0].keys()
+    bounds = []
+    start = 0
+    for leaves in locus_leaves:
+        assert set(leaves.keys()) == set(names), (leaves.keys(), names)
+        end = start + len(leaves[names[0]])
+        bounds.append((start, end))
+        start = end
+    pooled = {}
+    for name in names:
+        parts = [leaves[name] for leaves in locus_leaves]
+        uniq = []
+        rows = []
+        seen = {}
+        indices = []
+        for leaf in parts:
+            remap = numpy.zeros([len(leaf.uniq)], INTEGER_TYPE)
+            for (u, motif) in enumerate(leaf.uniq[:-1]):
+                if motif not in seen:
+                    seen[motif] = len(uniq)
+                    uniq.append(motif)
+                    rows.append(leaf.input_likelihoods[u])
+                remap[u] = seen[motif]
+            remap[-1] = -1  # the gap column, must stay last
+            indices.append(remap[leaf.index])
+        # extra column for gap
+        uniq.append(parts[0].uniq[-1])
+        rows.append(parts[0].input_likelihoods[-1])
+        index = numpy.concatenate(indices).astype(INTEGER_TYPE)
+        index[index < 0] = len(uniq) - 1
+        counts = numpy.zeros([len(uniq)], FLOAT_TYPE)
+        if len(index):
+            c = numpy.bincount(index)
+            counts[:len(c)] = c
+        pooled[name] = LikelihoodTreeLeaf(uniq, numpy.array(rows, FLOAT_TYPE),
+                counts, index, name, parts[0].alphabet, None)
+    return (pooled, bounds)
+
 class LikelihoodTreeLeaf(object):
     def __init__(self, uniq, likelihoods, counts, index, edge_name, 
             alphabet, sequence):
@@ -357,6 +473,17 @@ class LikelihoodTreeLeaf(object):
                 uniq, likelihoods, counts, index, self.edge_name, 
                 self.alphabet, None)
         
+    def inSharedMemory(self):
+        """A copy of self with the index and likelihood arrays in shared
+        memory so that they are not copied when sent to multiprocessing 
+        workers"""
+        result = self.__class__(self.uniq, 
+                share_array(self.input_likelihoods), share_array(self.counts),
+                share_array(self.index), self.edge_name, self.alphabet, None)
+        if hasattr(self, 'sequence'):
+            result.sequence = self.sequence
+        return result
+    
     def getEdge(self, name):
         if self.edge_name == name:
             return self
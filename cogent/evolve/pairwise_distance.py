@@ -1,9 +1,12 @@
 from __future__ import division
+from functools import partial
+import numpy
 from numpy import log, zeros, float64, int32, array, sqrt, dot, diag, where
 from numpy.linalg import det, norm, inv
 
 from cogent import DNA, RNA, LoadTable
 from cogent.util.progress_display import display_wrap
+from cogent.phylo.util import CondensedDistances
 
 __author__ = "Gavin Huttley and Yicheng Zhu"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -75,6 +78,101 @@ def _fill_diversity_matrix(matrix, seq1, seq2):
         matrix[paired[i][0], paired[i][1]] += 1
     
 
+# Limits the size of the temporary [seq, state, column] arrays used by
+# _diversity_matrices, in array elements.
+COLUMN_CHUNK_SIZE = 2**22
+
+def _diversity_matrices(seqs1, seqs2, dim):
+    """[i, j, state1, state2] array, the diversity matrix of each sequence
+    in seqs1 against each sequence in seqs2.  The sequences are arrays of
+    indices, as for _fill_diversity_matrix.
+    
+    Each diversity matrix is a sum over columns of the outer product of
+    state indicator vectors, so all of them are calculated together as one
+    matrix product per chunk of columns."""
+    (n1, n2) = (len(seqs1), len(seqs2))
+    result = zeros((n1 * dim, n2 * dim), float64)
+    length = seqs1.shape[1]
+    chunk = max(1, COLUMN_CHUNK_SIZE // (max(n1, n2) * dim))
+    states = numpy.arange(dim)[:, numpy.newaxis]
+    for start in range(0, length, chunk):
+        end = min(start + chunk, length)
+        # [seq, state, column] indicators, 0 for invalid characters.
+        # float32 sums of these are exact for any chunk under 2**24.
+        x = seqs1[:, numpy.newaxis, start:end] == states
+        y = seqs2[:, numpy.newaxis, start:end] == states
+        result += dot(x.reshape(n1 * dim, -1).astype(numpy.float32),
+                y.reshape(n2 * dim, -1).astype(numpy.float32).T)
+    return result.reshape(n1, dim, n2, dim).transpose(0, 2, 1, 3)
+
+def _jc69_from_matrices(matrices):
+    """_jc69_from_matrix for a [pair, state, state] array of diversity
+    matrices.  Returns total, p, dist and var arrays which are NaN where
+    _jc69_from_matrix would return None"""
+    total = matrices.sum(axis=2).sum(axis=1)
+    same = numpy.diagonal(matrices, axis1=1, axis2=2).sum(axis=1)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        p = (total - same) / total
+        factor = (1 - (4 / 3) * p)
+        dist = -3.0 * log(factor) / 4
+        var = p * (1 - p) / (factor * factor * total)
+    invalid = (total == 0) | ~(p < 0.75)
+    result = [total, p, dist, var]
+    for stat in result:
+        stat[invalid] = numpy.nan
+    return result
+
+def _tn93_from_matrices(matrices, freqs, pur_indices, pyr_indices,
+        pur_coords, pyr_coords, tv_coords):
+    """_tn93_from_matrix for a [pair, state, state] array of diversity
+    matrices.  Returns total, p, dist and var arrays which are NaN where
+    _tn93_from_matrix would return None"""
+    n = len(matrices)
+    flat = matrices.reshape(n, -1)
+    total = flat.sum(axis=1)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        freqs = (matrices.sum(axis=1) + matrices.sum(axis=2)) / \
+                (2 * total[:, numpy.newaxis])
+        p = flat[:, pur_coords + pyr_coords + tv_coords].sum(axis=1) / total
+        
+        freq_purs = freqs[:, pur_indices].sum(axis=1)
+        prod_purs = freqs[:, pur_indices].prod(axis=1)
+        freq_pyrs = freqs[:, pyr_indices].sum(axis=1)
+        prod_pyrs = freqs[:, pyr_indices].prod(axis=1)
+        
+        pur_ts_diffs = flat[:, pur_coords].sum(axis=1) / total
+        pyr_ts_diffs = flat[:, pyr_coords].sum(axis=1) / total
+        tv_diffs = flat[:, tv_coords].sum(axis=1) / total
+        
+        coeff1 = 2 * prod_purs / freq_purs
+        coeff2 = 2 * prod_pyrs / freq_pyrs
+        coeff3 = 2 * (freq_purs * freq_pyrs - \
+                (prod_purs * freq_pyrs / freq_purs) -\
+                (prod_pyrs * freq_purs / freq_pyrs))
+        
+        term1 = 1 - pur_ts_diffs / coeff1 - tv_diffs / (2*freq_purs)
+        term2 = 1 - pyr_ts_diffs / coeff2 - tv_diffs / (2*freq_pyrs)
+        term3 = 1 - tv_diffs / (2 * freq_purs * freq_pyrs)
+        invalid = (total == 0) | (term1 <= 0) | (term2 <= 0) | (term3 <= 0)
+        
+        dist = -coeff1 * log(term1) - coeff2 * log(term2) - \
+                coeff3 * log(term3)
+        v1 = 1 / term1
+        v2 = 1 / term2
+        v3 = 1 / term3
+        v4 = (coeff1 * v1 / (2 * freq_purs)) + \
+             (coeff2 * v2 / (2 * freq_pyrs)) + \
+             (coeff3 * v3 / (2 * freq_purs * freq_pyrs))
+        var = v1**2 * pur_ts_diffs + v2**2 * pyr_ts_diffs + \
+              v4**2 * tv_diffs - \
+              (v1 * pur_ts_diffs + v2 * pyr_ts_diffs + v4 * tv_diffs)**2
+        var /= total
+    
+    result = [total, p, dist, var]
+    for stat in result:
+        stat[invalid] = numpy.nan
+    return result
+
 def _jc69_from_matrix(matrix):
     """computes JC69 stats from a diversity matrix"""
     invalid = None, None, None, None
@@ -216,6 +314,26 @@ try:
 except ImportError:
     fill_diversity_matrix = _fill_diversity_matrix
 
+def _block_stats(seqs, dim, func, vector_func, func_args, block):
+    """(rows, cols, [total, p, dist, var]) arrays for each pair of
+    sequences i, j with i in block[0] and j > i in block[1].  Invalid
+    statistics are NaN."""
+    ((start1, end1), (start2, end2)) = block
+    pairs = [(i, j) for i in range(start1, end1)
+            for j in range(max(i + 1, start2), end2)]
+    if not pairs:
+        return ([], [], [[]] * 4)
+    (rows, cols) = numpy.array(pairs).T
+    matrices = _diversity_matrices(seqs[start1:end1], seqs[start2:end2], dim)
+    matrices = matrices[rows - start1, cols - start2]
+    if vector_func is not None:
+        stats = vector_func(matrices, *func_args)
+    else:
+        stats = [func(matrix, *func_args) for matrix in matrices]
+        stats = numpy.array([[[v, numpy.nan][v is None] for v in stat]
+                for stat in stats], float64).T
+    return (rows, cols, stats)
+
 def _number_formatter(template):
     """flexible number formatter"""
     def call(val):
@@ -235,6 +353,7 @@ class _PairwiseDistance(object):
         self.char_to_indices = get_moltype_index_array(moltype)
         self._dim = len(list(moltype))
         self._dists = None
+        self._condensed = None
         
         self.Names = None
         self.IndexedSeqs = None
@@ -262,32 +381,63 @@ class _PairwiseDistance(object):
     def func():
         pass # over ride in subclasses
     
+    # like func but for a [pair, state, state] array of diversity matrices,
+    # see _jc69_from_matrices.  Subclasses without one use func per pair.
+    vector_func = None
+    
     @display_wrap
-    def run(self, alignment=None, ui=None):
-        """computes the pairwise distances"""
+    def run(self, alignment=None, block_size=500, condensed=False,
+            filename=None, ui=None):
+        """computes the pairwise distances.
+        
+        The sequences are divided into blocks of 'block_size' and the
+        diversity matrices of all pairs from two blocks are calculated
+        together.  These blocks of pairs are shared out over the current
+        parallel context.
+        
+        Arguments:
+            - condensed: keep only the distances, in a CondensedDistances
+              rather than a dict, so the other statistics are unavailable.
+            - filename: write the CondensedDistances to this memory mapped
+              file as they are calculated. Implies condensed.
+        """
         if alignment is not None:
             self._convert_seqs_to_indices(alignment)
         
-        matrix = zeros((self._dim, self._dim), float64)
-        done = 0.0
-        to_do = (len(self.Names) * len(self.Names) - 1) / 2
-        for i in range(len(self.Names)-1):
-            name_1 = self.Names[i]
-            s1 = self.IndexedSeqs[i]
-            for j in range(i+1, len(self.Names)):
-                name_2 = self.Names[j]
-                ui.display('%s vs %s' % (name_1, name_2), done / to_do )
-                done += 1
-                matrix.fill(0)
-                s2 = self.IndexedSeqs[j]
-                fill_diversity_matrix(matrix, s1, s2)
-                total, p, dist, var = self.func(matrix, *self._func_args)
-                self._dists[(name_1, name_2)] = (total, p, dist, var)
-                self._dists[(name_2, name_1)] = (total, p, dist, var)
-        
+        condensed = condensed or filename is not None
+        if condensed:
+            self._dists = None
+            self._condensed = CondensedDistances(self.Names, filename)
+        else:
+            self._dists = {}
+            self._condensed = None
+        n = len(self.Names)
+        bounds = [(start, min(start + block_size, n))
+                for start in range(0, n, block_size)]
+        blocks = [(bounds1, bounds2) for (k, bounds1) in enumerate(bounds)
+                for bounds2 in bounds[k:]]
+        # only what the workers need, not self with its results
+        block_stats = partial(_block_stats, self.IndexedSeqs, self._dim,
+                self.func, self.vector_func, self._func_args)
+        for (rows, cols, stats) in ui.imap(block_stats, blocks,
+                noun='block'):
+            if condensed:
+                self._condensed.setValues(rows, cols, stats[2])
+                continue
+            stats = zip(*[[[None, float(v)][v == v] for v in stat]
+                    for stat in stats])
+            for (i, j, stat) in zip(rows, cols, stats):
+                (name_1, name_2) = (self.Names[i], self.Names[j])
+                self._dists[(name_1, name_2)] = stat
+                self._dists[(name_2, name_1)] = stat
+        if condensed:
+            self._condensed.flush()
     
     def getPairwiseDistances(self):
-        """returns a 2D dictionary of pairwise distances."""
+        """returns a 2D dictionary of pairwise distances, or if run with
+        condensed=True a CondensedDistances."""
+        if self._condensed is not None:
+            return self._condensed
         if self._dists is None:
             return None
         dists = {}
@@ -370,6 +520,7 @@ class JC69Pair(_NucleicSeqPair):
         """states: the valid sequence states"""
         super(JC69Pair, self).__init__(*args, **kwargs)
         self.func = _jc69_from_matrix
+        self.vector_func = _jc69_from_matrices
     
 
 class TN93Pair(_NucleicSeqPair):
@@ -395,6 +546,7 @@ class TN93Pair(_NucleicSeqPair):
         self.tv_coords = [i * 4 + j for i, j in self.tv_coords]
         
         self.func = _tn93_from_matrix
+        self.vector_func = _tn93_from_matrices
         self._func_args = [self._freqs, self.pur_indices,
             self.pyr_indices, self.pur_coords,
             self.pyr_coords, self.tv_coords]
@@ -325,7 +325,20 @@ class AlignmentLikelihoodFunction(_LikelihoodParameterController):
         except KeyError:
             pass
     
-    def makeLikelihoodDefn(self, sites_independent=True, discrete_edges=None):
+    def makeLikelihoodDefn(self, sites_independent=True, discrete_edges=None,
+            shared_memory=False, pool_loci=False, stack_bins=False,
+            scaled=False):
+        """shared_memory: keep the alignment's likelihood tree arrays in
+        shared memory so that multiprocessing workers don't each need 
+        their own copy.
+        pool_loci: evaluate site patterns which occur in several loci only
+        once, a saving when the loci share substitution parameters and 
+        motif probs.
+        stack_bins: calculate the partial likelihoods of all the bins
+        together in one array per edge, rather than one array per bin.
+        scaled: rescale any sites whose partial likelihoods get very small,
+        keeping track of the scale factors, so that trees with very many
+        tips don't underflow."""
         defns = self.model.makeParamControllerDefns(bin_names=self.bin_names)
         if discrete_edges is not None:
             from discrete_markov import PartialyDiscretePsubsDefn
@@ -334,7 +347,7 @@ class AlignmentLikelihoodFunction(_LikelihoodParameterController):
         return likelihood_calculation.makeTotalLogLikelihoodDefn(
             self.tree, defns['align'], defns['psubs'], defns['word_probs'],
             defns['bprobs'], self.bin_names, self.locus_names,
-            sites_independent)
+            sites_independent, shared_memory, pool_loci, stack_bins, scaled)
     
     def setAlignment(self, aligns, motif_pseudocount=None):
         """set the alignment to be used for computing the likelihood."""
@@ -367,12 +380,15 @@ class SequenceLikelihoodFunction(_LikelihoodParameterController):
         pass
     
     def makeLikelihoodDefn(self, sites_independent=None,
-            with_indel_params=True, kn=True):
+            with_indel_params=True, kn=True, linear_space=None,
+            parallel_subtrees=False):
         assert sites_independent is None or not sites_independent
         assert len(self.locus_names) == 1
         return dp_calculation.makeForwardTreeDefn(
                 self.model, self.tree, self.bin_names,
-                with_indel_params=with_indel_params, kn=kn)
+                with_indel_params=with_indel_params, kn=kn,
+                linear_space=linear_space,
+                parallel_subtrees=parallel_subtrees)
     
     def setSequences(self, seqs, locus=None):
         leaves = {}
@@ -6,6 +6,7 @@ from cogent.recalculation.definition import PositiveParamDefn, RatioParamDefn, \
         CalculationDefn, MonotonicDefn, ProductDefn, ConstDefn, PartitionDefn, \
         NonParamDefn, CallDefn, SelectForDimension, \
         GammaDefn, WeightedPartitionDefn, CalcDefn
+from cogent.recalculation.calculation import EvaluatedCell
 from cogent.maths.matrix_exponentiation import PadeExponentiator, \
         FastExponentiator, CheckedExponentiator, LinAlgError
 
@@ -74,3 +75,106 @@ class ExpDefn(CalculationDefn):
             return _both
 
 
+
+
+class QdDefn(CalculationDefn):
+    """Q prepared for exponentiation, ie: exp(Q).
+    
+    Optimisers often revisit exact parameter values already tried (line
+    searches, interval estimation), so the most recently used results
+    are kept in an LRU cache keyed on the values Q was calculated from."""
+    
+    name = 'Qd'
+    
+    def setup(self, cache_size=50):
+        self.cache_size = cache_size
+        self.clearCache()
+    
+    def clearCache(self):
+        self._cache = {}
+        self._lru = []
+        self.cache_hits = self.cache_misses = 0
+    
+    def getCacheInfo(self):
+        """Counts of cache hits and misses, and the current cache size"""
+        return dict(hits=self.cache_hits, misses=self.cache_misses,
+                size=len(self._cache))
+    
+    def __getstate__(self):
+        # Cached exponentiators aren't always picklable, and needn't be
+        state = self.__dict__.copy()
+        (state['_cache'], state['_lru']) = ({}, [])
+        return state
+    
+    def calc(self, exp, Q, word_probs, mprobs_matrix, *params):
+        key = (exp, numpy.asarray(word_probs).tostring(), 
+                numpy.asarray(mprobs_matrix).tostring(), params)
+        if key in self._cache:
+            self.cache_hits += 1
+            self._lru.remove(key)
+        else:
+            self.cache_misses += 1
+            self._cache[key] = exp(Q)
+            if len(self._lru) >= self.cache_size:
+                del self._cache[self._lru.pop(0)]
+        self._lru.append(key)
+        return self._cache[key]
+    
+
+class _StackedPsubs(object):
+    """Psubs calculated together for the most recently seen exponentiators.
+    Two are kept, current and previous, to suit the Calculator's undo"""
+    
+    depth = 2
+    
+    def __init__(self):
+        self.recent = []
+    
+    def calcAll(self, expm, *distances):
+        for (e, psubs) in self.recent:
+            if e is expm:
+                return None
+        psubs = dict(zip(distances, expm.stacked(distances)))
+        self.recent = [(expm, psubs)] + self.recent[:self.depth-1]
+        return None
+    
+    def __call__(self, expm, distance):
+        for (e, psubs) in self.recent:
+            if e is expm and distance in psubs:
+                return psubs[distance]
+        return expm(distance)
+    
+
+class StackedPsubsDefn(CallDefn):
+    """Psubs from exponentiator(distance), as CallDefn would make them.
+    
+    Whenever an exponentiator (ie: Q) changes, every psub which shares it
+    is calculated in one go by an extra cell which depends on Q and all the 
+    distances.  The psub cells themselves still depend on only their own 
+    Q and distance, so changing one distance recalculates only one psub."""
+    
+    name = 'psubs'
+    
+    def makeCells(self, input_soup, variable=None):
+        shared = {}
+        for (expm_num, distance_num) in self.uniq:
+            shared.setdefault(expm_num, []).append(distance_num)
+        
+        (expms, distances) = [input_soup[id(arg)] for arg in self.args]
+        stacks = {}
+        cells = []
+        for (expm_num, distance_nums) in sorted(shared.items()):
+            stack = stacks[expm_num] = _StackedPsubs()
+            if len(distance_nums) > 1:
+                args = [expms[expm_num]] + [distances[d] for d in distance_nums]
+                cells.append(EvaluatedCell(self.name+'_stack', stack.calcAll,
+                        args))
+        
+        psubs = []
+        for (expm_num, distance_num) in self.uniq:
+            cell = EvaluatedCell(self.name, stacks[expm_num],
+                    (expms[expm_num], distances[distance_num]),
+                    default=self.default)
+            psubs.append(cell)
+        return (cells + psubs, psubs)
+    
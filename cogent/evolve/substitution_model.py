@@ -42,7 +42,7 @@ from cogent.evolve.substitution_calculation import (
     RateDefn, LengthDefn, ProductDefn, CallDefn, CalcDefn,
     PartitionDefn, NonParamDefn, AlignmentAdaptDefn, ExpDefn, 
     ConstDefn, GammaDefn, MonotonicDefn, SelectForDimension, 
-    WeightedPartitionDefn)
+    WeightedPartitionDefn, StackedPsubsDefn, QdDefn)
 from cogent.evolve.discrete_markov import PsubMatrixDefn
 from cogent.evolve.likelihood_tree import makeLikelihoodTreeLeaf
 from cogent.maths.optimisers import ParameterOutOfBoundsError
@@ -502,7 +502,7 @@ class _ContinuousSubstitutionModel(_SubstitutionModel):
         Q = CalcDefn(self.calcQ, name='Q')(word_probs, mprobs_matrix, *rate_params)
         expm = NonParamDefn('expm')
         exp = ExpDefn(expm)
-        Qd = CallDefn(exp, Q, name='Qd')
+        Qd = QdDefn(exp, Q, word_probs, mprobs_matrix, *rate_params)
         return Qd
     
     def _makeBinParamDefn(self, edge_par_name, bin_par_name, bprob_defn):
@@ -558,7 +558,7 @@ class _ContinuousSubstitutionModel(_SubstitutionModel):
         
     def makeContinuousPsubDefn(self, word_probs, mprobs_matrix, distance, rate_params):
         Qd = self.makeQdDefn(word_probs, mprobs_matrix, rate_params)
-        P = CallDefn(Qd, distance, name='psubs')
+        P = StackedPsubsDefn(Qd, distance)
         return P
     
 
@@ -31,6 +31,10 @@ class _Exponentiator(object):
     def __repr__(self):
         return "%s(%s)" % (self.__class__.__name__, repr(self.Q))
     
+    def stacked(self, ts):
+        """P for each t in 'ts', as a (len(ts), M, M) array"""
+        return numpy.array([self(t) for t in ts])
+    
 
 class EigenExponentiator(_Exponentiator):
     """A matrix ready for fast exponentiation.  P=exp(Q*t)"""
@@ -52,6 +56,25 @@ class EigenExponentiator(_Exponentiator):
         result = numpy.maximum(result, 0.0)
         return result
     
+    def stacked(self, ts):
+        # Same as __call__ for each t, but as a few big matrix products.
+        # Chunked so that the intermediate array stays cache sized.
+        n = len(ts)
+        M = len(self.roots)
+        chunk = max(1, 2**15 // (M*M))
+        evIT = numpy.ascontiguousarray(self.evI.T)
+        exp_roots = numpy.exp(numpy.multiply.outer(ts, self.roots))
+        result = numpy.empty([n, M, M], exp_roots.dtype)
+        for start in range(0, n, chunk):
+            part = exp_roots[start:start+chunk]
+            scaled = self.evT[numpy.newaxis, :, :] * part[:, numpy.newaxis, :]
+            result[start:start+chunk] = numpy.dot(
+                    scaled.reshape(len(part)*M, M), evIT).reshape(-1, M, M)
+        if result.dtype.kind == "c":
+            result = numpy.asarray(result.real)
+        result = numpy.maximum(result, 0.0)
+        return result
+    
 
 def SemiSymmetricExponentiator(motif_probs, Q):
     """Like EigenExponentiator, but more numerically stable and
@@ -12,10 +12,14 @@ ie:
 also:
     Double quotes can be used.
     Spaces and quote marks are OK inside unquoted labels.
+
+Text without quoted labels or comments takes a quicker path which doesn't
+need the tokeniser.
 """
 
 from cogent.parse.record import FileFormatError
 import re
+import gc
 EOT = None
 
 __author__ = "Peter Maxwell"
@@ -131,6 +135,111 @@ class _Tokeniser(object):
                 self.token = token
                 yield token  
 
+def _check_is_newick(text):
+    if "(" not in text and ";" not in text and text.strip():
+         # otherwise "filename" is a valid (if small) tree
+        raise TreeParseError('Not a Newick tree: "%s"' % text[:10])
+
+_delimiters = re.compile('([(),:;])')
+
+def _parse_simple(text, strict_labels=False, underscore_unmunge=True):
+    """(parents, names, lengths, postorder) lists for the nodes, in preorder,
+    for the common case of Newick text without quoted labels or comments.
+    
+    The text is split on the delimiters by a single regular expression and
+    the resulting labels read in a single pass, without the token by token
+    state machine of _Tokeniser.  Returns None if the text has anything
+    else, or any error, so that the full parser can handle or report it."""
+    if strict_labels or "'" in text or '"' in text or '[' in text:
+        return None
+    (parents, names, lengths, postorder) = ([-1], [None], [None], [])
+    stack = []
+    node = 0
+    has_children = [False]
+    expect_length = False
+    for token in _delimiters.split(text):
+        if expect_length:
+            token = token.strip()
+            if not token:
+                continue
+            try:
+                lengths[node] = float(token)
+            except ValueError:
+                return None
+            expect_length = False
+        elif token == '(':
+            if has_children[node] or names[node] is not None or \
+                    lengths[node] is not None:
+                return None
+            has_children[node] = True
+            stack.append(node)
+            node = len(parents)
+            parents.append(stack[-1])
+            names.append(None)
+            lengths.append(None)
+            has_children.append(False)
+        elif token == ',':
+            if not stack:
+                return None
+            postorder.append(node)
+            node = len(parents)
+            parents.append(stack[-1])
+            names.append(None)
+            lengths.append(None)
+            has_children.append(False)
+        elif token == ')':
+            if not stack:
+                return None
+            postorder.append(node)
+            node = stack.pop()
+        elif token == ':':
+            if lengths[node] is not None:
+                return None
+            expect_length = True
+        elif token == ';':
+            break
+        else:
+            token = token.strip()
+            if not token:
+                continue
+            if '\n' in token or names[node] is not None or \
+                    lengths[node] is not None:
+                return None
+            if underscore_unmunge and '_' in token:
+                token = token.replace('_', ' ')
+            names[node] = token
+    if stack or expect_length:
+        return None
+    postorder.append(node)
+    return (parents, names, lengths, postorder)
+
+def parse_arrays(text, **kw):
+    """(parents, names, lengths, postorder) lists for the nodes of the tree
+    in a Newick-format string, numbered in preorder.  parents[0] is -1 for
+    the root and missing names and lengths are None.  postorder is the node
+    numbers in postorder.  Keyword arguments are as for parse_string."""
+    _check_is_newick(text)
+    result = _parse_simple(text, **kw)
+    if result is None:
+        nodes = []
+        def constructor(children, name, attributes):
+            nodes.append((children or [], name, attributes.get('length')))
+            return len(nodes) - 1
+        root = parse_string(text, constructor, **kw)
+        # nodes were constructed in postorder
+        (parents, names, lengths, postorder) = ([], [], [], [None]*len(nodes))
+        stack = [(root, -1)]
+        while stack:
+            (node, parent) = stack.pop()
+            (children, name, length) = nodes[node]
+            postorder[node] = len(parents)
+            parents.append(parent)
+            names.append(name)
+            lengths.append(length)
+            stack.extend((child, postorder[node]) for child in children[::-1])
+        result = (parents, names, lengths, postorder)
+    return result
+
 def parse_string(text, constructor, **kw):
     """Parses a Newick-format string, using specified constructor for tree.
     
@@ -140,9 +249,28 @@ def parse_string(text, constructor, **kw):
     the data that's read in. This is part of the Newick format, but it is
     often useful to suppress this behavior.
     """
-    if "(" not in text and ";" not in text and text.strip():
-         # otherwise "filename" is a valid (if small) tree
-        raise TreeParseError('Not a Newick tree: "%s"' % text[:10])
+    _check_is_newick(text)
+    simple = _parse_simple(text, **kw)
+    if simple is not None:
+        (parents, names, lengths, postorder) = simple
+        children = {}
+        # The many new nodes would otherwise trigger repeated and futile
+        # garbage collections
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            for index in postorder:
+                attributes = {}
+                if lengths[index] is not None:
+                    attributes['length'] = lengths[index]
+                node = constructor(children.pop(index, None), names[index],
+                        attributes)
+                if parents[index] >= 0:
+                    children.setdefault(parents[index], []).append(node)
+        finally:
+            if collecting:
+                gc.enable()
+        return node
     sentinals = [';', EOT]
     stack = []
     nodes = []
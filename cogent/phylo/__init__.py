@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 __all__ = ['consensus', 'distance', 'least_squares', 'maximum_likelihood',
-           'nj', 'tree_space', 'util']
+           'nj', 'splits', 'tree_space', 'util']
 
 __author__ = ""
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
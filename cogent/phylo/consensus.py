@@ -1,7 +1,7 @@
 #! /usr/bin/env python
 """This module implements methods for generating consensus trees from a list of trees"""
 
-from cogent.core.tree import TreeBuilder
+from cogent.phylo.splits import SplitCounter
 from cogent import LoadTree
 
 __author__ = "Matthew Wakefield"
@@ -31,82 +31,20 @@ def majorityRule(trees, strict=False):
     trees = [(1, tree) for tree in trees]
     return weightedMajorityRule(trees, strict, "count")
 
-def weightedMajorityRule(weighted_trees, strict=False, attr="support"):
-    cladecounts = {}
-    edgelengths = {}
-    total = 0
+def weightedMajorityRule(weighted_trees, strict=False, attr="support",
+        max_splits=None):
+    """Determines the consensus tree from a list of (weight, tree) pairs,
+    as majorityRule but with each clade counted by the total weight of the
+    trees it is in.
+
+    The clades are counted by a SplitCounter, so max_splits can be given to
+    limit memory when there are very many trees, see
+    cogent.phylo.splits.SplitCounter.
+    """
+    counter = SplitCounter(max_splits=max_splits)
     for (weight, tree) in weighted_trees:
-        total += weight
-        edges = tree.getEdgeVector()
-        for edge in edges:
-            tips = edge.getTipNames(includeself=True)
-            tips = frozenset(tips)
-            if tips not in cladecounts:
-                cladecounts[tips] = 0
-            cladecounts[tips] += weight
-            length = edge.Length and edge.Length * weight
-            if edgelengths.get(tips, None):
-                edgelengths[tips] += length
-            else:
-                edgelengths[tips] = length
-    cladecounts = [(count, clade) for (clade, count) in cladecounts.items()]
-    cladecounts.sort()
-    cladecounts.reverse()
-    
-    if strict:
-        # Remove any with support < 50%
-        for index, (count, clade) in enumerate(cladecounts):
-            if count <= 0.5 * total:
-                cladecounts = cladecounts[:index]
-                break
-    
-    # Remove conflicts
-    accepted_clades = set()
-    counts = {}
-    for (count, clade) in cladecounts:
-        for accepted_clade in accepted_clades:
-            if clade.intersection(accepted_clade) and not (
-                    clade.issubset(accepted_clade) or
-                    clade.issuperset(accepted_clade)):
-                        break
-        else:
-            accepted_clades.add(clade)
-            counts[clade] = count
-            weighted_length = edgelengths[clade]
-            edgelengths[clade] = weighted_length and weighted_length / total
-    
-    nodes = {}
-    queue = []
-    tree_build = TreeBuilder().createEdge    
-    for clade in accepted_clades:
-        if len(clade) == 1:
-            tip_name = iter(clade).next()
-            params = {'length':edgelengths[clade], attr:counts[clade]}
-            nodes[tip_name] = tree_build([], tip_name, params)
-        else:
-            queue.append(((len(clade), clade)))
-            
-    while queue:
-        queue.sort()
-        (size, clade) = queue.pop(0)
-        new_queue = []
-        for (size2, ancestor) in queue:
-            if clade.issubset(ancestor):
-                new_ancestor = (ancestor - clade) | frozenset([clade])
-                counts[new_ancestor] = counts.pop(ancestor)
-                edgelengths[new_ancestor] = edgelengths.pop(ancestor)
-                ancestor = new_ancestor
-            new_queue.append((len(ancestor), ancestor))
-        children = [nodes.pop(c) for c in clade]
-        assert len([children])
-        nodes[clade] = tree_build(children, None, 
-            {attr:counts[clade], 'length':edgelengths[clade]})
-        queue = new_queue
-    
-    for root in nodes.values():
-        root.Name = 'root' # Yuk
-    
-    return [root for root in nodes.values()]
+        counter.addTree(tree, weight)
+    return counter.getConsensusTrees(strict, attr)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@
 from cogent.util import parallel, table, warning, progress_display as UI
 from cogent.maths.stats.util import Numbers
 from cogent import LoadSeqs, LoadTree
+from cogent.align.batch import AllPairsAligner
+from cogent.phylo.util import CondensedDistances
 
 from warnings import warn
 
@@ -22,7 +24,7 @@ class EstimateDistances(object):
     
     def __init__(self, seqs, submodel, threeway=False, motif_probs = None,
                 do_pair_align=False, rigorous_align=False, est_params=None,
-                modify_lf=None):
+                modify_lf=None, batch_align=False):
         """Arguments:
             - seqs: an Alignment or SeqCollection instance with > 1 sequence
             - submodel: substitution model object Predefined models can
@@ -36,6 +38,10 @@ class EstimateDistances(object):
             - rigorous_align: if True the pairwise alignments are actually
               numerically optimised, otherwise the current substitution model
               settings are used. This slows down estimation considerably.
+            - batch_align: if True, and rigorous_align is False, all the
+              pairs are aligned together in advance, which is faster, but
+              any motif probabilities from the data are pooled over all the
+              sequences rather than taken from each pair.
             - est_params: substitution model parameters to save estimates from
               in addition to length (distance)
             - modify_lf: a callback function for that takes a likelihood
@@ -61,8 +67,11 @@ class EstimateDistances(object):
         self.__motif_probs = motif_probs
         # the following may be pairs or three way combinations
         self.__combination_aligns = None
+        # pairwise alignments done all together in advance
+        self.__pair_alignments = {}
         self._do_pair_align = do_pair_align
         self._rigorous_align = rigorous_align
+        self._batch_align = batch_align
         # substitution model stuff
         self.__sm = submodel
         
@@ -117,7 +126,10 @@ class EstimateDistances(object):
     def __doset(self, sequence_names, dist_opt_args, aln_opt_args, ui):
         # slice the alignment
         seqs = self.__seq_collection.takeSeqs(sequence_names)
-        if self._do_pair_align:
+        if tuple(sequence_names) in self.__pair_alignments:
+            align = self.__pair_alignments[tuple(sequence_names)]
+            ui.display('', progress=0.0, current=1.0)
+        elif self._do_pair_align:
             ui.display('Aligning', progress=0.0, current=.5)
             align = self.__make_pair_alignment(seqs, aln_opt_args)
             ui.display('', progress=.5, current=.5)
@@ -194,6 +206,15 @@ class EstimateDistances(object):
             combination_aligns = self.__make_pairwise_comparison_sets()
             desc = "pair "
         labels = [desc + ','.join(names) for names in combination_aligns]
+        
+        if self._do_pair_align and self._batch_align and \
+                not self._rigorous_align:
+            # no per pair optimisation, so the pair HMM is the same for
+            # every pair and they can all be aligned together.
+            ui.display("Aligning")
+            aligner = AllPairsAligner(self.__sm, self.__seq_collection,
+                    modify_lf=self._modify_lf)
+            self.__pair_alignments = aligner.getAlignments(combination_aligns)
                             
         def _one_alignment(comp):
             result = self.__doset(comp, dist_opt_args, aln_opt_args)
@@ -247,6 +268,23 @@ class EstimateDistances(object):
         return self.getPairwiseParam('length',summary_function=summary_function,
                                     **kwargs)
     
+    def getCondensedDistances(self, filename=None, summary_function="mean"):
+        """Return the pairwise distances as a CondensedDistances, which can
+        be memory mapped to 'filename', instead of as a dictionary.
+        
+        Arguments:
+            - summary_function: as for getPairwiseDistances"""
+        dists = CondensedDistances(self.__seqnames, filename)
+        if self.__threeway:
+            pairs = self.getPairwiseDistances(summary_function).items()
+        else:
+            pairs = ((comp, param_vals['length']) for (comp, param_vals)
+                    in self.__param_ests.items())
+        for (comp, value) in pairs:
+            dists[comp] = value
+        dists.flush()
+        return dists
+    
     def getParamValues(self, param, **kwargs):
         """Returns a Numbers object with all estimated values of param.
         
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Alignment free distances between sequences from the k-mers (words of
+length k) they have in common, as used for the first guide tree by MUSCLE.
+
+These are much cheaper to calculate than distances from pairwise alignments
+so are suitable for guide trees for progressive alignment of many sequences,
+but they are not estimates of evolutionary distance."""
+
+from __future__ import division
+import numpy
+
+from cogent.util import progress_display as UI
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+# Largest number of distinct k-mers for the default k.
+MAX_DEFAULT_WORDS = 4096
+# Limits the size of the temporary [seq, word] arrays, in array elements.
+BLOCK_SIZE = 2**20
+
+def default_word_length(alphabet_size):
+    """Longest k with no more than MAX_DEFAULT_WORDS possible words, eg:
+    6 for nucleotides and 2 for amino acids"""
+    k = 1
+    while alphabet_size ** (k+1) <= MAX_DEFAULT_WORDS:
+        k += 1
+    return k
+
+def word_counts(seq, alphabet, k):
+    """Array of the number of times each of the len(alphabet)**k words
+    occurs in 'seq'.  Words containing gaps, ambiguity codes or anything
+    else not in 'alphabet' are ignored."""
+    lookup = numpy.empty([256], int)
+    lookup[:] = -1
+    for (index, char) in enumerate(alphabet):
+        lookup[ord(char.upper())] = lookup[ord(char.lower())] = index
+    indices = lookup[numpy.fromstring(str(seq), numpy.uint8)]
+    word_count = len(indices) - k + 1
+    A = len(alphabet)
+    if word_count < 1:
+        return numpy.zeros([A ** k], int)
+    words = numpy.zeros([word_count], int)
+    valid = numpy.ones([word_count], bool)
+    for offset in range(k):
+        position = indices[offset:offset+word_count]
+        words = words * A + position
+        valid &= position >= 0
+    return numpy.bincount(words[valid], minlength=A ** k)
+
+@UI.display_wrap
+def kmer_distances(seqs, moltype=None, k=None, ui=None):
+    """Dict of (name1, name2): distance for each pair of sequences, in both
+    orders.
+
+    The distance is 1 - F, F being the number of k-mers the two sequences
+    have in common divided by the number in the shorter sequence.
+
+    Arguments:
+        - seqs: a sequence collection or dict of sequences, aligned or not
+        - moltype: the MolType of the sequences, by default taken from
+          'seqs'.  Words are made from its Alphabet.
+        - k: word length, by default from default_word_length()
+    """
+    if isinstance(seqs, dict):
+        names = sorted(seqs.keys())
+        named_seqs = seqs
+    else:
+        names = seqs.getSeqNames()
+        named_seqs = seqs.NamedSeqs
+        if moltype is None:
+            moltype = seqs.MolType
+    if moltype is None:
+        moltype = named_seqs[names[0]].MolType
+    alphabet = list(moltype.Alphabet)
+    if k is None:
+        k = default_word_length(len(alphabet))
+    counts = numpy.array([word_counts(named_seqs[name], alphabet, k)
+            for name in names])
+    totals = counts.sum(axis=1)
+
+    dists = {}
+    block = max(1, BLOCK_SIZE // counts.shape[1])
+    for i in ui.series(range(len(names)-1), noun='sequence'):
+        for start in range(i+1, len(names), block):
+            end = min(start + block, len(names))
+            shared = numpy.minimum(counts[i], counts[start:end]).sum(axis=1)
+            shortest = numpy.minimum(totals[i], totals[start:end])
+            F = shared / numpy.maximum(shortest, 1)
+            for (j, d) in zip(range(start, end), 1.0 - F):
+                dists[(names[i], names[j])] = dists[(names[j], names[i])] = d
+    return dists
@@ -7,6 +7,12 @@ This is based on the algorithm of Studier and Keppler, as described in the book
 Biological sequence analysis by Durbin et al
 
 Generalised as described by Pearson, Robins & Zhang, 1999.
+
+nj() uses fast_nj(), which calculates only the one tree, on a distance array
+updated in place, and so is suitable for many thousands of sequences.  This
+is the same unrooted tree as gnj(keep=1) finds, but the root trifurcation
+may be placed at a different internal node, so anything which depends on
+the rooting, like tree.bifurcating(), can differ.
 """
 
 from __future__ import division
@@ -269,13 +275,231 @@ def gnj(dists, keep=None, dkeep=0, ui=None):
     return ScoredTreeCollection(result)
 
 
+# Limits the size of the temporary block of join scores, in array elements.
+BLOCK_SIZE = 2**20
+
+class _NeighbourJoiner(object):
+    """Neighbour joining of a single tree in place on a square distance
+    array.  The L current subtrees occupy the first L rows and columns,
+    and after each join the last of them is moved into the vacated slot.
+    The diagonal is kept at infinity so that it is never chosen.
+    
+    Without pruning every join score is calculated at each step, a block
+    of rows at a time.  With pruning, as in RapidNJ (Simonsen, Mailund &
+    Pedersen, 2008), each row also has its distances in sorted order, so
+    that rows can be scanned, all together, in order of increasing
+    distance until d[i,j] - u[i] - max(u) shows that no more of the row
+    can hold the best join.  Distances between subtrees never change, so
+    the sorted rows stay valid apart from entries for subtrees which have
+    since been joined, which are skipped.  The new subtree's row holds its
+    distances to all the others, so it need not be added to their rows.
+    The sorted rows are rebuilt whenever half of them have been joined."""
+    
+    def __init__(self, names, d, prune=True):
+        self.builder = TreeBuilder()
+        self.nodes = [self.builder.createEdge([], name, {})
+                for name in names]
+        self.L = L = len(names)
+        d = numpy.array(d, float)
+        d[numpy.diag_indices(L)] = 0.0
+        block = max(1, BLOCK_SIZE // L)
+        for start in range(0, L, block):
+            bad = ~numpy.isfinite(d[start:start+block])
+            if bad.any():
+                (i, j) = divmod(numpy.argmax(bad), L)
+                raise ValueError('distance between %r and %r is %s' % (
+                        names[start+i], names[j], d[start+i, j]))
+        self.r = d.sum(axis=1)
+        d[numpy.diag_indices(L)] = numpy.inf
+        self.d = d
+        self.prune = prune
+        if prune:
+            # Each subtree has an id, and ids[slot] / slots[id] map between
+            # ids and the current positions of subtrees in d.  The last id
+            # is never used, and stands for padding.
+            self.ids = numpy.arange(L)
+            self.slots = -numpy.ones([2 * L], int)
+            self.slots[:L] = self.ids
+            self.next_id = L
+            self.sorted_dists = numpy.empty([L, L], numpy.float32)
+            self.sorted_ids = numpy.empty([L, L], numpy.int32)
+            self._sortRows()
+    
+    def _sortRows(self):
+        L = self.L
+        order = numpy.argsort(self.d[:L, :L], axis=1)
+        self.sorted_dists[:L, :L] = self._lowerBounds(
+                self.d[numpy.arange(L)[:, numpy.newaxis], order])
+        self.sorted_ids[:L, :L] = self.ids[order]
+        self.width = self.rebuilt_at = L
+    
+    def _lowerBounds(self, dists):
+        # Single precision copy, rounded down so as to remain a lower bound
+        bounds = dists.astype(numpy.float32)
+        too_high = bounds > dists
+        bounds[too_high] = numpy.nextafter(bounds[too_high], -numpy.inf)
+        return bounds
+    
+    def _bestOfAll(self, u):
+        L = self.L
+        block = max(1, BLOCK_SIZE // L)
+        best = numpy.inf
+        (i, j) = (0, 1)
+        for start in range(0, L, block):
+            end = min(start + block, L)
+            Q = self.d[start:end, :L] - u[start:end, numpy.newaxis]
+            Q -= u
+            index = numpy.argmin(Q)
+            if Q.flat[index] < best:
+                best = Q.flat[index]
+                (i, j) = divmod(index, L)
+                i += start
+        return (i, j)
+    
+    def _bestOfSorted(self, u):
+        (d, slots) = (self.d, self.slots)
+        rows = numpy.arange(self.L)
+        u_max = u.max()
+        best = numpy.inf
+        (i, j) = (0, 1)
+        (start, step) = (0, 8)
+        while len(rows) and start < self.width:
+            end = min(start + step, self.width)
+            lower = self.sorted_dists[rows, start:end]
+            cols = slots[self.sorted_ids[rows, start:end]]
+            joined = cols < 0
+            cols[joined] = 0
+            Q = d[rows[:, numpy.newaxis], cols] - u[rows, numpy.newaxis]
+            Q -= u[cols]
+            Q[joined] = numpy.inf
+            index = numpy.argmin(Q)
+            if Q.flat[index] < best:
+                best = Q.flat[index]
+                (k, m) = divmod(index, end - start)
+                (i, j) = (rows[k], cols[k, m])
+            # Any more of row i are at least this
+            remaining = lower[:, -1] - u[rows]
+            remaining -= u_max
+            rows = rows[remaining < best]
+            start = end
+            step = min(2 * step, max(8, BLOCK_SIZE // max(1, len(rows))))
+        return (i, j)
+    
+    def bestJoin(self):
+        """(i, j) with i < j minimising the join score
+        d[i,j] - (r[i] + r[j]) / (L-2)"""
+        u = self.r[:self.L] / (self.L - 2.0)
+        if self.prune:
+            (i, j) = self._bestOfSorted(u)
+        else:
+            (i, j) = self._bestOfAll(u)
+        return (min(i, j), max(i, j))
+    
+    def join(self, i, j):
+        """Join subtrees i and j (i < j) into a new subtree at i"""
+        (L, d, r) = (self.L, self.d, self.r)
+        d_ij = d[i, j]
+        ij_dist_diff = (r[i] - r[j]) / (L - 2.0)
+        left_length = 0.5 * (d_ij + ij_dist_diff)
+        right_length = 0.5 * (d_ij - ij_dist_diff)
+        (left, right) = (self.nodes[i], self.nodes[j])
+        left.Length = max(0.0, left_length)
+        right.Length = max(0.0, right_length)
+        self.nodes[i] = self.builder.createEdge([left, right], None, {})
+        
+        new_dists = 0.5 * (d[i, :L] + d[j, :L] - d_ij)
+        new_dists[[i, j]] = numpy.inf
+        others = numpy.ones([L], bool)
+        others[[i, j]] = False
+        r[:L][others] += (new_dists[others] - d[i, :L][others] -
+                d[j, :L][others])
+        r[i] = new_dists[others].sum()
+        d[i, :L] = new_dists
+        d[:L, i] = new_dists
+        
+        # Eliminate j
+        last = L - 1
+        if j != last:
+            d[j, :L] = d[last, :L]
+            d[:L, j] = d[:L, last]
+            d[j, j] = numpy.inf
+            r[j] = r[last]
+            self.nodes[j] = self.nodes[last]
+        self.nodes.pop()
+        self.L = L = last
+        
+        if self.prune:
+            (ids, slots) = (self.ids, self.slots)
+            slots[ids[[i, j]]] = -1
+            if j != last:
+                ids[j] = ids[last]
+                slots[ids[j]] = j
+                self.sorted_dists[j] = self.sorted_dists[last]
+                self.sorted_ids[j] = self.sorted_ids[last]
+            ids[i] = self.next_id
+            slots[ids[i]] = i
+            self.next_id += 1
+            if L <= self.rebuilt_at // 2:
+                self._sortRows()
+            else:
+                order = numpy.argsort(d[i, :L])
+                self.sorted_dists[i, :L] = self._lowerBounds(d[i, order])
+                self.sorted_dists[i, L:] = numpy.inf
+                self.sorted_ids[i, :L] = ids[order]
+                self.sorted_ids[i, L:] = len(slots) - 1
+    
+    def finish(self):
+        """The tree, rooted at a trifurcation of the last 3 subtrees"""
+        assert self.L == 3
+        d = self.d[:3, :3].copy()
+        d[numpy.diag_indices(3)] = 0.0
+        lengths = numpy.sum(d, axis=0) - numpy.sum(d)/4
+        for (node, length) in zip(self.nodes, lengths):
+            node.Length = max(0.0, length)
+        tree = self.builder.createEdge(self.nodes, None, {})
+        tree.Name = "root"
+        return tree
+    
+
+@UI.display_wrap
+def fast_nj(dists, prune=True, ui=None):
+    """Neighbour joining tree, calculated in place on a distance array
+    rather than via the partial trees of gnj, so suitable for many
+    thousands of sequences.
+    
+    The joins are those of gnj(dists, keep=1) except perhaps the last.  With
+    4 subtrees left, each join scores the same as joining the other two, so
+    which gets done, and so which of the 3 final subtrees are the root's
+    children, is decided by rounding.  The unrooted tree is the same.
+    
+    Arguments:
+        - dists: dict of (name1, name2): distance, or a
+          cogent.phylo.util.CondensedDistances
+        - prune: skip calculating join scores for rows of the distance
+          matrix which cannot contain the best join, as in RapidNJ
+          (Simonsen, Mailund & Pedersen, 2008).  Same result, usually
+          much faster.
+    
+    Raises a ValueError if any distance is missing (NaN) or infinite.
+    """
+    (names, d) = distanceDictTo2D(dists)
+    assert len(names) >= 3, 'need at least 3 sequences'
+    joiner = _NeighbourJoiner(names, d, prune)
+    del d
+    if len(names) > 3:
+        for L in ui.series(range(len(names), 3, -1), noun='join'):
+            joiner.join(*joiner.bestJoin())
+    return joiner.finish()
+
 def nj(dists, no_negatives=True):
-    """Arguments:
-        - dists: dict of (name1, name2): distance
+    """Neighbour joining tree, via fast_nj, rooted at a trifurcation which
+    need not be the one gnj(keep=1) would give.
+    
+    Arguments:
+        - dists: dict of (name1, name2): distance, or a
+          cogent.phylo.util.CondensedDistances
         - no_negatives: negative branch lengths will be set to 0
     """
     assert no_negatives, "no_negatives=False is deprecated"
-    (result,) = gnj(dists, keep=1)
-    (score, tree) = result
-    return tree
+    return fast_nj(dists)
 
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+"""Clades and splits (bipartitions) of trees encoded as integers, for
+counting them over many trees, consensus trees and Robinson-Foulds
+distances.
+
+By default each tip name gets one bit, in the order the names are first
+seen, and a clade is the bitwise OR of its tips, so clades are compact,
+hashable and can be tested for overlap with bit operations rather than as
+frozensets of names.  Alternatively each tip can get a random hash_bits bit
+number and a clade be the XOR of its tips, which has constant size however
+many tips there are, at the cost of a very small chance (about N**2 /
+2**hash_bits for N distinct clades) of two clades sharing a code.  Hashed
+clades can't be decoded back into tip names.
+"""
+
+from __future__ import division
+import random
+import numpy
+
+from cogent.core.tree import TreeBuilder
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell", "Matthew Wakefield"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+# Limits the size of the temporary [tree, split] arrays, in array elements.
+BLOCK_SIZE = 2**20
+
+def _popcount(code):
+    return bin(code).count('1')
+
+class SplitEncoder(object):
+    """Encodes the clades of trees as integers, giving tip names their
+    codes as they are encountered."""
+
+    def __init__(self, tip_names=None, hash_bits=None, seed=None):
+        """Arguments:
+            - tip_names: names to encode first, in order
+            - hash_bits: if given, random codes of this many bits are used
+              instead of one bit per tip
+            - seed: for the random codes
+        """
+        self.HashBits = hash_bits
+        self.TipNames = []
+        self._codes = {}
+        self.All = 0
+        if hash_bits is not None:
+            self._random = random.Random(seed)
+        for name in tip_names or []:
+            self.getTipCode(name)
+
+    def getTipCode(self, name):
+        """The code of a tip, assigned on first use"""
+        if name not in self._codes:
+            if self.HashBits is None:
+                code = 1 << len(self.TipNames)
+            else:
+                code = self._random.getrandbits(self.HashBits)
+            self._codes[name] = code
+            self.TipNames.append(name)
+            self.All ^= code
+        return self._codes[name]
+
+    def encode(self, names):
+        """The code of the clade with these tips"""
+        code = 0
+        for name in set(names):
+            code ^= self.getTipCode(name)
+        return code
+
+    def decode(self, code):
+        """The tip names in a clade, in order"""
+        if self.HashBits is not None:
+            raise ValueError("hashed clades can't be decoded")
+        return [name for (i, name) in enumerate(self.TipNames)
+                if code >> i & 1]
+
+    def getClades(self, tree):
+        """List of (node, clade code, number of tips) for each node of
+        'tree' in postorder, including the tips and the root"""
+        get_code = self.getTipCode
+        exact = self.HashBits is None
+        result = []
+        stack = []
+        for node in tree.postorder():
+            num_children = len(node)
+            if num_children:
+                children = stack[-num_children:]
+                del stack[-num_children:]
+                (code, size) = children[0]
+                for (child_code, child_size) in children[1:]:
+                    if exact:
+                        code |= child_code
+                    else:
+                        code ^= child_code
+                    size += child_size
+            else:
+                (code, size) = (get_code(node.Name), 1)
+            stack.append((code, size))
+            result.append((node, code, size))
+        return result
+
+    def getSplits(self, tree, rooted=True):
+        """Set of the codes of the nontrivial clades of 'tree'.
+
+        If rooted these are the clades of every node but the root with more
+        than one tip, as for TreeNode.subsets.  Otherwise they are the
+        bipartitions made by the internal edges, each given as whichever of
+        its two sides has the lower code, and the tree must have exactly the
+        tips already known to the encoder.
+        """
+        clades = self.getClades(tree)
+        (root, root_code, num_tips) = clades.pop()
+        if rooted:
+            if self.HashBits is None:
+                return set([code for (node, code, size) in clades
+                        if size > 1 and _popcount(code) > 1])
+            return set([code for (node, code, size) in clades if size > 1])
+        if num_tips != len(self.TipNames) or root_code != self.All:
+            raise ValueError("unrooted splits need trees with the same tips")
+        All = self.All
+        return set([min(code, All ^ code) for (node, code, size) in clades
+                if 1 < size < num_tips - 1])
+
+
+class SplitCounter(object):
+    """Total weight, and weighted branch length, of each clade in a stream
+    of trees, without keeping the trees.
+
+    With max_splits, memory is bounded by pruning the counts whenever there
+    are more than 2*max_splits clades, as for the Misra-Gries frequent items
+    algorithm: the (max_splits+1)th largest count is subtracted from every
+    count and those left at or below zero are dropped.  The counts of
+    remaining clades are then low by at most Deducted, and any clade with a
+    total weight over Total/(max_splits+1) is kept.
+    """
+
+    def __init__(self, tip_names=None, max_splits=None):
+        self.Encoder = SplitEncoder(tip_names)
+        self.MaxSplits = max_splits
+        self.Counts = {}
+        self.Lengths = {}
+        self.Total = 0
+        self.Deducted = 0
+
+    def addTree(self, tree, weight=1):
+        """Adds the clades of 'tree', including its tips and root"""
+        (counts, lengths) = (self.Counts, self.Lengths)
+        for (node, clade, size) in self.Encoder.getClades(tree):
+            counts[clade] = counts.get(clade, 0) + weight
+            length = node.Length
+            if length is not None:
+                lengths[clade] = lengths.get(clade, 0) + length * weight
+        self.Total += weight
+        if self.MaxSplits is not None and len(counts) > 2 * self.MaxSplits:
+            self._prune()
+
+    def addTrees(self, trees):
+        """Adds each tree in 'trees' with a weight of 1"""
+        for tree in trees:
+            self.addTree(tree)
+
+    def _prune(self):
+        cut = sorted(self.Counts.values(), reverse=True)[self.MaxSplits]
+        self.Deducted += cut
+        self.Counts = dict([(clade, count - cut)
+                for (clade, count) in self.Counts.items() if count > cut])
+        self.Lengths = dict([(clade, length)
+                for (clade, length) in self.Lengths.items()
+                if clade in self.Counts])
+
+    def getCladeCounts(self):
+        """List of (count, tip names) for each clade, most common first"""
+        decode = self.Encoder.decode
+        return [(count, decode(clade)) for (count, clade) in
+                self._sortedCounts()]
+
+    def _sortedCounts(self):
+        # larger clades first where counts are equal
+        counts = [(count, _popcount(clade), clade)
+                for (clade, count) in self.Counts.items()]
+        counts.sort(reverse=True)
+        return [(count, clade) for (count, size, clade) in counts]
+
+    def getConsensusTrees(self, strict=False, attr="support"):
+        """Majority rule consensus trees, as for weightedMajorityRule"""
+        total = self.Total
+        accepted = []
+        # Clades in over half of the trees are all compatible
+        cladecounts = self._sortedCounts()
+        for (count, clade) in cladecounts:
+            if count <= 0.5 * total:
+                break
+            accepted.append(clade)
+        majority = len(accepted)
+        if not strict:
+            # A binary tree has 2N-1 clades, and no more could be compatible
+            most = 2 * len(self.Encoder.TipNames) - 1
+            for (count, clade) in cladecounts[majority:]:
+                if len(accepted) >= most:
+                    break
+                for other in accepted:
+                    shared = clade & other
+                    if shared and shared != clade and shared != other:
+                        break
+                else:
+                    accepted.append(clade)
+        return self._buildTrees(accepted, attr)
+
+    def _buildTrees(self, clades, attr):
+        # Build the trees from the smallest clades up.  'up' links each
+        # clade built so far to the clade that contains it.
+        tree_build = TreeBuilder().createEdge
+        total = self.Total
+        names = self.Encoder.TipNames
+        clades = sorted(clades, key=lambda clade: (_popcount(clade), clade))
+        nodes = {}
+        up = {}
+
+        def params(clade):
+            length = self.Lengths.get(clade)
+            return {attr: self.Counts[clade],
+                    'length': length and length / total}
+
+        def top(clade):
+            path = []
+            while clade in up:
+                path.append(clade)
+                clade = up[clade]
+            for lower in path:
+                up[lower] = clade
+            return clade
+
+        for clade in clades:
+            if clade & (clade - 1) == 0:
+                index = clade.bit_length() - 1
+                nodes[clade] = tree_build([], names[index], params(clade))
+                continue
+            children = []
+            remaining = clade
+            while remaining:
+                tip = remaining & -remaining
+                if tip not in nodes:
+                    # a tip which is not itself an accepted clade
+                    nodes[tip] = tree_build([], names[tip.bit_length()-1],
+                            {})
+                child = top(tip)
+                children.append(nodes[child])
+                up[child] = clade
+                remaining &= ~child
+            nodes[clade] = tree_build(children, None, params(clade))
+
+        roots = [nodes[clade] for clade in nodes if clade not in up]
+        for root in roots:
+            root.Name = 'root' # Yuk
+        return roots
+
+
+def robinson_foulds_matrix(trees, rooted=False, hash_bits=None):
+    """Array of the Robinson-Foulds distance between each pair of trees,
+    the number of splits found in one tree but not the other.
+
+    Arguments:
+        - trees: with the same tips if not rooted
+        - rooted: compare clades (as TreeNode.subsets) rather than
+          bipartitions
+        - hash_bits: use random codes of this many bits rather than one bit
+          per tip, see SplitEncoder
+    """
+    trees = list(trees)
+    encoder = SplitEncoder(hash_bits=hash_bits)
+    if trees and not rooted:
+        for name in trees[0].getTipNames():
+            encoder.getTipCode(name)
+    split_sets = [encoder.getSplits(tree, rooted) for tree in trees]
+    num_trees = len(trees)
+    sizes = numpy.array([len(splits) for splits in split_sets])
+
+    # Only splits in more than one tree, but not all, vary in how many
+    # each pair of trees shares.
+    holders = {}
+    for (index, splits) in enumerate(split_sets):
+        for split in splits:
+            holders.setdefault(split, []).append(index)
+    everywhere = 0
+    columns = []
+    for group in holders.values():
+        if len(group) == num_trees:
+            everywhere += 1
+        elif len(group) > 1:
+            columns.append(group)
+    shared = numpy.zeros([num_trees, num_trees], float)
+    shared[:] = everywhere
+    block = max(1, BLOCK_SIZE // max(num_trees, 1))
+    for start in range(0, len(columns), block):
+        group = columns[start:start+block]
+        present = numpy.zeros([num_trees, len(group)], float)
+        for (column, rows) in enumerate(group):
+            present[rows, column] = 1.0
+        shared += numpy.dot(present, present.T)
+    result = sizes[:, numpy.newaxis] + sizes[numpy.newaxis, :] - 2 * shared
+    result[numpy.diag_indices(num_trees)] = 0
+    return result.astype(int)
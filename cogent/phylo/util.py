@@ -17,10 +17,14 @@ __status__ = "Production"
 
 def namesFromDistanceDict(dists):
     """Unique names from within the tuples which make up the keys of 'dists'"""
+    if isinstance(dists, CondensedDistances):
+        return dists.Names[:]
     names = []
+    seen = set()
     for key in dists:
         for name in key:
-            if name not in names:
+            if name not in seen:
+                seen.add(name)
                 names.append(name)
     return names
 
@@ -31,14 +35,18 @@ def lookupSymmetricDict(dists, a, b):
     v2 = dists.get((b, a), None)
     if v1 is None and v2 is None:
         raise KeyError((a,b))
-    elif v1 is None or v2 is None or v1 == v2:
-        return v1 or v2
+    elif v1 is None:
+        return v2
+    elif v2 is None or v1 == v2:
+        return v1
     else:
         raise ValueError("d[%s,%s] != d[%s,%s]" % (a,b,b,a))
 
 def distanceDictTo2D(dists):
     """(names, dists).  Distances converted into a straightforward distance
     matrix"""
+    if isinstance(dists, CondensedDistances):
+        return (dists.Names[:], dists.toArray2D())
     names = namesFromDistanceDict(dists)
     L = len(names)
     d = numpy.zeros([L, L], Float)
@@ -70,6 +78,122 @@ def distanceDictTo1D(dists):
     """(names, dists).  Distances converted into a triangular matrix
     implemented as a 1D array where j > i and i is the inner dimension:
     d[0,1], d[0, 2], d[1, 2], d[0, 3]..."""
+    if isinstance(dists, CondensedDistances):
+        return (dists.Names[:], numpy.array(dists.Data, Float))
     names = namesFromDistanceDict(dists)
     d = distanceDictAndNamesTo1D(dists, names)
     return (names, d)
+
+class CondensedDistances(object):
+    """Symmetric distances between named items stored as a triangular matrix
+    in a 1D array, in the same order as distanceDictTo1D, so d[i,j] for
+    i < j is Data[j*(j-1)//2 + i].  Missing distances are NaN.
+    
+    With a filename the array is a numpy memory map of float32 (by default)
+    values, and the names are kept one per line in filename + '.names', so
+    that very large matrices can be written a block at a time and read back
+    without ever being entirely in memory.  For compatibility it can also be
+    used like a dict of (name1, name2): distance, though that is slow."""
+    
+    def __init__(self, names=None, filename=None, dtype=numpy.float32,
+            mode='w+'):
+        """Arguments:
+            - names: the items, in order.  Read from filename + '.names'
+              when opening an existing file.
+            - filename: file for a memory map, otherwise the array is in
+              memory
+            - mode: as for numpy.memmap, eg: 'r' to read an existing file
+        """
+        if names is None:
+            assert filename is not None and mode != 'w+', \
+                    'need the names of a new distance matrix'
+            names = [line.rstrip('\n') for line in open(filename + '.names')]
+        self.Names = list(names)
+        self._index = dict((name, i) for (i, name) in enumerate(self.Names))
+        assert len(self._index) == len(self.Names), 'names must be unique'
+        n = len(self.Names)
+        size = n * (n - 1) // 2
+        if filename is None:
+            self.Data = numpy.empty([size], dtype)
+            self.Data[:] = numpy.nan
+        else:
+            if mode == 'w+':
+                outfile = open(filename + '.names', 'w')
+                outfile.writelines(name + '\n' for name in self.Names)
+                outfile.close()
+            self.Data = numpy.memmap(filename, dtype=dtype, mode=mode,
+                    shape=(max(size, 1),))[:size]
+            if mode == 'w+':
+                self.Data[:] = numpy.nan
+        self.filename = filename
+    
+    def _position(self, i, j):
+        if i > j:
+            (i, j) = (j, i)
+        elif i == j:
+            raise KeyError((self.Names[i], self.Names[j]))
+        return j * (j - 1) // 2 + i
+    
+    def positions(self, rows, cols):
+        """Indices into Data of the distances between the items numbered
+        in the arrays 'rows' and 'cols', which must differ pairwise"""
+        rows = numpy.asarray(rows, int)
+        cols = numpy.asarray(cols, int)
+        (i, j) = (numpy.minimum(rows, cols), numpy.maximum(rows, cols))
+        return j * (j - 1) // 2 + i
+    
+    def setValues(self, rows, cols, values):
+        """Set many distances at once, given item numbers"""
+        self.Data[self.positions(rows, cols)] = values
+    
+    def __len__(self):
+        return len(self.Data)
+    
+    def __contains__(self, key):
+        (a, b) = key
+        return a != b and a in self._index and b in self._index
+    
+    def __getitem__(self, key):
+        (a, b) = key
+        value = self.Data[self._position(self._index[a], self._index[b])]
+        if value != value:
+            return None
+        return float(value)
+    
+    def __setitem__(self, key, value):
+        (a, b) = key
+        if value is None:
+            value = numpy.nan
+        self.Data[self._position(self._index[a], self._index[b])] = value
+    
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+    
+    def keys(self):
+        return list(triangularOrder(self.Names))
+    
+    def __iter__(self):
+        return triangularOrder(self.Names)
+    
+    def items(self):
+        return [(key, self[key]) for key in self]
+    
+    def values(self):
+        return [self[key] for key in self]
+    
+    def toArray2D(self, dtype=Float):
+        """Square array of the distances with zeros on the diagonal"""
+        n = len(self.Names)
+        d = numpy.zeros([n, n], dtype)
+        for j in range(1, n):
+            row = self.Data[j*(j-1)//2:j*(j+1)//2]
+            d[j, :j] = row
+            d[:j, j] = row
+        return d
+    
+    def flush(self):
+        """Make sure everything is written to the file"""
+        if self.filename is not None:
+            self.Data.flush()
@@ -224,6 +224,7 @@ class Calculator(object):
                 arg.consequences.update(cell.consequences)
         
         self._programs = {}
+        self._program_counts = {}
         # Just for timings pre-calc these
         for opt_par in self.opt_pars:
             self.cellsChangedBy([(opt_par.rank, None)])
@@ -232,6 +233,12 @@ class Calculator(object):
         self.last_undo = []
         self.elapsed_time = 0.0
         self.evaluations = 0
+        # {cell name: number of those cells recalculated}, for the last
+        # evaluation and for all of them.  Eg: 'plh' counts the partial
+        # likelihood products, only those on the path(s) from the changed
+        # edge(s) to the root being redone.
+        self.last_recalculations = {}
+        self.recalculations = {}
         self.setTracing(trace)
         self.optimised = False
     
@@ -460,6 +467,7 @@ class Calculator(object):
                     self.tracingUpdate(changes, program, data)
                 else:
                     self.plainUpdate(program, data)
+                self._countRecalculations(program)
                 
                 # if non-optimiser parameter was set then undo is invalid
                 if (self.last_undo and
@@ -482,6 +490,43 @@ class Calculator(object):
         
         return self.cell_values[self._switch][-1]
     
+    def cellValuesWith(self, overrides, outputs):
+        """The values the 'outputs' cells would have if the cells in
+        'overrides', a {cell: value} dict, had those values instead.
+        Nothing about the current state of the calculator is changed.
+        Useful for derivatives of cells which are linear in some input."""
+        self.evaluations += 1
+        data = list(self.cell_values[self._switch])
+        consequences = {}
+        for (cell, value) in overrides.items():
+            data[cell.rank] = value
+            consequences.update(cell.consequences)
+        program = [cell for cell in self._cells
+                if cell.rank in consequences and cell not in overrides]
+        for cell in program:
+            if cell.recycled:
+                data[cell.rank] = None  # don't overwrite the current array
+        with parallel.parallel_context(self.remaining_parallel_context):
+            for cell in program:
+                data[cell.rank] = cell.calc(*[data[a] for a in cell.arg_ranks])
+        self._countRecalculations(program, cache=False)
+        return [data[cell.rank] for cell in outputs]
+    
+    def _countRecalculations(self, program, cache=True):
+        key = id(program)
+        if key in self._program_counts:
+            (program, counts) = self._program_counts[key]
+        else:
+            counts = {}
+            for cell in program:
+                counts[cell.name] = counts.get(cell.name, 0) + 1
+            if cache:
+                # keep the program too so that its id can't be reused
+                self._program_counts[key] = (program, counts)
+        self.last_recalculations = counts
+        for (name, count) in counts.items():
+            self.recalculations[name] = self.recalculations.get(name, 0) + count
+    
     def cellsChangedBy(self, changes):
         # What OptPars have been changed determines cells to update
         change_key = dict(changes).keys()
@@ -4,8 +4,15 @@ import os, sys
 from contextlib import contextmanager
 import warnings
 import threading
+import itertools
+import atexit
+import cPickle
+import marshal
+import tempfile
+import types
 import multiprocessing
 import multiprocessing.pool
+from cogent.util.shared_memory import ByReference, pickling_by_reference
 
 __author__ = "Peter Maxwell"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -145,8 +152,15 @@ class MPIParallelContext(ParallelContext):
                     yield results
 
 
-# Helping MultiprocessingParallelContext map unpicklable functions
+# Helping MultiprocessingParallelContext map unpicklable functions.
+# Worker processes see the contents of _FUNCTIONS as it was when they were
+# forked, so a function must be registered before the pool that runs it starts.
+# Keys come from a counter rather than id() because pools outlive the
+# functions mapped with them, and ids get reused.
 _FUNCTIONS = {}
+_FUNCTION_KEYS = {}
+_next_function_key = itertools.count()
+
 class PicklableAndCallable(object):
     def __init__(self, key):
         self.key = key
@@ -158,20 +172,148 @@ class PicklableAndCallable(object):
             except KeyError:
                 raise RuntimeError
         return self.func(*args, **kw)
-    
+
+def register_function(f):
+    """Make 'f', which may be defined in a local scope and so be unpicklable,
+    callable from multiprocessing workers.  Pools started after registration
+    can run 'f' without being restarted.  Returns a picklable stand-in."""
+    if id(f) not in _FUNCTION_KEYS:
+        key = _next_function_key.next()
+        _FUNCTIONS[key] = f
+        _FUNCTION_KEYS[id(f)] = key
+    return PicklableAndCallable(_FUNCTION_KEYS[id(f)])
+
+def unregister_function(f):
+    """Forget a function previously passed to register_function()"""
+    key = _FUNCTION_KEYS.pop(id(f), None)
+    if key is not None:
+        del _FUNCTIONS[key]
+
+def _isPicklableFunction(f):
+    # Only plain functions, which pickle cheaply by reference.  Pickling
+    # arbitrary callable objects could mean pickling lots of data per task.
+    # Workers have a stale copy of __main__, so its functions are excluded.
+    if not isinstance(f, (types.FunctionType, types.BuiltinFunctionType)):
+        return False
+    if getattr(f, '__module__', None) == '__main__':
+        return False
+    try:
+        cPickle.dumps(f, 2)
+    except (cPickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+# Functions from local scopes are shipped to the workers instead, when
+# their closures can be pickled: as their code, the name of their module and
+# their closure and default values, treating any local functions among those
+# values the same way.  Small ones travel with each task; bigger ones are
+# written to a temporary file once per map and read once by each worker.
+SHIP_INLINE_LIMIT = 2**16
+_SHIPPED = {}
+
+def _shipValue(value, seen):
+    if isinstance(value, types.FunctionType) and \
+            not _isPicklableFunction(value):
+        if id(value) in seen:
+            raise ValueError('recursive function')
+        seen = seen | frozenset([id(value)])
+        cells = [cell.cell_contents for cell in value.func_closure or ()]
+        defaults = value.func_defaults
+        if defaults is not None:
+            defaults = [_shipValue(v, seen) for v in defaults]
+        return ('function', marshal.dumps(value.func_code),
+                value.func_globals['__name__'], value.func_name, defaults,
+                [_shipValue(v, seen) for v in cells])
+    elif isinstance(value, types.MethodType) and value.im_self is not None:
+        return ('method', _shipValue(value.im_self, seen),
+                value.im_func.__name__)
+    return ('value', value)
+
+def _makeCell(value):
+    return (lambda: value).func_closure[0]
+
+def _unshipValue(shipped):
+    kind = shipped[0]
+    if kind == 'function':
+        (code, module, name, defaults, cells) = shipped[1:]
+        __import__(module)
+        if defaults is not None:
+            defaults = tuple(_unshipValue(v) for v in defaults)
+        closure = tuple(_makeCell(_unshipValue(v)) for v in cells) or None
+        return types.FunctionType(marshal.loads(code),
+                sys.modules[module].__dict__, name, defaults, closure)
+    elif kind == 'method':
+        return getattr(_unshipValue(shipped[1]), shipped[2])
+    return shipped[1]
+
+class ShippedFunction(object):
+    """Picklable stand-in for a callable which can't be pickled by
+    reference, carrying its code and closure.  Raises an error from
+    cPickle if the closure can't be pickled."""
+
+    def __init__(self, f):
+        self.func = f
+        self.key = (os.getpid(), _next_function_key.next())
+        with pickling_by_reference():
+            payload = cPickle.dumps(_shipValue(f, frozenset()), 2)
+        self.filename = None
+        if len(payload) > SHIP_INLINE_LIMIT:
+            (fd, self.filename) = tempfile.mkstemp(prefix='cogent_')
+            with os.fdopen(fd, 'wb') as outfile:
+                outfile.write(payload)
+            payload = None
+        self.payload = payload
+
+    def __getstate__(self):
+        return (self.key, self.payload, self.filename)
+
+    def __setstate__(self, state):
+        (self.key, self.payload, self.filename) = state
+        self.func = None
+
+    def __call__(self, *args, **kw):
+        if self.func is None:
+            if self.key not in _SHIPPED:
+                payload = self.payload
+                if payload is None:
+                    with open(self.filename, 'rb') as infile:
+                        payload = infile.read()
+                if len(_SHIPPED) > 16:
+                    _SHIPPED.clear()
+                _SHIPPED[self.key] = _unshipValue(cPickle.loads(payload))
+            self.func = _SHIPPED[self.key]
+        return self.func(*args, **kw)
+
+    def discard(self):
+        """Remove any temporary file, once the workers are finished"""
+        if self.filename is not None:
+            os.remove(self.filename)
+            self.filename = None
+
+# Contexts currently holding a pool, so they can all be shut down at exit.
+_POOLED_CONTEXTS = set()
+
 class MultiprocessingParallelContext(ParallelContext):
     """At the outermost opportunity, this parallel context delegates all
     work to a multiprocessing.Pool.  
     Subprocesses may also make pools if the outer pool is more than half idle.
     
-    Ideally the pool would be reused for later tasks, but cogent code mostly 
-    uses map() with functions defined in local scopes, which are unpicklable,
-    so that is hacked around and pools are only ever used for one map() call"""
+    The pool is kept and reused by later map() calls until shutdown() is
+    called or the interpreter exits.  Plain module level functions are sent
+    to the workers by pickling.  cogent code mostly uses map() with functions
+    defined in local scopes, which are unpicklable, so those are looked up in
+    the workers' copy of _FUNCTIONS if registered, or else shipped to the
+    workers as a ShippedFunction.  Only if the function's closure can't be
+    pickled either does the pool have to be replaced by a new one."""
     
     def __init__(self, size=None):
         if size is None:
             size = multiprocessing.cpu_count()
         self.size = size
+        self._subcontexts = {}
+        self._pool = None
+        self._pool_pid = None
+        self._pool_keys = frozenset()
     
     def getCommunicator(self):
         return FAKE_MPI_COMM
@@ -182,7 +324,10 @@ class MultiprocessingParallelContext(ParallelContext):
         elif size == self.size:
             return self
         else:
-            return type(self)(size)
+            # cached so that the subcontext's pool gets reused too
+            if size not in self._subcontexts:
+                self._subcontexts[size] = type(self)(size)
+            return self._subcontexts[size]
         
     def split(self, jobs):
         assert jobs > 0
@@ -196,15 +341,76 @@ class MultiprocessingParallelContext(ParallelContext):
         from cogent.util import progress_display
         progress_display.CURRENT.context = progress_display.NULL_CONTEXT
 
+    def _getPool(self, key=None):
+        if self._pool is not None and self._pool_pid != os.getpid():
+            # inherited from the parent process, not ours to use or close
+            self._pool = None
+        if self._pool is not None and key is not None \
+                and key not in self._pool_keys:
+            # Workers predate this function.  Let the old pool finish any
+            # work already given to it, but don't wait for that here.
+            self._pool.close()
+            reaper = threading.Thread(target=self._pool.join)
+            reaper.daemon = True
+            reaper.start()
+            self._pool = None
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.size, self._initWorkerProcess)
+            self._pool_pid = os.getpid()
+            self._pool_keys = frozenset(_FUNCTIONS)
+            _POOLED_CONTEXTS.add(self)
+        return self._pool
+
+    def shutdown(self):
+        """Stop the worker processes.  A later map() will start new ones."""
+        for sub in self._subcontexts.values():
+            sub.shutdown()
+        _POOLED_CONTEXTS.discard(self)
+        if self._pool is not None and self._pool_pid == os.getpid():
+            self._pool.close()
+            self._pool.join()
+        self._pool = None
+
     def imap(self, f, s, chunksize=1):
-        key = id(f)
-        _FUNCTIONS[key] = f
-        f = PicklableAndCallable(id(f))
-        pool = multiprocessing.Pool(self.size, self._initWorkerProcess)
-        for result in pool.imap(f, s, chunksize=chunksize):
-            yield result
-        del _FUNCTIONS[key]
-        pool.close()
+        (original, temporary, shipped) = (f, False, None)
+        if isinstance(f, PicklableAndCallable):
+            key = f.key
+        elif isinstance(f, ShippedFunction):
+            key = None
+        elif id(f) in _FUNCTION_KEYS:
+            key = _FUNCTION_KEYS[id(f)]
+            f = PicklableAndCallable(key)
+        elif _isPicklableFunction(f):
+            key = None
+        else:
+            key = None
+            try:
+                f = shipped = ShippedFunction(f)
+            except (cPickle.PicklingError, TypeError, ValueError,
+                    AttributeError):
+                temporary = True
+                f = register_function(f)
+                key = f.key
+        try:
+            pool = self._getPool(key)
+            # any shared memory arrays go as file names, not copies
+            tasks = (ByReference(x) for x in s)
+            for result in pool.imap(ByReference(f), tasks,
+                    chunksize=chunksize):
+                yield result
+        finally:
+            if temporary:
+                unregister_function(original)
+            if shipped is not None:
+                shipped.discard()
+
+
+def shutdown():
+    """Stop any multiprocessing worker pools.  Called automatically at exit"""
+    for context in list(_POOLED_CONTEXTS):
+        context.shutdown()
+
+atexit.register(shutdown)
 
 
 class ContextStack(threading.local):
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""Read-only numpy arrays kept in shared memory.
+
+Work sent to multiprocessing workers by cogent.util.parallel is pickled
+inside a ByReference wrapper, and then a SharedArray sends only the name of
+the file backing it, so the worker attaches to the same pages rather than
+receiving and holding its own copy.  Pickled any other way, eg: to save it,
+a SharedArray is copied like an ordinary array, because the file doesn't
+outlive the array which created it.  Arrays which merely view part of a
+SharedArray always pickle the ordinary way.
+
+The backing file lives in /dev/shm where available and is deleted once the
+process that created it no longer references it."""
+
+import os
+import tempfile
+import threading
+import cPickle
+import numpy
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+    SHARED_MEMORY_DIR = '/dev/shm'
+else:
+    SHARED_MEMORY_DIR = None  # ordinary temp dir, hopefully cached
+
+# Nesting depth of pickling_by_reference() in each thread
+_local = threading.local()
+
+class pickling_by_reference(object):
+    """Context in which this thread pickles SharedArrays by file name"""
+    def __enter__(self):
+        _local.depth = getattr(_local, 'depth', 0) + 1
+    
+    def __exit__(self, *exc_info):
+        _local.depth -= 1
+
+class ByReference(object):
+    """Pickles 'value' with any SharedArrays in it sent by file name, for
+    a process which will use them while their creator still holds them.
+    Unpickles as the value itself."""
+    __slots__ = ['value']
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __reduce__(self):
+        with pickling_by_reference():
+            data = cPickle.dumps(self.value, 2)
+        return (cPickle.loads, (data,))
+
+class _SharedFile(object):
+    """Owns a backing file, deleting it when garbage collected"""
+    def __init__(self, path):
+        self.path = path
+        self.pid = os.getpid()
+
+    def __del__(self):
+        # forked children inherit this object but don't own the file
+        if os.getpid() == self.pid:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+class SharedArray(numpy.memmap):
+    # _handle is (path, dtype, shape) for arrays which map a whole file,
+    # None for anything derived from them.
+    _handle = None
+
+    def __array_finalize__(self, obj):
+        numpy.memmap.__array_finalize__(self, obj)
+        self._handle = None
+        self._owner = getattr(obj, '_owner', None)
+
+    def __reduce__(self):
+        if self._handle is None or not getattr(_local, 'depth', 0):
+            return numpy.array(self).__reduce__()
+        return (_attach, self._handle)
+
+def _attach(path, dtype, shape):
+    a = numpy.memmap.__new__(SharedArray, path, dtype=dtype, mode='r',
+            shape=shape)
+    a._handle = (path, dtype, shape)
+    return a
+
+def share_array(a):
+    """A read-only copy of array 'a' in shared memory"""
+    a = numpy.ascontiguousarray(a)
+    if a.size == 0:
+        # can't mmap an empty file, and nothing to gain anyway
+        return a
+    (fd, path) = tempfile.mkstemp(prefix='cogent-', suffix='.shm',
+            dir=SHARED_MEMORY_DIR)
+    os.close(fd)
+    owner = _SharedFile(path)
+    dtype = a.dtype.str
+    shape = a.shape
+    m = numpy.memmap(path, dtype=dtype, mode='w+', shape=shape)
+    m[...] = a
+    m.flush()
+    del m
+    result = _attach(path, dtype, shape)
+    result._owner = owner
+    return result
+
+def is_shared(a):
+    """True if pickling 'a' by reference would not copy its data"""
+    return getattr(a, '_handle', None) is not None
+
@@ -63,6 +63,7 @@ def suite():
         'test_core.test_alignment',
         'test_core.test_annotation',
         'test_core.test_bitvector',
+        'test_core.test_compact_tree',
         'test_core.test_core_standalone',
         'test_core.test_features.rst',
         'test_core.test_entity',
@@ -95,6 +96,7 @@ def suite():
         'test_format.test_xyzrn',
         'test_maths.test_fit_function',
         'test_maths.test_geometry',
+        'test_maths.test_matrix_exponentiation',
         'test_maths.test_matrix_logarithm',
         'test_maths.test_period',
         'test_maths.test_matrix.test_distance',
@@ -191,7 +193,9 @@ def suite():
         'test_util.test_dict2d',
         'test_util.test_misc',
         'test_util.test_organizer',
+        'test_util.test_parallel',
         'test_util.test_recode_alignment',
+        'test_util.test_shared_memory',
         'test_util.test_table.rst',
         'test_util.test_transform',
         ]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""Likelihood function evaluation speed and peak memory for a range of
+substitution models, tree sizes and alignment lengths, for spotting
+performance regressions between releases.
+
+    python benchmark_likelihood.py [-o results.tsv] [-c previous.tsv]
+
+Results are written as a tab separated table which LoadTable can read
+back.  With -c they are compared to an earlier run of the same cases and
+the exit status is 1 if any case has become slower by more than the
+tolerance.  Each case is run in a fresh process so that its peak memory
+can be measured."""
+
+import sys
+import resource
+import multiprocessing
+from optparse import OptionParser
+
+import cogent
+from cogent import LoadSeqs, LoadTree, LoadTable, DNA
+from cogent.evolve.models import HKY85, GTR, MG94HKY, Y98, JTT92
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+# name: (model, makeLikelihoodFunction options, sequence type)
+MODELS = {
+    'HKY85': (HKY85, {}, 'nucleotide'),
+    'GTR+Gamma': (GTR, dict(bins=4), 'nucleotide'),
+    'MG94': (MG94HKY, {}, 'codon'),
+    'Y98': (Y98, {}, 'codon'),
+    'JTT92': (JTT92, {}, 'protein'),
+    }
+MODEL_ORDER = ['HKY85', 'GTR+Gamma', 'MG94', 'Y98', 'JTT92']
+
+TREE_SIZES = [5, 20, 50]
+# in nucleotides, so a third as many codons or amino acids
+ALIGNMENT_LENGTHS = [300, 1200]
+
+HEADER = ['model', 'taxa', 'length', 'evals/sec', 'peak MB', 'version']
+
+def _alignments():
+    # Complete codons only, so that it can also be translated
+    aln = LoadSeqs(filename="data/brca1.fasta", moltype=DNA)
+    aln = aln[:len(aln) // 3 * 3]
+    aln = aln.filtered(lambda codons: not [c for c in ''.join(codons)
+            if c not in 'TCAG'], motif_length=3)
+    return {'nucleotide': aln, 'codon': aln, 'protein': aln.getTranslation()}
+
+def _peak_MB():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024  # bytes rather than kilobytes
+    return peak / 1024.0
+
+def run_case(model_name, taxa, length, time_limit=1.0):
+    """(evals/sec, peak MB) for one case, best run in a fresh process"""
+    (model, lf_options, seq_type) = MODELS[model_name]
+    aln = _alignments()[seq_type]
+    names = aln.getSeqNames()[:taxa]
+    assert len(names) == taxa, (len(names), taxa)
+    if seq_type == 'protein':
+        length = length // 3
+    aln = aln.takeSeqs(names)[:length]
+    assert len(aln) == length, (len(aln), length)
+    tree = LoadTree(filename="data/murphy.tree").getSubTree(names)
+    lf = model().makeLikelihoodFunction(tree, **lf_options)
+    lf.setAlignment(aln)
+    speed = lf.measureEvalsPerSecond(time_limit=time_limit, wall=False)
+    return (speed, _peak_MB())
+
+def benchmarks(models=MODEL_ORDER, tree_sizes=TREE_SIZES,
+        lengths=ALIGNMENT_LENGTHS, time_limit=1.0):
+    """A Table of evals/sec and peak memory for each combination"""
+    rows = []
+    for model_name in models:
+        for taxa in tree_sizes:
+            for length in lengths:
+                pool = multiprocessing.Pool(1)
+                try:
+                    (speed, peak) = pool.apply(run_case,
+                            (model_name, taxa, length, time_limit))
+                finally:
+                    pool.terminate()
+                rows.append([model_name, taxa, length, speed, peak,
+                        cogent.__version__])
+    return LoadTable(header=HEADER, rows=rows)
+
+def compared(results, previous, tolerance=0.2):
+    """results with the ratio of the speed of each case to its speed in
+    'previous', and a column marking those more than 'tolerance' slower"""
+    def key(row):
+        return tuple(str(v) for v in row[:3])
+    before = dict((key(row), row[3])
+            for row in previous.getRawData(HEADER[:4]))
+    header = HEADER + ['relative speed', 'regression']
+    rows = []
+    for row in results.getRawData(HEADER):
+        if key(row) in before:
+            ratio = float(row[3]) / float(before[key(row)])
+            regression = ['', 'SLOWER'][ratio < 1.0 - tolerance]
+        else:
+            (ratio, regression) = ('', '')
+        rows.append(list(row) + [ratio, regression])
+    return LoadTable(header=header, rows=rows)
+
+def main():
+    parser = OptionParser(usage=__doc__.split('\n\n')[1].strip())
+    parser.add_option('-o', '--output', help='write the results to this file')
+    parser.add_option('-c', '--compare',
+            help='compare with the results in this file')
+    parser.add_option('-m', '--models', default=','.join(MODEL_ORDER),
+            help='comma separated, default %default')
+    parser.add_option('-t', '--taxa',
+            default=','.join(map(str, TREE_SIZES)),
+            help='comma separated tree sizes, default %default')
+    parser.add_option('-l', '--lengths',
+            default=','.join(map(str, ALIGNMENT_LENGTHS)),
+            help='comma separated alignment lengths in nucleotides, '
+                'default %default')
+    parser.add_option('--time-limit', type='float', default=1.0,
+            help='seconds to spend measuring each case, default %default')
+    parser.add_option('--tolerance', type='float', default=0.2,
+            help='fractional slow down reported as a regression, '
+                'default %default')
+    (options, args) = parser.parse_args()
+
+    results = benchmarks(
+            models=options.models.split(','),
+            tree_sizes=[int(n) for n in options.taxa.split(',')],
+            lengths=[int(n) for n in options.lengths.split(',')],
+            time_limit=options.time_limit)
+    if options.output:
+        results.writeToFile(options.output, sep='\t')
+    slower = False
+    if options.compare:
+        previous = LoadTable(filename=options.compare, sep='\t')
+        results = compared(results, previous, options.tolerance)
+        slower = 'SLOWER' in results.getRawData('regression')
+    print results
+    return slower
+
+if __name__ == '__main__':
+    sys.exit(main())
+
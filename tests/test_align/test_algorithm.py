@@ -6,6 +6,7 @@ from cogent.align.algorithm import ScoreCell, MatchScorer, equality_scorer,\
     default_gap, default_gap_symbol, ScoreMatrix, NeedlemanWunschMatrix, \
     SmithWatermanMatrix, nw_align, sw_align
 from copy import copy, deepcopy
+import random
 
 __author__ = "Jeremy Widmann"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -278,6 +279,37 @@ class NwAlignTests(TestCase):
         self.assertEqual(second,'-CAGU')
         self.assertEqual(score,1)
 
+    def test_nw_align_matches_matrix(self):
+        """nw_align should give the same result as NeedlemanWunschMatrix"""
+        random.seed(1)
+        float_scorer = MatchScorer(1.3, -0.7)
+        for i in range(200):
+            (s1, s2) = [''.join(random.choice('ACGU') for j in 
+                    range(random.randint(0, 10))) for k in range(2)]
+            for (scorer, gap) in [(equality_scorer, default_gap), 
+                    (float_scorer, -0.9)]:
+                m = NeedlemanWunschMatrix(s1, s2, scorer, gap)
+                self.assertEqual(nw_align(s1, s2, scorer, gap, True),
+                        (m.alignment(), m.MaxScore[0]))
+
+    def test_nw_align_affine(self):
+        """nw_align with gap_extend should score gaps as open + extensions"""
+        (first,second),score = nw_align('CCCCAAAAGGGG', 'CCCCGGGG', gap=-3,
+                gap_extend=-1, return_score=True)
+        self.assertEqual(first, 'CCCCAAAAGGGG')
+        self.assertEqual(second, 'CCCC----GGGG')
+        self.assertEqual(score, 2)
+        # equal open and extension scores are just linear gap scores
+        self.assertEqual(nw_align('AAAACCGG', 'AACAGG', gap=-1, 
+                gap_extend=-1, return_score=True),
+                nw_align('AAAACCGG', 'AACAGG', gap=-1, return_score=True))
+
+    def test_nw_align_lists(self):
+        """nw_align should align lists of any items"""
+        (first, second) = nw_align(['AC', 'GU', 'AA'], ['AC', 'AA'])
+        self.assertEqual(first, ['AC', 'GU', 'AA'])
+        self.assertEqual(second, ['AC', '-', 'AA'])
+
 class SwAlignTests(TestCase):
     """Tests for sw_align function.
     """
@@ -294,6 +326,27 @@ class SwAlignTests(TestCase):
         self.assertEqual(first,'GU')
         self.assertEqual(second,'GU')
         self.assertEqual(score,2)
+
+    def test_sw_align_matches_matrix(self):
+        """sw_align should give the same result as SmithWatermanMatrix"""
+        random.seed(1)
+        float_scorer = MatchScorer(1.3, -0.7)
+        for i in range(200):
+            (s1, s2) = [''.join(random.choice('ACGU') for j in 
+                    range(random.randint(0, 10))) for k in range(2)]
+            for (scorer, gap) in [(equality_scorer, default_gap), 
+                    (float_scorer, -0.9)]:
+                m = SmithWatermanMatrix(s1, s2, scorer, gap)
+                self.assertEqual(sw_align(s1, s2, scorer, gap, True),
+                        (m.alignment(), m.MaxScore[0]))
+
+    def test_sw_align_affine(self):
+        """sw_align with gap_extend should score gaps as open + extensions"""
+        (first,second),score = sw_align('UUUAAAACCCGGGGUU', 'CCAAAAGGGGCC',
+                gap=-1.5, gap_extend=-0.25, return_score=True)
+        self.assertEqual(first, 'AAAACCCGGGG')
+        self.assertEqual(second, 'AAAA---GGGG')
+        self.assertEqual(score, 6)
 #run if called from command-line
 if __name__ == "__main__":
     main()
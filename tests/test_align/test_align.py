@@ -1,16 +1,21 @@
 #!/usr/bin/env python
 
-from cogent import DNA
+from cogent import DNA, LoadTree
+from cogent.util import parallel
 from cogent.align.align import classic_align_pairwise, make_dna_scoring_dict,\
         local_pairwise, global_pairwise
+from cogent.align.band import band_bounds, anchor_segments
+from cogent.align.batch import AllPairsAligner
 from cogent.evolve.models import HKY85
 import cogent.evolve.substitution_model
 dna_model = cogent.evolve.substitution_model.Nucleotide(
         model_gaps=False, equal_motif_probs=True)
 
 import cogent.align.progressive
+from cogent.align import pairwise
 
 import unittest
+import warnings
 
 __author__ = "Peter Maxwell"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -101,6 +106,67 @@ class AlignmentTestCase(unittest.TestCase):
         hit = aln.NamedSeqs['target']
         self.assertEqual(str(hit).lower(), 'cac')
 
+    
+    def test_banded(self):
+        """a wide enough band around the anchors changes nothing"""
+        s1 = DNA.makeSequence('gcatcgattcgatcgtacgtgactagcatcg' * 3, Name='A')
+        s2 = DNA.makeSequence('gcatcgattcatcgtacgtggactagcagcg' * 3, Name='B')
+        S = make_dna_scoring_dict(10, -1, -8)
+        for align in [local_pairwise, global_pairwise]:
+            (full, score) = align(s1, s2, S, 10, 2, return_score=True)
+            for width in [2, 5]:
+                (banded, banded_score) = align(s1, s2, S, 10, 2,
+                        return_score=True, band=width)
+                self.assertEqual(banded_score, score)
+                self.assertEqual(banded.todict(), full.todict())
+    
+    def test_narrow_band(self):
+        """banded alignment is still a complete alignment"""
+        S = make_dna_scoring_dict(10, -1, -8)
+        (full, score) = global_pairwise(seq1, seq2, S, 10, 2,
+                return_score=True)
+        (banded, banded_score) = global_pairwise(seq1, seq2, S, 10, 2,
+                return_score=True, band=0)
+        self.assertTrue(banded_score <= score)
+        self.assertEqual(str(banded.NamedSeqs['FAKE01']).replace('-', ''),
+                str(seq1))
+        self.assertEqual(str(banded.NamedSeqs['FAKE02']).replace('-', ''),
+                str(seq2))
+    
+    def test_linear_space(self):
+        """Hirschberg's algorithm finds an equally good global alignment"""
+        s1 = DNA.makeSequence('gcatcgattcgatcgtacgtgactagcatcg' * 8, Name='A')
+        s2 = DNA.makeSequence('gcatcgattcatcgtacgtggactagcagcg' * 8, Name='B')
+        S = make_dna_scoring_dict(10, -1, -8)
+        (full, score) = global_pairwise(s1, s2, S, 10, 2,
+                return_score=True, linear_space=False)
+        (linear, linear_score) = global_pairwise(s1, s2, S, 10, 2,
+                return_score=True, linear_space=True)
+        self.assertAlmostEqual(linear_score, score)
+        self.assertEqual(matchedColumns(linear), matchedColumns(full))
+    
+    def test_linear_space_unavailable(self):
+        """local or banded alignment warns that linear_space is ignored"""
+        S = make_dna_scoring_dict(10, -1, -8)
+        for (local, band) in [(True, None), (False, 5)]:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                aln = classic_align_pairwise(seq1, seq2, S, 10, 2, local,
+                        band=band, linear_space=True)
+            self.assertTrue([w for w in caught
+                    if 'linear_space' in str(w.message)])
+            expected = classic_align_pairwise(seq1, seq2, S, 10, 2, local,
+                    band=band)
+            self.assertEqual(aln.todict(), expected.todict())
+    
+    def test_band_bounds(self):
+        """band widens between anchors to allow for indels"""
+        self.assertEqual(anchor_segments('acgtacgtac', 'acgtacgtac',
+                word_length=4, window=4, threshold=4), [(0, 10, 0)])
+        bounds = band_bounds(6, 8, 0, [(0, 2, 0), (4, 6, 2)])
+        self.assertEqual(bounds.tolist(), [[0, 1], [1, 2], [2, 5], [3, 6],
+                [4, 7], [5, 8], [8, 9], [9, 10]])
+
 
 class UnalignedPairTestCase(unittest.TestCase):
     def test_forward(self):
@@ -110,6 +176,25 @@ class UnalignedPairTestCase(unittest.TestCase):
         LnL = pc.getLogLikelihood()
         assert isinstance(LnL, float)
     
+    
+    def test_all_pairs(self):
+        """batch alignments match those of separate pair HMMs"""
+        seqs = {'A': seq1, 'B': seq2,
+                'C': DNA.makeSequence('aaaccgacattacgtgcgta')}
+        aligner = AllPairsAligner(dna_model, seqs)
+        alignments = aligner.getAlignments(chunksize=2)
+        self.assertEqual(sorted(alignments.keys()),
+                [('A', 'B'), ('A', 'C'), ('B', 'C')])
+        for ((a, b), aln) in alignments.items():
+            tree = cogent.LoadTree(tip_names=[a, b])
+            lf = dna_model.makeLikelihoodFunction(tree, aligned=False)
+            lf.setSequences({a: seqs[a], b: seqs[b]})
+            (score, expected) = lf.getLogLikelihood(
+                    ).edge.getViterbiScoreAndAlignment()
+            self.assertEqual(aln.todict(), expected.todict())
+            self.assertAlmostEqual(
+                    aligner.getScoreAndAlignment(a, b)[0], score)
+
 
 class MultipleAlignmentTestCase(unittest.TestCase):
     def _make_aln(self, orig, model=dna_model, param_vals=None, 
@@ -166,6 +251,82 @@ class MultipleAlignmentTestCase(unittest.TestCase):
                 'D': 'cac-cta',
                 }, model=HKY85(), param_vals=[('kappa',2.0)])
     
+    def test_progressive_linear_space(self):
+        """progressive alignment with Hirschberg's algorithm"""
+        hirschberg_min = pairwise.HIRSCHBERG_MIN
+        pairwise.HIRSCHBERG_MIN = 10
+        try:
+            self._test_aln({
+                    'A': 'tacagta', 
+                    'B': 'tac-gtc',
+                    'C': 'ta---ta', 
+                    'D': 'tac-gtc',
+                    }, linear_space=True)
+        finally:
+            pairwise.HIRSCHBERG_MIN = hirschberg_min
+    
+    def test_parallel_subtrees(self):
+        """subtrees aligned in parallel should give the usual alignment"""
+        seqs = {'A': 'tacagtacgt', 'B': 'taccgtgt', 'C': 'tagtaacgt',
+                'D': 'taccgtcgt', 'E': 'tacagcgt'}
+        seqs = dict((n, DNA.makeSequence(s)) for (n, s) in seqs.items())
+        tree = LoadTree(treestring='((A,B),((C,D),E))')
+        results = []
+        context = parallel.MultiprocessingParallelContext(2)
+        try:
+            for parallel_subtrees in [False, True]:
+                lf = dna_model.makeLikelihoodFunction(tree, aligned=False,
+                        parallel_subtrees=parallel_subtrees)
+                with parallel.parallel_context(context):
+                    lf.setSequences(seqs)
+                    edge = lf.getLogLikelihood().edge
+                (score, aln) = edge.getViterbiScoreAndAlignment(0.5)
+                results.append((score, aln.todict()))
+        finally:
+            context.shutdown()
+        self.assertAlmostEqual(results[0][0], results[1][0])
+        self.assertEqual(results[0][1], results[1][1])
+    
+    def test_band_on_pog(self):
+        """a band is ignored, with a warning, when aligning subalignments"""
+        seqs = {'A': 'tacagtacgt', 'B': 'taccgtgt', 'C': 'tagtaacgt'}
+        seqs = dict((n, DNA.makeSequence(s)) for (n, s) in seqs.items())
+        tree = LoadTree(treestring='((A,B),C)')
+        lf = dna_model.makeLikelihoodFunction(tree, aligned=False)
+        lf.setSequences(seqs)
+        edge = lf.getLogLikelihood().edge
+        (score, aln) = edge.getViterbiScoreAndAlignment(0.5)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            (banded_score, banded) = edge.getViterbiScoreAndAlignment(0.5,
+                    band=2)
+        self.assertTrue([w for w in caught if 'band' in str(w.message)])
+        self.assertAlmostEqual(banded_score, score)
+        self.assertEqual(banded.todict(), aln.todict())
+    
+    def test_kmer_tree(self):
+        """TreeAlign can make its guide tree from k-mer distances"""
+        seqs = {'A': 'tacagtacgt', 'B': 'taccgtgt', 'C': 'tagtaacgt',
+                'D': 'taccgtcgt', 'E': 'tacagcgt'}
+        (aln, tree) = cogent.align.progressive.TreeAlign(dna_model,
+                dict((n, DNA.makeSequence(s)) for (n, s) in seqs.items()),
+                kmer_tree=True)
+        self.assertEqual(sorted(tree.getTipNames()), sorted(seqs))
+        self.assertEqual(dict((n, s.replace('-', '').lower())
+                for (n, s) in aln.todict().items()), seqs)
+    
+    def test_kmer_tree_duplicates(self):
+        """identical sequences have k-mer distance 0, which is usable"""
+        seqs = {'A': 'tacagtacgt', 'B': 'taccgtgt', 'C': 'tagtaacgt',
+                'D': 'taccgtgt', 'E': 'tacagcgt'}
+        (aln, tree) = cogent.align.progressive.TreeAlign(HKY85(),
+                dict((n, DNA.makeSequence(s)) for (n, s) in seqs.items()),
+                kmer_tree=True)
+        self.assertEqual(sorted(tree.getTipNames()), sorted(seqs))
+        self.assertEqual(tree.getDistances()[('B', 'D')], 0.0)
+        self.assertEqual(dict((n, s.replace('-', '').lower())
+                for (n, s) in aln.todict().items()), seqs)
+    
     def test_TreeAlign_does_pairs(self):
         """test TreeAlign handles pairs of sequences"""
         self._test_aln({
@@ -6,8 +6,10 @@ from numpy import array
 import numpy
 Float = numpy.core.numerictypes.sctype2char(float)
 from cogent.cluster.UPGMA import find_smallest_index, condense_matrix, \
-        condense_node_order, UPGMA_cluster, inputs_from_dict2D, upgma
+        condense_node_order, UPGMA_cluster, inputs_from_dict2D, upgma, \
+        nn_chain_cluster
 from cogent.util.dict2d import Dict2D
+from cogent.phylo.util import CondensedDistances
 
 __author__ = "Rob Knight"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -98,6 +100,14 @@ class UPGMATests(TestCase):
         self.assertEqual(node_order[3].__str__(), 'd;')
         self.assertEqual(node_order[4].__str__(), 'e;')
 
+    def test_UPGMA_condensed(self):
+        """upgma gives the same tree from a CondensedDistances"""
+        condensed = CondensedDistances(['a', 'b', 'c', 'd', 'e'])
+        for (pair, dist) in self.pairwise_distances.items():
+            condensed[pair] = dist
+        expected = upgma(self.pairwise_distances).getDistances()
+        self.assertEqual(upgma(condensed).getDistances(), expected)
+    
     def test_upgma_cluster(self):
         """UPGMA_cluster clusters nodes based on info in a matrix with UPGMA
         """
@@ -108,6 +118,20 @@ class UPGMATests(TestCase):
         self.assertEqual(str(tree), \
                 '(((a:0.5,b:0.5):1.75,c:2.25):5.875,(d:1.0,e:1.0):7.125);')
     
+    def test_nn_chain_cluster(self):
+        """nn_chain_cluster clusters nodes from a 1D array like UPGMA_cluster
+        """
+        i, j = numpy.triu_indices(5, 1)
+        dists = self.matrix[j, i][numpy.lexsort([i, j])]
+        tree = nn_chain_cluster(dists, self.node_order)
+        self.assertEqual(str(tree), \
+                '(((a:0.5,b:0.5):1.75,c:2.25):5.875,(d:1.0,e:1.0):7.125);')
+    
+    def test_upgma_float32(self):
+        """upgma with single precision distances gives the same tree"""
+        cluster = upgma(self.pairwise_distances, dtype=numpy.float32)
+        self.assertEqual(str(cluster), str(upgma(self.pairwise_distances)))
+    
     def test_UPGMA_cluster_diag(self):
         """UPGMA_cluster works when the diagonal has lowest values
         """
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""Tests of the array based CompactTree against the equivalent PhyloNode.
+"""
+
+from cogent import LoadTree
+from cogent.core.tree import TreeError, TreeNode
+from cogent.core.compact_tree import CompactTree, CompactNode
+from cogent.util.unit_test import TestCase, main
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+class CompactTreeTests(TestCase):
+    """Tests of CompactTree and CompactNode"""
+
+    def setUp(self):
+        self.tree = LoadTree(treestring=
+            "((a:1,b:2)ab:0.5,(c:3,(d:1,e:1.5)de:2,'f g':1)cdf:1,h:4)root;")
+        self.compact = CompactTree.fromTree(self.tree)
+
+    def test_arrays(self):
+        """nodes should be numbered in preorder"""
+        c = self.compact
+        self.assertEqual(c.Names, [n.Name for n in self.tree.preorder()])
+        self.assertEqual(c.Parents[:4], [-1, 0, 1, 1])
+        self.assertEqual(c.Sizes[0], len(c.Names))
+        self.assertEqual(c.NextSiblings[1], 4)
+        self.assertEqual(c.FirstChildren[4], 5)
+        self.assertEqual(c.Depths[7], 3)
+        self.assertEqual([c.Names[i] for i in c.Postorder],
+                [n.Name for n in self.tree.postorder()])
+        self.assertRaises(TreeError, CompactTree, [-1, 0, 0, 1], 'abcd')
+
+    def test_conversion(self):
+        """conversion to and from PhyloNode should be lossless"""
+        self.tree.getNodeMatchingName('de').params['rate'] = 2.0
+        compact = CompactTree.fromTree(self.tree)
+        self.assertEqual(compact.getNodeMatchingName('de').params,
+                {'length':2.0, 'rate':2.0})
+        tree = compact.toTree()
+        self.assertEqual(str(tree), str(self.tree))
+        self.assertEqual(tree.getNodeMatchingName('de').params['rate'], 2.0)
+        plain = CompactTree.fromTree(TreeNode(Name='x',
+                Children=[TreeNode(Name='y'), TreeNode(Name='z')]))
+        self.assertEqual(str(plain), '(y,z)x;')
+        self.assertEqual(str(plain.toTree(TreeNode)), '(y,z)x;')
+
+    def test_fromNewick(self):
+        """LoadTree(compact=True) should name nodes as for PhyloNode trees"""
+        text = "((a:1,b:2):0.5,(c,d_e),'f g');"
+        tree = LoadTree(treestring=text)
+        compact = LoadTree(treestring=text, compact=True)
+        self.assertTrue(isinstance(compact, CompactTree))
+        self.assertEqual(compact.Names, [n.Name for n in tree.preorder()])
+        self.assertEqual(str(compact), str(tree))
+        self.assertEqual(compact.getNodeMatchingName('edge.1').getTipNames(),
+                ['c', 'd_e'])
+        compact = LoadTree(tip_names=['a', 'b', 'c'], compact=True)
+        self.assertEqual(str(compact), '(a,b,c)root;')
+
+    def test_getNewick(self):
+        """getNewick should match PhyloNode"""
+        for with_distances in [False, True]:
+            for node in ['root', 'cdf', 'a']:
+                self.assertEqual(
+                    self.compact.getNodeMatchingName(node).getNewick(
+                        with_distances=with_distances),
+                    self.tree.getNodeMatchingName(node).getNewick(
+                        with_distances=with_distances))
+        self.assertEqual(self.compact.getNewick(semicolon=False),
+                self.tree.getNewick(semicolon=False))
+
+    def test_traverse(self):
+        """tips, traverse and node attributes should match PhyloNode"""
+        self.assertEqual(self.compact.getTipNames(), self.tree.getTipNames())
+        cdf = self.compact.getNodeMatchingName('cdf')
+        self.assertEqual([n.Name for n in cdf.tips()], ['c', 'd', 'e', 'f g'])
+        for args in [(True, False, True), (False, True, False),
+                (True, True, True), (True, True, False), (False, False)]:
+            self.assertEqual([n.Name for n in self.compact.traverse(*args)],
+                [n.Name for n in self.tree.traverse(*args)])
+        self.assertEqual([n.Name for n in cdf.Children], ['c', 'de', 'f g'])
+        self.assertEqual(cdf.Parent, self.compact)
+        self.assertEqual(cdf.Length, 1.0)
+        self.assertEqual(self.compact.Parent, None)
+        self.assertTrue(cdf.Children[0].istip())
+        self.assertEqual(len(cdf), 3)
+        d = cdf.Children[1].Children[0]
+        self.assertEqual([n.Name for n in d.ancestors()],
+                ['de', 'cdf', 'root'])
+        self.assertRaises(TreeError, self.compact.getNodeMatchingName, 'x')
+
+    def test_tipToTipDistances(self):
+        """tipToTipDistances should match PhyloNode"""
+        (matrix, order) = self.compact.tipToTipDistances()
+        (expect, expect_order) = self.tree.tipToTipDistances()
+        self.assertEqual([n.Name for n in order],
+                [n.Name for n in expect_order])
+        self.assertFloatEqual(matrix, expect)
+        endpoints = ['e', 'a', 'h', 'd']
+        (matrix, order) = self.compact.tipToTipDistances(endpoints)
+        self.assertEqual([n.Name for n in order], endpoints)
+        self.assertFloatEqual(matrix,
+                self.tree.tipToTipDistances(endpoints)[0])
+        cdf = self.compact.getNodeMatchingName('cdf')
+        self.assertFloatEqual(cdf.tipToTipDistances()[0],
+                self.tree.getNodeMatchingName('cdf').tipToTipDistances()[0])
+
+    def test_pairDistances(self):
+        """pairDistances and lowestCommonAncestors should match PhyloNode"""
+        names1 = ['a', 'd', 'cdf', 'h', 'e']
+        names2 = ['b', 'f g', 'e', 'h', 'a']
+        ancestors = self.compact.lowestCommonAncestors(names1, names2)
+        self.assertEqual([self.compact.Names[i] for i in ancestors],
+                ['ab', 'cdf', 'cdf', 'h', 'root'])
+        tree = self.tree
+        self.assertFloatEqual(self.compact.pairDistances(names1, names2),
+                [tree.getNodeMatchingName(name1).distance(
+                    tree.getNodeMatchingName(name2))
+                    for (name1, name2) in zip(names1, names2)])
+        cdf = self.compact.getNodeMatchingName('cdf')
+        self.assertFloatEqual(cdf.pairDistances(['c'], ['e']), [6.5])
+        self.assertRaises(TreeError, cdf.pairDistances, ['a'], ['c'])
+
+    def test_getSubTree(self):
+        """getSubTree should match PhyloNode"""
+        for (names, keep_root) in [(['a', 'd', 'e'], False),
+                (['a', 'b', 'c'], False), (['cdf', 'a'], False),
+                (['d', 'e'], False), (['d', 'e'], True), (['ab'], True)]:
+            subtree = self.compact.getSubTree(names, keep_root=keep_root)
+            self.assertTrue(isinstance(subtree, CompactTree))
+            self.assertEqual(str(subtree),
+                    str(self.tree.getSubTree(names, keep_root=keep_root)))
+        self.assertRaises(ValueError, self.compact.getSubTree, ['a', 'x'])
+        self.assertRaises(TreeError, self.compact.getSubTree, ['a'])
+
+if __name__ == '__main__':
+    main()
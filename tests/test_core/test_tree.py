@@ -4,7 +4,7 @@
 
 from copy import copy, deepcopy
 from cogent import LoadTree
-from cogent.core.tree import TreeNode, PhyloNode, TreeError
+from cogent.core.tree import TreeNode, PhyloNode, TreeError, LCAIndex
 from cogent.parse.tree import DndParser
 from cogent.maths.stats.test import correlation
 from cogent.util.unit_test import TestCase, main
@@ -1479,6 +1479,68 @@ class Test_tip_tip_distances_array(Test_tip_tip_distances_I, TestCase):
         self.assertEqual(dist, tree_one_child_dist)
         self.assertEqual(tips, tree_one_child_tips)
 
+    def test_endpoints(self):
+        """tip_to_tip should follow the order of endpoints, in subtrees too"""
+        tree = LoadTree(treestring=tree_std)
+        for node in [tree, tree.Children[0]]:
+            names = node.getTipNames()[::-1]
+            dist, tips = node.tipToTipDistances(endpoints=names)
+            self.assertEqual([tip.Name for tip in tips], names)
+            pairs = node.getDistances()
+            for (i, name1) in enumerate(names):
+                for (j, name2) in enumerate(names):
+                    if i != j:
+                        self.assertFloatEqual(dist[i, j],
+                                pairs[(name1, name2)])
+        self.assertRaises(TreeError, tree.tipToTipDistances,
+                endpoints=[tree.Children[0].Name])
+
+class LCAIndexTests(TestCase):
+    """Tests of LCAIndex"""
+
+    def test_lowestCommonAncestors(self):
+        """LCAIndex should match lastCommonAncestor for every pair"""
+        tree = LoadTree(treestring=tree_std)
+        nodes = list(tree.preorder())
+        number = dict([(id(node), i) for (i, node) in enumerate(nodes)])
+        index = LCAIndex([-1] + [number[id(node.Parent)]
+                for node in nodes[1:]])
+        pairs = [(i, j) for i in range(len(nodes))
+                for j in range(len(nodes))]
+        (nodes1, nodes2) = zip(*pairs)
+        ancestors = index.lowestCommonAncestors(nodes1, nodes2)
+        for ((i, j), ancestor) in zip(pairs, ancestors):
+            self.assertEqual(ancestor,
+                number[id(nodes[i].lastCommonAncestor(nodes[j]))])
+        distances = [node.distance(tree) for node in nodes]
+        self.assertFloatEqual(index.pairDistances([1, 2], [2, 2], distances),
+                [nodes[1].distance(nodes[2]), 0.0])
+
+    def test_getLCAIndex(self):
+        """getLCAIndex should answer batches of queries until tree changes"""
+        tree = LoadTree(treestring=tree_std)
+        names1 = ['a', 'b', 'e', 'a']
+        names2 = ['b', 'd', 'f', 'a']
+        expect = [tree.getConnectingNode(n1, n2)
+                for (n1, n2) in zip(names1, names2)]
+        index = tree.Children[0].getLCAIndex()
+        self.assertTrue(tree.getLCAIndex() is index)
+        self.assertEqual([index.Nodes[i] for i in
+                index.lowestCommonAncestors(names1, names2)], expect)
+        self.assertEqual([tree.getConnectingNode(n1, n2)
+                for (n1, n2) in zip(names1, names2)], expect)
+        self.assertEqual(tree.lowestCommonAncestor(['a', 'd']), tree)
+        self.assertFalse(hasattr(tree, 'black'))
+        a = tree.getNodeMatchingName('a')
+        b = tree.getNodeMatchingName('b')
+        b.append(a)
+        self.assertFalse(index.Valid)
+        self.assertRaises(TreeError, index.lowestCommonAncestors, ['a'], ['b'])
+        self.assertEqual(a.lastCommonAncestor(b), b)
+        self.assertTrue(tree.getLCAIndex() is not index)
+        self.assertEqual(a.lastCommonAncestor(b), b)
+        self.assertTrue(tree.deepcopy()._lca_index is None)
+
 # for use with testing iterative copy method
 def comb_tree(num_leaves):
     """Returns a comb node_class tree."""
@@ -17,7 +17,8 @@ warnings.filterwarnings("ignore", "Model not reversible")
 warnings.filterwarnings("ignore", "Ignoring tree edge lengths")
 
 import os
-from numpy import ones, dot
+import random
+from numpy import ones, dot, log, array
 
 from cogent.evolve import substitution_model, predicate
 from cogent import DNA, LoadSeqs, LoadTree
@@ -146,6 +147,62 @@ class LikelihoodCalcs(TestCase):
         except AssertionError:
             pass
     
+    def test_shared_memory(self):
+        """shared memory alignment arrays shouldn't change the likelihood"""
+        import cPickle
+        from cogent.util.shared_memory import is_shared
+        submod = Nucleotide(predicates={'kappa': 'transition'})
+        plain = self._makeLikelihoodFunction(submod)
+        shared = self._makeLikelihoodFunction(submod, shared_memory=True)
+        self.assertFloatEqual(shared.getLogLikelihood(),
+                plain.getLogLikelihood())
+        lht = shared.getParamValue('lht')
+        self.assertTrue(is_shared(lht.index))
+        leaf = lht.getEdge('Human')
+        self.assertTrue(is_shared(leaf.input_likelihoods))
+        copied = cPickle.loads(cPickle.dumps(leaf, 2))
+        self.assertEqual(copied.index, leaf.index)
+        self.assertEqual(copied.input_likelihoods, leaf.input_likelihoods)
+        # a saved copy shouldn't depend on the shared memory files
+        saved = cPickle.dumps(leaf, 2)
+        expected = array(leaf.input_likelihoods)
+        del shared, lht, leaf, copied
+        loaded = cPickle.loads(saved)
+        self.assertFalse(is_shared(loaded.input_likelihoods))
+        self.assertEqual(loaded.input_likelihoods, expected)
+    
+    def test_pool_loci(self):
+        """pooling loci site patterns shouldn't change the likelihood"""
+        submod = Nucleotide(predicates={'kappa': 'transition'},
+                motif_probs=None)
+        aligns = [self.alignment[:21], self.alignment[21:],
+                self.alignment[10:30]]
+        for kw in [{}, dict(bins=2), dict(bins=2, sites_independent=False)]:
+            lfs = []
+            for pool_loci in [False, True]:
+                lf = submod.makeLikelihoodFunction(self.tree,
+                        motif_probs_from_align=False, loci=['a', 'b', 'c'],
+                        pool_loci=pool_loci, **kw)
+                lf.setMotifProbs(dict(A=.2, T=.2, C=.3, G=.3))
+                lf.setParamRule('kappa', value=4.0, locus='c')
+                lf.setAlignment(aligns)
+                lfs.append(lf)
+            (plain, pooled) = lfs
+            self.assertFloatEqual(pooled.getLogLikelihood(),
+                    plain.getLogLikelihood())
+            for locus in 'abc':
+                self.assertEqual(
+                    len(pooled.getParamValue('lht', locus=locus).index),
+                    len(plain.getParamValue('lht', locus=locus).index))
+                self.assertFloatEqual(
+                    pooled.getFullLengthLikelihoods(locus=locus),
+                    plain.getFullLengthLikelihoods(locus=locus))
+        pooled_lht = pooled.getParamValue('pooled_lht')
+        self.assertEqual(len(pooled_lht.index), sum(map(len, aligns)))
+        self.assertTrue(len(pooled_lht.uniq) <
+                sum(len(plain.getParamValue('lht', locus=l).uniq)
+                    for l in 'abc'))
+
     def test_binned_gamma(self):
         """just rate is gamma distributed"""
         submod = substitution_model.Codon(
@@ -163,6 +220,95 @@ class LikelihoodCalcs(TestCase):
         self.assertEqual(len(values), 3)
         shape = lf.getParamValue('rate_shape')
     
+    def test_stack_bins(self):
+        """stacking the bins shouldn't change the likelihood"""
+        submod = Nucleotide(predicates={'kappa': 'transition'},
+                ordered_param='rate', distribution='gamma')
+        for kw in [{}, dict(sites_independent=False),
+                dict(loci=['a', 'b'], pool_loci=True)]:
+            lfs = []
+            for stack_bins in [False, True]:
+                lf = submod.makeLikelihoodFunction(self.tree, bins=4,
+                        stack_bins=stack_bins, **kw)
+                lf.setParamRule('rate_shape', value=0.5)
+                lf.setParamRule('length', value=0.3)
+                lf.setAlignment([self.alignment] * len(lf.locus_names))
+                lfs.append(lf)
+            (plain, stacked) = lfs
+            self.assertFloatEqual(stacked.getLogLikelihood(),
+                    plain.getLogLikelihood())
+            locus = plain.locus_names[0]
+            self.assertFloatEqual(stacked.getBinProbs(locus=locus).array,
+                    plain.getBinProbs(locus=locus).array)
+            if kw.get('sites_independent', True):
+                derivs = [lf.getBranchLengthDerivatives()['Human']
+                        for lf in lfs]
+                self.assertFloatEqual(*derivs)
+        (plain, stacked) = [submod.makeLikelihoodFunction(self.tree, bins=4,
+                stack_bins=stack_bins) for stack_bins in [False, True]]
+        for lf in [plain, stacked]:
+            lf.setParamRule('rate_shape', value=0.5)
+            lf.setAlignment(self.alignment)
+        self.assertFloatEqual(
+                stacked.reconstructAncestralSeqs()['root'].array,
+                plain.reconstructAncestralSeqs()['root'].array)
+
+    def _balancedTreeAndRandomAlignment(self, n_tips, length):
+        names = ['tip%s' % i for i in range(n_tips)]
+        def newick(names):
+            if len(names) == 1:
+                return names[0]
+            half = len(names) // 2
+            return '(%s,%s)' % (newick(names[:half]), newick(names[half:]))
+        rng = random.Random(1)
+        seqs = [(name, ''.join([rng.choice('ACGT') for i in range(length)]))
+                for name in names]
+        tree = LoadTree(treestring=newick(names)+';')
+        return (tree, LoadSeqs(data=seqs, moltype=DNA))
+    
+    def test_scaled(self):
+        """scaled partial likelihoods should give the same results"""
+        # 128 tips: small enough likelihoods to get scaled, but not so
+        # small that the unscaled calculation underflows.
+        (tree, alignment) = self._balancedTreeAndRandomAlignment(128, 10)
+        submod = Nucleotide(ordered_param='rate', distribution='gamma')
+        for kw in [{}, dict(bins=3), dict(bins=3, sites_independent=False),
+                dict(bins=3, stack_bins=True),
+                dict(loci=['a', 'b'], pool_loci=True)]:
+            lfs = []
+            for scaled in [False, True]:
+                lf = submod.makeLikelihoodFunction(tree, scaled=scaled, **kw)
+                lf.setParamRule('length', value=1.0)
+                lf.setAlignment([alignment] * len(lf.locus_names))
+                lfs.append(lf)
+            (plain, scaled) = lfs
+            self.assertFloatEqual(scaled.getLogLikelihood(),
+                    plain.getLogLikelihood())
+            locus = plain.locus_names[0]
+            self.assertFloatEqual(
+                    log(scaled.getFullLengthLikelihoods(locus=locus)),
+                    log(plain.getFullLengthLikelihoods(locus=locus)))
+            if 'bins' in kw:
+                self.assertFloatEqual(scaled.getBinProbs(locus=locus).array,
+                        plain.getBinProbs(locus=locus).array)
+                if kw.get('sites_independent', True):
+                    derivs = [lf.getBranchLengthDerivatives()['tip0']
+                            for lf in lfs]
+                    self.assertFloatEqual(*derivs)
+            if not kw:
+                (lh, exponents) = scaled.getParamValue('lh')
+                self.assertTrue(exponents.max() > 0)
+    
+    def test_scaled_underflow(self):
+        """scaled partial likelihoods shouldn't underflow"""
+        # Long branches so each site likelihood is about 1/4**600, 2**-1200
+        (tree, alignment) = self._balancedTreeAndRandomAlignment(600, 10)
+        lf = Nucleotide(equal_motif_probs=True).makeLikelihoodFunction(
+                tree, scaled=True)
+        lf.setParamRule('length', value=10.0)
+        lf.setAlignment(alignment)
+        self.assertFloatEqual(lf.getLogLikelihood(), 600 * 10 * log(0.25))
+    
     def test_binned_gamma_ordered_param(self):
         """rate is gamma distributed omega follows"""
         submod = substitution_model.Codon(
@@ -304,6 +450,108 @@ class LikelihoodFunctionTests(TestCase):
         
         likelihood_function.setParamRule("beta", value=4.0, is_constant=True)
     
+    def test_qd_cache(self):
+        """revisiting parameter values should reuse the cached Qd"""
+        lf = self._makeLikelihoodFunction()
+        calc = lf.makeCalculator()
+        qd_defn = lf.defn_for['Qd']
+        qd_defn.clearCache()
+        beta = [i for (i, p) in enumerate(calc.opt_pars) if p.name == 'beta']
+        x = calc.getValueArray()
+        first = calc.change([(beta[0], x[beta[0]] + 0.1)])
+        calc.change([(beta[0], x[beta[0]] + 0.2)])
+        calc.change([(beta[0], x[beta[0]] + 0.3)])
+        again = calc.change([(beta[0], x[beta[0]] + 0.1)])
+        self.assertEqual(again, first)
+        info = qd_defn.getCacheInfo()
+        self.assertEqual((info['hits'], info['misses']), (1, 3))
+    
+    def test_recalculations(self):
+        """changing a length should only redo the plh above that edge"""
+        lf = self._makeLikelihoodFunction()
+        calc = lf.makeCalculator()
+        x = calc.getValueArray()
+        rank_for = dict([(p.scope[0][0], i) for (i, p) in enumerate(calc.opt_pars)
+                if p.name == 'length'])
+        for (edge, depth) in [('Human', 3), ('Mouse', 2), ('DogFaced', 1)]:
+            i = rank_for[edge]
+            calc.change([(i, x[i] + 0.1)])
+            self.assertEqual(calc.last_recalculations['plh'], depth)
+            self.assertEqual(calc.last_recalculations['psubs'], 1)
+        self.assertEqual(calc.recalculations['plh'], 6)
+    
+    def test_branch_length_derivatives(self):
+        """analytic branch length derivatives should match numerical ones"""
+        for bins in [1, 2]:
+            lf = self._makeLikelihoodFunction(bins=bins)
+            edges = [e.Name for e in self.tree.getEdgeVector()
+                    if not e.isroot()]
+            for (i, edge) in enumerate(edges):
+                lf.setParamRule('length', edge=edge, value=0.1*(i+1))
+            derivs = lf.getBranchLengthDerivatives()
+            self.assertEqual(sorted(derivs), sorted(edges))
+            h = 1e-4
+            for edge in ['Human', 'edge.0']:
+                x = lf.getParamValue('length', edge=edge)
+                lnL = lf.getLogLikelihood()
+                lf.setParamRule('length', edge=edge, value=x+h)
+                above = lf.getLogLikelihood()
+                lf.setParamRule('length', edge=edge, value=x-h)
+                below = lf.getLogLikelihood()
+                lf.setParamRule('length', edge=edge, value=x)
+                (first, second) = derivs[edge]
+                self.assertFloatEqual(first, (above-below)/(2*h), eps=1e-5)
+                self.assertFloatEqual(second, (above-2*lnL+below)/(h*h),
+                        eps=1e-3)
+
+    def test_newton_branch_lengths(self):
+        """Newton's method should find the same branch lengths as Powell"""
+        results = []
+        for newton in [False, True]:
+            lf = self._makeLikelihoodFunction()
+            lf.setParamRule('beta', is_constant=True, value=4.0)
+            lf.optimise(local=True, newton_branch_lengths=newton,
+                    show_progress=False)
+            results.append(lf)
+        (powell, newton) = results
+        self.assertFloatEqual(newton.getLogLikelihood(),
+                powell.getLogLikelihood(), eps=1e-6)
+        for edge in ['Human', 'edge.0']:
+            self.assertFloatEqual(
+                newton.getParamValue('length', edge=edge),
+                powell.getParamValue('length', edge=edge), eps=1e-3)
+
+    def test_newton_branch_lengths_limits(self):
+        """max_evaluations and limit_action apply to Newton's method"""
+        lf = self._makeLikelihoodFunction()
+        lf.setParamRule('beta', is_constant=True, value=4.0)
+        self.assertRaises(ArithmeticError, lf.optimise, local=True,
+                newton_branch_lengths=True, show_progress=False,
+                max_evaluations=5, limit_action='raise')
+        lf = self._makeLikelihoodFunction()
+        lf.setParamRule('beta', is_constant=True, value=4.0)
+        before = lf.getLogLikelihood()
+        lc = lf.optimise(local=True, newton_branch_lengths=True,
+                show_progress=False, max_evaluations=5,
+                limit_action='ignore', return_calculator=True)
+        # one more to restore the lengths after an unsuccessful trial
+        self.assertTrue(lc.evaluations <= 6, lc.evaluations)
+        self.assertTrue(lf.getLogLikelihood() >= before)
+    
+    def test_newton_branch_lengths_switching_bins(self):
+        """Switching bins have no branch length derivatives, so optimise
+        should warn and skip Newton's method rather than fail"""
+        lf = self._makeLikelihoodFunction(bins=2, sites_independent=False)
+        lf.setParamRule('beta', is_constant=True, value=4.0)
+        lf.setParamRule('bprobs', is_constant=True)
+        lf.setParamRule('bin_switch', is_constant=True)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            lf.optimise(local=True, newton_branch_lengths=True,
+                    show_progress=False, max_evaluations=50)
+        self.assertTrue([w for w in caught
+                if 'sites_independent' in str(w.message)])
+
     def test_information_criteria(self):
         """test get information criteria from a model."""
         lf = self._makeLikelihoodFunction()
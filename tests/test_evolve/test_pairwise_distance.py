@@ -9,10 +9,12 @@ numpy.seterr(invalid='ignore')
 from cogent.util.unit_test import TestCase, main
 from cogent import LoadSeqs, DNA, RNA, PROTEIN
 from cogent.evolve.pairwise_distance import get_moltype_index_array, \
-    seq_to_indices, _fill_diversity_matrix, \
+    seq_to_indices, _fill_diversity_matrix, _diversity_matrices, \
     _jc69_from_matrix, JC69Pair, _tn93_from_matrix, TN93Pair, LogDetPair
 from cogent.evolve._pairwise_distance import \
     _fill_diversity_matrix as pyx_fill_diversity_matrix
+from cogent.phylo.util import CondensedDistances
+from cogent.util.misc import remove_files
 import math
 
 __author__ = "Gavin Huttley and Yicheng Zhu"
@@ -235,6 +237,67 @@ class TestPair(TestCase):
         dists = logdet_calc.getPairwiseDistances()
         self.assertFloatEqual(logdet_calc.Variances[1,1], 0.4797, eps=1e-3)
     
+    def test_diversity_matrices(self):
+        """diversity matrices of all pairs at once match one at a time"""
+        seqs = numpy.array([seq_to_indices(s, self.dna_char_indices)
+                for s in ['RACGTACGTACN', 'AGTGTACGTACA', 'AC-TTCGTAC-A']])
+        matrices = _diversity_matrices(seqs, seqs[1:], 4)
+        self.assertEqual(matrices.shape, (3, 2, 4, 4))
+        for i in range(3):
+            for j in range(2):
+                matrix = numpy.zeros((4,4), float)
+                _fill_diversity_matrix(matrix, seqs[i], seqs[j+1])
+                self.assertEqual(matrices[i, j], matrix)
+    
+    def test_vectorised_stats(self):
+        """distances from all pairs at once match those from each pair"""
+        aln = LoadSeqs('data/brca1_5.paml', moltype=DNA)
+        for klass in [JC69Pair, TN93Pair]:
+            calc = klass(DNA, alignment=aln)
+            calc.run(show_progress=False)
+            vectorised = calc.getPairwiseDistances()
+            calc.vector_func = None
+            # also with pairs split across blocks
+            calc.run(show_progress=False, block_size=2)
+            expect = calc.getPairwiseDistances()
+            self.assertEqual(sorted(vectorised), sorted(expect))
+            for pair in expect:
+                self.assertFloatEqual(vectorised[pair], expect[pair])
+    
+    def test_vectorised_invalid(self):
+        """pairs without valid distances should get None"""
+        aln = LoadSeqs(data=[('s1', 'AAAA'), ('s2', 'CCCC'), ('s3', '----')],
+                moltype=DNA)
+        for klass in [JC69Pair, TN93Pair]:
+            calc = klass(DNA, alignment=aln)
+            calc.run(show_progress=False)
+            dists = calc.getPairwiseDistances()
+            self.assertEqual(dists[('s1', 's2')], None)
+            self.assertEqual(dists[('s1', 's3')], None)
+    
+    def test_condensed(self):
+        """distances streamed to a memory mapped file match the dict"""
+        aln = LoadSeqs('data/brca1_5.paml', moltype=DNA)
+        calc = TN93Pair(DNA, alignment=aln)
+        calc.run(show_progress=False)
+        expect = calc.getPairwiseDistances()
+        filename = 'tn93_condensed.tmp'
+        try:
+            calc.run(show_progress=False, block_size=2, filename=filename)
+            condensed = calc.getPairwiseDistances()
+            self.assertEqual(condensed.Names, calc.Names)
+            reopened = CondensedDistances(filename=filename, mode='r')
+            self.assertEqual(reopened.Names, calc.Names)
+            for (a, b) in expect:
+                self.assertFloatEqual(condensed[(a, b)], expect[(a, b)],
+                        eps=1e-6)
+                self.assertFloatEqual(reopened[(b, a)], expect[(a, b)],
+                        eps=1e-6)
+            del condensed, reopened
+        finally:
+            remove_files([filename, filename + '.names'],
+                    error_on_missing=False)
+    
     def est_logdet_for_determinant_lte_zero(self):
         """returns distance of None if the determinant is <= 0"""
         data = dict(seq1="AGGGGGGGGGGCCCCCCCCCCCCCCCCCGGGGGGGGGGGGGGGCGGTTTTTTTTTTTTTTTTTT",
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""Unit tests for matrix exponentiation."""
+import numpy
+from cogent.util.unit_test import TestCase, main
+from cogent.maths.matrix_exponentiation import FastExponentiator, \
+        PadeExponentiator, SemiSymmetricExponentiator
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+def _reversible_Q(size, seed):
+    rng = numpy.random.RandomState(seed)
+    S = rng.uniform(0.5, 2.0, [size, size])
+    S = S + S.T
+    mprobs = rng.uniform(0.5, 1.0, [size])
+    mprobs /= mprobs.sum()
+    Q = S * mprobs
+    Q -= numpy.diag(Q.sum(axis=1))
+    return (Q, mprobs)
+
+class StackedTests(TestCase):
+    """stacked(ts) should match calling the exponentiator for each t"""
+    
+    def setUp(self):
+        self.ts = [0.0, 0.01, 0.3, 1.5, 0.3]
+    
+    def _check(self, expm, size):
+        P = expm.stacked(self.ts)
+        self.assertEqual(P.shape, (len(self.ts), size, size))
+        for (t, p) in zip(self.ts, P):
+            self.assertFloatEqualAbs(p, expm(t), 1e-10)
+    
+    def test_eigen(self):
+        """eigen decomposition based"""
+        for size in [4, 61]:
+            (Q, mprobs) = _reversible_Q(size, size)
+            self._check(FastExponentiator(Q), size)
+            self._check(SemiSymmetricExponentiator(mprobs, Q), size)
+    
+    def test_pade(self):
+        """fallback for exponentiators without an eigen decomposition"""
+        (Q, mprobs) = _reversible_Q(4, 1)
+        self._check(PadeExponentiator(Q), 4)
+        self.assertFloatEqual(PadeExponentiator(Q).stacked(self.ts),
+                FastExponentiator(Q).stacked(self.ts))
+    
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,9 @@
 """Unit tests for tree parsers.
 """
 from cogent.parse.tree import DndParser, DndTokenizer, RecordError
+from cogent.parse.newick import parse_arrays, parse_string, _parse_simple, \
+    TreeParseError
+from cogent.core.tree import TreeBuilder
 from cogent.core.tree import PhyloNode
 from cogent.util.unit_test import TestCase, main
 
@@ -220,6 +223,33 @@ class DndParserTests(TestCase):
         self.assertEqual(obs.getNewick(with_distances=True), \
                          tree_unesc.getNewick(with_distances=True))
 
+class NewickParserTests(TestCase):
+    """Tests of the quick path through the Newick parser"""
+
+    def test_parse_arrays(self):
+        """parse_arrays should number nodes in preorder"""
+        expected = ([-1, 0, 1, 1, 0], [None, 'x', 'a', 'b', 'c'],
+                [None, 3.0, 1.0, 2.0, None], [2, 3, 1, 4, 0])
+        self.assertEqual(parse_arrays('((a:1,b:2)x:3,c);'), expected)
+        # quoted labels need the full parser, with the same result
+        self.assertEqual(_parse_simple("(('a':1,b:2)x:3,c);"), None)
+        self.assertEqual(parse_arrays("(('a':1,b:2)x:3,c);"), expected)
+        self.assertRaises(TreeParseError, parse_arrays, 'abc')
+
+    def test_simple(self):
+        """anything unusual should be left to the full parser"""
+        for text in ['(a[comment],b);', '(a\nb);', '(a,b', '(a:1:2,b);',
+                '(a:x,b);', '(a,b)c(d);']:
+            self.assertEqual(_parse_simple(text), None)
+        for text in ['(a,b', '(a\nb);', '(a:1:2,b);', '(a,b)c(d);']:
+            self.assertRaises(TreeParseError, parse_string, text,
+                    TreeBuilder().createEdge)
+        tree = parse_string(' (a b:1,\n(c_d,e)f ) ;',
+                TreeBuilder().createEdge)
+        self.assertEqual(str(tree), "(a_b:1.0,(c_d,e)f);")
+        self.assertEqual(tree.Children[0].Name, 'a b')
+        self.assertEqual(tree.Children[1].Children[0].Name, 'c d')
+
 class PhyloNodeTests(TestCase):
     """Check that PhyloNode works the way I think"""
     def test_gops(self):
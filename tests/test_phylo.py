@@ -1,18 +1,22 @@
 #! /usr/bin/env python
-import unittest, os
+import unittest, os, random
 import warnings
-from numpy import log, exp
+from numpy import log, exp, nan
 warnings.filterwarnings('ignore', 'Not using MPI as mpi4py not found')
 
 from cogent.phylo.distance import EstimateDistances
-from cogent.phylo.nj import nj, gnj
+from cogent.phylo.kmer_distance import kmer_distances, word_counts
+from cogent.phylo.nj import nj, gnj, fast_nj
 from cogent.phylo.least_squares import wls
-from cogent import LoadSeqs, LoadTree
+from cogent import LoadSeqs, LoadTree, DNA
 from cogent.phylo.tree_collection import LogLikelihoodScoredTreeCollection,\
     WeightedTreeCollection, LoadTrees
 from cogent.evolve.models import JC69, HKY85, F81
 from cogent.phylo.consensus import majorityRule, weightedMajorityRule
+from cogent.phylo.splits import SplitEncoder, SplitCounter, \
+    robinson_foulds_matrix
 from cogent.util.misc import remove_files
+from cogent.phylo.util import CondensedDistances
 
 __author__ = "Peter Maxwell"
 __copyright__ = "Copyright 2007-2011, The Cogent Project"
@@ -51,6 +55,38 @@ class ConsensusTests(unittest.TestCase):
         self.assertEqual(len(outtrees), 1)
         self.assert_(outtrees[0].sameTopology(Tree("(c,d,(a,b));")))
     
+    def test_split_counter(self):
+        """SplitCounter should count clades, within max_splits if given"""
+        counter = SplitCounter()
+        counter.addTrees(self.trees)
+        counts = dict((tuple(clade), count)
+                for (count, clade) in counter.getCladeCounts())
+        self.assertEqual(counts[('a', 'b')], 3)
+        self.assertEqual(counts[('c', 'd')], 2)
+        self.assertEqual(counts[('a', 'c')], 1)
+        self.assertEqual(counter.Total, 4)
+        bounded = SplitCounter(max_splits=6)
+        bounded.addTrees(self.trees * 3)
+        self.assertTrue(len(bounded.Counts) <= 12)
+        outtrees = bounded.getConsensusTrees(strict=True)
+        self.assert_(outtrees[0].sameTopology(Tree("(c,d,(a,b));")))
+
+    def test_robinson_foulds_matrix(self):
+        """robinson_foulds_matrix counts splits in only one of two trees"""
+        for hash_bits in [None, 64]:
+            rooted = robinson_foulds_matrix(self.trees, rooted=True,
+                    hash_bits=hash_bits)
+            self.assertEqual(rooted[0].tolist(), [0, 0, 4, 1])
+            self.assertEqual(rooted[3].tolist(), [1, 1, 3, 0])
+            unrooted = robinson_foulds_matrix(self.trees, hash_bits=hash_bits)
+            self.assertEqual(unrooted[0].tolist(), [0, 0, 2, 0])
+        encoder = SplitEncoder('abcd')
+        self.assertEqual(encoder.getSplits(self.trees[0], rooted=False),
+                set([encoder.encode('ab')]))
+        self.assertEqual(encoder.decode(encoder.encode('db')), ['b', 'd'])
+        self.assertRaises(ValueError, encoder.getSplits, Tree("(a,b,(c,e));"),
+                rooted=False)
+
     def test_consensus_from_scored_trees_collection(self):
         """tree collection should get same consensus as direct approach"""
         sct = LogLikelihoodScoredTreeCollection([(1, t) for t in self.trees])
@@ -107,6 +143,50 @@ class TreeReconstructionTests(unittest.TestCase):
         reconstructed = nj(self.dists)
         self.assertTreeDistancesEqual(self.tree, reconstructed)
         
+    def test_fast_nj(self):
+        """fast_nj gives the same unrooted trees as gnj, with or without
+        pruning"""
+        reconstructed = fast_nj(self.dists, prune=False)
+        self.assertTreeDistancesEqual(self.tree, reconstructed)
+        random.seed(7)
+        names = ['s%s' % i for i in range(25)]
+        dists = {}
+        for (i, a) in enumerate(names):
+            for b in names[:i]:
+                dists[(a, b)] = random.uniform(1.0, 2.0)
+        (score, expect) = gnj(dists, keep=1)[0]
+        for prune in [True, False]:
+            reconstructed = fast_nj(dists, prune=prune)
+            self.assertEqual(reconstructed.Name, 'root')
+            rf = robinson_foulds_matrix([expect, reconstructed])
+            self.assertEqual(rf[0, 1], 0)
+            self.assertTreeDistancesEqual(expect, reconstructed)
+    
+    def test_nj_zero_and_missing(self):
+        """zero distances are kept, missing ones are a ValueError"""
+        dists = {('a', 'b'): 0.0, ('a', 'c'): 1.0, ('b', 'c'): 1.0,
+                ('a', 'd'): 2.0, ('b', 'd'): 2.0, ('c', 'd'): 1.5}
+        for prune in [True, False]:
+            tree = fast_nj(dists, prune=prune)
+            self.assertEqual(tree.getDistances()[('a', 'b')], 0.0)
+            self.assertEqual(sorted(tree.getTipNames()), list('abcd'))
+        condensed = CondensedDistances(list('abcd'), dtype=float)
+        for (pair, dist) in dists.items():
+            condensed[pair] = dist
+        condensed[('c', 'd')] = nan
+        for prune in [True, False]:
+            self.assertRaises(ValueError, fast_nj, condensed, prune=prune)
+    
+    def test_nj_condensed(self):
+        """nj from a CondensedDistances"""
+        names = self.tree.getTipNames()
+        condensed = CondensedDistances(names, dtype=float)
+        for (pair, dist) in self.dists.items():
+            condensed[pair] = dist
+        self.assertEqual(condensed[('b', 'a')], 7)
+        reconstructed = nj(condensed)
+        self.assertTreeDistancesEqual(self.tree, reconstructed)
+        
     def test_gnj(self):
         """testing gnj"""
         results = gnj(self.dists, keep=1)
@@ -195,6 +275,15 @@ class DistancesTests(unittest.TestCase):
         except OSError:
             pass # probably parallel
     
+    def test_getCondensedDistances(self):
+        """EstimateDistances results as a CondensedDistances"""
+        d = EstimateDistances(self.al, JC69())
+        d.run()
+        condensed = d.getCondensedDistances()
+        self.assertEqual(sorted(condensed.Names), ['a', 'b', 'c', 'e'])
+        self.assertDistsAlmostEqual(d.getPairwiseDistances(),
+                dict(condensed.items()))
+    
     def test_EstimateDistancesWithMotifProbs(self):
         """EstimateDistances with supplied motif probs"""
         motif_probs= {'A':0.1,'C':0.2,'G':0.2,'T':0.5}
@@ -247,6 +336,12 @@ class DistancesTests(unittest.TestCase):
                         ('b', 'c'): 0.0883373}
         result = d.getPairwiseDistances()
         self.assertDistsAlmostEqual(canned_result, result)
+        
+        # with JC69 pooling the motif probs changes nothing
+        d = EstimateDistances(self.collection, JC69(), do_pair_align=True,
+                                batch_align=True)
+        d.run()
+        self.assertDistsAlmostEqual(canned_result, d.getPairwiseDistances())
     
     def test_EstimateDistances_other_model_params(self):
         """test getting other model params from EstimateDistances"""
@@ -273,7 +368,26 @@ class DistancesTests(unittest.TestCase):
         d.run()
         expect = d.getPairwiseDistances()
         self.assertDistsAlmostEqual(expect, result)
-        
+    
+    def test_word_counts(self):
+        """word_counts should skip words with gaps or ambiguities"""
+        counts = word_counts('ac-gtNtac', 'TCAG', 2)
+        self.assertEqual(len(counts), 16)
+        self.assertEqual(counts.sum(), 4)
+        # TA, AC and GT as indices into TCAG
+        self.assertEqual(list(counts.nonzero()[0]), [2, 9, 12])
+        self.assertEqual(counts[9], 2)
+    
+    def test_kmer_distances(self):
+        """kmer_distances should be 1 - the fraction of k-mers shared"""
+        result = kmer_distances(self.collection, k=2)
+        self.assertEqual(len(result), 12)
+        self.assertEqual(result[('b', 'a')], result[('a', 'b')])
+        self.assertDistsAlmostEqual({('a', 'b'): 1 - 8/11.,
+                ('b', 'c'): 1 - 9/11.}, result)
+        d = kmer_distances({'x': 'ACGT', 'y': 'ACGA', 'z': 'ACGT'}, DNA, 2)
+        self.assertDistsAlmostEqual({('x', 'y'): 1/3., ('x', 'z'): 0.0,
+                ('y', 'z'): 1/3.}, d)
     
 
 if __name__ == '__main__':
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+"""tests for the multiprocessing parallel context and its worker pool."""
+
+import os
+import threading
+from operator import neg
+from cogent.util.unit_test import TestCase, main
+from cogent.util import parallel
+from cogent.util import progress_display as UI
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Gavin Huttley"
+__email__ = "gavin.huttley@anu.edu.au"
+__status__ = "Production"
+
+@UI.display_wrap
+def _worker_pids(count, ui=None):
+    def pid(x):
+        return (os.getpid(), x + count)
+    return ui.eager_map(pid, range(count))
+
+class MultiprocessingTests(TestCase):
+    
+    def setUp(self):
+        self.context = parallel.MultiprocessingParallelContext(2)
+    
+    def tearDown(self):
+        self.context.shutdown()
+    
+    def test_pool_reused(self):
+        """the worker pool should survive between map calls"""
+        with parallel.parallel_context(self.context):
+            self.assertEqual(parallel.map(neg, range(5)), [0, -1, -2, -3, -4])
+            pool = self.context._pool
+            self.assertNotEqual(pool, None)
+            self.assertEqual(parallel.map(neg, range(3)), [0, -1, -2])
+            self.assertTrue(self.context._pool is pool)
+    
+    def test_local_function(self):
+        """unregistered local functions should still work"""
+        offset = 3
+        def add(x):
+            return x + offset
+        self.assertEqual(list(self.context.imap(add, range(3))), [3, 4, 5])
+        self.assertFalse(id(add) in parallel._FUNCTION_KEYS)
+    
+    def test_shipped_functions_reuse_pool(self):
+        """local closures should be shipped to the existing workers"""
+        with parallel.parallel_context(self.context):
+            first = _worker_pids(4)
+            pool = self.context._pool
+            worker_pids = set(p.pid for p in pool._pool)
+            second = _worker_pids(3)
+            self.assertTrue(self.context._pool is pool)
+            self.assertEqual([x for (pid, x) in second], [3, 4, 5])
+            self.assertTrue(set(pid for (pid, x) in first + second)
+                    <= worker_pids)
+            # big closures go by way of a temporary file
+            padding = 'x' * (parallel.SHIP_INLINE_LIMIT + 1)
+            def length(x):
+                return len(padding) + x
+            self.assertEqual(parallel.map(length, [0, 1]),
+                    [len(padding), len(padding) + 1])
+            self.assertTrue(self.context._pool is pool)
+    
+    def test_unpicklable_closure(self):
+        """closures which can't be pickled need a new pool"""
+        lock = threading.Lock()
+        def locked(x):
+            with lock:
+                return -x
+        list(self.context.imap(neg, range(3)))
+        pool = self.context._pool
+        self.assertEqual(list(self.context.imap(locked, range(3))),
+                [0, -1, -2])
+        self.assertFalse(self.context._pool is pool)
+    
+    def test_registered_function(self):
+        """functions registered before the pool starts shouldn't restart it"""
+        negate = lambda x: -x
+        handle = parallel.register_function(negate)
+        try:
+            self.assertEqual(list(self.context.imap(negate, range(3))),
+                    [0, -1, -2])
+            pool = self.context._pool
+            self.assertEqual(list(self.context.imap(handle, range(3))),
+                    [0, -1, -2])
+            self.assertTrue(self.context._pool is pool)
+        finally:
+            parallel.unregister_function(negate)
+    
+    def test_shutdown(self):
+        """shutdown should discard the pool, a later map starts another"""
+        list(self.context.imap(neg, range(3)))
+        self.context.shutdown()
+        self.assertEqual(self.context._pool, None)
+        self.assertEqual(list(self.context.imap(neg, [2])), [-2])
+    
+
+if __name__ == '__main__':
+    main()
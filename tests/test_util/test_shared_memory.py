@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""tests for numpy arrays in shared memory."""
+
+import os
+import cPickle
+import numpy
+from cogent.util.unit_test import TestCase, main
+from cogent.util.shared_memory import share_array, is_shared, ByReference
+from cogent.util import parallel
+
+__author__ = "Peter Maxwell"
+__copyright__ = "Copyright 2007-2011, The Cogent Project"
+__credits__ = ["Peter Maxwell"]
+__license__ = "GPL"
+__version__ = "1.6.0dev"
+__maintainer__ = "Peter Maxwell"
+__email__ = "pm67nz@gmail.com"
+__status__ = "Production"
+
+class SharedArrayTests(TestCase):
+    
+    def setUp(self):
+        self.data = numpy.arange(12.0).reshape(3, 4)
+    
+    def test_share_array(self):
+        """shared copy should have same contents and be read only"""
+        a = share_array(self.data)
+        self.assertEqual(a, self.data)
+        self.assertEqual(a.dtype, self.data.dtype)
+        self.assertTrue(is_shared(a))
+        self.assertFalse(is_shared(self.data))
+        self.assertRaises((ValueError, RuntimeError), a.__setitem__, 0, 1.0)
+    
+    def test_pickle(self):
+        """shared arrays pickled by reference should refer to the same
+        file"""
+        data = numpy.arange(1000.0)
+        a = share_array(data)
+        s = cPickle.dumps(ByReference(a), 2)
+        self.assertTrue(len(s) < data.nbytes // 10)
+        b = cPickle.loads(s)
+        self.assertEqual(b, data)
+        self.assertTrue(is_shared(b))
+    
+    def test_pickle_outlives_array(self):
+        """ordinary pickles should copy the data, so they can be loaded
+        after the shared array and its file are gone"""
+        a = share_array(self.data)
+        path = a._handle[0]
+        s = cPickle.dumps(a, 2)
+        del a
+        self.assertFalse(os.path.exists(path))
+        b = cPickle.loads(s)
+        self.assertEqual(b, self.data)
+        self.assertFalse(is_shared(b))
+    
+    def test_workers_attach(self):
+        """multiprocessing workers should get the file, not a copy"""
+        a = share_array(self.data)
+        context = parallel.MultiprocessingParallelContext(2)
+        try:
+            with parallel.parallel_context(context):
+                result = list(parallel.imap(is_shared, [a, a]))
+        finally:
+            context.shutdown()
+        self.assertEqual(result, [True, True])
+    
+    def test_views_copied(self):
+        """parts of a shared array should pickle as normal arrays"""
+        a = share_array(self.data)
+        part = a[1:]
+        self.assertFalse(is_shared(part))
+        b = cPickle.loads(cPickle.dumps(part, 2))
+        self.assertEqual(b, self.data[1:])
+    
+    def test_cleanup(self):
+        """the backing file should go when the array does"""
+        a = share_array(self.data)
+        path = a._handle[0]
+        self.assertTrue(os.path.exists(path))
+        del a
+        self.assertFalse(os.path.exists(path))
+    
+
+if __name__ == '__main__':
+    main()